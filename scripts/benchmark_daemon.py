@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark per-file latency of the migration daemon against cold CLI runs.
+
+Times ``python -m splurge_unittest_to_pytest migrate --dry-run FILE`` (a new
+process per file, as a pre-commit hook runs it) and the same dry-run
+migration sent to a warm ``MigrationDaemon`` over its Unix socket.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+import argparse
+import logging
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from splurge_unittest_to_pytest.daemon import MigrationDaemon, send_request
+
+SAMPLES = Path(__file__).resolve().parents[1] / "tests" / "data" / "given_and_expected"
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5, help="sample files to migrate (default: 5)")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    samples = sorted(SAMPLES.glob("unittest_given_*.txt"))[: args.files]
+    with tempfile.TemporaryDirectory(prefix="sutp-bench-") as tmp:
+        files = []
+        for sample in samples:
+            path = Path(tmp) / f"test_{sample.stem}.py"
+            path.write_text(sample.read_text(encoding="utf-8"), encoding="utf-8")
+            files.append(str(path))
+
+        cold = []
+        for path in files:
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-m", "splurge_unittest_to_pytest", "migrate", "--dry-run", "--list", path],
+                capture_output=True,
+                check=True,
+            )
+            cold.append(time.perf_counter() - start)
+
+        daemon = MigrationDaemon(Path(tmp) / "daemon.sock")
+        start = time.perf_counter()
+        daemon.start()
+        warm_up = time.perf_counter() - start
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        warm = []
+        for path in files:
+            start = time.perf_counter()
+            request = {"op": "migrate", "source_file": path, "config": {"dry_run": True}}
+            response = send_request(request, daemon.socket_path)
+            warm.append(time.perf_counter() - start)
+            assert response is not None and response["status"] != "error", response
+        send_request({"op": "shutdown"}, daemon.socket_path)
+        thread.join(timeout=10)
+
+    print("Per-file latency: cold CLI process vs warm daemon")
+    print("=" * 60)
+    print(f"files:              {len(files)}")
+    print(f"cold CLI (median):  {statistics.median(cold) * 1000:8.1f} ms")
+    print(f"daemon (median):    {statistics.median(warm) * 1000:8.1f} ms  (one-time warm-up {warm_up:.2f} s)")
+    print(f"speedup:            {statistics.median(cold) / statistics.median(warm):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark loading a stored decision model against re-running the analysis.
+
+Analyzes a generated unittest module with ``DecisionAnalysisJob``, stores
+the resulting model in the JSON and binary formats, and times loading each
+one back. Prints file sizes and the speedup of loading over analysis.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from splurge_unittest_to_pytest.context import MigrationConfig, PipelineContext
+from splurge_unittest_to_pytest.decision_model import BINARY_SUFFIX, DecisionModel
+from splurge_unittest_to_pytest.events import EventBus
+from splurge_unittest_to_pytest.jobs.decision_analysis_job import DecisionAnalysisJob
+
+
+def create_module(classes: int = 20, methods: int = 15) -> str:
+    """Return unittest source with subTest loops spread over ``classes`` classes."""
+    lines = ["import unittest", ""]
+    for c in range(classes):
+        lines += ["", f"class TestGroup{c}(unittest.TestCase):", "    def setUp(self):", "        self.items = []", ""]
+        for m in range(methods):
+            lines += [
+                f"    def test_case_{m}(self):",
+                f"        for value in [{m}, {m + 1}, {m + 2}]:",
+                "            with self.subTest(value=value):",
+                "                self.assertTrue(value >= 0)",
+                "",
+            ]
+    return "\n".join(lines) + "\n"
+
+
+def best_of(func, runs: int = 5) -> float:
+    """Return the best wall time of ``func`` over ``runs`` runs."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark."""
+    source = create_module()
+    config = MigrationConfig(cache_analysis_results=False)
+    job = DecisionAnalysisJob(EventBus())
+
+    def analyze() -> DecisionModel:
+        context = PipelineContext.create("test_generated.py", config=config)
+        job.execute(context, source)
+        return context.metadata["decision_model"]
+
+    model = analyze()
+    analysis_time = best_of(analyze, runs=3)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "model.json"
+        binary_path = Path(tmp) / f"model{BINARY_SUFFIX}"
+        model.save_to_file(json_path)
+        model.save_to_file(binary_path)
+
+        def load(path: Path) -> None:
+            DecisionModel(module_proposals={}).load_from_file(path)
+
+        json_time = best_of(lambda: load(json_path))
+        binary_time = best_of(lambda: load(binary_path))
+
+        print("Decision model: analysis vs. loading a stored model")
+        print("=" * 60)
+        print(f"functions analyzed: {model.get_statistics()['total_functions']}")
+        print(f"analysis:           {analysis_time * 1000:8.2f} ms")
+        print(
+            f"load JSON:          {json_time * 1000:8.2f} ms  ({json_path.stat().st_size:,} bytes)"
+            f"  {analysis_time / json_time:6.1f}x"
+        )
+        print(
+            f"load binary:        {binary_time * 1000:8.2f} ms  ({binary_path.stat().st_size:,} bytes)"
+            f"  {analysis_time / binary_time:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Measure the memory held by IR and decision models per analyzed file.
+
+Analyzes the bundled unittest samples with ``UnittestPatternAnalyzer`` and
+``DecisionAnalysisJob`` and measures the memory held by the resulting
+``TestModule`` and ``DecisionModel`` objects, counting every object
+reachable from them once (shared strings and enum members included). The
+"before" column rebuilds the same data as plain (dict-backed) dataclasses
+holding private string copies and free-form evidence text, which is how the
+models were represented before slots, interning and evidence codes.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+import argparse
+import gc
+import logging
+import sys
+import types
+from dataclasses import fields, is_dataclass, make_dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from splurge_unittest_to_pytest.context import MigrationConfig, PipelineContext
+from splurge_unittest_to_pytest.events import EventBus
+from splurge_unittest_to_pytest.jobs.decision_analysis_job import DecisionAnalysisJob
+from splurge_unittest_to_pytest.pattern_analyzer import UnittestPatternAnalyzer
+
+SAMPLES = Path(__file__).resolve().parents[1] / "tests" / "data" / "given_and_expected"
+
+_legacy_classes: dict[type, type] = {}
+
+
+def to_legacy(value: Any) -> Any:
+    """Return a copy of ``value`` built from unslotted dataclasses and private strings."""
+    if is_dataclass(value) and not isinstance(value, type):
+        cls = type(value)
+        legacy_cls = _legacy_classes.get(cls)
+        if legacy_cls is None:
+            legacy_cls = make_dataclass(f"Legacy{cls.__name__}", [(f.name, Any) for f in fields(cls)])
+            _legacy_classes[cls] = legacy_cls
+        return legacy_cls(**{f.name: to_legacy(getattr(value, f.name)) for f in fields(cls)})
+    if isinstance(value, list):
+        return [to_legacy(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(to_legacy(item) for item in value)
+    if isinstance(value, dict):
+        return {to_legacy(key): to_legacy(item) for key, item in value.items()}
+    if isinstance(value, str) and not (isinstance(value, Enum) and type(value).__module__ == "enum"):
+        text = str.__str__(value)
+        # A new string object with the same text, as produced by a fresh parse
+        return (text + ".")[:-1] if len(text) > 1 else text
+    return value
+
+
+def analyze(sources: list[tuple[str, str]]) -> list[tuple[Any, Any]]:
+    """Return (TestModule, DecisionModel) pairs for ``sources``."""
+    job = DecisionAnalysisJob(EventBus())
+    config = MigrationConfig(cache_analysis_results=False)
+    models = []
+    for name, source in sources:
+        ir_module = UnittestPatternAnalyzer().analyze_module(source)
+        context = PipelineContext.create(name, config=config)
+        job.execute(context, source)
+        models.append((ir_module, context.metadata.get("decision_model")))
+    return models
+
+
+_SKIPPED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+
+
+def deep_size(root: Any) -> int:
+    """Return the size in bytes of ``root`` and every object reachable from it, each counted once."""
+    seen: set[int] = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIPPED_TYPES) or obj is None or isinstance(obj, bool):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return total
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=20, help="times to analyze each sample (default: 20)")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    samples = sorted(SAMPLES.glob("unittest_given_*.txt"))
+    sources = [
+        (f"{path.stem}_{i}.py", path.read_text(encoding="utf-8")) for path in samples for i in range(args.copies)
+    ]
+    current = analyze(sources)
+    after = deep_size(current)
+    before = deep_size(to_legacy(current))
+
+    files = len(sources)
+    print("IR + decision model memory per analyzed file")
+    print("=" * 60)
+    print(f"files analyzed:     {files}")
+    print(f"before (dict-based): {before / files / 1024:8.1f} KiB/file")
+    print(f"after (slotted):     {after / files / 1024:8.1f} KiB/file")
+    print(f"reduction:           {(1 - after / before) * 100:8.1f} %")
+    projected = 20000 / files / 2**20
+    print(f"projected for 20k files: {before * projected:,.0f} MiB -> {after * projected:,.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Allocation benchmark for the shared CST node factory.
+
+This script measures how many Python objects the assertion rewrites
+allocate. It first builds the recurring node shapes (``pytest.raises``
+calls, ``assert a == b``, ``@pytest.fixture(autouse=True)``) once with
+fresh libcst nodes and once through
+``splurge_unittest_to_pytest.transformers.node_factory``. It then reports
+the allocations of a full transformation of an assertion-dense module.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import libcst as cst
+
+from splurge_unittest_to_pytest.transformers import node_factory as nodes
+from splurge_unittest_to_pytest.transformers.unittest_transformer import UnittestToPytestCstTransformer
+
+ITERATIONS = 20_000
+
+
+def build_fresh(left: cst.BaseExpression, right: cst.BaseExpression) -> list[cst.CSTNode]:
+    """Build the benchmark shapes with freshly constructed nodes."""
+    raises = cst.Call(
+        func=cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="raises")),
+        args=[cst.Arg(value=left), cst.Arg(keyword=cst.Name(value="match"), value=right)],
+    )
+    compare = cst.Assert(
+        test=cst.Comparison(left=left, comparisons=[cst.ComparisonTarget(operator=cst.Equal(), comparator=right)])
+    )
+    decorator = cst.Decorator(
+        decorator=cst.Call(
+            func=cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="fixture")),
+            args=[cst.Arg(keyword=cst.Name(value="autouse"), value=cst.Name(value="True"))],
+        )
+    )
+    return [raises, compare, decorator]
+
+
+def build_shared(left: cst.BaseExpression, right: cst.BaseExpression) -> list[cst.CSTNode]:
+    """Build the benchmark shapes through the node factory."""
+    raises = nodes.call("pytest.raises", [cst.Arg(value=left), nodes.keyword_arg("match", right)])
+    compare = nodes.assert_compare(left, nodes.EQUAL, right)
+    decorator = nodes.fixture_decorator(autouse=True)
+    return [raises, compare, decorator]
+
+
+def measure(label: str, func: Callable[[], object]) -> tuple[int, float]:
+    """Run ``func`` under tracemalloc and print live blocks, peak memory and time.
+
+    Times include tracemalloc overhead and are only comparable with each other.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    snapshot = tracemalloc.take_snapshot()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = snapshot.statistics("filename")
+    blocks = sum(stat.count for stat in stats)
+    size = sum(stat.size for stat in stats)
+    del result
+    print(
+        f"  {label:<16} {blocks:>10,} live blocks {size / 1024:>10,.1f} KiB live"
+        f" {peak / 1024:>10,.1f} KiB peak {elapsed:>8.3f} s"
+    )
+    return blocks, elapsed
+
+
+def create_assertion_dense_module(methods: int = 50, asserts_per_method: int = 20) -> str:
+    """Return unittest source with many assertions per test method."""
+    lines = ["import unittest", "", "", "class TestDense(unittest.TestCase):"]
+    lines += ["    def setUp(self):", "        self.value = 1", ""]
+    for m in range(methods):
+        lines.append(f"    def test_case_{m}(self):")
+        for a in range(asserts_per_method):
+            kind = a % 5
+            if kind == 0:
+                lines.append(f"        self.assertEqual(self.value, {a})")
+            elif kind == 1:
+                lines.append(f"        self.assertIsNone(result_{a})")
+            elif kind == 2:
+                lines.append(f"        self.assertIn({a}, items)")
+            elif kind == 3:
+                lines.append(f"        self.assertFalse(flag_{a})")
+            else:
+                lines.append(f"        self.assertGreater(count, {a})")
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    """Run the allocation benchmarks."""
+    print("Allocation Benchmark: Shared CST Node Factory")
+    print("=" * 50)
+
+    left = cst.Name(value="ValueError")
+    right = cst.SimpleString(value='"boom"')
+
+    print(f"Building {ITERATIONS:,} sets of recurring nodes (objects kept alive):")
+    fresh_blocks, fresh_time = measure("fresh nodes", lambda: [build_fresh(left, right) for _ in range(ITERATIONS)])
+    shared_blocks, shared_time = measure("node factory", lambda: [build_shared(left, right) for _ in range(ITERATIONS)])
+    saved = (fresh_blocks - shared_blocks) / fresh_blocks * 100 if fresh_blocks else 0.0
+    print(f"  -> {saved:.1f}% fewer live blocks, {fresh_time / shared_time if shared_time else 0.0:.2f}x build speed")
+
+    source = create_assertion_dense_module()
+    print(f"\nTransforming an assertion-dense module ({source.count('self.assert'):,} assertions):")
+    measure("transform_code", lambda: UnittestToPytestCstTransformer().transform_code(source))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Benchmark the main CST pass on modules dominated by non-test code.
+
+Builds modules with a fixed amount of test code and a growing amount of
+helper logic and data literals, then times the primary transformer
+traversal with and without the relevance index. With subtree skipping the
+cost should stay close to flat as the non-test code grows.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+import time
+
+import libcst as cst
+
+from splurge_unittest_to_pytest.transformers.unittest_transformer import UnittestToPytestCstTransformer
+
+
+class _FullTraversalTransformer(UnittestToPytestCstTransformer):
+    """Transformer that visits every node (subtree skipping disabled)."""
+
+    def visit_Module(self, node: cst.Module) -> bool | None:
+        result = super().visit_Module(node)
+        self._relevant_statements = None
+        return result
+
+
+def create_module(helper_lines: int, tests: int = 20) -> str:
+    """Return unittest source with ``tests`` test methods and ``helper_lines`` lines of helpers and data."""
+    lines = ["import unittest", "", "DATA = {"]
+    lines += [f"    'k{i}': [{i}, {i + 1}, 'v{i}']," for i in range(helper_lines // 2)]
+    lines += ["}", "", "", "def helper(x):"]
+    lines += [f"    y{j} = x * {j} + sum(v[0] for v in DATA.values() if v[1] > {j})" for j in range(helper_lines // 2)]
+    lines += ["    return x", "", "", "class TestModule(unittest.TestCase):"]
+    for m in range(tests):
+        lines += [f"    def test_{m}(self):", f"        self.assertEqual(helper({m}), {m})", ""]
+    return "\n".join(lines) + "\n"
+
+
+def time_main_pass(transformer_class: type[UnittestToPytestCstTransformer], source: str, runs: int = 3) -> float:
+    """Return the best time of the primary traversal over ``runs`` runs."""
+    best = float("inf")
+    for _ in range(runs):
+        module = cst.parse_module(source)
+        start = time.perf_counter()
+        transformer_class()._visit_with_metadata(module)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print("Main CST pass: full traversal vs. subtree skipping")
+    print("=" * 60)
+    print(f"{'helper lines':>12} {'full (s)':>10} {'skipping (s)':>13} {'speedup':>8}")
+    for helper_lines in (0, 200, 800, 1600):
+        source = create_module(helper_lines)
+        full = time_main_pass(_FullTraversalTransformer, source)
+        skipping = time_main_pass(UnittestToPytestCstTransformer, source)
+        print(f"{helper_lines:>12} {full:>10.3f} {skipping:>13.3f} {full / skipping:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Benchmark worker pool startup with and without the warm fork server.
+
+For each worker count, times how long a fresh pool takes to migrate one
+small module per worker: first with plain ``spawn`` workers that import
+and warm up on their own, then with :func:`create_worker_pool`, whose
+workers are forked from a preloaded, frozen fork server. The fork server
+itself is started (and warmed) once, before the timed runs, as it would
+be by the first pool of a run.
+
+Usage: ``python scripts/benchmark_worker_startup.py [COUNT ...]``
+(default counts: 1 4 8).
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from splurge_unittest_to_pytest.context import MigrationConfig, PipelineContext
+from splurge_unittest_to_pytest.migration_orchestrator import _transform_in_worker
+from splurge_unittest_to_pytest.worker_pool import create_worker_pool
+
+SOURCE = """\
+import unittest
+
+
+class TestNumbers(unittest.TestCase):
+    def test_value(self):
+        self.assertEqual(1 + 1, 2)
+"""
+
+
+def run_pool(executor: ProcessPoolExecutor, workers: int) -> float:
+    """Return the wall time for ``executor`` to migrate one module per worker."""
+    context = PipelineContext.create("<bench>", config=MigrationConfig(cache_analysis_results=False), in_memory=True)
+    start = time.perf_counter()
+    with executor:
+        results = [executor.submit(_transform_in_worker, context, SOURCE) for _ in range(workers)]
+        assert all(future.result().is_success() for future in results)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    counts = [int(arg) for arg in sys.argv[1:]] or [1, 4, 8]
+    spawn = multiprocessing.get_context("spawn")
+
+    start = time.perf_counter()
+    run_pool(create_worker_pool(1), 1)
+    print(f"fork server start and warm-up: {time.perf_counter() - start:.2f}s")
+
+    print(f"{'workers':>8} {'spawn':>10} {'warm pool':>10}")
+    for count in counts:
+        cold = run_pool(ProcessPoolExecutor(max_workers=count, mp_context=spawn), count)
+        warm = run_pool(create_worker_pool(count), count)
+        print(f"{count:>8} {cold:>9.2f}s {warm:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
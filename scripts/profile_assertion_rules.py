@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Report which assertion rewrite rules dominate transformation time.
+
+Enables the per-rule counters of the assertion dispatch registry,
+transforms every file under the given paths that matches ``--pattern`` in
+memory (nothing is written) and prints hits, failures and cumulative time
+per rule.
+
+Usage:
+    python scripts/profile_assertion_rules.py tests/ other_tests/test_x.py
+    python scripts/profile_assertion_rules.py --pattern "*.txt" tests/data
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from splurge_unittest_to_pytest.transformers.assert_dispatch import get_assertion_registry
+from splurge_unittest_to_pytest.transformers.unittest_transformer import UnittestToPytestCstTransformer
+
+
+def iter_sources(paths: list[str], pattern: str) -> list[Path]:
+    """Return the files named by ``paths``; directories are searched recursively for ``pattern``."""
+    files: list[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        files.extend(sorted(path.rglob(pattern)) if path.is_dir() else [path])
+    return files
+
+
+def main(argv: list[str]) -> int:
+    """Transform the given files and print the per-rule counters."""
+    parser = argparse.ArgumentParser(description="Profile assertion rewrite rules over a corpus")
+    parser.add_argument("paths", nargs="+", help="Files or directories to transform")
+    parser.add_argument("--pattern", default="*.py", help="Glob used inside directories (default: *.py)")
+    args = parser.parse_args(argv)
+
+    registry = get_assertion_registry()
+    registry.reset_stats()
+    registry.enable_stats()
+
+    files = iter_sources(args.paths, args.pattern)
+    for file in files:
+        try:
+            UnittestToPytestCstTransformer().transform_code(file.read_text(encoding="utf-8"))
+        except Exception as e:  # keep profiling the rest of the corpus
+            print(f"skipped {file}: {e}", file=sys.stderr)
+
+    rows = registry.stats()
+    total = sum(row["total_time"] for row in rows) or 1.0
+    print(f"Assertion rule profile over {len(files)} file(s)")
+    print(f"{'rule':<24} {'source':<12} {'hits':>8} {'failures':>8} {'time (ms)':>10} {'share':>7}")
+    for row in rows:
+        print(
+            f"{row['method_name']:<24} {row['source']:<12} {row['hits']:>8} {row['failures']:>8}"
+            f" {row['total_time'] * 1000:>10.2f} {row['total_time'] / total:>7.1%}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
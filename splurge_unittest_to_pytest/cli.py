@@ -10,13 +10,14 @@ Copyright (c) 2025 Jim Schilling
 This software is released under the MIT License.
 """
 
+import importlib
 import logging
+import os
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 import typer
 
-from . import main as main_module
 from .cli_adapters import build_config_from_cli
 from .cli_helpers import (
     _apply_defaults_to_config,
@@ -32,29 +33,51 @@ from .cli_helpers import (
     validate_source_files,
     validate_source_files_with_patterns,
 )
-
-# Enhanced validation imports
-# Phase 3: Intelligent Configuration Assistant
-from .config_validation import (
-    ConfigurationAdvisor,
-    ConfigurationUseCaseDetector,
-    IntegratedConfigurationManager,
-    InteractiveConfigBuilder,
-    ProjectAnalyzer,
-    generate_configuration_documentation,
-    get_field_help,
-    get_template,
-    list_available_templates,
-)
 from .context import ContextManager, MigrationConfig
+from .helpers.source_io import read_source, source_cache, source_exists
+
+# Heavy modules (the migration engine with libcst, the pydantic-based
+# configuration assistant and error reporting) are imported only by the
+# commands that use them, so ``version``, ``--help`` and the lightweight
+# commands start quickly. Attribute name -> (module, attribute or None for
+# the module itself).
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    "main_module": (".main", None),
+    "PipelineFactory": (".pipeline", "PipelineFactory"),
+    # Phase 3: Intelligent Configuration Assistant
+    "ConfigurationAdvisor": (".config_validation", "ConfigurationAdvisor"),
+    "ConfigurationUseCaseDetector": (".config_validation", "ConfigurationUseCaseDetector"),
+    "IntegratedConfigurationManager": (".config_validation", "IntegratedConfigurationManager"),
+    "InteractiveConfigBuilder": (".config_validation", "InteractiveConfigBuilder"),
+    "ProjectAnalyzer": (".config_validation", "ProjectAnalyzer"),
+    "generate_configuration_documentation": (".config_validation", "generate_configuration_documentation"),
+    "get_field_help": (".config_validation", "get_field_help"),
+    "get_template": (".config_validation", "get_template"),
+    "list_available_templates": (".config_validation", "list_available_templates"),
+    # Error reporting
+    "ErrorCategory": (".error_reporting", "ErrorCategory"),
+    "ErrorReporter": (".error_reporting", "ErrorReporter"),
+    "SmartError": (".error_reporting", "SmartError"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the lazily loaded module attributes on first access."""
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __package__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Return a lazily imported attribute, honoring values set on the module (e.g. by tests)."""
+    value = globals().get(name)
+    return value if value is not None else __getattr__(name)
 
-# Error reporting imports
-from .error_reporting import (
-    ErrorCategory,
-    ErrorReporter,
-    SmartError,
-)
-from .pipeline import PipelineFactory
 
 # Initialize typer app
 app = typer.Typer(
@@ -68,13 +91,22 @@ logger = logging.getLogger(__name__)
 
 
 @app.command("migrate")
+@source_cache()
 def migrate(
-    source_files: list[str] = typer.Argument(..., help="Source unittest files or directories (use -d/-f to search)"),
+    source_files: list[str] | None = typer.Argument(
+        None, help="Source unittest files or directories (use -d/-f to search); '-' reads source from stdin"
+    ),
     root_directory: str | None = typer.Option(None, "--dir", "-d", help="Root directory for input files"),
     file_patterns: list[str] = typer.Option(
         ["test_*.py"], "--file", "-f", help="Glob patterns for input files (repeatable)"
     ),
     recurse: bool = typer.Option(True, "--recurse", "-r", help="Recurse directories when searching for files"),
+    changed_since: str | None = typer.Option(
+        None, "--since", help="Only migrate files git reports as changed since this ref that match -f patterns"
+    ),
+    staged: bool = typer.Option(
+        False, "--staged", help="Only migrate files with staged git changes that match -f patterns", is_flag=True
+    ),
     target_root: str | None = typer.Option(None, "--target-root", "-t", help="Target root directory for output files"),
     skip_backup: bool = typer.Option(False, "--skip-backup", "-sb", help="Skip backup of original files", is_flag=True),
     backup_root: str | None = typer.Option(
@@ -97,11 +129,17 @@ def migrate(
         False, "--list", help="When used with --dry-run, list files only (no code shown)", is_flag=True
     ),
     fail_fast: bool = typer.Option(False, "--fail-fast", help="Stop on first error", is_flag=True),
+    read_stdin: bool = typer.Option(
+        False, "--stdin", help="Read source from stdin and write the converted code to stdout", is_flag=True
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output", is_flag=True),
     info: bool = typer.Option(False, "--info", help="Enable info logging output", is_flag=True),
     debug: bool = typer.Option(False, "--debug", help="Enable debug logging output", is_flag=True),
     generate_report: bool = typer.Option(False, "--report", help="Generate migration report", is_flag=True),
     report_format: str = typer.Option("json", "--report-format", help="Format for migration report"),
+    report_path: str | None = typer.Option(
+        None, "--report-path", help="Write the JSONL migration report to this file (implies --report)"
+    ),
     test_method_prefixes: list[str] = typer.Option(
         ["test", "spec", "should", "it"], "--prefix", help="Allowed test method prefixes (repeatable)"
     ),
@@ -198,12 +236,22 @@ def migrate(
         "--max-concurrent",
         help="Maximum files to process concurrently (1-50, use higher values for better performance on multi-core systems)",
     ),
+    pipeline_mode: str = typer.Option(
+        "sequential",
+        "--pipeline-mode",
+        help="Multi-file execution: 'sequential', or 'staged' to overlap reads and writes with transformation",
+    ),
     cache_analysis: bool = typer.Option(
         True, "--cache-analysis", help="Cache analysis results for better performance on repeated runs", is_flag=True
     ),
     no_cache_analysis: bool = typer.Option(
         False, "--no-cache-analysis", help="Disable analysis result caching (slower but uses less memory)", is_flag=True
     ),
+    decision_model_dir: str | None = typer.Option(
+        None,
+        "--decision-model-dir",
+        help="Store decision models here and reuse them for unchanged files on later runs",
+    ),
     # Advanced options
     preserve_encoding: bool = typer.Option(
         True, "--preserve-encoding", help="Preserve original file encoding when writing output", is_flag=True
@@ -215,7 +263,12 @@ def migrate(
         False, "--source-map", help="Create source mapping for debugging transformations (advanced users)", is_flag=True
     ),
     max_depth: int = typer.Option(
-        7, "--max-depth", help="Maximum depth to traverse nested control flow structures (3-15, default: 7)"
+        7, "--max-depth", help="Deprecated and ignored; nested control flow is transformed at any depth (3-15)"
+    ),
+    parametrize_table_threshold: int = typer.Option(
+        0,
+        "--parametrize-table-threshold",
+        help="Emit parametrize tables with more rows than this as a module-level constant (0 keeps them inline)",
     ),
     # Enhanced validation features
     show_suggestions: bool = typer.Option(
@@ -261,15 +314,29 @@ def migrate(
         # Use multiple prefixes for modern testing
         splurge-unittest-to-pytest migrate --prefix test --prefix spec tests/
 
+        # Convert stdin to stdout (editor integrations, pipes)
+        splurge-unittest-to-pytest migrate - < test_example.py
+
+        # Pre-commit: only staged test files
+        splurge-unittest-to-pytest migrate --staged --dry-run
+
     The CLI command serves as a thin wrapper that prepares the application
     configuration, validates inputs, creates the application event bus, and
     delegates the actual migration work to :func:`splurge_unittest_to_pytest.main.migrate`.
+    The whole command runs inside one ``source_cache()``, so prefix detection,
+    classification, migration and the diff printer share a single read of
+    each file.
 
     Args:
-        source_files: Source unittest files or directories to process.
+        source_files: Source unittest files or directories to process, or
+            ``-`` to read source from stdin.
         root_directory: Optional root directory to search when using patterns.
         file_patterns: Glob patterns used to discover input files.
         recurse: Recurse directories when searching for files.
+        changed_since: Only process files ``git diff`` reports as changed
+            since this ref, intersected with ``file_patterns``.
+        staged: Only process files with staged changes, intersected with
+            ``file_patterns``.
         target_root: Root directory where converted files will be written.
         backup_originals: When True create backups of original files prior to overwriting.
         backup_root: Root directory for backup files. When specified, backups preserve folder structure.
@@ -282,9 +349,12 @@ def migrate(
         max_file_size: Maximum file size in MB to process (larger files may cause memory issues).
         list_files: When used with --dry-run, list files only (no code shown).
         fail_fast: Stop processing on the first encountered error.
+        read_stdin: Read source from stdin and write the converted code to
+            stdout; no files are validated, backed up or written.
         verbose: Enable verbose info logging.
         generate_report: Whether to create a migration report.
         report_format: Report output format (e.g. ``json``).
+        report_path: JSONL report file; setting it enables the report.
         test_method_prefixes: Allowed test method prefixes.
         parametrize: Attempt conservative subTest -> parametrize conversions.
         suffix: Suffix appended to target filename stem.
@@ -300,9 +370,16 @@ def migrate(
         transform_imports: Whether to transform unittest imports to pytest.
         continue_on_error: Whether to continue processing when individual files fail.
         max_concurrent: Maximum files to process concurrently.
+        pipeline_mode: ``sequential`` or ``staged`` (jobs run as stages
+            connected by bounded queues).
         cache_analysis: Whether to cache analysis results for performance.
+        decision_model_dir: Directory of stored decision models reused for
+            unchanged files.
         preserve_encoding: Whether to preserve original file encoding.
         create_source_map: Whether to create source mapping for debugging.
+        max_depth: Deprecated and ignored; kept for compatibility.
+        parametrize_table_threshold: Row count above which parametrize tables
+            are emitted as a module-level constant.
     """
     # Validate mutually exclusive flags: verbose and debug cannot be used together
     if info and debug:
@@ -327,11 +404,36 @@ def migrate(
             typer.echo(f"Error loading configuration file: {e}")
             raise typer.Exit(code=1) from e
 
-    # Validate source files first to get valid_files for prefix detection
-    valid_files = cast(
-        list[str], validate_source_files_with_patterns(source_files, root_directory, file_patterns, recurse) or []
+    # Extract actual values from OptionInfo when migrate() is called directly
+    from typer.models import OptionInfo
+
+    read_stdin, changed_since, staged, report_path, pipeline_mode, decision_model_dir = (
+        option.default if isinstance(option, OptionInfo) else option
+        for option in (read_stdin, changed_since, staged, report_path, pipeline_mode, decision_model_dir)
     )
 
+    # "-" (or --stdin) converts stdin to stdout; no paths are involved
+    given_files = list(source_files) if isinstance(source_files, list | tuple) else []
+    use_stdin = read_stdin or given_files == ["-"]
+    # --since/--staged take the candidate files from git instead of the tree
+    since_ref = changed_since or None
+    changed_mode = since_ref is not None or staged
+    if use_stdin and (given_files not in ([], ["-"]) or changed_mode):
+        typer.echo("Error: source files cannot be combined with reading from stdin.", err=True)
+        raise typer.Exit(code=2)
+    if not use_stdin and source_files is None and not changed_mode:
+        typer.echo("Error: no source files given (use '-' to read from stdin).", err=True)
+        raise typer.Exit(code=2)
+
+    # Validate source files first to get valid_files for prefix detection
+    valid_files: list[str] = []
+    if changed_mode:
+        valid_files = _changed_files(given_files, root_directory, file_patterns, recurse, since_ref, staged)
+    elif not use_stdin:
+        valid_files = cast(
+            list[str], validate_source_files_with_patterns(given_files, root_directory, file_patterns, recurse) or []
+        )
+
     # Auto-detect test prefixes if requested
     effective_prefixes = test_method_prefixes
     if detect_prefixes and valid_files:
@@ -380,6 +482,9 @@ def migrate(
         config_kwargs["generate_report"] = generate_report
     if report_format is not None:
         config_kwargs["report_format"] = report_format
+    if report_path:
+        config_kwargs["generate_report"] = True
+        config_kwargs["report_path"] = report_path
     if effective_prefixes is not None:
         config_kwargs["test_method_prefixes"] = effective_prefixes
     if assert_places is not None:
@@ -428,7 +533,11 @@ def migrate(
         config_kwargs["max_concurrent_files"] = int(max_concurrent.default)
     else:
         config_kwargs["max_concurrent_files"] = int(max_concurrent)
+    if pipeline_mode is not None:
+        config_kwargs["pipeline_mode"] = pipeline_mode
     config_kwargs["cache_analysis_results"] = final_cache_analysis
+    if decision_model_dir:
+        config_kwargs["decision_model_dir"] = decision_model_dir
     config_kwargs["preserve_file_encoding"] = final_preserve_encoding
     config_kwargs["create_source_map"] = create_source_map
     # Extract actual value from OptionInfo if needed
@@ -436,6 +545,10 @@ def migrate(
         config_kwargs["max_depth"] = int(max_depth.default)
     else:
         config_kwargs["max_depth"] = int(max_depth)
+    if isinstance(parametrize_table_threshold, OptionInfo):
+        config_kwargs["parametrize_table_threshold"] = int(parametrize_table_threshold.default)
+    else:
+        config_kwargs["parametrize_table_threshold"] = int(parametrize_table_threshold)
 
     # Create configuration with enhanced validation, but handle gracefully
     try:
@@ -480,6 +593,10 @@ def migrate(
     # Default behavior: quiet when neither debug nor info are set
     set_quiet_mode(not (debug or info))
 
+    if use_stdin:
+        _migrate_stdin(config, show_diff=diff)
+        return
+
     try:
         # Create event bus
         event_bus = create_event_bus()
@@ -515,7 +632,7 @@ def migrate(
             config = _handle_enhanced_validation_features(config, config_kwargs)
 
         # Create pipeline factory
-        PipelineFactory(event_bus)  # Initialize factory for future use
+        _lazy("PipelineFactory")(event_bus)  # Initialize factory for future use
 
         # Delegate heavy lifting to the programmatic API entrypoint so the logic
         # can be exercised from both the CLI and other Python code.
@@ -526,11 +643,20 @@ def migrate(
             for f in valid_files:
                 logger.info(f"  - {f}")
 
-        result = main_module.migrate(valid_files, config=config, event_bus=event_bus)
+        result = _lazy("main_module").migrate(valid_files, config=config, event_bus=event_bus)
 
         if result.is_success():
             logger.info("Migration completed!")
             logger.info(f"Migrated: {len(result.data)} files")
+            report_meta = getattr(result, "metadata", None)
+            report_meta = report_meta if isinstance(report_meta, dict) else {}
+            skipped_files = report_meta.get("skipped") or {}
+            if skipped_files:
+                logger.info(f"Skipped (no unittest code): {len(skipped_files)} files")
+                for skipped_file, reason in skipped_files.items():
+                    logger.info(f"  - {skipped_file}: {reason}")
+            if "report" in report_meta:
+                logger.info(f"Report: {report_meta.get('report_summary', report_meta['report'])}")
 
             # If dry-run, the orchestrator may attach the generated/formatted
             # code in the Result.metadata under 'generated_code'. Print it
@@ -589,7 +715,7 @@ def migrate(
                                 # default and users should pass explicit targets
                                 # or use the backup/extension flags when needed.
 
-                                orig_text = original.read_text(encoding="utf-8") if original.exists() else ""
+                                orig_text = read_source(original).text if source_exists(original) else ""
                             except (FileNotFoundError, PermissionError, UnicodeDecodeError, OSError):
                                 orig_text = ""
 
@@ -624,6 +750,244 @@ def migrate(
         raise typer.Exit(code=1) from None
 
 
+def _migrate_stdin(config: MigrationConfig, show_diff: bool = False) -> None:
+    """Convert source read from stdin and write the result to stdout.
+
+    Nothing touches the filesystem: the source is converted in memory with
+    :func:`splurge_unittest_to_pytest.main.transform_source`. Errors go to
+    stderr so stdout only ever carries converted code (or a diff).
+
+    Args:
+        config: Migration configuration; output location settings are ignored.
+        show_diff: Write a unified diff against the input instead of the code.
+    """
+    import sys
+
+    source_code = sys.stdin.read()
+    try:
+        result = _lazy("main_module").transform_source(source_code, config)
+    except Exception as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1) from None
+    if not result.is_success():
+        typer.echo(f"Error: {result.error}", err=True)
+        raise typer.Exit(code=1)
+
+    code = result.data
+    if show_diff:
+        import difflib
+
+        diff_lines = difflib.unified_diff(
+            source_code.splitlines(keepends=True), code.splitlines(keepends=True), fromfile="stdin", tofile="stdout"
+        )
+        code = "".join(diff_lines)
+    typer.echo(code, nl=False)
+
+
+def _changed_files(
+    source_files: list[str],
+    root_directory: str | None,
+    file_patterns: Any,
+    recurse: Any,
+    since: str | None,
+    staged: bool,
+) -> list[str]:
+    """Return the changed files git reports within the search scope, or exit on git errors."""
+    from .helpers.git_changes import GitChangesError
+
+    patterns = list(file_patterns) if file_patterns else ["test_*.py"]
+    try:
+        files = validate_source_files_with_patterns(
+            source_files,
+            root_directory,
+            patterns,
+            recurse,
+            changed_since=since,
+            staged=staged,
+        )
+    except GitChangesError as e:
+        typer.echo(f"Error: cannot list changed files: {e}", err=True)
+        raise typer.Exit(code=1) from None
+    logger.info(f"git reports {len(files)} changed files matching {patterns}")
+    return files
+
+
+@app.command("analyze")
+def analyze_cmd(
+    source_files: list[str] = typer.Argument(None, help="Source files or directories to analyze"),
+    root_directory: str | None = typer.Option(None, "--dir", "-d", help="Root directory for input files"),
+    file_patterns: list[str] = typer.Option(
+        ["test_*.py"], "--file", "-f", help="Glob patterns for input files (repeatable)"
+    ),
+    recurse: bool = typer.Option(True, "--recurse", "-r", help="Recurse directories when searching for files"),
+    changed_since: str | None = typer.Option(
+        None, "--since", help="Only analyze files git reports as changed since this ref that match -f patterns"
+    ),
+    staged: bool = typer.Option(
+        False, "--staged", help="Only analyze files with staged git changes that match -f patterns", is_flag=True
+    ),
+    workers: int = typer.Option(0, "--workers", "-w", help="Worker processes (0 = one per CPU, 1 = in-process)"),
+    test_method_prefixes: list[str] = typer.Option(
+        ["test", "spec", "should", "it"], "--prefix", help="Test method prefixes (repeatable)"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the full analysis as JSON", is_flag=True),
+) -> None:
+    """Report migration readiness without transforming, formatting or writing files.
+
+    Args:
+        source_files: Files or directories to analyze. Directories are
+            searched with ``file_patterns``.
+        root_directory: Additional root directory searched with ``file_patterns``.
+        file_patterns: Glob patterns used when searching directories.
+        recurse: Whether directory searches recurse.
+        changed_since: Only analyze files changed since this git ref.
+        staged: Only analyze files with staged git changes.
+        workers: Worker process count (0 = one per CPU, 1 = in-process).
+        test_method_prefixes: Prefixes identifying test methods.
+        as_json: Print the analysis as JSON instead of a summary.
+    """
+    import json
+
+    from typer.models import OptionInfo
+
+    if isinstance(workers, OptionInfo):
+        workers = int(workers.default)
+
+    paths = list(source_files or [])
+    since_ref = changed_since or None
+    if since_ref is not None or staged:
+        files = _changed_files(paths, root_directory, file_patterns, recurse, since_ref, staged)
+        if not files:
+            typer.echo("No changed files to analyze.")
+            return
+    else:
+        files = validate_source_files_with_patterns(
+            [p for p in paths if not os.path.isdir(p)], root_directory, file_patterns, recurse
+        )
+        for directory in (p for p in paths if os.path.isdir(p)):
+            files += [
+                f for f in validate_source_files_with_patterns([], directory, file_patterns, recurse) if f not in files
+            ]
+    if not files:
+        typer.echo("No files found to analyze.")
+        raise typer.Exit(code=1)
+
+    config = MigrationConfig(test_method_prefixes=list(test_method_prefixes))
+    result = _lazy("main_module").analyze(files, config, workers=int(workers))
+    if result.is_error() or result.data is None:
+        typer.echo(f"Analysis failed: {result.error}")
+        raise typer.Exit(code=1)
+
+    analysis = result.data
+    if as_json:
+        typer.echo(json.dumps(analysis.to_dict(), indent=2))
+        return
+
+    summary = analysis.to_dict()["summary"]
+    typer.echo(
+        f"Analyzed {summary['files']} files ({summary['lines']:,} lines) in {summary['elapsed_seconds']:.2f}s "
+        f"with {summary['workers']} worker(s)"
+    )
+    typer.echo(f"  unittest files:   {summary['unittest_files']}")
+    typer.echo(f"  test classes:     {summary['test_classes']}")
+    typer.echo(f"  test methods:     {summary['test_methods']}")
+    typer.echo(f"  assertions:       {sum(summary['assertions'].values())}")
+    for name, count in summary["assertions"].items():
+        typer.echo(f"    {name:<22} {count}")
+    typer.echo(f"  fixtures:         {summary['fixtures']}")
+    typer.echo(f"  subTests:         {summary['subtests']}")
+    typer.echo(f"  unsupported:      {sum(summary['unsupported'].values())}")
+    for name, count in summary["unsupported"].items():
+        typer.echo(f"    {name:<22} {count}")
+    if analysis.failed_files:
+        typer.echo(f"  failed to parse:  {len(analysis.failed_files)}")
+        for failed in analysis.failed_files:
+            typer.echo(f"    {failed.path}: {failed.error}")
+    typer.echo(f"Estimated manual effort: {summary['effort_hours']:.1f} hours")
+
+
+@app.command("serve")
+def serve_cmd(
+    socket_path: str | None = typer.Option(
+        None, "--socket", help="Unix socket to listen on (default: per-user socket in the temp directory)"
+    ),
+    config_file: str | None = typer.Option(
+        None, "--config", "-c", help="YAML configuration used as the base for every request"
+    ),
+    warm_up: bool = typer.Option(True, "--warm-up/--no-warm-up", help="Load the migration engine before serving"),
+) -> None:
+    """Run a migration daemon that keeps the engine and caches warm.
+
+    Requests are JSON lines sent over a Unix domain socket (see
+    ``splurge_unittest_to_pytest.daemon``); ``client`` is the matching
+    command-line client. Stop the daemon with ``client --shutdown``.
+    """
+    from .daemon import MigrationDaemon
+
+    base_config = MigrationConfig()
+    if config_file:
+        config_result = ContextManager.load_config_from_file(config_file)
+        if not config_result.is_success() or config_result.data is None:
+            typer.echo(f"Error loading configuration: {config_result.error}")
+            raise typer.Exit(code=1)
+        base_config = config_result.data
+
+    daemon = MigrationDaemon(socket_path, base_config)
+    try:
+        daemon.start(warm_up=warm_up)
+    except (RuntimeError, OSError) as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Exit(code=1) from None
+    typer.echo(f"Serving on {daemon.socket_path}")
+    daemon.serve_forever()
+
+
+@app.command("client")
+def client_cmd(
+    source_files: list[str] | None = typer.Argument(None, help="Files to migrate"),
+    socket_path: str | None = typer.Option(None, "--socket", help="Socket of the daemon started with `serve`"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Print converted code instead of writing", is_flag=True),
+    suffix: str | None = typer.Option(None, "--suffix", help="Suffix appended to the target filename stem"),
+    ping: bool = typer.Option(False, "--ping", help="Report whether a daemon is running", is_flag=True),
+    shutdown: bool = typer.Option(False, "--shutdown", help="Stop the running daemon", is_flag=True),
+) -> None:
+    """Migrate files through a running ``serve`` daemon.
+
+    Falls back to migrating in this process when no daemon is listening.
+    """
+    from .daemon import run_request, send_request
+
+    if ping or shutdown:
+        response = send_request({"op": "shutdown" if shutdown else "ping"}, socket_path, timeout=5.0)
+        if response is None:
+            typer.echo("No daemon is running.")
+            raise typer.Exit(code=1)
+        if response.get("status") == "error":
+            typer.echo(f"Daemon error: {response.get('error')}", err=True)
+            raise typer.Exit(code=1)
+        typer.echo("Daemon stopped." if shutdown else f"Daemon running: {response}")
+        return
+
+    overrides: dict[str, object] = {"dry_run": dry_run}
+    if suffix:
+        overrides["target_suffix"] = suffix
+    failed = 0
+    for source_file in source_files or []:
+        response = run_request(
+            {"op": "migrate", "source_file": os.path.abspath(source_file), "config": overrides}, socket_path
+        )
+        if response.get("status") == "error":
+            failed += 1
+            typer.echo(f"{source_file}: {response.get('error')}", err=True)
+        elif dry_run and response.get("generated_code") is not None:
+            typer.echo(response["generated_code"])
+        else:
+            served = f"{response['served_by']}, {response['elapsed_ms']} ms"
+            typer.echo(f"{source_file} -> {response.get('data')} ({served})")
+    if failed:
+        raise typer.Exit(code=1)
+
+
 @app.command("version")
 def version() -> None:
     """Show the version of splurge-unittest-to-pytest."""
@@ -635,6 +999,8 @@ def version() -> None:
 @app.command("templates")
 def list_templates_cmd() -> None:
     """List available configuration templates."""
+    list_available_templates = _lazy("list_available_templates")
+    get_template = _lazy("get_template")
     templates = list_available_templates()
     typer.echo("Available configuration templates:")
     for template in templates:
@@ -647,7 +1013,7 @@ def list_templates_cmd() -> None:
 @app.command("template-info")
 def template_info(template_name: str = typer.Argument(..., help="Name of the template to show info for")) -> None:
     """Show detailed information about a specific template."""
-    template = get_template(template_name)
+    template = _lazy("get_template")(template_name)
     if template:
         typer.echo(f"Template: {template.name}")
         typer.echo(f"Description: {template.description}")
@@ -658,7 +1024,7 @@ def template_info(template_name: str = typer.Argument(..., help="Name of the tem
         typer.echo(f"splurge-unittest-to-pytest migrate {template.to_cli_args()}")
     else:
         typer.echo(f"Error: Template '{template_name}' not found.")
-        available = list_available_templates()
+        available = _lazy("list_available_templates")()
         typer.echo(f"Available templates: {', '.join(available)}")
 
 
@@ -667,7 +1033,7 @@ def field_help_cmd(
     field_name: str = typer.Argument(..., help="Name of the configuration field to get help for"),
 ) -> None:
     """Show help for a specific configuration field."""
-    help_text = get_field_help(field_name)
+    help_text = _lazy("get_field_help")(field_name)
     typer.echo(help_text)
 
 
@@ -682,7 +1048,7 @@ def generate_docs_cmd(
         raise typer.Exit(code=1)
 
     typer.echo(f"Generating {format} documentation...")
-    docs = generate_configuration_documentation(format)
+    docs = _lazy("generate_configuration_documentation")(format)
 
     if output_file:
         with open(output_file, "w", encoding="utf-8") as f:
@@ -785,10 +1151,12 @@ def init_config(
         "fail_fast": default_config.get("fail_fast"),
         "continue_on_error": default_config.get("continue_on_error"),
         "max_concurrent_files": default_config.get("max_concurrent_files"),
+        "pipeline_mode": default_config.get("pipeline_mode"),
         "# Reporting settings": None,
         "verbose": default_config.get("verbose"),
         "generate_report": default_config.get("generate_report"),
         "report_format": default_config.get("report_format"),
+        "report_path": default_config.get("report_path"),
         "# Test discovery settings": None,
         "file_patterns": default_config.get("file_patterns"),
         "recurse_directories": default_config.get("recurse_directories"),
@@ -806,10 +1174,12 @@ def init_config(
         "transform_imports": default_config.get("transform_imports"),
         "# Processing options": None,
         "cache_analysis_results": default_config.get("cache_analysis_results"),
+        "decision_model_dir": default_config.get("decision_model_dir"),
         "# Advanced options": None,
         "preserve_file_encoding": default_config.get("preserve_file_encoding"),
         "create_source_map": default_config.get("create_source_map"),
         "max_depth": default_config.get("max_depth"),
+        "parametrize_table_threshold": default_config.get("parametrize_table_threshold"),
         "# Enhanced validation features": None,
         "show_suggestions": False,
         "use_case_analysis": False,
@@ -864,7 +1234,8 @@ def error_recovery_cmd(
     import json
 
     # Initialize error reporter
-    reporter = ErrorReporter()
+    ErrorCategory = _lazy("ErrorCategory")
+    reporter = _lazy("ErrorReporter")()
 
     # Parse category
     if category == "auto":
@@ -901,7 +1272,7 @@ def error_recovery_cmd(
             typer.echo(f"Warning: Invalid JSON context: {e}. Using empty context.")
 
     # Create SmartError for analysis
-    smart_error = SmartError(message=error_message, category=error_category, context=context_dict)
+    smart_error = _lazy("SmartError")(message=error_message, category=error_category, context=context_dict)
 
     # Generate suggestions
     suggestions = reporter.suggestion_engine.generate_suggestions(smart_error)
@@ -980,14 +1351,14 @@ def configure_cmd(
     typer.echo("This wizard will analyze your project and help create an optimal configuration.")
 
     # Initialize components
-    analyzer = ProjectAnalyzer()
-    builder = InteractiveConfigBuilder()
+    analyzer = _lazy("ProjectAnalyzer")()
+    builder = _lazy("InteractiveConfigBuilder")()
 
     # Initialize manager with required components
-    manager = IntegratedConfigurationManager()
+    manager = _lazy("IntegratedConfigurationManager")()
 
-    manager.analyzer = ConfigurationUseCaseDetector()
-    manager.advisor = ConfigurationAdvisor()
+    manager.analyzer = _lazy("ConfigurationUseCaseDetector")()
+    manager.advisor = _lazy("ConfigurationAdvisor")()
 
     # Analyze project
     typer.echo(f"\nAnalyzing project in: {project_root}")
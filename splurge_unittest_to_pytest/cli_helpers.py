@@ -10,6 +10,7 @@ from typing import Any
 
 from .context import MigrationConfig
 from .events import EventBus
+from .helpers.source_io import read_source
 
 
 def setup_logging(debug_mode: bool = False) -> None:
@@ -57,8 +58,7 @@ def detect_test_prefixes_from_files(source_files: list[str]) -> list[str]:
 
     for file_path in source_files:
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
+            content = read_source(file_path).text
 
             # Look for test methods
             import re
@@ -158,8 +158,25 @@ def validate_source_files_with_patterns(
     root_directory: str | None,
     file_patterns: list[str],
     recurse: bool = True,
+    changed_since: str | None = None,
+    staged: bool = False,
 ) -> list[str]:
-    """Validate source files with pattern matching."""
+    """Validate source files with pattern matching.
+
+    With ``changed_since`` or ``staged`` the files come from
+    ``git diff --name-only`` instead of globbing, narrowed to the same
+    scope and patterns (see :mod:`splurge_unittest_to_pytest.helpers.git_changes`).
+
+    Raises:
+        GitChangesError: If git cannot report the changed files.
+    """
+    if changed_since or staged:
+        from .helpers.git_changes import changed_python_files, filter_changed_files
+
+        cwd = root_directory if root_directory and os.path.isdir(root_directory) else None
+        changed = changed_python_files(since=changed_since, staged=staged, cwd=cwd)
+        return filter_changed_files(changed, source_files, root_directory, file_patterns, recurse)
+
     import glob
 
     valid_files = []
@@ -539,6 +539,27 @@ class ConfigurationMetadataRegistry:
             )
         )
 
+        self._add_field(
+            ConfigurationField(
+                name="pipeline_mode",
+                type="str",
+                description="How multi-file runs execute: one file at a time, or with the jobs as stages "
+                "connected by bounded queues so reads and writes overlap transformation.",
+                examples=["sequential", "staged"],
+                constraints=["Must be one of: sequential, staged"],
+                related_fields=["max_concurrent_files"],
+                common_mistakes=[
+                    "Expecting staged mode to speed up single-file runs",
+                    "Expecting more transform throughput from extra workers (transforms share the GIL)",
+                ],
+                default_value="sequential",
+                category="Processing Options",
+                importance="optional",
+                cli_flag="--pipeline-mode",
+                environment_variable="SPLURGE_PIPELINE_MODE",
+            )
+        )
+
         self._add_field(
             ConfigurationField(
                 name="cache_analysis_results",
@@ -546,7 +567,7 @@ class ConfigurationMetadataRegistry:
                 description="Whether to cache analysis results for improved performance.",
                 examples=["true", "false"],
                 constraints=[],
-                related_fields=[],
+                related_fields=["decision_model_dir"],
                 common_mistakes=[
                     "Disabling when you have repeated runs on same files",
                     "Not understanding this improves performance for large codebases",
@@ -559,6 +580,29 @@ class ConfigurationMetadataRegistry:
             )
         )
 
+        self._add_field(
+            ConfigurationField(
+                name="decision_model_dir",
+                type="str | None",
+                description=(
+                    "Directory where decision models are stored in a compact binary format. A stored model "
+                    "whose source path and contents match is loaded instead of re-running decision analysis."
+                ),
+                examples=["./.splurge/models", "/tmp/splurge-models"],
+                constraints=["Must be writable if specified", "Only used when cache_analysis_results=True"],
+                related_fields=["cache_analysis_results"],
+                common_mistakes=[
+                    "Disabling cache_analysis_results, which turns stored models off",
+                    "Placing the directory inside a tree scanned for test files",
+                ],
+                default_value=None,
+                category="Processing Options",
+                importance="optional",
+                cli_flag="--decision-model-dir",
+                environment_variable="SPLURGE_DECISION_MODEL_DIR",
+            )
+        )
+
         # Advanced options
         self._add_field(
             ConfigurationField(
@@ -604,14 +648,14 @@ class ConfigurationMetadataRegistry:
             ConfigurationField(
                 name="max_depth",
                 type="int",
-                description="Maximum depth to traverse nested control flow structures.",
-                examples=["7", "5", "10"],
+                description=(
+                    "Deprecated and ignored: nested control flow is transformed at any depth. "
+                    "Still accepted so existing configurations keep working."
+                ),
+                examples=["7"],
                 constraints=["Must be between 3-15"],
                 related_fields=[],
-                common_mistakes=[
-                    "Setting too low causing incomplete transformations",
-                    "Setting too high causing performance issues",
-                ],
+                common_mistakes=["Expecting a lower value to limit how deeply nested blocks are transformed"],
                 default_value=7,
                 category="Advanced Options",
                 importance="optional",
@@ -649,7 +693,12 @@ class ConfigurationMetadataRegistry:
                 description="Whether to convert unittest subTests to pytest parametrize.",
                 examples=["true", "false"],
                 constraints=[],
-                related_fields=["transform_subtests", "parametrize_ids", "parametrize_type_hints"],
+                related_fields=[
+                    "transform_subtests",
+                    "parametrize_ids",
+                    "parametrize_type_hints",
+                    "parametrize_table_threshold",
+                ],
                 common_mistakes=[
                     "Disabling when you want subTest conversion",
                     "Not understanding parametrize vs subTest differences",
@@ -702,6 +751,28 @@ class ConfigurationMetadataRegistry:
             )
         )
 
+        self._add_field(
+            ConfigurationField(
+                name="parametrize_table_threshold",
+                type="int",
+                description=(
+                    "Row count above which a converted subTest table is emitted as a module-level "
+                    "constant referenced by pytest.mark.parametrize instead of an inline literal."
+                ),
+                examples=["0", "500", "1000"],
+                constraints=["Must be >= 0 (0 keeps every table inline)"],
+                related_fields=["parametrize"],
+                common_mistakes=[
+                    "Setting a very low threshold, which moves small tables away from their tests",
+                ],
+                default_value=0,
+                category="Parametrize Settings",
+                importance="optional",
+                cli_flag="--parametrize-table-threshold",
+                environment_variable="SPLURGE_PARAMETRIZE_TABLE_THRESHOLD",
+            )
+        )
+
         # Degradation settings
         self._add_field(
             ConfigurationField(
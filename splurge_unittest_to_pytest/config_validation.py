@@ -93,13 +93,17 @@ class ValidatedMigrationConfig(BaseModel):
     # Processing options
     continue_on_error: bool = Field(default=False, description="Whether to continue on individual file errors")
     max_concurrent_files: int = Field(default=1, ge=1, le=50, description="Maximum concurrent file processing")
+    pipeline_mode: str = Field(default="sequential", description="Multi-file execution mode (sequential, staged)")
     cache_analysis_results: bool = Field(default=True, description="Whether to cache analysis results")
+    decision_model_dir: str | None = Field(
+        default=None, description="Directory where decision models are stored and reused between runs"
+    )
 
     # Advanced options
     preserve_file_encoding: bool = Field(default=True, description="Whether to preserve original file encoding")
     create_source_map: bool = Field(default=False, description="Whether to create source mapping for debugging")
     max_depth: int = Field(
-        default=7, ge=3, le=15, description="Maximum depth to traverse nested control flow structures"
+        default=7, ge=3, le=15, description="Deprecated and ignored; nested control flow is transformed at any depth"
     )
 
     # Test method patterns
@@ -111,6 +115,9 @@ class ValidatedMigrationConfig(BaseModel):
     parametrize: bool = Field(default=True, description="Whether to convert subTests to parametrize")
     parametrize_ids: bool = Field(default=False, description="Whether to add ids to parametrize")
     parametrize_type_hints: bool = Field(default=False, description="Whether to add type hints to parametrize")
+    parametrize_table_threshold: int = Field(
+        default=0, ge=0, description="Rows above which parametrize tables are emitted as a module-level constant"
+    )
 
     # Degradation settings
     degradation_enabled: bool = Field(
@@ -336,6 +343,18 @@ class ValidatedMigrationConfig(BaseModel):
             )
         return v
 
+    @field_validator("pipeline_mode")
+    @classmethod
+    def validate_pipeline_mode(cls, v):
+        """Validate pipeline mode values."""
+        valid_modes = ["sequential", "staged"]
+        if v not in valid_modes:
+            raise ValueError(
+                f"pipeline_mode must be one of: {', '.join(valid_modes)}, got '{v}'. "
+                "Choose 'staged' to overlap reading and writing files with transformation."
+            )
+        return v
+
     class Config:
         """Pydantic configuration."""
 
@@ -18,8 +18,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from .config_validation import validate_migration_config_object
 from .degradation import DegradationManager
+from .helpers.source_io import source_exists
 from .result import Result
 
 
@@ -121,11 +121,15 @@ class MigrationConfig:
     parametrize: bool = True
     parametrize_ids: bool = True
     parametrize_type_hints: bool = True
+    parametrize_table_threshold: int = 0
+    """Rows above which a parametrize table becomes a module-level constant (0 keeps tables inline)"""
 
     # Reporting settings
     verbose: bool = False
     generate_report: bool = True
     report_format: str = "json"  # json, html, markdown
+    report_path: str | None = None
+    """JSONL report file (default: migration-report.jsonl in target_root or next to the sources)"""
 
     # Test discovery / naming
     test_method_prefixes: list[str] = field(default_factory=lambda: ["test", "spec", "should", "it"])
@@ -161,8 +165,12 @@ class MigrationConfig:
     """Whether to continue processing other files when one fails"""
     max_concurrent_files: int = 1
     """Maximum number of files to process concurrently (1 = sequential)"""
+    pipeline_mode: str = "sequential"
+    """How multi-file runs execute: "sequential" (one file at a time) or "staged" (jobs as queued stages)"""
     cache_analysis_results: bool = True
     """Whether to cache analysis results between runs for improved performance"""
+    decision_model_dir: str | None = None
+    """Directory where decision models are stored and reused between runs (needs cache_analysis_results)"""
 
     # Advanced options
     preserve_file_encoding: bool = True
@@ -170,7 +178,7 @@ class MigrationConfig:
     create_source_map: bool = False
     """Whether to create source mapping for debugging transformations"""
     max_depth: int = 7
-    """Maximum depth to traverse when processing nested control flow structures (3-15)"""
+    """Deprecated and ignored: nested control flow is transformed at any depth (still validated as 3-15)"""
 
     def with_override(self, **kwargs: Any) -> "MigrationConfig":
         """Return a new ``MigrationConfig`` with specified overrides.
@@ -191,6 +199,10 @@ class MigrationConfig:
         Raises:
             ValueError: If configuration is invalid.
         """
+        # Imported here: config_validation pulls in pydantic, which most
+        # callers (and CLI startup) never need
+        from .config_validation import validate_migration_config_object
+
         try:
             validate_migration_config_object(self)
         except Exception as e:
@@ -244,6 +256,7 @@ class PipelineContext:
     metadata: dict[str, Any] = field(default_factory=dict)
     decision_model: Any | None = None  # DecisionModel from analysis job
     degradation_manager: DegradationManager | None = None
+    in_memory: bool = False  # Source is passed as a string; no file on disk
 
     def __post_init__(self) -> None:
         """Perform lightweight validation of the constructed context.
@@ -251,9 +264,9 @@ class PipelineContext:
         Currently this verifies that the configured ``source_file`` exists
         and raises ``ValueError`` when it does not. The check is
         intentionally conservative to catch obvious misconfigurations
-        early in the pipeline.
+        early in the pipeline. In-memory contexts skip the check.
         """
-        if not Path(self.source_file).exists():
+        if not self.in_memory and not source_exists(self.source_file):
             # Do not raise here to allow tests and in-memory analysis to
             # construct PipelineContext objects without an on-disk file.
             # Steps that require a real file should validate existence as
@@ -271,6 +284,7 @@ class PipelineContext:
         target_file: str | None = None,
         config: MigrationConfig | None = None,
         run_id: str | None = None,
+        in_memory: bool = False,
     ) -> "PipelineContext":
         """Construct a ``PipelineContext`` from call-site information.
 
@@ -283,6 +297,9 @@ class PipelineContext:
                 default configuration is created.
             run_id: Optional run identifier; if omitted a UUID is
                 generated.
+            in_memory: When ``True`` the source is supplied as a string and
+                ``source_file`` is only a display name; jobs must not read or
+                write files for this context.
 
         Returns:
             A new ``PipelineContext`` instance.
@@ -301,7 +318,14 @@ class PipelineContext:
         if not run_id:
             run_id = str(uuid.uuid4())
 
-        return cls(source_file=source_file, target_file=target_file, config=config, run_id=run_id, metadata={})
+        return cls(
+            source_file=source_file,
+            target_file=target_file,
+            config=config,
+            run_id=run_id,
+            metadata={},
+            in_memory=in_memory,
+        )
 
     def with_metadata(self, key: str, value: Any) -> "PipelineContext":
         """Return a new context with an additional metadata entry.
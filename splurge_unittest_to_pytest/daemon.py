@@ -0,0 +1,425 @@
+"""Long-running migration daemon and its thin client.
+
+Pre-commit hooks and editor integrations run the tool once per file, and
+each run pays for importing libcst, black and isort and for building a
+``MigrationOrchestrator``. :class:`MigrationDaemon` does that work once and
+then serves JSON requests over a Unix domain socket. The orchestrator, the
+formatter imports and the process-wide analysis caches stay warm between
+requests.
+
+The protocol is one JSON object per line. A client connects, sends one
+request line and reads one response line. Requests:
+
+* ``{"op": "ping"}``: the daemon's pid, version and request count.
+* ``{"op": "migrate", "source_file": PATH, "config": {...}}``: migrate a
+  file. ``config`` holds ``MigrationConfig`` field overrides applied on
+  top of the daemon's base configuration.
+* ``{"op": "migrate", "code": SOURCE, "config": {...}}``: convert inline
+  source in memory and return the generated code without touching the
+  filesystem.
+* ``{"op": "shutdown"}``: stop the daemon.
+
+:func:`run_request` sends a request to the daemon and falls back to
+handling it in the calling process when no daemon is listening, so callers
+never depend on one running. Once a request has been sent it is never
+re-run in-process: a daemon that times out or drops the connection yields
+an error response instead.
+
+The default socket lives in ``$XDG_RUNTIME_DIR`` or, without one, in a
+per-user ``0700`` directory under the temp directory. The daemon creates
+the socket with mode ``0600``, and the client only connects to a socket
+owned by the current user.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+import getpass
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .context import MigrationConfig
+
+if TYPE_CHECKING:
+    from .migration_orchestrator import MigrationOrchestrator
+
+__all__ = [
+    "SOCKET_ENV_VAR",
+    "MigrationDaemon",
+    "RequestHandler",
+    "default_socket_path",
+    "run_request",
+    "send_request",
+]
+
+_logger = logging.getLogger(__name__)
+
+SOCKET_ENV_VAR = "SPLURGE_UNITTEST_TO_PYTEST_SOCKET"
+"""Environment variable overriding the default socket path."""
+
+_MAX_CACHED_CONFIGS = 32
+_WARMUP_SOURCE = """\
+import unittest
+
+
+class TestWarmup(unittest.TestCase):
+    def setUp(self):
+        self.value = 1
+
+    def test_value(self):
+        for item in [1, 2]:
+            with self.subTest(item=item):
+                self.assertEqual(self.value, 1)
+"""
+
+
+def default_socket_path() -> Path:
+    """Return the daemon socket path.
+
+    This is ``$SPLURGE_UNITTEST_TO_PYTEST_SOCKET`` when set, otherwise
+    ``splurge-unittest-to-pytest.sock`` in ``$XDG_RUNTIME_DIR`` or, without
+    one, in the private per-user directory :func:`_fallback_socket_dir`.
+    """
+    configured = os.environ.get(SOCKET_ENV_VAR)
+    if configured:
+        return Path(configured)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    directory = Path(runtime_dir) if runtime_dir and os.path.isdir(runtime_dir) else _fallback_socket_dir()
+    return directory / "splurge-unittest-to-pytest.sock"
+
+
+def _fallback_socket_dir() -> Path:
+    """Per-user socket directory in the shared temp directory; it must be private (``0700``)."""
+    user = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+    return Path(tempfile.gettempdir()) / f"splurge-unittest-to-pytest-{user}"
+
+
+def _owned_by_current_user(path: Path, *, private: bool = False) -> bool:
+    """Whether ``path`` is owned by the current user (and, with ``private``, has no group/other access).
+
+    Raises:
+        FileNotFoundError: If ``path`` does not exist.
+    """
+    info = os.stat(path)
+    if not hasattr(os, "getuid"):
+        return True
+    if info.st_uid != os.getuid():
+        return False
+    return not private or stat.S_IMODE(info.st_mode) & 0o077 == 0
+
+
+def _socket_is_trusted(path: Path) -> bool:
+    """Whether the client may connect to ``path``: the socket (and a temp-dir parent) belong to this user.
+
+    Raises:
+        FileNotFoundError: If ``path`` does not exist.
+    """
+    if path.parent == _fallback_socket_dir() and not _owned_by_current_user(path.parent, private=True):
+        return False
+    return _owned_by_current_user(path)
+
+
+class RequestHandler:
+    """Handle daemon requests with one warm orchestrator.
+
+    The same handler serves requests inside the daemon and in-process when
+    no daemon is running, so both paths return identical responses.
+    """
+
+    def __init__(self, base_config: MigrationConfig | None = None) -> None:
+        """Create the handler.
+
+        Args:
+            base_config: Configuration that request overrides are applied to.
+        """
+        self.base_config = base_config or MigrationConfig()
+        self.requests_handled = 0
+        self._orchestrator: MigrationOrchestrator | None = None
+        self._configs: dict[str, MigrationConfig] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def orchestrator(self) -> MigrationOrchestrator:
+        """The orchestrator, created on first use."""
+        if self._orchestrator is None:
+            from .migration_orchestrator import MigrationOrchestrator
+
+            self._orchestrator = MigrationOrchestrator()
+        return self._orchestrator
+
+    def warm_up(self) -> float:
+        """Import the migration engine and formatters and fill caches.
+
+        Returns:
+            Seconds spent warming up.
+        """
+        start = time.perf_counter()
+        self.handle({"op": "migrate", "code": _WARMUP_SOURCE})
+        self.requests_handled = 0
+        return time.perf_counter() - start
+
+    def config_for(self, overrides: dict[str, Any] | None) -> MigrationConfig:
+        """Return the base configuration with ``overrides`` applied (cached).
+
+        Raises:
+            ValueError: If an override names an unknown field or the result
+                is not a valid configuration.
+        """
+        if not overrides:
+            return self.base_config
+        key = json.dumps(overrides, sort_keys=True, default=str)
+        config = self._configs.get(key)
+        if config is None:
+            unknown = sorted(set(overrides) - set(MigrationConfig.__dataclass_fields__))
+            if unknown:
+                raise ValueError(f"Unknown configuration fields: {', '.join(unknown)}")
+            config = MigrationConfig.from_dict({**self.base_config.to_dict(), **overrides})
+            if len(self._configs) >= _MAX_CACHED_CONFIGS:
+                self._configs.pop(next(iter(self._configs)))
+            self._configs[key] = config
+        return config
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Handle one request and return the JSON-serializable response."""
+        start = time.perf_counter()
+        op = request.get("op")
+        with self._lock:
+            self.requests_handled += 1
+            try:
+                if op == "ping":
+                    response = self._ping()
+                elif op == "migrate":
+                    response = self._migrate(request)
+                else:
+                    response = {"status": "error", "error": f"Unknown op: {op!r}"}
+            except (ValueError, TypeError, OSError) as e:
+                response = {"status": "error", "error": str(e)}
+        response["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return response
+
+    def _ping(self) -> dict[str, Any]:
+        from . import __version__
+
+        return {"status": "success", "pid": os.getpid(), "version": __version__, "requests": self.requests_handled}
+
+    def _migrate(self, request: dict[str, Any]) -> dict[str, Any]:
+        config = self.config_for(request.get("config"))
+        code = request.get("code")
+        if code is not None:
+            if not isinstance(code, str):
+                raise TypeError("'code' must be a string")
+            filename = request.get("filename")
+            name = filename if isinstance(filename, str) and filename else "<inline>"
+            result = self.orchestrator.transform_source(code, config, source_name=name)
+            generated_code = result.data if result.is_success() else None
+            data = None
+        else:
+            source_file = request.get("source_file")
+            if not isinstance(source_file, str):
+                raise ValueError("migrate needs 'source_file' or 'code'")
+            result = self.orchestrator.migrate_file(source_file, config)
+            metadata = result.metadata if isinstance(result.metadata, dict) else {}
+            generated_code = metadata.get("generated_code")
+            data = result.data
+
+        return {
+            "status": result.status.value,
+            "data": data,
+            "generated_code": generated_code,
+            "warnings": list(result.warnings or []),
+            "error": str(result.error) if result.error is not None else None,
+        }
+
+
+class _StreamHandler(socketserver.StreamRequestHandler):
+    server: _DaemonServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            response: dict[str, Any] = {"status": "error", "error": f"Invalid request: {e}"}
+        else:
+            if request.get("op") == "shutdown":
+                response = {"status": "success"}
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                response = self.server.request_handler.handle(request)
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class _DaemonServer(socketserver.UnixStreamServer):
+        def __init__(self, path: str, request_handler: RequestHandler) -> None:
+            self.request_handler = request_handler
+            super().__init__(path, _StreamHandler)
+
+else:  # pragma: no cover - platforms without Unix domain sockets
+    _DaemonServer = None  # type: ignore[assignment,misc]
+
+
+class MigrationDaemon:
+    """Serve migration requests over a Unix domain socket.
+
+    Requests are handled one at a time by a single :class:`RequestHandler`,
+    which keeps the orchestrator and caches warm.
+    """
+
+    def __init__(self, socket_path: str | Path | None = None, base_config: MigrationConfig | None = None) -> None:
+        """Create the daemon.
+
+        Args:
+            socket_path: Socket to listen on (default: :func:`default_socket_path`).
+            base_config: Configuration request overrides are applied to.
+        """
+        self.socket_path = Path(socket_path) if socket_path is not None else default_socket_path()
+        self.handler = RequestHandler(base_config)
+        self._server: Any = None
+
+    def start(self, warm_up: bool = True) -> None:
+        """Bind the socket (replacing a stale one) and optionally warm up.
+
+        Raises:
+            RuntimeError: If Unix domain sockets are unavailable or another
+                daemon is already listening on the socket.
+        """
+        if _DaemonServer is None:
+            raise RuntimeError("The daemon needs Unix domain socket support")
+        directory = self.socket_path.parent
+        if directory == _fallback_socket_dir():
+            directory.mkdir(mode=0o700, exist_ok=True)
+            if not _owned_by_current_user(directory, private=True):
+                raise RuntimeError(f"{directory} must be owned by the current user and not accessible to others")
+        else:
+            directory.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if not _owned_by_current_user(self.socket_path):
+                raise RuntimeError(f"{self.socket_path} belongs to another user")
+            if send_request({"op": "ping"}, self.socket_path, timeout=1.0) is not None:
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+            self.socket_path.unlink()
+        if warm_up:
+            seconds = self.handler.warm_up()
+            _logger.info(f"Daemon warmed up in {seconds:.2f}s")
+        # Create the socket as 0600 from the start rather than tightening it after bind
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = _DaemonServer(str(self.socket_path), self.handler)
+        finally:
+            os.umask(previous_umask)
+
+    def serve_forever(self) -> None:
+        """Handle requests until a ``shutdown`` request arrives, then clean up."""
+        if self._server is None:
+            self.start()
+        _logger.info(f"Serving on {self.socket_path}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the socket and remove its file."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+
+def send_request(
+    request: dict[str, Any], socket_path: str | Path | None = None, timeout: float | None = 300.0
+) -> dict[str, Any] | None:
+    """Send ``request`` to a running daemon.
+
+    Args:
+        request: Request object (see the module docstring).
+        socket_path: Daemon socket (default: :func:`default_socket_path`).
+        timeout: Socket timeout in seconds.
+
+    Returns:
+        The daemon's response, or ``None`` when no daemon is listening (or
+        the socket belongs to another user). Once connected, failures such
+        as a timeout, a dropped connection or an unreadable reply give an
+        error response, since the daemon may already have acted on the
+        request.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = Path(socket_path) if socket_path is not None else default_socket_path()
+    try:
+        if not _socket_is_trusted(path):
+            _logger.warning(f"Ignoring daemon socket {path}: it is not owned by the current user")
+            return None
+    except FileNotFoundError:
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        try:
+            client.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+        except OSError as e:
+            return {"status": "error", "error": f"Cannot connect to daemon at {path}: {e}"}
+        try:
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with client.makefile("rb") as reader:
+                line = reader.readline()
+        except OSError as e:
+            _logger.debug(f"Daemon request failed: {e}")
+            return {"status": "error", "error": f"Daemon request failed: {e}"}
+    if not line:
+        return {"status": "error", "error": "Daemon closed the connection without a response"}
+    try:
+        response = json.loads(line)
+    except ValueError as e:
+        return {"status": "error", "error": f"Invalid daemon response: {e}"}
+    if not isinstance(response, dict):
+        return {"status": "error", "error": "Invalid daemon response: not a JSON object"}
+    return response
+
+
+_local_handler: RequestHandler | None = None
+
+
+def run_request(request: dict[str, Any], socket_path: str | Path | None = None) -> dict[str, Any]:
+    """Handle ``request`` through the daemon, or in-process when none is running.
+
+    Only a missing daemon triggers the in-process fallback. A request the
+    daemon failed to answer is not run again, so a file is never migrated
+    (and backed up) twice.
+
+    Returns:
+        The response. ``"served_by"`` is ``"daemon"`` or ``"in-process"``.
+    """
+    response = send_request(request, socket_path)
+    if response is not None:
+        response["served_by"] = "daemon"
+        return response
+
+    global _local_handler
+    if _local_handler is None:
+        _local_handler = RequestHandler()
+    response = _local_handler.handle(request)
+    response["served_by"] = "in-process"
+    return response
@@ -11,10 +11,25 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
+import zlib
 from dataclasses import asdict, dataclass, field
+from enum import Enum
 from pathlib import Path
 from typing import Any, Literal, TypedDict
 
+SCHEMA_VERSION = 1
+"""Version of the serialized decision model layout (JSON and binary)."""
+
+BINARY_MAGIC = b"SUTPDM"
+"""Leading bytes of a binary decision model file."""
+
+BINARY_SUFFIX = ".sdm"
+"""File suffix used for binary decision model files."""
+
+_STRATEGIES: tuple[str, ...] = ("parametrize", "subtests", "keep-loop")
+_ITERABLE_ORIGINS: tuple[str | None, ...] = (None, "literal", "name", "call")
+
 
 class Stats(TypedDict):
     total_modules: int
@@ -26,15 +41,60 @@ class Stats(TypedDict):
 
 
 __all__ = [
+    "EvidenceCode",
+    "intern_evidence",
     "CaplogAliasMetadata",
     "FunctionProposal",
     "ClassProposal",
     "ModuleProposal",
     "DecisionModel",
+    "SCHEMA_VERSION",
 ]
 
 
-@dataclass
+class EvidenceCode(str, Enum):
+    """Fixed evidence messages recorded by the decision analysis.
+
+    Members are ``str`` instances, so evidence lists holding them compare,
+    join and serialize exactly like lists of the message text, while every
+    proposal shares one object per message.
+    """
+
+    NO_SUBTEST_LOOPS = "No subTest loops detected"
+    LITERAL_ITERABLE = "Found literal list/tuple iterable"
+    RANGE_CALL = "Found range() call - can parametrize"
+    UNKNOWN_ITERABLE = "Unknown iterable type - use subtests"
+    ALIGNED_PARAMETRIZE = "Aligned to class consensus: parametrize"
+    ALIGNED_SUBTESTS = "Aligned to class consensus: subtests"
+    ALIGNED_KEEP_LOOP = "Aligned to class consensus: keep-loop"
+    MIXED_STRATEGIES = "Changed to subtests due to mixed strategies in class"
+    ACCUMULATOR_PATTERN = "Changed to subtests due to accumulator pattern"
+    CONSERVATIVE = "Changed to subtests for conservative approach"
+
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+_EVIDENCE_BY_TEXT: dict[str, EvidenceCode] = {code.value: code for code in EvidenceCode}
+
+
+def intern_evidence(text: str) -> str:
+    """Return the shared object for an evidence message.
+
+    Known messages map to their :class:`EvidenceCode` member; other
+    messages (which embed names) are interned.
+    """
+    code = _EVIDENCE_BY_TEXT.get(text)
+    if code is not None:
+        return code
+    return sys.intern(text) if type(text) is str else text
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class CaplogAliasMetadata:
     """Metadata about caplog/assertLogs alias usage in a function."""
 
@@ -52,11 +112,12 @@ class CaplogAliasMetadata:
 
     def __post_init__(self) -> None:
         """Validate the metadata after initialization."""
+        self.alias_name = _intern(self.alias_name)  # type: ignore[assignment]
         if not self.used_as_records and not self.used_as_messages:
             logging.warning(f"CaplogAliasMetadata for '{self.alias_name}' has no usage detected")
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionProposal:
     """Proposal for how to transform a specific function."""
 
@@ -81,17 +142,23 @@ class FunctionProposal:
     evidence: list[str] = field(default_factory=list)
     """Evidence and reasoning for this recommendation"""
 
+    def __post_init__(self) -> None:
+        """Share identifier strings and evidence messages between proposals."""
+        self.function_name = _intern(self.function_name)  # type: ignore[assignment]
+        self.loop_var_name = _intern(self.loop_var_name)
+        self.evidence = [intern_evidence(line) for line in self.evidence]
+
     def add_evidence(self, evidence_line: str) -> None:
         """Add evidence for this proposal."""
         if evidence_line not in self.evidence:
-            self.evidence.append(evidence_line)
+            self.evidence.append(intern_evidence(evidence_line))
 
     def is_confident(self) -> bool:
         """Check if this proposal has sufficient evidence."""
         return len(self.evidence) >= 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassProposal:
     """Aggregated proposal for transforming a test class."""
 
@@ -107,6 +174,11 @@ class ClassProposal:
     class_setup_methods: list[str] = field(default_factory=list)
     """SetUp/tearDown methods detected"""
 
+    def __post_init__(self) -> None:
+        """Share the class name and setup method names between proposals."""
+        self.class_name = _intern(self.class_name)  # type: ignore[assignment]
+        self.class_setup_methods = [_intern(name) for name in self.class_setup_methods]  # type: ignore[misc]
+
     def add_function_proposal(self, proposal: FunctionProposal) -> None:
         """Add a function proposal to this class."""
         self.function_proposals[proposal.function_name] = proposal
@@ -120,7 +192,7 @@ class ClassProposal:
         return max(set(strategies), key=strategies.count) if strategies else None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleProposal:
     """Proposal for transforming an entire module."""
 
@@ -151,7 +223,7 @@ class ModuleProposal:
         return all_proposals
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionModel:
     """Complete decision model for a module's transformation."""
 
@@ -162,32 +234,110 @@ class DecisionModel:
         """Add a module proposal to this model."""
         self.module_proposals[proposal.module_name] = proposal
 
-    def save_to_file(self, filepath: str | Path) -> None:
-        """Save the decision model to a JSON file."""
+    def save_to_file(self, filepath: str | Path, fingerprint: str = "") -> None:
+        """Save the decision model to a file.
+
+        Files ending in ``.json`` are written as compact JSON; any other
+        suffix (normally :data:`BINARY_SUFFIX`) uses the binary encoding from
+        :meth:`to_bytes`. Both formats round-trip every proposal field.
+
+        Args:
+            filepath: Destination path; parent directories are created.
+            fingerprint: Optional identifier of the analyzed source stored
+                alongside the model (see :meth:`from_bytes`).
+        """
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert dataclasses to dict for JSON serialization
-        data = {
-            "module_proposals": {
-                name: self._proposal_to_dict(proposal) for name, proposal in self.module_proposals.items()
+        if filepath.suffix.lower() == ".json":
+            data = {
+                "schema_version": SCHEMA_VERSION,
+                "fingerprint": fingerprint,
+                "module_proposals": {
+                    name: self._proposal_to_dict(proposal) for name, proposal in self.module_proposals.items()
+                },
             }
-        }
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        else:
+            filepath.write_bytes(self.to_bytes(fingerprint))
 
     def load_from_file(self, filepath: str | Path) -> None:
-        """Load a decision model from a JSON file."""
-        filepath = Path(filepath)
+        """Load a decision model saved by :meth:`save_to_file`.
+
+        The format is detected from the file contents, so binary and JSON
+        files can be loaded regardless of their suffix.
+
+        Raises:
+            ValueError: If the file was written with an unsupported schema
+                version or is not a decision model.
+        """
+        raw = Path(filepath).read_bytes()
+
+        if raw.startswith(BINARY_MAGIC):
+            self.module_proposals = type(self).from_bytes(raw).module_proposals
+            return
 
-        with open(filepath, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(raw.decode("utf-8"))
+        version = data.get("schema_version", 0)
+        if version > SCHEMA_VERSION:
+            raise ValueError(f"Unsupported decision model schema version {version} (expected <= {SCHEMA_VERSION})")
 
         self.module_proposals = {
             name: self._dict_to_proposal(data["module_proposals"][name]) for name in data["module_proposals"]
         }
 
+    def to_bytes(self, fingerprint: str = "") -> bytes:
+        """Encode the model in the compact binary format.
+
+        The payload is ``BINARY_MAGIC``, a two-byte big-endian schema
+        version and a zlib-compressed JSON array in which every proposal is
+        a positional row and strategies and iterable origins are small
+        integer codes.
+
+        Args:
+            fingerprint: Optional identifier of the analyzed source.
+
+        Returns:
+            The encoded model.
+        """
+        payload = [fingerprint, [_encode_module(name, proposal) for name, proposal in self.module_proposals.items()]]
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return BINARY_MAGIC + SCHEMA_VERSION.to_bytes(2, "big") + zlib.compress(body, 6)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, fingerprint: str | None = None) -> DecisionModel:
+        """Decode a model produced by :meth:`to_bytes`.
+
+        Args:
+            data: Encoded model.
+            fingerprint: When given, the stored fingerprint must match.
+
+        Returns:
+            The decoded ``DecisionModel``.
+
+        Raises:
+            ValueError: If the data is not a binary decision model, uses a
+                different schema version, or its fingerprint does not match.
+        """
+        header = len(BINARY_MAGIC)
+        if not data.startswith(BINARY_MAGIC) or len(data) < header + 2:
+            raise ValueError("Data is not a binary decision model")
+        version = int.from_bytes(data[header : header + 2], "big")
+        if version != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported decision model schema version {version} (expected {SCHEMA_VERSION})")
+
+        try:
+            stored_fingerprint, modules = json.loads(zlib.decompress(data[header + 2 :]))
+            if fingerprint is None or stored_fingerprint == fingerprint:
+                module_proposals = dict(_decode_module(row) for row in modules)
+        except (zlib.error, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Corrupt decision model data: {e}") from e
+        if fingerprint is not None and stored_fingerprint != fingerprint:
+            raise ValueError("Decision model fingerprint does not match")
+
+        return cls(module_proposals=module_proposals)
+
     def _proposal_to_dict(self, proposal: ModuleProposal) -> dict:
         """Convert a ModuleProposal to dict for JSON serialization."""
         return {
@@ -210,10 +360,20 @@ class DecisionModel:
 
     def _dict_to_proposal(self, data: dict) -> ModuleProposal:
         """Convert dict back to ModuleProposal."""
-        # This is a simplified reconstruction - in practice we'd want more robust deserialization
         return ModuleProposal(
             module_name=data["module_name"],
-            class_proposals={},  # Simplified for now
+            class_proposals={
+                name: ClassProposal(
+                    class_name=class_data["class_name"],
+                    function_proposals={
+                        fname: _function_from_dict(func_data)
+                        for fname, func_data in class_data.get("function_proposals", {}).items()
+                    },
+                    class_fixtures=list(class_data.get("class_fixtures", [])),
+                    class_setup_methods=list(class_data.get("class_setup_methods", [])),
+                )
+                for name, class_data in data.get("class_proposals", {}).items()
+            },
             module_fixtures=data.get("module_fixtures", []),
             module_imports=data.get("module_imports", []),
             top_level_assignments=data.get("top_level_assignments", {}),
@@ -337,3 +497,91 @@ class DecisionModel:
                 lines.append(f"      {class_name}: {len(class_prop.function_proposals)} functions")
 
         return "\n".join(lines)
+
+
+def _function_from_dict(data: dict[str, Any]) -> FunctionProposal:
+    """Rebuild a FunctionProposal from its ``asdict`` form."""
+    return FunctionProposal(
+        function_name=data["function_name"],
+        recommended_strategy=data["recommended_strategy"],
+        loop_var_name=data.get("loop_var_name"),
+        iterable_origin=data.get("iterable_origin"),
+        accumulator_mutated=bool(data.get("accumulator_mutated", False)),
+        caplog_aliases=[CaplogAliasMetadata(**alias) for alias in data.get("caplog_aliases", [])],
+        evidence=list(data.get("evidence", [])),
+    )
+
+
+# Binary rows. Each proposal is a positional list; dictionary keys are stored
+# explicitly so models whose keys differ from the proposal names round-trip.
+
+
+def _encode_function(name: str, proposal: FunctionProposal) -> list[Any]:
+    return [
+        name,
+        proposal.function_name,
+        _STRATEGIES.index(proposal.recommended_strategy),
+        proposal.loop_var_name,
+        _ITERABLE_ORIGINS.index(proposal.iterable_origin),
+        1 if proposal.accumulator_mutated else 0,
+        [
+            [alias.alias_name, 1 if alias.used_as_records else 0, 1 if alias.used_as_messages else 0, alias.locations]
+            for alias in proposal.caplog_aliases
+        ],
+        proposal.evidence,
+    ]
+
+
+def _decode_function(row: list[Any]) -> tuple[str, FunctionProposal]:
+    name, function_name, strategy, loop_var_name, origin, accumulator, aliases, evidence = row
+    return name, FunctionProposal(
+        function_name=function_name,
+        recommended_strategy=_STRATEGIES[strategy],  # type: ignore[arg-type]
+        loop_var_name=loop_var_name,
+        iterable_origin=_ITERABLE_ORIGINS[origin],  # type: ignore[arg-type]
+        accumulator_mutated=bool(accumulator),
+        caplog_aliases=[
+            CaplogAliasMetadata(alias_name, bool(records), bool(messages), locations)
+            for alias_name, records, messages, locations in aliases
+        ],
+        evidence=evidence,
+    )
+
+
+def _encode_module(name: str, proposal: ModuleProposal) -> list[Any]:
+    return [
+        name,
+        proposal.module_name,
+        [
+            [
+                class_key,
+                class_prop.class_name,
+                [_encode_function(fname, func) for fname, func in class_prop.function_proposals.items()],
+                class_prop.class_fixtures,
+                class_prop.class_setup_methods,
+            ]
+            for class_key, class_prop in proposal.class_proposals.items()
+        ],
+        proposal.module_fixtures,
+        proposal.module_imports,
+        proposal.top_level_assignments,
+    ]
+
+
+def _decode_module(row: list[Any]) -> tuple[str, ModuleProposal]:
+    name, module_name, classes, module_fixtures, module_imports, assignments = row
+    return name, ModuleProposal(
+        module_name=module_name,
+        class_proposals={
+            class_key: ClassProposal(
+                class_name=class_name,
+                function_proposals=dict(_decode_function(func_row) for func_row in functions),
+                class_fixtures=class_fixtures,
+                class_setup_methods=class_setup_methods,
+            )
+            for class_key, class_name, functions, class_fixtures, class_setup_methods in classes
+        },
+        module_fixtures=module_fixtures,
+        module_imports=module_imports,
+        top_level_assignments=assignments,
+    )
@@ -4,6 +4,7 @@ This module provides robust detection of unittest files using AST analysis
 rather than string heuristics, eliminating false positives and negatives.
 """
 
+from .file_classifier import FileClassification, classify_file, classify_source
 from .unittest_detector import UnittestFileDetector
 
-__all__ = ["UnittestFileDetector"]
+__all__ = ["FileClassification", "UnittestFileDetector", "classify_file", "classify_source"]
@@ -0,0 +1,130 @@
+"""Cheap classification of files before migration.
+
+Running a file through decision analysis, the CST transform and the
+formatters costs the same whether or not anything in it will change.
+:func:`classify_file` decides with one ``ast`` parse whether a file is a
+migration candidate at all: it is when :class:`UnittestFileDetector`
+finds a unittest module, or when any unittest marker is present (a
+``unittest``/``TestCase`` reference, ``self.assert*``/``self.fail*``/
+``self.skipTest``/``self.subTest`` calls, or unittest lifecycle methods
+such as ``setUp``). Everything else is reported as already pytest-style
+or as not using unittest.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+import ast
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..helpers.source_io import read_source
+from .unittest_detector import UnittestFileDetector
+
+__all__ = ["ALREADY_PYTEST", "NO_UNITTEST", "FileClassification", "classify_file", "classify_source"]
+
+ALREADY_PYTEST = "already pytest-style"
+"""Reason given for files that use pytest and no unittest."""
+
+NO_UNITTEST = "no unittest usage"
+"""Reason given for files without any unittest or pytest markers."""
+
+_UNITTEST_NAMES = frozenset({"unittest", "TestCase", "IsolatedAsyncioTestCase"})
+_SELF_METHODS = frozenset({"skipTest", "subTest", "addCleanup", "addClassCleanup", "enterContext"})
+_SELF_PREFIXES = ("assert", "fail")
+_LIFECYCLE_METHODS = frozenset(
+    {
+        "setUp",
+        "tearDown",
+        "setUpClass",
+        "tearDownClass",
+        "setUpModule",
+        "tearDownModule",
+        "asyncSetUp",
+        "asyncTearDown",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FileClassification:
+    """Whether a file needs migrating, and why not when it does not.
+
+    Attributes:
+        is_candidate: Whether the file uses unittest and should be migrated.
+        reason: Short explanation, e.g. :data:`ALREADY_PYTEST`.
+    """
+
+    is_candidate: bool
+    reason: str
+
+
+def classify_source(source: str, filename: str = "<unknown>") -> FileClassification:
+    """Classify Python source code.
+
+    Args:
+        source: Module source code.
+        filename: Name used in syntax errors.
+
+    Returns:
+        The classification.
+
+    Raises:
+        SyntaxError: If the source cannot be parsed.
+    """
+    try:
+        tree = ast.parse(source, filename=filename)
+    except ValueError as e:  # null bytes
+        raise SyntaxError(f"Invalid Python syntax in {filename}: {e}") from e
+
+    detector = UnittestFileDetector()
+    if detector.is_unittest_tree(tree):
+        return FileClassification(True, "unittest test module")
+    if detector.has_unittest_import or detector.has_testcase_inheritance or detector.has_assertion_calls:
+        return FileClassification(True, "uses unittest")
+
+    uses_pytest = False
+    for node in ast.walk(tree):
+        if _is_unittest_marker(node):
+            return FileClassification(True, "uses unittest")
+        if isinstance(node, ast.Import):
+            uses_pytest = uses_pytest or any(alias.name.split(".")[0] == "pytest" for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            uses_pytest = uses_pytest or (node.module or "").split(".")[0] == "pytest"
+        elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef) and node.name.startswith("test"):
+            uses_pytest = uses_pytest or any(isinstance(child, ast.Assert) for child in ast.walk(node))
+    return FileClassification(False, ALREADY_PYTEST if uses_pytest else NO_UNITTEST)
+
+
+def classify_file(file_path: str | Path) -> FileClassification:
+    """Classify a Python file, read with :func:`~..helpers.source_io.read_source`.
+
+    Args:
+        file_path: Path of the file.
+
+    Returns:
+        The classification.
+
+    Raises:
+        OSError: If the file cannot be read.
+        UnicodeDecodeError: If the file is not valid in its declared encoding.
+        SyntaxError: If the file cannot be parsed.
+    """
+    path = Path(file_path)
+    return classify_source(read_source(path).text, str(path))
+
+
+def _is_unittest_marker(node: ast.AST) -> bool:
+    if isinstance(node, ast.Name):
+        return node.id in _UNITTEST_NAMES
+    if isinstance(node, ast.Attribute):
+        if node.attr in _UNITTEST_NAMES:
+            return True
+        if isinstance(node.value, ast.Name) and node.value.id == "self":
+            return node.attr in _SELF_METHODS or node.attr.startswith(_SELF_PREFIXES)
+        return False
+    if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+        return node.name in _LIFECYCLE_METHODS
+    return False
@@ -10,6 +10,8 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
+from ..helpers.source_io import read_source
+
 
 class UnittestFileDetector(ast.NodeVisitor):
     """AST visitor that detects unittest files through structural analysis.
@@ -40,20 +42,19 @@ class UnittestFileDetector(ast.NodeVisitor):
 
         Raises:
             FileNotFoundError: If the file doesn't exist.
-            UnicodeDecodeError: If the file can't be decoded as UTF-8.
+            UnicodeDecodeError: If the file can't be decoded in its declared encoding.
             SyntaxError: If the file contains invalid Python syntax.
         """
         file_path = Path(file_path)
 
         # Read and parse the file
         try:
-            with open(file_path, encoding="utf-8") as f:
-                source_code = f.read()
+            source_code = read_source(file_path).text
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}") from None
         except UnicodeDecodeError as e:
             raise UnicodeDecodeError(
-                e.encoding, e.object, e.start, e.end, f"Cannot decode file {file_path} as UTF-8"
+                e.encoding, e.object, e.start, e.end, f"Cannot decode file {file_path} as {e.encoding}"
             ) from e
 
         try:
@@ -66,6 +67,17 @@ class UnittestFileDetector(ast.NodeVisitor):
             # Tests expect a SyntaxError for binary files; normalize to SyntaxError
             raise SyntaxError(f"Invalid Python syntax in {file_path}: {e}") from e
 
+        return self.is_unittest_tree(tree)
+
+    def is_unittest_tree(self, tree: ast.AST) -> bool:
+        """Check an already parsed module for unittest patterns.
+
+        Args:
+            tree: Module parsed with :func:`ast.parse`.
+
+        Returns:
+            True if the module contains unittest patterns, False otherwise.
+        """
         # Reset state and visit the AST
         self.has_unittest_import = False
         self.has_testcase_inheritance = False
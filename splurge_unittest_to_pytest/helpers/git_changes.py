@@ -0,0 +1,151 @@
+"""Changed-file discovery through local git.
+
+Pre-commit hooks and CI jobs usually only need to migrate the handful of
+files a change touches. :func:`changed_python_files` asks
+``git diff --name-only`` for the changed Python files and
+:func:`filter_changed_files` narrows them to the search scope and
+``file_patterns`` of the run, so discovery never walks the tree.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+import fnmatch
+import os
+import subprocess
+from pathlib import Path, PurePosixPath
+
+from ..exceptions import MigrationError
+
+
+class GitChangesError(MigrationError):
+    """Raised when git cannot report changed files (no git, not a repository, bad ref)."""
+
+
+def _git(args: list[str], cwd: str | Path | None) -> str:
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="surrogateescape",
+            check=False,
+        )
+    except FileNotFoundError as e:
+        raise GitChangesError("git is not installed or not on PATH") from e
+    except OSError as e:
+        raise GitChangesError(f"Could not run git: {e}") from e
+    if completed.returncode != 0:
+        message = completed.stderr.strip() or f"git {' '.join(args)} failed"
+        raise GitChangesError(message, {"args": args, "returncode": completed.returncode})
+    return completed.stdout
+
+
+def changed_python_files(since: str | None = None, staged: bool = False, cwd: str | Path | None = None) -> list[str]:
+    """Return the Python files git reports as added, copied, modified or renamed.
+
+    Args:
+        since: Compare the working tree (or the index, with ``staged``)
+            against this ref, e.g. ``origin/main`` or ``HEAD~3``.
+        staged: Only report changes staged in the index.
+        cwd: Directory inside the repository (default: current directory).
+
+    Returns:
+        Absolute paths of the changed ``.py`` files that exist on disk.
+
+    Raises:
+        ValueError: If neither ``since`` nor ``staged`` is given.
+        GitChangesError: If git is unavailable, ``cwd`` is not inside a
+            repository or ``since`` is not a valid ref.
+    """
+    if not since and not staged:
+        raise ValueError("changed_python_files needs 'since', 'staged' or both")
+    if since and since.startswith("-"):
+        raise GitChangesError(f"Invalid git ref: {since}")
+
+    root = Path(_git(["rev-parse", "--show-toplevel"], cwd).strip())
+    args = ["diff", "--name-only", "-z", "--diff-filter=ACMR"]
+    if staged:
+        args.append("--cached")
+    if since:
+        args.append(since)
+    output = _git([*args, "--"], cwd)
+
+    files = []
+    for name in output.split("\0"):
+        if name.endswith(".py"):
+            path = root / name
+            if path.is_file():
+                files.append(str(path))
+    return files
+
+
+def _matches(relative: PurePosixPath, pattern: str) -> bool:
+    pattern = pattern.replace(os.sep, "/")
+    candidates = [pattern]
+    while pattern.startswith("**/"):
+        pattern = pattern[3:]
+        candidates.append(pattern)
+    text = relative.as_posix()
+    return any(relative.match(p) or fnmatch.fnmatchcase(text, p) for p in candidates if p)
+
+
+def _display_path(path: Path) -> str:
+    try:
+        return str(path.relative_to(Path.cwd()))
+    except ValueError:
+        return str(path)
+
+
+def filter_changed_files(
+    changed_files: list[str],
+    source_files: list[str],
+    root_directory: str | None,
+    file_patterns: list[str],
+    recurse: bool = True,
+) -> list[str]:
+    """Keep the changed files that a pattern-based discovery would have found.
+
+    Explicit source files are kept when they changed. Changed files under
+    ``root_directory`` or an explicit source directory are kept when their
+    path relative to that directory matches one of ``file_patterns``
+    (and, without ``recurse``, when they sit directly in it). Without any
+    source paths or root directory the current directory is the scope.
+
+    Args:
+        changed_files: Paths reported by :func:`changed_python_files`.
+        source_files: Explicit source files or directories of the run.
+        root_directory: Optional root directory searched with the patterns.
+        file_patterns: Glob patterns selecting input files.
+        recurse: Whether files in subdirectories are included.
+
+    Returns:
+        The selected paths, relative to the current directory when inside
+        it, in the order git reported them.
+    """
+    scopes = [Path(p).resolve() for p in [*source_files, root_directory] if p]
+    if not scopes:
+        scopes = [Path.cwd().resolve()]
+    files = [scope for scope in scopes if scope.is_file()]
+    directories = [scope for scope in scopes if scope.is_dir()]
+
+    selected: list[str] = []
+    for changed in changed_files:
+        path = Path(changed).resolve()
+        keep = path in files
+        for directory in directories:
+            if keep:
+                break
+            try:
+                relative = PurePosixPath(path.relative_to(directory).as_posix())
+            except ValueError:
+                continue
+            if not recurse and len(relative.parts) > 1:
+                continue
+            keep = any(_matches(relative, pattern) for pattern in file_patterns)
+        display = _display_path(path)
+        if keep and display not in selected:
+            selected.append(display)
+    return selected
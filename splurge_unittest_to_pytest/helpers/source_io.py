@@ -0,0 +1,220 @@
+"""Encoding-aware, single-read source ingestion.
+
+A source file is looked at by several consumers during one run: test
+prefix detection, file classification, the orchestrator and the CLI diff
+printer. :func:`read_source` reads a file's bytes once, detects its
+encoding the way Python does (a UTF-8 BOM or a PEP 263 coding cookie,
+UTF-8 otherwise) and records its newline style, and returns a
+:class:`SourceFile` whose text always uses ``"\\n"``.
+
+Inside :func:`source_cache` every consumer shares the same
+:class:`SourceFile` for a path, so each file is read and decoded once per
+run. The cache is a snapshot of the run's inputs: entries are not
+revalidated, and writers call :func:`forget_source` for the files they
+replace. :func:`encode_source` turns generated code back into bytes in the
+original encoding and newline style.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+import io
+import os
+import re
+import threading
+import tokenize
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+__all__ = [
+    "SourceCache",
+    "SourceFile",
+    "decode_source",
+    "encode_source",
+    "forget_source",
+    "read_source",
+    "source_cache",
+    "source_exists",
+]
+
+_NEWLINE = re.compile(r"\r\n|\r|\n")
+
+
+@dataclass(frozen=True, slots=True)
+class SourceFile:
+    """A decoded source file and what is needed to write it back.
+
+    Attributes:
+        path: Path the file was read from.
+        text: Decoded source with ``"\\n"`` line endings.
+        encoding: Codec name; ``"utf-8-sig"`` when the file starts with a BOM.
+        newline: The file's first line ending (``"\\n"``, ``"\\r\\n"`` or ``"\\r"``).
+        size: Size of the file in bytes.
+        mtime_ns: Modification time of the file when it was read.
+    """
+
+    path: str
+    text: str
+    encoding: str
+    newline: str
+    size: int
+    mtime_ns: int
+
+    def encode(self, code: str) -> bytes:
+        """Encode ``code`` in this file's encoding and newline style."""
+        return encode_source(code, self.encoding, self.newline)
+
+
+def decode_source(data: bytes) -> tuple[str, str, str]:
+    """Decode Python source bytes.
+
+    The encoding comes from :func:`tokenize.detect_encoding`. An invalid
+    coding cookie falls back to UTF-8 so that parsing reports the problem.
+
+    Args:
+        data: Raw file contents.
+
+    Returns:
+        ``(text, encoding, newline)`` with ``text`` using ``"\\n"`` line endings.
+
+    Raises:
+        UnicodeDecodeError: If the bytes are not valid in the detected encoding.
+    """
+    try:
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(data).readline)
+    except SyntaxError:
+        encoding = "utf-8"
+    text = data.decode(encoding)
+    match = _NEWLINE.search(text)
+    newline = match.group() if match else "\n"
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, encoding, newline
+
+
+def encode_source(code: str, encoding: str, newline: str = "\n") -> bytes:
+    """Encode ``code`` (with ``"\\n"`` line endings) for writing.
+
+    Raises:
+        UnicodeEncodeError: If ``code`` cannot be represented in ``encoding``.
+    """
+    if newline != "\n":
+        code = code.replace("\n", newline)
+    return code.encode(encoding)
+
+
+def _load(path: str) -> SourceFile:
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        data = f.read()
+    text, encoding, newline = decode_source(data)
+    return SourceFile(path, text, encoding, newline, stat.st_size, stat.st_mtime_ns)
+
+
+class SourceCache:
+    """Thread-safe map of absolute path to :class:`SourceFile`.
+
+    Attributes:
+        reads: Number of files read from disk.
+        hits: Number of lookups served from the cache.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, SourceFile] = {}
+        self._lock = threading.Lock()
+        self.reads = 0
+        self.hits = 0
+
+    def get(self, path: str | Path) -> SourceFile:
+        """Return the file at ``path``, reading it on first use.
+
+        Raises:
+            OSError: If the file cannot be read.
+            UnicodeDecodeError: If the file cannot be decoded.
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry
+        # Read outside the lock so concurrent readers of different files do not wait on each other
+        entry = _load(str(path))
+        with self._lock:
+            self.reads += 1
+            return self._entries.setdefault(key, entry)
+
+    def forget(self, path: str | Path) -> None:
+        """Drop ``path`` from the cache, e.g. after it was overwritten."""
+        with self._lock:
+            self._entries.pop(os.path.abspath(path), None)
+
+    def __contains__(self, path: object) -> bool:
+        if not isinstance(path, str | Path):
+            return False
+        with self._lock:
+            return os.path.abspath(path) in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_active_lock = threading.Lock()
+_active: SourceCache | None = None
+_active_depth = 0
+
+
+@contextmanager
+def source_cache() -> Iterator[SourceCache]:
+    """Share one :class:`SourceCache` for the duration of a run.
+
+    Nested uses share the outer cache; it is dropped when the outermost use
+    exits. Also usable as a decorator.
+
+    Yields:
+        The active cache.
+    """
+    global _active, _active_depth
+    with _active_lock:
+        if _active is None:
+            _active = SourceCache()
+        _active_depth += 1
+        cache = _active
+    try:
+        yield cache
+    finally:
+        with _active_lock:
+            _active_depth -= 1
+            if _active_depth == 0:
+                _active = None
+
+
+def read_source(path: str | Path) -> SourceFile:
+    """Read and decode ``path``, through the active :func:`source_cache` if any.
+
+    Raises:
+        OSError: If the file cannot be read.
+        UnicodeDecodeError: If the file cannot be decoded.
+    """
+    cache = _active
+    if cache is not None:
+        return cache.get(path)
+    return _load(str(path))
+
+
+def source_exists(path: str | Path) -> bool:
+    """Whether ``path`` exists, answered from the active cache when it holds the file."""
+    cache = _active
+    if cache is not None and path in cache:
+        return True
+    return Path(path).exists()
+
+
+def forget_source(path: str | Path) -> None:
+    """Drop ``path`` from the active cache (no-op without one)."""
+    cache = _active
+    if cache is not None:
+        cache.forget(path)
@@ -3,17 +3,25 @@
 
 This module defines data structures that represent unittest code
 semantically, making transformations more reliable and testable than
-direct CST manipulation.
+direct CST manipulation. The dataclasses use ``__slots__`` and intern
+identifier strings (names, bases, decorators, imports) so that IR for a
+whole repository stays compact.
 
 Copyright (c) 2025 Jim Schilling
 This software is released under the MIT License.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
 
+def _intern(value: Any) -> Any:
+    """Intern ``value`` when it is a plain string; return it unchanged otherwise."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class AssertionType(Enum):
     """Types of unittest assertions that need transformation.
 
@@ -70,7 +78,7 @@ class FixtureScope(Enum):
     SESSION = "session"
 
 
-@dataclass
+@dataclass(slots=True)
 class Expression:
     """Representation of a generic expression in source code.
 
@@ -87,7 +95,7 @@ class Expression:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Assertion:
     """Represents a unittest assertion that should be transformed.
 
@@ -106,7 +114,7 @@ class Assertion:
     original_location: dict[str, int] | None = None  # For debugging
 
 
-@dataclass
+@dataclass(slots=True)
 class Fixture:
     """Represents a setup/teardown fixture to be converted to pytest.
 
@@ -128,8 +136,13 @@ class Fixture:
     dependencies: list[str] = field(default_factory=list)  # Other fixtures this depends on
     is_autouse: bool = False
 
+    def __post_init__(self) -> None:
+        """Intern identifier strings shared across IR nodes."""
+        self.name = _intern(self.name)
+        self.dependencies = [_intern(name) for name in self.dependencies]
+
 
-@dataclass
+@dataclass(slots=True)
 class TestMethod:
     """Represents a test method.
 
@@ -149,8 +162,15 @@ class TestMethod:
     parameters: list[str] = field(default_factory=list)
     return_type: str | None = None
 
+    def __post_init__(self) -> None:
+        """Intern identifier strings shared across IR nodes."""
+        self.name = _intern(self.name)
+        self.decorators = [_intern(decorator) for decorator in self.decorators]
+        self.parameters = [_intern(parameter) for parameter in self.parameters]
+        self.return_type = _intern(self.return_type)
 
-@dataclass
+
+@dataclass(slots=True)
 class TestClass:
     """Represents a test class (either a ``unittest.TestCase`` or plain).
 
@@ -177,6 +197,11 @@ class TestClass:
     is_unittest_class: bool = False
     _needs_pytest_import: bool = False
 
+    def __post_init__(self) -> None:
+        """Intern identifier strings shared across IR nodes."""
+        self.name = _intern(self.name)
+        self.base_classes = [_intern(base) for base in self.base_classes]
+
     @property
     def needs_pytest_import(self) -> bool:
         """Return True when the class requires importing pytest.
@@ -192,7 +217,7 @@ class TestClass:
         self._needs_pytest_import = value
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportStatement:
     """Represents an import statement."""
 
@@ -203,8 +228,14 @@ class ImportStatement:
     alias: str | None = None
     import_type: str = "direct"  # "direct", "from", "relative"
 
+    def __post_init__(self) -> None:
+        """Intern identifier strings shared across IR nodes."""
+        self.module = _intern(self.module)
+        self.imported_items = [_intern(item) for item in self.imported_items]
+        self.alias = _intern(self.alias)
+
 
-@dataclass
+@dataclass(slots=True)
 class TestModule:
     """Represents a complete test module/file."""
 
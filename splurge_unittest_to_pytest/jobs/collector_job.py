@@ -12,11 +12,11 @@ This software is released under the MIT License.
 """
 
 import logging
-from pathlib import Path
 from typing import Any
 
 from ..context import PipelineContext
 from ..events import EventBus
+from ..helpers.source_io import source_exists
 from ..pipeline import Job, Task
 from ..result import Result
 from ..steps import GenerateCodeStep, ParseSourceStep, TransformUnittestStep
@@ -68,8 +68,8 @@ class CollectorJob(Job[str, str]):
         """
         self._logger.info(f"Starting collection job for {context.source_file}")
 
-        # Validate source file exists
-        if not Path(context.source_file).exists():
+        # Validate source file exists (in-memory sources have no file)
+        if not context.in_memory and not source_exists(context.source_file):
             return Result.failure(FileNotFoundError(f"Source file not found: {context.source_file}"))
 
         # Execute the job using the source file as input
@@ -9,13 +9,24 @@ Copyright (c) 2025 Jim Schilling
 This software is released under the MIT License.
 """
 
+import hashlib
 import logging
+import sys
+from pathlib import Path
 from typing import Any, Literal
 
 import libcst as cst
 
 from ..context import PipelineContext
-from ..decision_model import ClassProposal, DecisionModel, FunctionProposal, ModuleProposal
+from ..decision_model import (
+    BINARY_SUFFIX,
+    ClassProposal,
+    DecisionModel,
+    EvidenceCode,
+    FunctionProposal,
+    ModuleProposal,
+    intern_evidence,
+)
 from ..events import EventBus
 from ..exceptions import AnalysisStepError, ContextError
 from ..pipeline import Job, Step, Task
@@ -32,16 +43,94 @@ class DecisionAnalysisJob(Job[str, DecisionModel]):
     4. Bubbler - reconcile and aggregate proposals
 
     The job outputs a DecisionModel without performing any transformations.
+
+    When a model directory is configured (``model_dir`` or
+    ``config.decision_model_dir`` with ``cache_analysis_results`` enabled),
+    models are stored in the binary format keyed by a fingerprint of the
+    source path and contents, and a matching stored model is loaded instead
+    of re-running the analysis passes.
     """
 
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, model_dir: str | Path | None = None):
         """Initialize the decision analysis job.
 
         Args:
             event_bus: Event bus used for publishing pipeline events.
+            model_dir: Optional directory of stored decision models. Takes
+                precedence over ``config.decision_model_dir``.
         """
         super().__init__("decision_analysis", [self._create_analysis_task(event_bus)], event_bus)
         self._logger = logging.getLogger(f"{__name__}.{self.name}")
+        self.model_dir = Path(model_dir) if model_dir is not None else None
+
+    def execute(self, context: PipelineContext, initial_input: Any = None) -> Result[Any]:
+        """Analyze ``initial_input`` or reuse a stored model for the same source.
+
+        Args:
+            context: Pipeline execution context.
+            initial_input: Source code to analyze.
+
+        Returns:
+            ``Result`` with the unchanged source code; the decision model is
+            stored in ``context.metadata["decision_model"]``.
+        """
+        model_dir = self._resolve_model_dir(context)
+        if model_dir is None or not isinstance(initial_input, str):
+            return super().execute(context, initial_input)
+
+        fingerprint = self.source_fingerprint(context.source_file, initial_input)
+        model_path = model_dir / f"{fingerprint}{BINARY_SUFFIX}"
+
+        stored = self.load_stored_model(model_path, fingerprint)
+        if stored is not None:
+            self._logger.debug(f"Loaded stored decision model for {context.source_file}")
+            context.metadata["decision_model"] = stored
+            return Result.success(initial_input, {"job": self.name, "decision_model_path": str(model_path)})
+
+        result = super().execute(context, initial_input)
+        model = context.metadata.get("decision_model")
+        if result.is_success() and isinstance(model, DecisionModel):
+            try:
+                model.save_to_file(model_path, fingerprint)
+            except OSError as e:
+                self._logger.warning(f"Could not store decision model at {model_path}: {e}")
+        return result
+
+    @staticmethod
+    def source_fingerprint(source_file: str, source_code: str) -> str:
+        """Return the key under which the model for ``source_code`` is stored."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(source_file).encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+        digest.update(source_code.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def load_stored_model(self, model_path: Path, fingerprint: str | None = None) -> DecisionModel | None:
+        """Load a stored decision model, or return None if it is missing or unusable.
+
+        Args:
+            model_path: Path of the stored model.
+            fingerprint: Expected source fingerprint; stale models are ignored.
+        """
+        try:
+            return DecisionModel.from_bytes(model_path.read_bytes(), fingerprint)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self._logger.debug(f"Ignoring stored decision model {model_path}: {e}")
+            return None
+
+    def _resolve_model_dir(self, context: PipelineContext) -> Path | None:
+        """Return the directory of stored models for this run, if any."""
+        if getattr(context, "in_memory", False):
+            return None
+        if self.model_dir is not None:
+            return self.model_dir
+        config = getattr(context, "config", None)
+        model_dir = getattr(config, "decision_model_dir", None)
+        if model_dir and getattr(config, "cache_analysis_results", False):
+            return Path(model_dir)
+        return None
 
     def _create_analysis_task(self, event_bus: EventBus) -> Task[str, str]:
         """Create and return the analysis task for this job."""
@@ -309,7 +398,7 @@ class ClassScannerStep(Step[cst.Module, cst.Module]):
                 if isinstance(node, cst.FunctionDef):
                     method_name = node.name.value
                     if method_name in ("setUp", "tearDown", "setUpClass", "tearDownClass"):
-                        setup_methods.append(method_name)
+                        setup_methods.append(sys.intern(method_name))
         except Exception as e:
             self._logger.warning(f"Error collecting setup methods: {e}")
         return setup_methods
@@ -412,7 +501,7 @@ class FunctionScannerStep(Step[cst.Module, cst.Module]):
         return FunctionProposal(
             function_name=f"{class_name}.{func_name}",
             recommended_strategy="keep-loop",  # Conservative default
-            evidence=["No subTest loops detected"],
+            evidence=[EvidenceCode.NO_SUBTEST_LOOPS],
         )
 
     def _analyze_subtest_loops(
@@ -531,12 +620,12 @@ class FunctionScannerStep(Step[cst.Module, cst.Module]):
         self, iterable: cst.BaseExpression, body_statements: list, loop_index: int, class_name: str, func_name: str
     ) -> tuple[Literal["parametrize", "subtests", "keep-loop"], list[str], bool]:
         """Analyze the loop iterable to determine transformation strategy."""
-        evidence = []
+        evidence: list[str] = []
         accumulator_mutated = False
 
         # Check for literal lists/tuples (can be parametrized)
         if isinstance(iterable, cst.List | cst.Tuple):
-            evidence.append("Found literal list/tuple iterable")
+            evidence.append(EvidenceCode.LITERAL_ITERABLE)
             return "parametrize", evidence, accumulator_mutated
 
         # Check for simple name references (can be parametrized if not mutated)
@@ -557,11 +646,11 @@ class FunctionScannerStep(Step[cst.Module, cst.Module]):
         if isinstance(iterable, cst.Call):
             func = getattr(iterable, "func", None)
             if isinstance(func, cst.Name) and getattr(func, "value", None) == "range":
-                evidence.append("Found range() call - can parametrize")
+                evidence.append(EvidenceCode.RANGE_CALL)
                 return "parametrize", evidence, accumulator_mutated
 
         # Default to conservative approach
-        evidence.append("Unknown iterable type - use subtests")
+        evidence.append(EvidenceCode.UNKNOWN_ITERABLE)
         return "subtests", evidence, accumulator_mutated
 
     def _is_variable_mutated(self, var_name: str, body_statements: list, loop_index: int) -> bool:
@@ -709,7 +798,7 @@ class ProposalReconcilerStep(Step[cst.Module, str]):
             for func_proposal in class_proposal.function_proposals.values():
                 if func_proposal.recommended_strategy != common_strategy:
                     func_proposal.recommended_strategy = common_strategy
-                    func_proposal.evidence.append(f"Aligned to class consensus: {common_strategy}")
+                    func_proposal.evidence.append(intern_evidence(f"Aligned to class consensus: {common_strategy}"))
             return
 
         # Rule 2: If there's a mix of parametrize and subtests, keep individual decisions
@@ -739,7 +828,7 @@ class ProposalReconcilerStep(Step[cst.Module, str]):
         for _func_name, func_proposal in class_proposal.function_proposals.items():
             if func_proposal.recommended_strategy == "parametrize":
                 func_proposal.recommended_strategy = "subtests"
-                func_proposal.evidence.append("Changed to subtests due to mixed strategies in class")
+                func_proposal.evidence.append(EvidenceCode.MIXED_STRATEGIES)
 
     def _apply_accumulator_safety(self, class_proposal: ClassProposal, accumulator_functions: list[str]) -> None:
         """Apply rule that accumulator functions must use subtests."""
@@ -747,11 +836,11 @@ class ProposalReconcilerStep(Step[cst.Module, str]):
             func_proposal = class_proposal.function_proposals[func_name]
             if func_proposal.recommended_strategy != "subtests":
                 func_proposal.recommended_strategy = "subtests"
-                func_proposal.evidence.append("Changed to subtests due to accumulator pattern")
+                func_proposal.evidence.append(EvidenceCode.ACCUMULATOR_PATTERN)
 
     def _apply_conservative_approach(self, class_proposal: ClassProposal) -> None:
         """Apply conservative rule - use subtests if any function suggests it."""
         for _func_name, func_proposal in class_proposal.function_proposals.items():
             if func_proposal.recommended_strategy != "subtests":
                 func_proposal.recommended_strategy = "subtests"
-                func_proposal.evidence.append("Changed to subtests for conservative approach")
+                func_proposal.evidence.append(EvidenceCode.CONSERVATIVE)
@@ -1,9 +1,13 @@
 """Programmatic API for splurge_unittest_to_pytest.
 
-This module exposes a small programmatic entry point, ``migrate``, which
-is used by the CLI and tests. It delegates work to
-``MigrationOrchestrator`` and returns a ``Result`` containing the list
-of written target paths.
+This module exposes small programmatic entry points used by the CLI and
+tests. ``migrate`` delegates work to ``MigrationOrchestrator`` and returns
+a ``Result`` containing the list of written target paths, and streams a
+per-file JSONL migration report when ``generate_report`` is enabled;
+``migrate_async`` and ``iter_migrate_async`` do the same from asyncio code
+with bounded concurrency; ``transform_source`` converts source code held
+in memory; ``analyze`` reports migration readiness for many files without
+transforming them.
 
 Copyright (c) 2025 Jim Schilling
 This software is released under the MIT License.
@@ -11,12 +15,29 @@ This software is released under the MIT License.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import asyncio
+import contextlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
 
 from .context import MigrationConfig
+from .detectors import classify_file
 from .events import EventBus
+from .helpers.source_io import source_cache
 from .migration_orchestrator import MigrationOrchestrator
+from .migration_report import MigrationReportWriter, default_report_path, render_report_summary
+from .repository_analysis import RepositoryAnalysis, analyze_repository
 from .result import Result
+from .worker_pool import create_worker_pool
+
+_logger = logging.getLogger(__name__)
 
 
 def migrate(
@@ -31,7 +52,15 @@ def migrate(
 
     Returns:
         ``Result`` containing a list of written target file paths on
-        success. On failure a failure ``Result`` is returned.
+        success. On failure a failure ``Result`` is returned. When a report
+        was written its path is in ``metadata["report"]`` (and the rendered
+        summary, for markdown/html, in ``metadata["report_summary"]``).
+        With ``pipeline_mode="staged"`` several files run through
+        :class:`~.staged_pipeline.StagedMigrationPipeline` and its
+        per-stage metrics are in ``metadata["stage_metrics"]``.
+        Files that do not use unittest are not migrated (see
+        :func:`_pass_through`); ``metadata["skipped"]`` maps each of them
+        to the reason.
     """
     if isinstance(source_files, str):
         files = [source_files]
@@ -41,53 +70,504 @@ def migrate(
     if config is None:
         config = MigrationConfig()
 
+    if event_bus is None:
+        event_bus = EventBus()
     orchestrator = MigrationOrchestrator(event_bus)
     written: list[str] = []
     # Collect per-file generated code when running in dry-run so callers
     # (CLI) can display the converted code without writing files.
     generated_map: dict[str, str] = {}
-
-    for src in files:
-        res = orchestrator.migrate_file(src, config)
-
-        # Defensive handling: tests may monkeypatch migrate_file to return a
-        # lightweight DummyResult without `.data`. Handle objects that expose
-        # `is_success()` and optionally `data` or `error`.
+    stage_metrics: dict[str, Any] = {}
+    skipped: dict[str, str] = {}
+    report = _open_report(config, files, event_bus)
+    # Classification and migration share one read of each file
+    with source_cache():
         try:
-            ok = bool(res.is_success())
-        except Exception:
-            ok = bool(getattr(res, "_success", False))
-
-        if ok:
-            data = getattr(res, "data", None)
-            if data is None:
-                # If no data was returned, fall back to the source path.
-                written.append(src)
-            elif isinstance(data, list):
-                written.extend(data)
+            if config.pipeline_mode == "staged" and len(files) > 1:
+                result = _migrate_files_staged(
+                    orchestrator, files, config, event_bus, written, generated_map, report, stage_metrics, skipped
+                )
             else:
-                written.append(str(data))
-            # Collect generated_code if present in the per-file result metadata
+                result = _migrate_files(orchestrator, files, config, written, generated_map, report, skipped)
+        finally:
+            report_metadata = _close_report(report, config)
+    if result is not None:
+        return result
+
+    # Attach generated_code map to metadata if present
+    metadata: dict[str, object] = {"generated_code": generated_map} if generated_map else {}
+    metadata.update(report_metadata)
+    if stage_metrics:
+        metadata["stage_metrics"] = stage_metrics
+    if skipped:
+        metadata["skipped"] = skipped
+    return Result.success(written, metadata=metadata or None)
+
+
+def transform_source(
+    source_code: str, config: MigrationConfig | None = None, event_bus: EventBus | None = None
+) -> Result[str]:
+    """Convert unittest source code in memory, without touching the filesystem.
+
+    Args:
+        source_code: Source of the unittest module.
+        config: Optional ``MigrationConfig`` to control migration behavior.
+            Output location, backup and report settings do not apply.
+        event_bus: Optional event bus to use for publishing events.
+
+    Returns:
+        ``Result`` containing the converted pytest source code.
+    """
+    return MigrationOrchestrator(event_bus).transform_source(source_code, config)
+
+
+def _transform_executor(workers: int | None, max_in_flight: int) -> Executor:
+    """Create the executor used for transforms (``workers`` as in :func:`analyze`)."""
+    if not workers:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, max_in_flight))
+    if workers == 1:
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="splurge-transform")
+    return create_worker_pool(workers)
+
+
+class _TrackedExecutor(Executor):
+    """Submit to ``executor`` and remember the futures that have not finished.
+
+    Cancelling an ``asyncio`` task does not stop work an executor has
+    already started, so :func:`iter_migrate_async` waits on these before it
+    returns. The wrapped executor is not shut down.
+    """
+
+    def __init__(self, executor: Executor) -> None:
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._unfinished: set[Future[Any]] = set()
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+        future = self._executor.submit(fn, *args, **kwargs)
+        with self._lock:
+            self._unfinished.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._unfinished.discard(future)
+
+    async def drain(self) -> None:
+        """Cancel the queued futures and wait for the running ones."""
+        with self._lock:
+            unfinished = list(self._unfinished)
+        for future in unfinished:
+            future.cancel()
+        if unfinished:
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in unfinished), return_exceptions=True)
+
+
+async def iter_migrate_async(
+    source_files: Iterable[str] | str,
+    config: MigrationConfig | None = None,
+    *,
+    orchestrator: MigrationOrchestrator | None = None,
+    max_in_flight: int | None = None,
+    workers: int | None = None,
+    transform_executor: Executor | None = None,
+) -> AsyncIterator[tuple[str, Result[str]]]:
+    """Migrate files concurrently, yielding ``(source, result)`` as each finishes.
+
+    At most ``max_in_flight`` files are between their read and their write
+    at any time (an ``asyncio.Semaphore``), and only a small window of
+    tasks is created ahead of that, so memory stays flat for long file
+    lists. Reads and writes use a thread pool of that size; transforms use
+    ``transform_executor`` or a process pool of ``workers`` processes,
+    forked warm from a preloaded fork server (see :mod:`.worker_pool`).
+    Worker processes receive only each file's path and read and write it
+    themselves (see :meth:`MigrationOrchestrator.migrate_file_async`).
+
+    Leaving the ``async for`` early, closing the iterator or cancelling the
+    consuming task cancels the files still in flight: queued work never
+    starts, and work an executor has already started (including a worker
+    process writing its file) is waited for, so nothing is written once the
+    iterator has closed. Wrap the iterator in ``contextlib.aclosing`` to
+    close it immediately when stopping early.
+
+    Args:
+        source_files: Iterable of file paths (or single path string).
+        config: Optional ``MigrationConfig`` to control migration behavior.
+        orchestrator: Orchestrator to use (default: a new one).
+        max_in_flight: Files processed concurrently (default:
+            ``config.max_concurrent_files``).
+        workers: Transform worker processes when no ``transform_executor``
+            is given (``None``/``0`` for one per CPU, ``1`` for a single
+            in-process thread); capped at ``max_in_flight``.
+        transform_executor: Executor for transforms. It is not shut down.
+
+    Yields:
+        ``(source_file, Result)`` pairs in completion order.
+    """
+    files = [source_files] if isinstance(source_files, str) else list(source_files)
+    if config is None:
+        config = MigrationConfig()
+    if orchestrator is None:
+        orchestrator = MigrationOrchestrator()
+    limit = max(1, max_in_flight or config.max_concurrent_files or 1)
+
+    owned_executor = transform_executor is None
+    executor = _transform_executor(workers, limit) if transform_executor is None else transform_executor
+    io_pool = ThreadPoolExecutor(max_workers=limit, thread_name_prefix="splurge-io")
+    direct_io = isinstance(executor, ProcessPoolExecutor)
+    # Tracked so that work already running when the iterator closes is waited for
+    tracked_transform, io_executor = _TrackedExecutor(executor), _TrackedExecutor(io_pool)
+    semaphore = asyncio.Semaphore(limit)
+    # Dry-run code handles from worker processes live here until collected
+    spool = tempfile.TemporaryDirectory(prefix="splurge-spool-", ignore_cleanup_errors=True) if config.dry_run else None
+    spool_dir = spool.name if spool is not None else None
+
+    async def run(source: str) -> tuple[str, Result[str]]:
+        async with semaphore:
             try:
-                meta = getattr(res, "metadata", None) or {}
-                if isinstance(meta, dict) and "generated_code" in meta:
-                    # If multiple targets were returned for this source, map
-                    # each target to the same generated code; otherwise map
-                    # the single target path.
-                    gen = meta["generated_code"]
-                    if isinstance(data, list):
-                        for d in data:
-                            generated_map[str(d)] = gen
-                    elif data is not None:
-                        generated_map[str(data)] = gen
-                    else:
-                        generated_map[str(src)] = gen
-            except Exception:
-                pass
-        else:
+                result = await orchestrator.migrate_file_async(
+                    source,
+                    config,
+                    io_executor=io_executor,
+                    transform_executor=tracked_transform,
+                    direct_io=direct_io,
+                    spool_dir=spool_dir,
+                )
+            except Exception as e:  # keep one broken file from ending the run
+                result = Result.failure(e)
+            return source, result
+
+    pending: set[asyncio.Task[tuple[str, Result[str]]]] = set()
+    remaining = iter(files)
+    try:
+        while True:
+            # Keep a short queue of tasks waiting on the semaphore
+            while len(pending) < limit * 2:
+                source = next(remaining, None)
+                if source is None:
+                    break
+                pending.add(asyncio.create_task(run(source)))
+            if not pending:
+                break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await tracked_transform.drain()
+        await io_executor.drain()
+        io_pool.shutdown(wait=False, cancel_futures=True)
+        if owned_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if spool is not None:
+            spool.cleanup()
+
+
+async def migrate_async(
+    source_files: Iterable[str] | str,
+    config: MigrationConfig | None = None,
+    event_bus: EventBus | None = None,
+    *,
+    max_in_flight: int | None = None,
+    workers: int | None = None,
+    transform_executor: Executor | None = None,
+) -> Result[list[str]]:
+    """Asyncio counterpart of :func:`migrate` with bounded concurrency.
+
+    Files are migrated through :func:`iter_migrate_async`. As with
+    :func:`migrate`, the first failing file ends the run (the files still
+    in flight are cancelled) and a report is streamed when
+    ``generate_report`` is enabled. Written paths are returned in input
+    order.
+
+    Args:
+        source_files: Iterable of file paths (or single path string).
+        config: Optional ``MigrationConfig`` to control migration behavior.
+        event_bus: Optional event bus to use for publishing events.
+        max_in_flight: Files processed concurrently (default:
+            ``config.max_concurrent_files``).
+        workers: Transform worker processes (see :func:`iter_migrate_async`).
+        transform_executor: Executor for transforms. It is not shut down.
+
+    Returns:
+        ``Result`` shaped like the one from :func:`migrate`.
+    """
+    files = [source_files] if isinstance(source_files, str) else list(source_files)
+    if config is None:
+        config = MigrationConfig()
+    if event_bus is None:
+        event_bus = EventBus()
+    orchestrator = MigrationOrchestrator(event_bus)
+
+    written_by_source: dict[str, list[str]] = {}
+    generated_map: dict[str, str] = {}
+    failure: Result[list[str]] | None = None
+    report = _open_report(config, files, event_bus)
+    try:
+        results = iter_migrate_async(
+            files,
+            config,
+            orchestrator=orchestrator,
+            max_in_flight=max_in_flight,
+            workers=workers,
+            transform_executor=transform_executor,
+        )
+        async with contextlib.aclosing(results):
+            async for source, result in results:
+                written = written_by_source.setdefault(source, [])
+                if not _collect_result(source, result, config, written, generated_map, report):
+                    failure = Result.failure(result.error or Exception("Migration failed"))
+                    break
+    finally:
+        report_metadata = _close_report(report, config)
+    if failure is not None:
+        return failure
+
+    metadata: dict[str, object] = {"generated_code": generated_map} if generated_map else {}
+    metadata.update(report_metadata)
+    written_paths = [path for source in files for path in written_by_source.pop(source, [])]
+    return Result.success(written_paths, metadata=metadata or None)
+
+
+def _open_report(config: MigrationConfig, files: list[str], event_bus: EventBus) -> MigrationReportWriter | None:
+    path = default_report_path(config, files)
+    if path is None:
+        return None
+    try:
+        return MigrationReportWriter(path, event_bus)
+    except OSError as e:
+        _logger.warning(f"Cannot write migration report to {path}: {e}")
+        return None
+
+
+def _close_report(report: MigrationReportWriter | None, config: MigrationConfig) -> dict[str, str]:
+    if report is None:
+        return {}
+    metadata = {"report": str(report.path)}
+    try:
+        report.close()
+        summary = render_report_summary(report.path, config.report_format)
+        if summary is not None:
+            metadata["report_summary"] = str(summary)
+    except (OSError, ValueError) as e:
+        _logger.warning(f"Cannot finish migration report {report.path}: {e}")
+    return metadata
+
+
+def _migrate_files(
+    orchestrator: MigrationOrchestrator,
+    files: list[str],
+    config: MigrationConfig,
+    written: list[str],
+    generated_map: dict[str, str],
+    report: MigrationReportWriter | None,
+    skipped: dict[str, str] | None = None,
+) -> Result[list[str]] | None:
+    """Migrate ``files`` in order, filling ``written``, ``generated_map`` and ``skipped``.
+
+    Returns:
+        A failure ``Result`` for the first file that fails, else ``None``.
+    """
+    for src in files:
+        res = _pass_through(orchestrator, src, config)
+        if res is None:
+            res = orchestrator.migrate_file(src, config)
+        if not _collect_result(src, res, config, written, generated_map, report, skipped):
             err = getattr(res, "error", Exception("Migration failed"))
             return Result.failure(err)
+    return None
 
-    # Attach generated_code map to metadata if present
-    metadata = {"generated_code": generated_map} if generated_map else None
-    return Result.success(written, metadata=metadata)
+
+def _migrate_files_staged(
+    orchestrator: MigrationOrchestrator,
+    files: list[str],
+    config: MigrationConfig,
+    event_bus: EventBus,
+    written: list[str],
+    generated_map: dict[str, str],
+    report: MigrationReportWriter | None,
+    stage_metrics: dict[str, Any],
+    skipped: dict[str, str] | None = None,
+) -> Result[list[str]] | None:
+    """Migrate ``files`` through the staged pipeline, like :func:`_migrate_files`.
+
+    ``max_concurrent_files`` sets the read and write workers. The first
+    failing file stops the stages, though files behind it in the queues
+    may already have been written. ``written`` is filled in input order and
+    ``stage_metrics`` with the per-stage metrics.
+    """
+    from .staged_pipeline import StagedMigrationPipeline
+
+    io_workers = max(1, config.max_concurrent_files)
+    pipeline = StagedMigrationPipeline(
+        config,
+        event_bus,
+        stage_workers={"read": io_workers, "output": io_workers},
+        queue_size=max(4, 2 * io_workers),
+    )
+    written_by_source: dict[str, list[str]] = {}
+    candidates = []
+    for src in files:
+        res = _pass_through(orchestrator, src, config)
+        if res is None:
+            candidates.append(src)
+            continue
+        if not _collect_result(src, res, config, written_by_source.setdefault(src, []), generated_map, report, skipped):
+            return Result.failure(res.error or Exception("Migration failed"))
+
+    failure: Result[list[str]] | None = None
+    results = pipeline.run(candidates)
+    try:
+        for src, res in results:
+            outputs = written_by_source.setdefault(src, [])
+            if not _collect_result(src, res, config, outputs, generated_map, report, skipped):
+                failure = Result.failure(res.error or Exception("Migration failed"))
+                break
+    finally:
+        results.close()
+        stage_metrics.update(pipeline.metrics())
+    written.extend(path for src in files for path in written_by_source.pop(src, []))
+    return failure
+
+
+def _pass_through(orchestrator: MigrationOrchestrator, src: str, config: MigrationConfig) -> Result[str] | None:
+    """Skip ``src``, or copy it unchanged, when it is not a migration candidate.
+
+    Files are classified with :func:`~.detectors.classify_file`. A file
+    without unittest usage gets a skipped ``Result`` whose
+    ``metadata["skip_reason"]`` says why. With a ``target_root`` (outside
+    dry runs) it is copied to its target byte for byte instead, so the
+    output tree stays complete. Files that cannot be read or parsed are
+    left to the full pipeline, which reports the problem.
+
+    Returns:
+        The file's ``Result``, or ``None`` when it should be migrated.
+    """
+    try:
+        classification = classify_file(src)
+    except (OSError, UnicodeDecodeError, SyntaxError):
+        return None
+    if classification.is_candidate:
+        return None
+    reason = classification.reason
+    _logger.info(f"Skipping {src}: {reason}")
+    if not config.target_root or config.dry_run:
+        return Result.skipped(reason, metadata={"skip_reason": reason})
+
+    loaded = orchestrator.read_for_migration(src, config)
+    if not loaded.is_success() or loaded.data is None:
+        return Result.failure(loaded.error or ValueError(f"Cannot migrate {src}"))
+    context, _ = loaded.data
+    target = Path(context.target_file)
+    try:
+        if target.resolve() != Path(src).resolve():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(src, target)
+    except OSError as e:
+        return Result.failure(e)
+    return Result.success(str(target), metadata={"skip_reason": reason, "copied": True})
+
+
+def _collect_result(
+    src: str,
+    res: Any,
+    config: MigrationConfig,
+    written: list[str],
+    generated_map: dict[str, str],
+    report: MigrationReportWriter | None,
+    skipped: dict[str, str] | None = None,
+) -> bool:
+    """Record one file's result in ``written``, ``generated_map``, ``skipped`` and the report.
+
+    Returns:
+        Whether the file migrated successfully (or was skipped).
+    """
+    if report is not None:
+        try:
+            report.record(src, res, config)
+        except (OSError, TypeError, ValueError) as e:
+            _logger.warning(f"Cannot record {src} in migration report: {e}")
+
+    meta = getattr(res, "metadata", None)
+    if isinstance(meta, dict) and "skip_reason" in meta:
+        if skipped is not None:
+            skipped[src] = str(meta["skip_reason"])
+        if getattr(res, "is_skipped", lambda: False)():
+            return True
+
+    # Defensive handling: tests may monkeypatch migrate_file to return a
+    # lightweight DummyResult without `.data`. Handle objects that expose
+    # `is_success()` and optionally `data` or `error`.
+    try:
+        ok = bool(res.is_success())
+    except Exception:
+        ok = bool(getattr(res, "_success", False))
+
+    if ok:
+        data = getattr(res, "data", None)
+        if data is None:
+            # If no data was returned, fall back to the source path.
+            written.append(src)
+        elif isinstance(data, list):
+            written.extend(data)
+        else:
+            written.append(str(data))
+        # Collect generated_code if present in the per-file result metadata
+        try:
+            meta = getattr(res, "metadata", None) or {}
+            if isinstance(meta, dict) and "generated_code" in meta:
+                # If multiple targets were returned for this source, map
+                # each target to the same generated code; otherwise map
+                # the single target path.
+                gen = meta["generated_code"]
+                if isinstance(data, list):
+                    for d in data:
+                        generated_map[str(d)] = gen
+                elif data is not None:
+                    generated_map[str(data)] = gen
+                else:
+                    generated_map[str(src)] = gen
+        except Exception:
+            pass
+    return ok
+
+
+def analyze(
+    source_files: Iterable[str] | str, config: MigrationConfig | None = None, workers: int | None = None
+) -> Result[RepositoryAnalysis]:
+    """Report migration readiness for one or more files without migrating them.
+
+    Only parsing and IR analysis run; nothing is transformed, formatted or
+    written.
+
+    Args:
+        source_files: Iterable of file paths (or single path string).
+        config: Optional ``MigrationConfig``; ``test_method_prefixes`` is used.
+        workers: Worker processes to use (``None``/``0`` for one per CPU,
+            ``1`` to analyze in-process).
+
+    Returns:
+        ``Result`` containing the ``RepositoryAnalysis``. Files that cannot
+        be parsed are reported in the analysis rather than failing the run.
+    """
+    files = [source_files] if isinstance(source_files, str) else list(source_files)
+    if config is None:
+        config = MigrationConfig()
+
+    try:
+        analysis = analyze_repository(files, test_prefixes=config.test_method_prefixes, workers=workers)
+    except Exception as e:
+        return Result.failure(e)
+
+    if analysis.failed_files:
+        return Result.warning(
+            analysis,
+            [f"Could not analyze {len(analysis.failed_files)} files"],
+            metadata={"failed_files": [f.path for f in analysis.failed_files]},
+        )
+    return Result.success(analysis)
@@ -2,13 +2,19 @@
 
 This module provides the high-level orchestration of the entire
 migration process, coordinating the collector, transformer, formatter,
-and output jobs.
+and output jobs. ``migrate_file_async`` runs the same jobs from asyncio
+code, with filesystem work and transforms on separate executors; worker
+processes get only the file's path and do its I/O themselves.
 
 Copyright (c) 2025 Jim Schilling
 This software is released under the MIT License.
 """
 
+import asyncio
 import logging
+import pickle
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -16,11 +22,14 @@ from .circuit_breaker import CircuitBreakerConfig
 from .context import MigrationConfig, PipelineContext
 from .detectors import UnittestFileDetector
 from .events import EventBus, LoggingSubscriber
+from .exceptions import MigrationError
 from .helpers.path_utils import PathValidationError, validate_source_path, validate_target_path
+from .helpers.source_io import read_source
 from .jobs import CollectorJob, FormatterJob, OutputJob
 from .jobs.decision_analysis_job import DecisionAnalysisJob
 from .pipeline import Pipeline
 from .result import Result
+from .worker_handoff import CodeHandle, spool_code
 
 
 class MigrationOrchestrator:
@@ -70,107 +79,14 @@ class MigrationOrchestrator:
 
         self._logger.info(f"Starting migration of {source_file}")
 
-        # Validate and normalize source file path
-        try:
-            validated_source = validate_source_path(source_file)
-        except PathValidationError as e:
-            return Result.failure(e)
-
-        # Determine target file path. If a target_root is provided in
-        # the config, use it while preserving the original filename and
-        # extension. Otherwise, let PipelineContext.create compute a default
-        # (which preserves the original extension unless overridden by
-        # `target_extension`/`target_suffix`).
-        target_file: str | None = None
-        suffix = config.target_suffix if config else ""
-
-        if config and config.target_root:
-            # Use validated source path
-            src_path = validated_source
-            dest_dir = Path(config.target_root)
-
-            # Validate target directory (pure validation) and ensure parent dir exists
-            try:
-                validated_target_dir = validate_target_path(dest_dir)
-                # Perform the side-effect of creating parent directories
-                from .helpers.path_utils import ensure_parent_dir
-
-                ensure_parent_dir(validated_target_dir)
-            except PathValidationError as e:
-                return Result.failure(e)
-
-            # Determine extension to use (override if provided)
-            if config.target_extension is not None:
-                # Ensure extension starts with a dot
-                ext_to_use = (
-                    f".{config.target_extension}"
-                    if not config.target_extension.startswith(".")
-                    else config.target_extension
-                )
-            else:
-                ext_to_use = src_path.suffix
-            if suffix:
-                # Append suffix to the stem, preserve/override extension
-                new_name = f"{src_path.stem}{suffix}{ext_to_use}"
-            else:
-                # No suffix: preserve full stem and set extension (may be same as original)
-                new_name = f"{src_path.stem}{ext_to_use}"
-
-            target_file = str(validated_target_dir.joinpath(new_name))
-        else:
-            # No explicit target_directory; if a suffix is provided, apply
-            # it to the filename stem. We construct a tentative target and
-            # pass it in; otherwise leave target_file as None to let
-            # PipelineContext.create decide (which will preserve the
-            # original extension by default).
-            if suffix:
-                src_path = Path(source_file)
-                # keep original extension (unless target_extension provided),
-                # but add suffix to stem.
-                if config.target_extension is not None:
-                    # Ensure extension starts with a dot
-                    ext_to_use = (
-                        f".{config.target_extension}"
-                        if not config.target_extension.startswith(".")
-                        else config.target_extension
-                    )
-                else:
-                    ext_to_use = src_path.suffix
-                tentative = f"{src_path.stem}{suffix}{ext_to_use}"
-                # Create target path alongside the source
-                target_file = str(src_path.with_name(tentative))
-
-        # Create pipeline context
-        context = PipelineContext.create(source_file=source_file, target_file=target_file, config=config)
+        loaded = self.read_for_migration(source_file, config)
+        if not loaded.is_success() or loaded.data is None:
+            return Result.failure(loaded.error or ValueError(f"Cannot migrate {source_file}"))
+        context, source_code = loaded.data
 
         # Create the main migration pipeline
         pipeline = self._create_migration_pipeline(config)
 
-        # Read source file content for initial input with enhanced error handling
-        try:
-            # Use validated source path for consistency
-            source_file_path = str(validated_source)
-            with open(source_file_path, encoding="utf-8") as f:
-                source_code = f.read()
-            self._logger.debug(f"Read source code: {len(source_code)} characters")
-        except (FileNotFoundError, PermissionError, UnicodeDecodeError, OSError) as e:
-            # Enhanced error reporting for file operations
-            from .helpers.error_reporting import report_transformation_error
-
-            suggestions = [
-                f"Check if the file exists and is readable: {source_file}",
-                "Verify file permissions",
-                "Ensure the file is not open in another program",
-            ]
-            if isinstance(e, UnicodeDecodeError):
-                suggestions.append("Check if the file is encoded as UTF-8")
-                suggestions.append("Try specifying a different encoding if needed")
-
-            report_transformation_error(
-                e, "migration_orchestrator", "read_source_file", source_file=source_file, suggestions=suggestions
-            )
-            return Result.failure(e)
-
         # Execute the pipeline with source code as initial input
         result = pipeline.execute(context, source_code)
         if result.is_success():
@@ -200,6 +116,168 @@ class MigrationOrchestrator:
 
         return result
 
+    async def migrate_file_async(
+        self,
+        source_file: str,
+        config: MigrationConfig | None = None,
+        *,
+        io_executor: Executor | None = None,
+        transform_executor: Executor | None = None,
+        direct_io: bool | None = None,
+        spool_dir: str | None = None,
+    ) -> Result[str]:
+        """Migrate a single file without blocking the event loop.
+
+        Path validation, the source read and the output write (with its
+        backup) run in ``io_executor``. Analysis, transformation and
+        formatting run in ``transform_executor``, normally a
+        ``ProcessPoolExecutor`` so CPU-bound work leaves the event loop's
+        process. Transforms running in worker processes publish their job
+        events there, not on this orchestrator's bus.
+
+        With ``direct_io`` the worker does the whole file instead: it gets
+        only the path, reads the source, transforms it and writes the output
+        itself, and returns the target path. Dry-run code comes back as a
+        :class:`~.worker_handoff.CodeHandle` spooled to ``spool_dir`` and is
+        read here once the worker is done, so this process never holds the
+        source, and holds the generated code only for finished dry runs.
+
+        Cancelling the awaiting task stops the file at the next stage: a
+        cancelled file is never written, although a read, transform or write
+        that has already started in an executor runs to completion. With
+        ``direct_io`` a file whose worker has started is written.
+
+        Args:
+            source_file: Path to the source unittest file.
+            config: Optional ``MigrationConfig`` to control behavior.
+            io_executor: Executor for filesystem work (default: the loop's
+                default thread pool).
+            transform_executor: Executor for transforms (default: the loop's
+                default thread pool).
+            direct_io: Whether the transform worker reads and writes the file
+                itself (default: when ``transform_executor`` is a
+                ``ProcessPoolExecutor``).
+            spool_dir: Directory for dry-run code handles (default: the
+                system temporary directory).
+
+        Returns:
+            ``Result`` like :meth:`migrate_file`: the target path, with the
+            generated code in ``metadata["generated_code"]`` for dry runs.
+        """
+        if config is None:
+            config = MigrationConfig()
+        loop = asyncio.get_running_loop()
+        self._logger.info(f"Starting async migration of {source_file}")
+        if direct_io is None:
+            direct_io = isinstance(transform_executor, ProcessPoolExecutor)
+        if direct_io:
+            return await self._migrate_file_direct(source_file, config, io_executor, transform_executor, spool_dir)
+
+        loaded = await loop.run_in_executor(io_executor, self.read_for_migration, source_file, config)
+        if not loaded.is_success() or loaded.data is None:
+            return Result.failure(loaded.error or ValueError(f"Cannot migrate {source_file}"))
+        context, source_code = loaded.data
+
+        transformed = await loop.run_in_executor(transform_executor, _transform_in_worker, context, source_code)
+        if not transformed.is_success() or transformed.data is None:
+            self._logger.error(f"Migration failed for {source_file}: {transformed.error}")
+            return transformed
+
+        result = await loop.run_in_executor(io_executor, self.output_job.execute, context, transformed.data)
+        if not result.is_success():
+            self._logger.error(f"Migration failed for {source_file}: {result.error}")
+            return result
+        self._logger.info(f"Migration completed successfully for {source_file}")
+        if config.dry_run:
+            return Result.success(str(result.data), metadata={"generated_code": transformed.data})
+        return result
+
+    async def _migrate_file_direct(
+        self,
+        source_file: str,
+        config: MigrationConfig,
+        io_executor: Executor | None,
+        transform_executor: Executor | None,
+        spool_dir: str | None,
+    ) -> Result[str]:
+        """Run :func:`_migrate_in_worker` and resolve a dry run's code handle."""
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(transform_executor, _migrate_in_worker, source_file, config, spool_dir)
+        if not result.is_success():
+            self._logger.error(f"Migration failed for {source_file}: {result.error}")
+            return result
+        handle = (result.metadata or {}).get("generated_code")
+        if isinstance(handle, CodeHandle):
+            try:
+                code = await loop.run_in_executor(io_executor, handle.read_text)
+            finally:
+                handle.release()
+            result = Result.success(str(result.data), metadata={"generated_code": code})
+        self._logger.info(f"Migration completed successfully for {source_file}")
+        return result
+
+    def read_for_migration(
+        self, source_file: str, config: MigrationConfig | None = None
+    ) -> Result[tuple[PipelineContext, str]]:
+        """Validate ``source_file``, build its pipeline context and read its source.
+
+        This is the first step of every migration path (sequential, async,
+        worker processes and the staged pipeline). The context carries the
+        target path and the file's encoding and newline style in
+        ``metadata["source_encoding"]`` and ``metadata["source_newline"]``.
+
+        Args:
+            source_file: Path to the source unittest file.
+            config: Optional ``MigrationConfig`` to control behavior.
+
+        Returns:
+            ``Result`` containing ``(context, source_code)``, or a failure
+            for invalid paths and unreadable files.
+        """
+        if config is None:
+            config = MigrationConfig()
+        prepared = self._prepare_context(source_file, config)
+        if not prepared.is_success() or prepared.data is None:
+            return Result.failure(prepared.error or ValueError(f"Cannot migrate {source_file}"))
+        read = self._read_source(source_file)
+        if not read.is_success() or read.data is None:
+            return Result.failure(read.error or ValueError(f"Cannot read {source_file}"))
+        return Result.success((self._with_source_format(prepared.data, read), read.data))
+
+    def transform_source(
+        self, source_code: str, config: MigrationConfig | None = None, source_name: str = "<stdin>"
+    ) -> Result[str]:
+        """Convert unittest source code held in memory.
+
+        Runs decision analysis, collection and formatting on ``source_code``
+        without touching the filesystem: no path validation, no reads, no
+        writes, no backups and no stored decision models.
+
+        Args:
+            source_code: Source of the unittest module.
+            config: Optional ``MigrationConfig`` to control behavior. Output
+                location settings are ignored.
+            source_name: Display name used in logs and errors.
+
+        Returns:
+            ``Result`` containing the converted pytest source code.
+        """
+        if config is None:
+            config = MigrationConfig()
+        if not isinstance(source_code, str):
+            return Result.failure(TypeError(f"source_code must be a string, not {type(source_code).__name__}"))
+
+        self._logger.info(f"Starting in-memory migration of {source_name}")
+        context = PipelineContext.create(
+            source_file=source_name, target_file=source_name, config=config, in_memory=True
+        )
+        result = self._create_transform_pipeline().execute(context, source_code)
+        if result.is_success():
+            self._logger.info(f"In-memory migration completed for {source_name}")
+        else:
+            self._logger.error(f"In-memory migration failed for {source_name}: {result.error}")
+        return result
+
     def migrate_directory(self, source_dir: str, config: MigrationConfig | None = None) -> Result[list[str]]:
         """Migrate all unittest files under a directory.
 
@@ -287,6 +365,131 @@ class MigrationOrchestrator:
 
         return Result.success(successful_migrations)
 
+    def _prepare_context(self, source_file: str, config: MigrationConfig) -> Result[PipelineContext]:
+        """Validate ``source_file`` and build its pipeline context with the target path.
+
+        Returns:
+            ``Result`` containing the context, or a failure for invalid paths.
+        """
+        # Validate and normalize source file path
+        try:
+            validated_source = validate_source_path(source_file)
+        except PathValidationError as e:
+            return Result.failure(e)
+
+        # Determine target file path. If a target_root is provided in
+        # the config, use it while preserving the original filename and
+        # extension. Otherwise, let PipelineContext.create compute a default
+        # (which preserves the original extension unless overridden by
+        # `target_extension`/`target_suffix`).
+        target_file: str | None = None
+        suffix = config.target_suffix if config else ""
+
+        if config and config.target_root:
+            # Use validated source path
+            src_path = validated_source
+            dest_dir = Path(config.target_root)
+
+            # Validate target directory (pure validation) and ensure parent dir exists
+            try:
+                validated_target_dir = validate_target_path(dest_dir)
+                # Perform the side-effect of creating parent directories
+                from .helpers.path_utils import ensure_parent_dir
+
+                ensure_parent_dir(validated_target_dir)
+            except PathValidationError as e:
+                return Result.failure(e)
+
+            # Determine extension to use (override if provided)
+            if config.target_extension is not None:
+                # Ensure extension starts with a dot
+                ext_to_use = (
+                    f".{config.target_extension}"
+                    if not config.target_extension.startswith(".")
+                    else config.target_extension
+                )
+            else:
+                ext_to_use = src_path.suffix
+            if suffix:
+                # Append suffix to the stem, preserve/override extension
+                new_name = f"{src_path.stem}{suffix}{ext_to_use}"
+            else:
+                # No suffix: preserve full stem and set extension (may be same as original)
+                new_name = f"{src_path.stem}{ext_to_use}"
+
+            target_file = str(validated_target_dir.joinpath(new_name))
+        else:
+            # No explicit target_directory; if a suffix is provided, apply
+            # it to the filename stem. We construct a tentative target and
+            # pass it in; otherwise leave target_file as None to let
+            # PipelineContext.create decide (which will preserve the
+            # original extension by default).
+            if suffix:
+                src_path = Path(source_file)
+                # keep original extension (unless target_extension provided),
+                # but add suffix to stem.
+                if config.target_extension is not None:
+                    # Ensure extension starts with a dot
+                    ext_to_use = (
+                        f".{config.target_extension}"
+                        if not config.target_extension.startswith(".")
+                        else config.target_extension
+                    )
+                else:
+                    ext_to_use = src_path.suffix
+                tentative = f"{src_path.stem}{suffix}{ext_to_use}"
+                # Create target path alongside the source
+                target_file = str(src_path.with_name(tentative))
+
+        # Create pipeline context
+        context = PipelineContext.create(source_file=source_file, target_file=target_file, config=config)
+        return Result.success(context)
+
+    def _read_source(self, source_file: str) -> Result[str]:
+        """Read ``source_file`` in its own encoding, reporting failures with suggestions.
+
+        The file is read through :func:`~.helpers.source_io.read_source`, so
+        it is shared with other consumers inside a ``source_cache()``.
+
+        Returns:
+            ``Result`` containing the source code, with the file's encoding
+            and newline style in ``metadata["source_encoding"]`` and
+            ``metadata["source_newline"]``.
+        """
+        # Read source file content for initial input with enhanced error handling
+        try:
+            source = read_source(source_file)
+            self._logger.debug(f"Read source code: {len(source.text)} characters ({source.encoding})")
+        except (FileNotFoundError, PermissionError, UnicodeDecodeError, OSError) as e:
+            # Enhanced error reporting for file operations
+            from .helpers.error_reporting import report_transformation_error
+
+            suggestions = [
+                f"Check if the file exists and is readable: {source_file}",
+                "Verify file permissions",
+                "Ensure the file is not open in another program",
+            ]
+            if isinstance(e, UnicodeDecodeError):
+                suggestions.append(f"Check if the file is encoded as {e.encoding}")
+                suggestions.append("Declare the file's encoding with a PEP 263 coding comment if it is not UTF-8")
+
+            report_transformation_error(
+                e, "migration_orchestrator", "read_source_file", source_file=source_file, suggestions=suggestions
+            )
+            return Result.failure(e)
+        return Result.success(
+            source.text, metadata={"source_encoding": source.encoding, "source_newline": source.newline}
+        )
+
+    @staticmethod
+    def _with_source_format(context: PipelineContext, read: Result[str]) -> PipelineContext:
+        """Copy the encoding and newline style from a :meth:`_read_source` result into ``context``."""
+        for key in ("source_encoding", "source_newline"):
+            value = (read.metadata or {}).get(key)
+            if value is not None:
+                context = context.with_metadata(key, value)
+        return context
+
     def _create_migration_pipeline(self, config: MigrationConfig | None = None) -> Pipeline[str, str]:
         """Create the main migration pipeline.
 
@@ -303,3 +506,70 @@ class MigrationOrchestrator:
         jobs: list[Any] = [self.decision_analysis_job, self.collector_job, self.formatter_job, self.output_job]
 
         return Pipeline("migration", jobs, self.event_bus, self.circuit_breaker_config)
+
+    def _create_transform_pipeline(self) -> Pipeline[str, str]:
+        """Create the pipeline that turns source code into formatted pytest code without writing it."""
+        jobs: list[Any] = [self.decision_analysis_job, self.collector_job, self.formatter_job]
+        return Pipeline("transform", jobs, self.event_bus, self.circuit_breaker_config)
+
+
+_worker_state = threading.local()
+
+
+def _transform_in_worker(context: PipelineContext, source_code: str) -> Result[str]:
+    """Run the transform pipeline for one file in an executor worker.
+
+    Each worker process (or thread) keeps its own orchestrator, so jobs and
+    their caches are never shared between concurrent transforms. Errors that
+    cannot be pickled back to the parent are replaced by a
+    :class:`MigrationError` carrying the same message.
+    """
+    result = _worker_orchestrator()._create_transform_pipeline().execute(context, source_code)
+    return _portable(result)
+
+
+def _migrate_in_worker(source_file: str, config: MigrationConfig, spool_dir: str | None = None) -> Result[str]:
+    """Migrate one file entirely inside an executor worker.
+
+    The worker reads the source, transforms it and writes the output (with
+    its backup) itself, so only the path goes in and a compact ``Result``
+    comes back: the target path, plus a :class:`CodeHandle` in
+    ``metadata["generated_code"]`` for dry runs.
+    """
+    orchestrator = _worker_orchestrator()
+    loaded = orchestrator.read_for_migration(source_file, config)
+    if not loaded.is_success() or loaded.data is None:
+        return _portable(Result.failure(loaded.error or ValueError(f"Cannot migrate {source_file}")))
+    context, source_code = loaded.data
+
+    transformed = orchestrator._create_transform_pipeline().execute(context, source_code)
+    if not transformed.is_success() or transformed.data is None:
+        return _portable(transformed)
+    written = orchestrator.output_job.execute(context, transformed.data)
+    if not written.is_success():
+        return _portable(written)
+
+    # Only the target path (and, for dry runs, a handle to the code) goes back
+    if config.dry_run:
+        return Result.success(str(written.data), metadata={"generated_code": spool_code(transformed.data, spool_dir)})
+    return Result.success(str(written.data))
+
+
+def _worker_orchestrator() -> "MigrationOrchestrator":
+    """Return this worker's orchestrator, created on first use."""
+    orchestrator = getattr(_worker_state, "orchestrator", None)
+    if orchestrator is None:
+        orchestrator = MigrationOrchestrator()
+        _worker_state.orchestrator = orchestrator
+    return orchestrator
+
+
+def _portable(result: Result[Any]) -> Result[Any]:
+    """Replace an error that cannot be pickled back to the parent by a :class:`MigrationError`."""
+    if result.error is not None:
+        try:
+            pickle.loads(pickle.dumps(result.error))
+        except Exception:
+            error = MigrationError(f"{type(result.error).__name__}: {result.error}")
+            return Result.failure(error, metadata=dict(result.metadata or {}))
+    return result
@@ -0,0 +1,307 @@
+"""Streaming migration report.
+
+:class:`MigrationReportWriter` appends one JSON object per migrated file to
+a JSON Lines report as each file completes, through a buffered file
+handle. Per-stage timings and decision strategy counts are collected from
+the pipeline events and released as soon as the file's line is written, so
+memory use does not grow with the number of files.
+
+For ``report_format`` ``markdown`` or ``html`` a summary is rendered from
+the finished JSONL file afterwards (:func:`render_report_summary`). The
+JSONL file is read twice, once for the totals and once for the per-file
+table, and never loaded as a whole.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+import html
+import json
+import logging
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from .context import MigrationConfig
+from .events import EventBus, JobCompletedEvent, PipelineCompletedEvent
+
+__all__ = [
+    "REPORT_FILENAME",
+    "MigrationReportWriter",
+    "default_report_path",
+    "iter_report_records",
+    "render_report_summary",
+]
+
+_logger = logging.getLogger(__name__)
+
+REPORT_FILENAME = "migration-report.jsonl"
+"""File name of the JSONL report when ``report_path`` is not configured."""
+
+_SUMMARY_SUFFIXES = {"markdown": ".md", "html": ".html"}
+_BUFFER_SIZE = 64 * 1024
+
+
+def default_report_path(config: MigrationConfig, source_files: list[str]) -> Path | None:
+    """Return where the JSONL report for a run is written.
+
+    ``config.report_path`` wins when set. Otherwise the report is written to
+    ``target_root``, or next to the first source file. Dry runs write no
+    report unless ``report_path`` is set, since they write no other files.
+
+    Args:
+        config: Migration configuration of the run.
+        source_files: Files being migrated.
+
+    Returns:
+        The report path, or ``None`` when no report should be written.
+    """
+    if not config.generate_report:
+        return None
+    if config.report_path:
+        return Path(config.report_path)
+    if config.dry_run or not source_files:
+        return None
+    if config.target_root:
+        return Path(config.target_root) / REPORT_FILENAME
+    return Path(source_files[0]).parent / REPORT_FILENAME
+
+
+class MigrationReportWriter:
+    """Write one JSON line per migrated file as the run progresses.
+
+    Attach it to the event bus used by the orchestrator, then call
+    :meth:`record` with each file's result. Use it as a context manager
+    (or call :meth:`close`) so the buffered lines reach the file.
+    """
+
+    def __init__(self, path: str | Path, event_bus: EventBus | None = None, buffer_size: int = _BUFFER_SIZE) -> None:
+        """Open the report file and subscribe to pipeline events.
+
+        Args:
+            path: JSONL report file; it is replaced if it exists.
+            event_bus: Bus the migration publishes job and pipeline events
+                on. Without it, lines carry no timings or strategy counts.
+            buffer_size: Size of the write buffer in bytes.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("w", encoding="utf-8", buffering=buffer_size)
+        self.records_written = 0
+        # Per-source state gathered from events, dropped once the line is written
+        self._stage_ms: dict[str, dict[str, float]] = {}
+        self._details: dict[str, dict[str, Any]] = {}
+        self._event_bus = event_bus
+        if event_bus is not None:
+            event_bus.subscribe(JobCompletedEvent, self._on_job_completed)
+            event_bus.subscribe(PipelineCompletedEvent, self._on_pipeline_completed)
+
+    def __enter__(self) -> MigrationReportWriter:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def _on_job_completed(self, event: JobCompletedEvent) -> None:
+        stages = self._stage_ms.setdefault(event.context.source_file, {})
+        stages[event.job_name] = stages.get(event.job_name, 0.0) + event.duration_ms
+
+    def _on_pipeline_completed(self, event: PipelineCompletedEvent) -> None:
+        context = event.context
+        details = self._details.setdefault(context.source_file, {"target": context.target_file})
+        model = context.metadata.get("decision_model")
+        if model is not None and "strategies" not in details:
+            try:
+                details["strategies"] = dict(model.get_statistics()["strategy_counts"])
+            except (AttributeError, KeyError, TypeError):
+                pass
+
+    def record(self, source_file: str, result: Any, config: MigrationConfig) -> dict[str, Any]:
+        """Append the report line for ``source_file`` and return it.
+
+        Args:
+            source_file: Migrated file, as passed to the orchestrator.
+            result: The file's migration ``Result``.
+            config: Migration configuration of the run.
+
+        Returns:
+            The record that was written.
+        """
+        stages = self._stage_ms.pop(source_file, {})
+        details = self._details.pop(source_file, {})
+        try:
+            success = bool(result.is_success())
+        except Exception:
+            success = bool(getattr(result, "_success", False))
+        meta = getattr(result, "metadata", None)
+        skip_reason = meta.get("skip_reason") if isinstance(meta, dict) else None
+        skipped = skip_reason is not None and bool(getattr(result, "is_skipped", lambda: False)())
+        warnings = list(getattr(result, "warnings", None) or [])
+        data = getattr(result, "data", None)
+        target = data[0] if isinstance(data, list) and data else data
+        if not success or target is None:
+            target = details.get("target")
+
+        record: dict[str, Any] = {
+            "source": source_file,
+            "target": str(target) if target is not None else None,
+            "status": "skipped" if skipped else ("warning" if warnings else "success") if success else "failed",
+            "dry_run": config.dry_run,
+            "tier": config.degradation_tier if config.degradation_enabled else None,
+            "strategies": details.get("strategies", {}),
+            "timings_ms": {name: round(ms, 3) for name, ms in stages.items()},
+            "input_bytes": _file_size(source_file),
+            "output_bytes": _output_size(result, target, config) if success else None,
+            "warnings": warnings,
+            "error": None if success or skipped else str(getattr(result, "error", None) or "Migration failed"),
+            "skip_reason": skip_reason,
+        }
+        self._handle.write(json.dumps(record, ensure_ascii=False))
+        self._handle.write("\n")
+        self.records_written += 1
+        return record
+
+    def close(self) -> None:
+        """Flush and close the report file and stop listening for events."""
+        if self._event_bus is not None:
+            self._event_bus.unsubscribe(JobCompletedEvent, self._on_job_completed)
+            self._event_bus.unsubscribe(PipelineCompletedEvent, self._on_pipeline_completed)
+            self._event_bus = None
+        if not self._handle.closed:
+            self._handle.close()
+        self._stage_ms.clear()
+        self._details.clear()
+
+
+def _file_size(path: Any) -> int | None:
+    try:
+        return Path(path).stat().st_size
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def _output_size(result: Any, target: Any, config: MigrationConfig) -> int | None:
+    if config.dry_run:
+        metadata = getattr(result, "metadata", None) or {}
+        code = metadata.get("generated_code") if isinstance(metadata, dict) else None
+        return len(code.encode("utf-8")) if isinstance(code, str) else None
+    return _file_size(target) if target is not None else None
+
+
+def iter_report_records(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of a JSONL report one at a time, skipping blank lines."""
+    with Path(path).open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _totals(path: Path) -> dict[str, Any]:
+    statuses: Counter[str] = Counter()
+    strategies: Counter[str] = Counter()
+    stages: Counter[str] = Counter()
+    totals: dict[str, Any] = {"files": 0, "input_bytes": 0, "output_bytes": 0, "warnings": 0}
+    for record in iter_report_records(path):
+        totals["files"] += 1
+        statuses[record.get("status", "unknown")] += 1
+        strategies.update(record.get("strategies") or {})
+        stages.update(record.get("timings_ms") or {})
+        totals["input_bytes"] += record.get("input_bytes") or 0
+        totals["output_bytes"] += record.get("output_bytes") or 0
+        totals["warnings"] += len(record.get("warnings") or [])
+    totals["statuses"] = dict(statuses.most_common())
+    totals["strategies"] = {name: count for name, count in strategies.most_common() if count}
+    totals["timings_ms"] = dict(stages)
+    return totals
+
+
+def _summary_rows(totals: dict[str, Any]) -> list[tuple[str, str]]:
+    rows = [("Files", str(totals["files"]))]
+    rows += [(f"Status: {status}", str(count)) for status, count in totals["statuses"].items()]
+    rows += [(f"Strategy: {name}", str(count)) for name, count in totals["strategies"].items()]
+    rows += [(f"Stage: {name}", f"{ms / 1000:.2f} s") for name, ms in totals["timings_ms"].items()]
+    rows += [
+        ("Input bytes", f"{totals['input_bytes']:,}"),
+        ("Output bytes", f"{totals['output_bytes']:,}"),
+        ("Warnings", str(totals["warnings"])),
+    ]
+    return rows
+
+
+def _file_cells(record: dict[str, Any]) -> list[str]:
+    total_ms = sum((record.get("timings_ms") or {}).values())
+    return [
+        str(record.get("source", "")),
+        str(record.get("target") or ""),
+        str(record.get("status", "")),
+        ", ".join(f"{name}: {count}" for name, count in (record.get("strategies") or {}).items() if count),
+        f"{total_ms:.1f}",
+        str(len(record.get("warnings") or [])),
+        str(record.get("error") or ""),
+    ]
+
+
+_FILE_HEADERS = ["Source", "Target", "Status", "Strategies", "Time (ms)", "Warnings", "Error"]
+
+
+def _markdown_cell(text: str) -> str:
+    return text.replace("|", "\\|").replace("\n", " ")
+
+
+def _write_markdown(source: Path, out: Any, totals: dict[str, Any]) -> None:
+    out.write("# Migration Report\n\n## Summary\n\n| Metric | Value |\n| --- | --- |\n")
+    for name, value in _summary_rows(totals):
+        out.write(f"| {name} | {value} |\n")
+    out.write("\n## Files\n\n")
+    out.write("| " + " | ".join(_FILE_HEADERS) + " |\n")
+    out.write("|" + " --- |" * len(_FILE_HEADERS) + "\n")
+    for record in iter_report_records(source):
+        out.write("| " + " | ".join(_markdown_cell(cell) for cell in _file_cells(record)) + " |\n")
+
+
+def _write_html(source: Path, out: Any, totals: dict[str, Any]) -> None:
+    out.write('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<title>Migration Report</title>\n</head>\n')
+    out.write("<body>\n<h1>Migration Report</h1>\n<h2>Summary</h2>\n<table>\n")
+    for name, value in _summary_rows(totals):
+        out.write(f"<tr><th>{html.escape(name)}</th><td>{html.escape(value)}</td></tr>\n")
+    out.write("</table>\n<h2>Files</h2>\n<table>\n<tr>")
+    out.write("".join(f"<th>{header}</th>" for header in _FILE_HEADERS) + "</tr>\n")
+    for record in iter_report_records(source):
+        out.write("<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in _file_cells(record)) + "</tr>\n")
+    out.write("</table>\n</body>\n</html>\n")
+
+
+def render_report_summary(jsonl_path: str | Path, report_format: str) -> Path | None:
+    """Render a Markdown or HTML summary next to a JSONL report.
+
+    Args:
+        jsonl_path: JSONL report written by :class:`MigrationReportWriter`.
+        report_format: ``markdown`` or ``html``; ``json`` renders nothing
+            because the JSONL file is the report.
+
+    Returns:
+        Path of the rendered summary, or ``None`` for ``json``.
+
+    Raises:
+        ValueError: If ``report_format`` is not supported.
+    """
+    if report_format == "json":
+        return None
+    suffix = _SUMMARY_SUFFIXES.get(report_format)
+    if suffix is None:
+        raise ValueError(f"Unsupported report format: {report_format}")
+    source = Path(jsonl_path)
+    totals = _totals(source)
+    output = source.with_suffix(suffix)
+    with output.open("w", encoding="utf-8", buffering=_BUFFER_SIZE) as out:
+        if report_format == "markdown":
+            _write_markdown(source, out, totals)
+        else:
+            _write_html(source, out, totals)
+    return output
@@ -75,9 +75,25 @@ class UnittestPatternAnalyzer(cst.CSTVisitor):
             imports.
         """
         try:
-            # Parse the code into CST
             module = cst.parse_module(code)
+        except Exception as e:
+            raise ValueError(f"Failed to analyze module: {e}") from e
+        return self.analyze_parsed_module(module)
+
+    def analyze_parsed_module(self, module: cst.Module) -> TestModule:
+        """Analyze an already parsed module and return its IR representation.
+
+        Callers that already hold a ``libcst.Module`` use this to avoid
+        parsing the source a second time.
 
+        Args:
+            module: Parsed module to analyze.
+
+        Returns:
+            ``TestModule`` representing the discovered tests, fixtures, and
+            imports.
+        """
+        try:
             # Create the IR module
             ir_module = TestModule(
                 name="test_module",  # Will be updated with actual filename
@@ -122,12 +138,13 @@ class UnittestPatternAnalyzer(cst.CSTVisitor):
         except Exception as e:
             raise ValueError(f"Failed to analyze module: {e}") from e
 
-    def visit_ClassDef(self, node: cst.ClassDef) -> None:
+    def visit_ClassDef(self, node: cst.ClassDef) -> bool:
         """Handle a class definition and record test-class information.
 
         This method records base classes, detects ``unittest.TestCase``
         inheritance, and collects methods for later processing. Also handles
-        nested test classes by maintaining a class hierarchy stack.
+        nested test classes by maintaining a class hierarchy stack. The class
+        body is visited here, so the generic traversal does not descend again.
         """
         class_name = node.name.value
 
@@ -165,12 +182,15 @@ class UnittestPatternAnalyzer(cst.CSTVisitor):
         # Restore previous class and pop from stack
         self.current_class = old_class
         self._class_stack.pop()
+        return False
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool | None:
         """Handle a function definition to classify test methods and fixtures.
 
         Module-level functions are treated as standalone functions and
-        converted to ``TestMethod`` entries in the IR when appropriate.
+        converted to ``TestMethod`` entries in the IR when appropriate. Test
+        method bodies are visited by ``_analyze_test_method`` and are not
+        descended into again.
         """
         func_name = node.name.value
 
@@ -185,7 +205,7 @@ class UnittestPatternAnalyzer(cst.CSTVisitor):
         # Check if this is a test method
         if self._is_test_method(func_name):
             self._analyze_test_method(node, func_name)
-            return
+            return self.current_class is None
 
         # Regular function - add to standalone functions if in module level
         if self.current_class is None:
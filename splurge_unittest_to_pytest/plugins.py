@@ -10,12 +10,16 @@ import importlib
 import importlib.util
 import inspect
 import logging
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from .result import Result
 
+if TYPE_CHECKING:
+    from .transformers.assert_dispatch import AssertionRule
+
 logger = logging.getLogger(__name__)
 
 
@@ -132,6 +136,7 @@ class PluginManager:
 
         self.plugins[plugin_info.name] = plugin_info
         logger.info(f"Registered plugin: {plugin_info.name} v{plugin_info.version}")
+        self._install_assertion_rules(plugin_info.name)
         return True
 
     def enable_plugin(self, plugin_name: str) -> bool:
@@ -147,6 +152,7 @@ class PluginManager:
             self.plugins[plugin_name].enabled = True
             # Remove from loaded plugins so it gets reloaded
             self._loaded_plugins.pop(plugin_name, None)
+            self._install_assertion_rules(plugin_name)
             logger.info(f"Enabled plugin: {plugin_name}")
             return True
         return False
@@ -164,6 +170,7 @@ class PluginManager:
             self.plugins[plugin_name].enabled = False
             # Remove from loaded plugins
             self._loaded_plugins.pop(plugin_name, None)
+            self._assertion_registry().unregister_source(plugin_name)
             logger.info(f"Disabled plugin: {plugin_name}")
             return True
         return False
@@ -193,6 +200,66 @@ class PluginManager:
             logger.error(f"Failed to instantiate plugin {plugin_name}: {e}")
             return None
 
+    def register_assertion_rule(
+        self,
+        method_name: str,
+        rewrite: Callable[..., Any],
+        *,
+        uses_context: bool = False,
+        requires: Iterable[str] = (),
+        source: str = "plugin",
+        replace: bool = False,
+    ) -> bool:
+        """Register a rewrite for a ``self.<method_name>(...)`` assertion call.
+
+        Args:
+            method_name: Assertion method handled by the rule, e.g. ``"assertAlmostEqualDict"``
+            rewrite: Function returning the replacement node; called as
+                ``rewrite(call)`` or, with ``uses_context``, ``rewrite(call, transformer)``
+            uses_context: Pass the running transformer to ``rewrite``
+            requires: Modules the rewritten code needs imported (``"pytest"``, ``"re"``)
+            source: Name recorded on the rule, used to unregister it later
+            replace: Allow overriding a built-in or previously registered rule
+
+        Returns:
+            True if the rule was registered, False otherwise
+        """
+        from .transformers.assert_dispatch import AssertionRule
+
+        rule = AssertionRule(
+            method_name, rewrite, uses_context=uses_context, requires=frozenset(requires), source=source
+        )
+        return self._assertion_registry().register(rule, replace=replace)
+
+    def _install_assertion_rules(self, plugin_name: str) -> None:
+        """Register the assertion rules an enabled plugin provides.
+
+        Plugins opt in by defining ``assertion_rules()`` returning
+        :class:`~splurge_unittest_to_pytest.transformers.assert_dispatch.AssertionRule`
+        records; they are registered under the plugin's name and may
+        replace built-in rules.
+        """
+        if not hasattr(self.plugins[plugin_name].plugin_class, "assertion_rules"):
+            return
+        plugin = self.get_plugin(plugin_name)
+        if plugin is None:
+            return
+        registry = self._assertion_registry()
+        registry.unregister_source(plugin_name)
+        try:
+            rules: Iterable[AssertionRule] = plugin.assertion_rules()  # type: ignore[attr-defined]
+            for rule in rules:
+                rule.source = plugin_name
+                registry.register(rule, replace=True)
+        except Exception as e:
+            logger.warning(f"Plugin {plugin_name} failed to provide assertion rules: {e}")
+
+    @staticmethod
+    def _assertion_registry():
+        from .transformers.assert_dispatch import get_assertion_registry
+
+        return get_assertion_registry()
+
     def find_plugins_for_node(self, node: Any, context: Any) -> list[TransformationPlugin]:
         """Find all enabled plugins that can handle the given node.
 
@@ -0,0 +1,341 @@
+"""Repository-wide migration readiness analysis.
+
+Runs only the parse and IR stages (``UnittestPatternAnalyzer``) plus a
+light feature scan over many files, optionally in parallel worker
+processes, and aggregates the results into migration readiness numbers:
+assertion types, fixtures, subTests, constructs the migration does not
+convert, and an estimate of the manual effort involved. No code is
+transformed, formatted or written.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import time
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import Any
+
+import libcst as cst
+
+from .helpers.source_io import read_source
+from .ir import AssertionType, TestModule
+from .pattern_analyzer import UnittestPatternAnalyzer
+
+__all__ = [
+    "EFFORT_MINUTES",
+    "FileAnalysis",
+    "RepositoryAnalysis",
+    "analyze_file",
+    "analyze_repository",
+]
+
+_logger = logging.getLogger(__name__)
+
+EFFORT_MINUTES: dict[str, float] = {
+    "file": 2.0,
+    "assertion": 0.1,
+    "fixture": 3.0,
+    "subtest": 5.0,
+    "unsupported": 15.0,
+    "parse_error": 30.0,
+}
+"""Heuristic minutes of manual review per file and per feature found."""
+
+# ``self.<name>(...)`` calls the migration leaves untouched
+_UNSUPPORTED_SELF_CALLS = frozenset(
+    {
+        "addCleanup",
+        "addClassCleanup",
+        "addTypeEqualityFunc",
+        "doCleanups",
+        "enterClassContext",
+        "enterContext",
+    }
+)
+# TestCase class attributes that change assertion behavior
+_UNSUPPORTED_CLASS_ATTRIBUTES = frozenset({"failureException", "longMessage", "maxDiff"})
+_UNSUPPORTED_BASES = frozenset({"IsolatedAsyncioTestCase"})
+_UNSUPPORTED_MODULE_FUNCTIONS = frozenset({"load_tests"})
+# Files without any of these names cannot contain a scanned feature, so the
+# CST feature scan (a full traversal) is skipped for them
+_FEATURE_HINT = re.compile(
+    "|".join(
+        sorted(
+            {"subTest"}
+            | _UNSUPPORTED_SELF_CALLS
+            | _UNSUPPORTED_CLASS_ATTRIBUTES
+            | _UNSUPPORTED_BASES
+            | _UNSUPPORTED_MODULE_FUNCTIONS
+        )
+    )
+)
+
+
+@dataclass
+class FileAnalysis:
+    """Readiness facts for a single source file.
+
+    Attributes:
+        path: Analyzed file path.
+        lines: Number of source lines.
+        test_classes: ``unittest.TestCase`` classes (including subclasses of
+            other test classes in the same file).
+        test_methods: Test methods in those classes.
+        assertions: Assertion counts keyed by unittest method name.
+        fixtures: setUp/tearDown style fixtures.
+        subtests: ``self.subTest`` calls.
+        unsupported: Counts of constructs the migration does not convert.
+        error: Read or parse error, when the file could not be analyzed.
+    """
+
+    path: str
+    lines: int = 0
+    test_classes: int = 0
+    test_methods: int = 0
+    assertions: dict[str, int] = field(default_factory=dict)
+    fixtures: int = 0
+    subtests: int = 0
+    unsupported: dict[str, int] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def is_unittest(self) -> bool:
+        """Return True when the file contains unittest test classes."""
+        return self.test_classes > 0
+
+    @property
+    def effort_minutes(self) -> float:
+        """Estimated minutes of manual migration effort for this file."""
+        if self.error is not None:
+            return EFFORT_MINUTES["parse_error"]
+        if not self.is_unittest:
+            return 0.0
+        return (
+            EFFORT_MINUTES["file"]
+            + EFFORT_MINUTES["assertion"] * sum(self.assertions.values())
+            + EFFORT_MINUTES["fixture"] * self.fixtures
+            + EFFORT_MINUTES["subtest"] * self.subtests
+            + EFFORT_MINUTES["unsupported"] * sum(self.unsupported.values())
+        )
+
+
+@dataclass
+class RepositoryAnalysis:
+    """Aggregated readiness numbers for a set of files.
+
+    Attributes:
+        files: Per-file results in input order.
+        workers: Number of worker processes used (1 means in-process).
+        elapsed_seconds: Wall time of the analysis.
+    """
+
+    files: list[FileAnalysis]
+    workers: int = 1
+    elapsed_seconds: float = 0.0
+
+    @property
+    def unittest_files(self) -> list[FileAnalysis]:
+        """Files that contain unittest test classes."""
+        return [f for f in self.files if f.is_unittest]
+
+    @property
+    def failed_files(self) -> list[FileAnalysis]:
+        """Files that could not be read or parsed."""
+        return [f for f in self.files if f.error is not None]
+
+    def assertion_counts(self) -> dict[str, int]:
+        """Return assertion counts across all files, most common first."""
+        totals: Counter[str] = Counter()
+        for file_analysis in self.files:
+            totals.update(file_analysis.assertions)
+        return dict(totals.most_common())
+
+    def unsupported_counts(self) -> dict[str, int]:
+        """Return unsupported construct counts across all files, most common first."""
+        totals: Counter[str] = Counter()
+        for file_analysis in self.files:
+            totals.update(file_analysis.unsupported)
+        return dict(totals.most_common())
+
+    @property
+    def effort_hours(self) -> float:
+        """Estimated hours of manual migration effort for all files."""
+        return sum(f.effort_minutes for f in self.files) / 60.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the analysis to a JSON-serializable dictionary."""
+        return {
+            "summary": {
+                "files": len(self.files),
+                "unittest_files": len(self.unittest_files),
+                "failed_files": len(self.failed_files),
+                "lines": sum(f.lines for f in self.files),
+                "test_classes": sum(f.test_classes for f in self.files),
+                "test_methods": sum(f.test_methods for f in self.files),
+                "assertions": self.assertion_counts(),
+                "fixtures": sum(f.fixtures for f in self.files),
+                "subtests": sum(f.subtests for f in self.files),
+                "unsupported": self.unsupported_counts(),
+                "effort_hours": round(self.effort_hours, 2),
+                "workers": self.workers,
+                "elapsed_seconds": round(self.elapsed_seconds, 3),
+            },
+            "files": [
+                {
+                    "path": f.path,
+                    "lines": f.lines,
+                    "test_classes": f.test_classes,
+                    "test_methods": f.test_methods,
+                    "assertions": f.assertions,
+                    "fixtures": f.fixtures,
+                    "subtests": f.subtests,
+                    "unsupported": f.unsupported,
+                    "effort_minutes": round(f.effort_minutes, 1),
+                    "error": f.error,
+                }
+                for f in self.files
+            ],
+        }
+
+
+class _FeatureScanner(cst.CSTVisitor):
+    """Count subTests and unsupported constructs not represented in the IR."""
+
+    def __init__(self) -> None:
+        self.subtests = 0
+        self.unsupported: Counter[str] = Counter()
+        self._class_depth = 0
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> None:
+        for base in node.bases:
+            value = base.value
+            name = value.attr.value if isinstance(value, cst.Attribute) else getattr(value, "value", None)
+            if name in _UNSUPPORTED_BASES:
+                self.unsupported[name] += 1
+        for stmt in node.body.body:
+            if not isinstance(stmt, cst.SimpleStatementLine):
+                continue
+            for small in stmt.body:
+                targets = small.targets if isinstance(small, cst.Assign) else []
+                for target in targets:
+                    name = getattr(target.target, "value", None)
+                    if isinstance(target.target, cst.Name) and name in _UNSUPPORTED_CLASS_ATTRIBUTES:
+                        self.unsupported[name] += 1
+        self._class_depth += 1
+
+    def leave_ClassDef(self, original_node: cst.ClassDef) -> None:
+        self._class_depth -= 1
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
+        if self._class_depth == 0 and node.name.value in _UNSUPPORTED_MODULE_FUNCTIONS:
+            self.unsupported[node.name.value] += 1
+
+    def visit_Call(self, node: cst.Call) -> None:
+        func = node.func
+        if not (isinstance(func, cst.Attribute) and isinstance(func.value, cst.Name)):
+            return
+        if func.value.value not in ("self", "cls"):
+            return
+        name = func.attr.value
+        if name == "subTest":
+            self.subtests += 1
+        elif name in _UNSUPPORTED_SELF_CALLS:
+            self.unsupported[name] += 1
+
+
+def _count_assertions(ir_module: TestModule) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for assertion_type in AssertionType:
+        found = len(ir_module.get_assertions_by_type(assertion_type))
+        if found:
+            counts[assertion_type.value] = found
+    return counts
+
+
+def analyze_file(path: str, test_prefixes: list[str] | None = None) -> FileAnalysis:
+    """Analyze one file without transforming it.
+
+    Args:
+        path: File to analyze.
+        test_prefixes: Test method prefixes (defaults to the analyzer's).
+
+    Returns:
+        ``FileAnalysis`` for ``path``. Read and parse failures are recorded
+        in ``error`` rather than raised.
+    """
+    result = FileAnalysis(path=path)
+    try:
+        source = read_source(path).text
+        result.lines = len(source.splitlines())
+        module = cst.parse_module(source)
+    except (OSError, UnicodeDecodeError, cst.ParserSyntaxError) as e:
+        result.error = f"{type(e).__name__}: {e}".splitlines()[0]
+        return result
+
+    try:
+        ir_module = UnittestPatternAnalyzer(test_prefixes=test_prefixes).analyze_parsed_module(module)
+    except ValueError as e:
+        result.error = str(e).splitlines()[0]
+        return result
+
+    test_classes = [cls for cls in ir_module.classes if cls.is_unittest_class]
+    result.test_classes = len(test_classes)
+    result.test_methods = sum(len(cls.methods) for cls in test_classes)
+    result.assertions = _count_assertions(ir_module)
+    result.fixtures = sum(
+        fixture is not None
+        for cls in test_classes
+        for fixture in (cls.class_setup, cls.class_teardown, cls.instance_setup, cls.instance_teardown)
+    )
+
+    if _FEATURE_HINT.search(source):
+        scanner = _FeatureScanner()
+        module.visit(scanner)
+        result.subtests = scanner.subtests
+        result.unsupported = dict(scanner.unsupported)
+    return result
+
+
+def analyze_repository(
+    source_files: Iterable[str], test_prefixes: list[str] | None = None, workers: int | None = None
+) -> RepositoryAnalysis:
+    """Analyze many files, in parallel worker processes when worthwhile.
+
+    Args:
+        source_files: Files to analyze.
+        test_prefixes: Test method prefixes passed to the analyzer.
+        workers: Worker process count; ``None`` or ``0`` uses one per CPU.
+            ``1`` analyzes in the calling process.
+
+    Returns:
+        ``RepositoryAnalysis`` with one ``FileAnalysis`` per input file, in
+        input order.
+    """
+    files = list(source_files)
+    if not workers:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(files)))
+
+    start = time.perf_counter()
+    results: list[FileAnalysis] | None = None
+    if workers > 1:
+        chunksize = max(1, len(files) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(analyze_file, files, repeat(test_prefixes), chunksize=chunksize))
+        except (OSError, RuntimeError) as e:
+            _logger.warning(f"Parallel analysis unavailable ({e}); analyzing in-process")
+            workers = 1
+    if results is None:
+        results = [analyze_file(path, test_prefixes) for path in files]
+
+    return RepositoryAnalysis(files=results, workers=workers, elapsed_seconds=time.perf_counter() - start)
@@ -0,0 +1,345 @@
+"""Staged multi-file execution with bounded queues.
+
+The sequential engine takes each file through read, analysis,
+transformation, formatting and write before it starts the next file, so
+disk I/O and CPU work never overlap. :class:`StagedMigrationPipeline` runs
+the same jobs as stages connected by bounded queues:
+
+``read -> decision_analysis -> collector -> formatter -> output``
+
+Every stage has its own worker threads and its own job instances, so jobs
+are never shared between threads. The read stage prefetches sources while
+earlier files are still being transformed, and full queues block the
+stage feeding them, which bounds memory however many files are queued.
+Per-stage counters, busy time, queue depth and utilization are kept in
+:class:`StageMetrics`.
+
+The transform stages hold the GIL, so their throughput does not grow with
+their worker counts. What overlaps are the reads and writes of some files
+with the transformation of others.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from .context import MigrationConfig, PipelineContext
+from .events import EventBus, PipelineCompletedEvent, PipelineStartedEvent
+from .jobs import CollectorJob, FormatterJob, OutputJob
+from .jobs.decision_analysis_job import DecisionAnalysisJob
+from .migration_orchestrator import MigrationOrchestrator
+from .result import Result
+
+__all__ = [
+    "DEFAULT_STAGE_WORKERS",
+    "STAGE_NAMES",
+    "StageMetrics",
+    "StagedMigrationPipeline",
+]
+
+_logger = logging.getLogger(__name__)
+
+STAGE_NAMES = ("read", "decision_analysis", "collector", "formatter", "output")
+"""Stages in execution order."""
+
+DEFAULT_STAGE_WORKERS = {"read": 2, "decision_analysis": 1, "collector": 1, "formatter": 1, "output": 2}
+"""Worker threads per stage when not configured."""
+
+_POLL_SECONDS = 0.1
+_DONE = object()
+
+_JOB_FACTORIES: dict[str, Callable[[EventBus], Any]] = {
+    "decision_analysis": DecisionAnalysisJob,
+    "collector": CollectorJob,
+    "formatter": FormatterJob,
+    "output": OutputJob,
+}
+
+
+@dataclass(slots=True)
+class StageMetrics:
+    """Counters for one stage of a :class:`StagedMigrationPipeline` run.
+
+    Attributes:
+        name: Stage name.
+        workers: Worker threads of the stage.
+        queue_capacity: Capacity of the stage's input queue.
+        processed: Files the stage handled.
+        failed: Files that failed in the stage.
+        busy_seconds: Time workers spent handling files, summed over workers.
+        max_queue_depth: Deepest the input queue got.
+    """
+
+    name: str
+    workers: int
+    queue_capacity: int
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+    depth_total: int = 0
+    depth_samples: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def mean_queue_depth(self) -> float:
+        """Average input queue depth, sampled whenever a file is queued."""
+        return self.depth_total / self.depth_samples if self.depth_samples else 0.0
+
+    def record_depth(self, depth: int) -> None:
+        """Record the input queue depth after a file was queued."""
+        with self.lock:
+            self.depth_total += depth
+            self.depth_samples += 1
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def record_item(self, seconds: float, failed: bool) -> None:
+        """Record one handled file."""
+        with self.lock:
+            self.processed += 1
+            self.failed += int(failed)
+            self.busy_seconds += seconds
+
+    def utilization(self, elapsed_seconds: float) -> float:
+        """Fraction of the stage's worker time spent busy during ``elapsed_seconds``."""
+        if elapsed_seconds <= 0:
+            return 0.0
+        return min(1.0, self.busy_seconds / (self.workers * elapsed_seconds))
+
+    def to_dict(self, elapsed_seconds: float) -> dict[str, Any]:
+        """Return the metrics as a JSON-serializable mapping."""
+        return {
+            "workers": self.workers,
+            "queue_capacity": self.queue_capacity,
+            "processed": self.processed,
+            "failed": self.failed,
+            "busy_seconds": round(self.busy_seconds, 6),
+            "utilization": round(self.utilization(elapsed_seconds), 4),
+            "mean_queue_depth": round(self.mean_queue_depth, 3),
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+@dataclass(slots=True)
+class _WorkItem:
+    source: str
+    started: float
+    context: PipelineContext | None = None
+    data: Any = None
+    generated_code: str | None = None
+    result: Result[str] | None = None
+
+
+class StagedMigrationPipeline:
+    """Migrate many files with the migration jobs running as queued stages.
+
+    Use :meth:`run` to iterate over ``(source, Result)`` pairs as files
+    finish, then read :meth:`metrics` for the per-stage counters.
+    """
+
+    def __init__(
+        self,
+        config: MigrationConfig | None = None,
+        event_bus: EventBus | None = None,
+        *,
+        stage_workers: dict[str, int] | None = None,
+        queue_size: int = 4,
+        prefetch: int | None = None,
+    ) -> None:
+        """Configure the pipeline.
+
+        Args:
+            config: Migration configuration applied to every file.
+            event_bus: Bus the jobs publish their events on.
+            stage_workers: Worker threads per stage name; stages not listed
+                use :data:`DEFAULT_STAGE_WORKERS`.
+            queue_size: Capacity of each stage's input queue.
+            prefetch: Files the read stage may hold ahead of analysis
+                (default: ``queue_size``).
+
+        Raises:
+            ValueError: If a stage name is unknown or a size is below 1.
+        """
+        unknown = sorted(set(stage_workers or {}) - set(STAGE_NAMES))
+        if unknown:
+            raise ValueError(f"Unknown pipeline stages: {', '.join(unknown)}")
+        self.stage_workers = {**DEFAULT_STAGE_WORKERS, **(stage_workers or {})}
+        self.prefetch = queue_size if prefetch is None else prefetch
+        if min(self.stage_workers.values()) < 1 or queue_size < 1 or self.prefetch < 1:
+            raise ValueError("Stage workers, queue_size and prefetch must be at least 1")
+        self.config = config or MigrationConfig()
+        self.event_bus = event_bus or EventBus()
+        self.queue_size = queue_size
+        self._orchestrator = MigrationOrchestrator(self.event_bus)
+        self._metrics: dict[str, StageMetrics] = {}
+        self._elapsed = 0.0
+        self._started: float | None = None
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Return per-stage metrics of the current or last run, keyed by stage name."""
+        elapsed = time.perf_counter() - self._started if self._started is not None else self._elapsed
+        return {name: stage.to_dict(elapsed) for name, stage in self._metrics.items()}
+
+    def run(self, source_files: Iterable[str]) -> Iterator[tuple[str, Result[str]]]:
+        """Migrate ``source_files``, yielding ``(source, Result)`` as each file finishes.
+
+        Closing the iterator early stops the stages; files still queued are
+        dropped and never written.
+        """
+        files = list(source_files)
+        capacities = {name: self.queue_size for name in STAGE_NAMES}
+        capacities["decision_analysis"] = self.prefetch
+        self._metrics = {name: StageMetrics(name, self.stage_workers[name], capacities[name]) for name in STAGE_NAMES}
+        queues: dict[str, queue.Queue[Any]] = {name: queue.Queue(maxsize=capacities[name]) for name in STAGE_NAMES}
+        results: queue.Queue[_WorkItem] = queue.Queue()
+        stop = threading.Event()
+        threads: list[threading.Thread] = []
+        self._started = time.perf_counter()
+
+        for position, name in enumerate(STAGE_NAMES):
+            next_name = STAGE_NAMES[position + 1] if position + 1 < len(STAGE_NAMES) else None
+            # Workers of a stage share a count of those still running, guarded by one lock
+            remaining, lock = [self.stage_workers[name]], threading.Lock()
+            for index in range(self.stage_workers[name]):
+                thread = threading.Thread(
+                    target=self._stage_worker,
+                    args=(name, next_name, queues, results, stop, remaining, lock),
+                    name=f"splurge-{name}-{index}",
+                    daemon=True,
+                )
+                threads.append(thread)
+                thread.start()
+        feeder = threading.Thread(
+            target=self._feed, args=(files, queues["read"], stop), name="splurge-feeder", daemon=True
+        )
+        feeder.start()
+
+        try:
+            for _ in files:
+                item = results.get()
+                assert item.result is not None
+                yield item.source, item.result
+        finally:
+            stop.set()
+            feeder.join()
+            for thread in threads:
+                thread.join()
+            self._elapsed = time.perf_counter() - self._started
+            self._started = None
+
+    def _feed(self, files: list[str], first: queue.Queue[Any], stop: threading.Event) -> None:
+        for source in files:
+            if not self._put(first, _WorkItem(source, time.perf_counter()), stop, "read"):
+                return
+        for _ in range(self.stage_workers["read"]):
+            if not self._put(first, _DONE, stop, None):
+                return
+
+    def _put(self, target: queue.Queue[Any], item: Any, stop: threading.Event, stage: str | None) -> bool:
+        """Put ``item`` on ``target``, blocking while it is full; ``False`` once stopped."""
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_SECONDS)
+            except queue.Full:
+                continue
+            if stage is not None:
+                self._metrics[stage].record_depth(target.qsize())
+            return True
+        return False
+
+    def _stage_worker(
+        self,
+        name: str,
+        next_name: str | None,
+        queues: dict[str, queue.Queue[Any]],
+        results: queue.Queue[_WorkItem],
+        stop: threading.Event,
+        remaining: list[int],
+        lock: threading.Lock,
+    ) -> None:
+        job = _JOB_FACTORIES[name](self.event_bus) if name in _JOB_FACTORIES else None
+        metrics = self._metrics[name]
+        source_queue = queues[name]
+        while not stop.is_set():
+            try:
+                item = source_queue.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                # The last worker of a stage passes end-of-input downstream
+                if last and next_name is not None:
+                    for _ in range(self.stage_workers[next_name]):
+                        if not self._put(queues[next_name], _DONE, stop, None):
+                            return
+                return
+
+            start = time.perf_counter()
+            try:
+                self._handle(name, job, item)
+            except Exception as e:  # a broken file must not stall the stages
+                item.result = Result.failure(e)
+            failed = item.result is not None and not item.result.is_success()
+            metrics.record_item(time.perf_counter() - start, failed)
+
+            if item.result is not None or next_name is None:
+                self._finish(item)
+                results.put(item)
+            elif not self._put(queues[next_name], item, stop, next_name):
+                return
+
+    def _handle(self, name: str, job: Any, item: _WorkItem) -> None:
+        """Run stage ``name`` for ``item``; sets ``item.result`` when the file is done or failed."""
+        if name == "read":
+            loaded = self._orchestrator.read_for_migration(item.source, self.config)
+            if not loaded.is_success() or loaded.data is None:
+                item.result = Result.failure(loaded.error or ValueError(f"Cannot migrate {item.source}"))
+                return
+            item.context, item.data = loaded.data
+            self.event_bus.publish(
+                PipelineStartedEvent(timestamp=time.time(), run_id=item.context.run_id, context=item.context)
+            )
+            return
+
+        assert item.context is not None
+        result = job.execute(item.context, item.data)
+        if not result.is_success():
+            item.result = Result.failure(result.error or RuntimeError(f"Stage {name} failed for {item.source}"))
+            return
+        if name == "formatter":
+            item.generated_code = result.data
+        if name == "output":
+            if self.config.dry_run:
+                item.result = Result.success(str(result.data), metadata={"generated_code": item.generated_code})
+            else:
+                item.result = result
+            return
+        item.data = result.data
+
+    def _finish(self, item: _WorkItem) -> None:
+        assert item.result is not None
+        if item.context is not None:
+            self.event_bus.publish(
+                PipelineCompletedEvent(
+                    timestamp=time.time(),
+                    run_id=item.context.run_id,
+                    context=item.context,
+                    final_result=item.result,
+                    duration_ms=(time.perf_counter() - item.started) * 1000,
+                )
+            )
+        if item.result.is_success():
+            _logger.info(f"Migration completed successfully for {item.source}")
+        else:
+            _logger.error(f"Migration failed for {item.source}: {item.result.error}")
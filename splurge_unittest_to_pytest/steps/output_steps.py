@@ -10,6 +10,7 @@ This software is released under the MIT License.
 from pathlib import Path
 
 from ..context import PipelineContext
+from ..helpers.source_io import encode_source, forget_source
 from ..pipeline import Step
 from ..result import Result
 
@@ -20,6 +21,9 @@ class WriteOutputStep(Step[str, str]):
     This step either writes the provided source code to ``context.target_file``
     or, when running in dry-run mode, returns the generated code in the
     result metadata so callers can present it without filesystem writes.
+    With ``preserve_file_encoding`` the code is written in the source file's
+    encoding and newline style (``context.metadata["source_encoding"]`` and
+    ``["source_newline"]``); otherwise, or when they are unknown, as UTF-8.
     """
 
     def execute(self, context: PipelineContext, code: str) -> Result[str]:
@@ -51,9 +55,15 @@ class WriteOutputStep(Step[str, str]):
             target_path = Path(context.target_file)
             target_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(context.target_file, "w", encoding="utf-8") as f:
-                f.write(code)
+            encoding = context.metadata.get("source_encoding")
+            if context.config.preserve_file_encoding and encoding:
+                # Encode before opening so an unencodable result leaves the target untouched
+                target_path.write_bytes(encode_source(code, encoding, context.metadata.get("source_newline", "\n")))
+            else:
+                with open(context.target_file, "w", encoding="utf-8") as f:
+                    f.write(code)
+            forget_source(target_path)
             # Return the path of the file we wrote so callers can use it
             return Result.success(str(context.target_file))
-        except OSError as e:
+        except (OSError, UnicodeEncodeError) as e:
             return Result.failure(e)
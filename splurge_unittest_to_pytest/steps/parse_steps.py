@@ -15,6 +15,7 @@ from ..context import PipelineContext
 from ..pipeline import Step
 from ..result import Result
 from ..transformers import UnittestToPytestCstTransformer
+from ..transformers.function_cache import get_function_cache
 
 
 class ParseSourceStep(Step[str, cst.Module]):
@@ -81,8 +82,11 @@ class TransformUnittestStep(Step[cst.Module, cst.Module]):
                 parametrize=effective_parametrize,
                 parametrize_include_ids=context.config.parametrize_ids,
                 parametrize_add_annotations=context.config.parametrize_type_hints,
+                parametrize_table_threshold=context.config.parametrize_table_threshold,
                 decision_model=decision_model,
                 config=context.config,
+                # Reuse transformed functions from earlier runs when caching is enabled
+                function_cache=get_function_cache() if cfg.cache_analysis_results else None,
             )
             source_code: str = module.code
             transformed_code: str = transformer.transform_code(source_code)
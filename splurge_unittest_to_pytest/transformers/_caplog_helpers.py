@@ -11,6 +11,8 @@ from typing import cast
 
 import libcst as cst
 
+from . import node_factory as nodes
+
 
 @dataclass(frozen=True)
 class AliasOutputAccess:
@@ -52,7 +54,7 @@ def extract_alias_output_slices(expr: cst.BaseExpression) -> AliasOutputAccess |
 
 def build_caplog_records_expr(access: AliasOutputAccess) -> cst.BaseExpression:
     """Construct `caplog.records` expression and apply subscripts from access.slices."""
-    base: cst.BaseExpression = cst.Attribute(value=cst.Name(value="caplog"), attr=cst.Name(value="records"))
+    base: cst.BaseExpression = nodes.dotted_name("caplog.records")
     for slice_item in access.slices:
         # cst.Subscript expects a sequence of SubscriptElement for the `slice` parameter.
         base = cst.Subscript(value=base, slice=(slice_item,))
@@ -61,6 +63,4 @@ def build_caplog_records_expr(access: AliasOutputAccess) -> cst.BaseExpression:
 
 def build_get_message_call(access: AliasOutputAccess) -> cst.Call:
     """Construct `caplog.records[...].getMessage()` call for the provided access."""
-    return cst.Call(
-        func=cst.Attribute(value=build_caplog_records_expr(access), attr=cst.Name(value="getMessage")), args=[]
-    )
+    return cst.Call(func=cst.Attribute(value=build_caplog_records_expr(access), attr=nodes.name("getMessage")), args=[])
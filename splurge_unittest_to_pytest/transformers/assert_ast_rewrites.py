@@ -11,6 +11,8 @@ from typing import Any
 
 import libcst as cst
 
+from . import node_factory as nodes
+
 __all__ = [
     "ParenthesizedExpression",
     "parenthesized_expression",
@@ -86,11 +88,7 @@ def parenthesized_expression(expr: cst.BaseExpression) -> ParenthesizedExpressio
 
 def transform_assert_equal(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.Equal(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.EQUAL, node.args[1].value)
     return node
 
 
@@ -106,13 +104,9 @@ def transform_assert_not_almost_equal(node: cst.Call, config: Any | None = None)
         if places is None:
             places_value = getattr(config, "assert_almost_equal_places", 7) if config else 7
             places = cst.Integer(value=str(places_value))
-        diff = cst.BinaryOperation(left=left, operator=cst.Subtract(), right=right)
-        round_call = cst.Call(func=cst.Name(value="round"), args=[cst.Arg(value=diff), cst.Arg(value=places)])
-        comp = cst.Comparison(
-            left=round_call,
-            comparisons=[cst.ComparisonTarget(operator=cst.Equal(), comparator=cst.Integer(value="0"))],
-        )
-        return cst.Assert(test=cst.UnaryOperation(operator=cst.Not(), expression=comp))
+        diff = cst.BinaryOperation(left=left, operator=nodes.SUBTRACT, right=right)
+        round_call = cst.Call(func=nodes.name("round"), args=[cst.Arg(value=diff), cst.Arg(value=places)])
+        return nodes.assert_not(nodes.compare(round_call, nodes.EQUAL, nodes.ZERO))
     return node
 
 
@@ -124,74 +118,50 @@ def transform_assert_true(node: cst.Call) -> cst.CSTNode:
 
 def transform_assert_false(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 1:
-        return cst.Assert(test=cst.UnaryOperation(operator=cst.Not(), expression=node.args[0].value))
+        return nodes.assert_not(node.args[0].value)
     return node
 
 
 def transform_assert_is(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.Is(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.IS, node.args[1].value)
     return node
 
 
 def transform_assert_not_equal(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.NotEqual(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.NOT_EQUAL, node.args[1].value)
     return node
 
 
 def transform_assert_is_not(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.IsNot(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.IS_NOT, node.args[1].value)
     return node
 
 
 def transform_assert_is_none(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 1:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.Is(), comparator=cst.Name(value="None"))],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.IS, nodes.name("None"))
     return node
 
 
 def transform_assert_is_not_none(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 1:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.IsNot(), comparator=cst.Name(value="None"))],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.IS_NOT, nodes.name("None"))
     return node
 
 
 def transform_assert_not_in(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.NotIn(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.NOT_IN, node.args[1].value)
     return node
 
 
 def transform_assert_isinstance(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
         isinstance_call = cst.Call(
-            func=cst.Name(value="isinstance"),
+            func=nodes.name("isinstance"),
             args=[cst.Arg(value=node.args[0].value), cst.Arg(value=node.args[1].value)],
         )
         return cst.Assert(test=isinstance_call)
@@ -201,29 +171,24 @@ def transform_assert_isinstance(node: cst.Call) -> cst.CSTNode:
 def transform_assert_not_isinstance(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
         isinstance_call = cst.Call(
-            func=cst.Name(value="isinstance"),
+            func=nodes.name("isinstance"),
             args=[cst.Arg(value=node.args[0].value), cst.Arg(value=node.args[1].value)],
         )
-        return cst.Assert(test=cst.UnaryOperation(operator=cst.Not(), expression=isinstance_call))
+        return nodes.assert_not(isinstance_call)
     return node
 
 
 def transform_assert_count_equal(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        left = cst.Call(func=cst.Name(value="sorted"), args=[cst.Arg(value=node.args[0].value)])
-        right = cst.Call(func=cst.Name(value="sorted"), args=[cst.Arg(value=node.args[1].value)])
-        comp = cst.Comparison(left=left, comparisons=[cst.ComparisonTarget(operator=cst.Equal(), comparator=right)])
-        return cst.Assert(test=comp)
+        left = cst.Call(func=nodes.name("sorted"), args=[cst.Arg(value=node.args[0].value)])
+        right = cst.Call(func=nodes.name("sorted"), args=[cst.Arg(value=node.args[1].value)])
+        return nodes.assert_compare(left, nodes.EQUAL, right)
     return node
 
 
 def transform_assert_multiline_equal(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.Equal(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.EQUAL, node.args[1].value)
     return node
 
 
@@ -232,10 +197,9 @@ def transform_assert_regex(
 ) -> cst.CSTNode:
     if len(node.args) >= 2:
         if re_search_name:
-            func: cst.BaseExpression = cst.Name(value=re_search_name)
+            func: cst.BaseExpression = nodes.name(re_search_name)
         else:
-            re_name = re_alias or "re"
-            func = cst.Attribute(value=cst.Name(value=re_name), attr=cst.Name(value="search"))
+            func = nodes.dotted_name(f"{re_alias or 're'}.search")
 
         call = cst.Call(func=func, args=[cst.Arg(value=node.args[1].value), cst.Arg(value=node.args[0].value)])
         return cst.Assert(test=call)
@@ -247,103 +211,66 @@ def transform_assert_not_regex(
 ) -> cst.CSTNode:
     if len(node.args) >= 2:
         if re_search_name:
-            func: cst.BaseExpression = cst.Name(value=re_search_name)
+            func: cst.BaseExpression = nodes.name(re_search_name)
         else:
-            re_name = re_alias or "re"
-            func = cst.Attribute(value=cst.Name(value=re_name), attr=cst.Name(value="search"))
+            func = nodes.dotted_name(f"{re_alias or 're'}.search")
 
         call = cst.Call(func=func, args=[cst.Arg(value=node.args[1].value), cst.Arg(value=node.args[0].value)])
-        return cst.Assert(test=cst.UnaryOperation(operator=cst.Not(), expression=call))
+        return nodes.assert_not(call)
     return node
 
 
 def transform_assert_in(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.In(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.IN, node.args[1].value)
     return node
 
 
 def transform_assert_dict_equal(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.Equal(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.EQUAL, node.args[1].value)
     return node
 
 
 def transform_assert_list_equal(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.Equal(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.EQUAL, node.args[1].value)
     return node
 
 
 def transform_assert_set_equal(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.Equal(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.EQUAL, node.args[1].value)
     return node
 
 
 def transform_assert_tuple_equal(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.Equal(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.EQUAL, node.args[1].value)
     return node
 
 
 def transform_assert_greater(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.GreaterThan(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.GREATER_THAN, node.args[1].value)
     return node
 
 
 def transform_assert_greater_equal(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.GreaterThanEqual(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.GREATER_THAN_EQUAL, node.args[1].value)
     return node
 
 
 def transform_assert_less(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.LessThan(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.LESS_THAN, node.args[1].value)
     return node
 
 
 def transform_assert_less_equal(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
-        comp = cst.Comparison(
-            left=node.args[0].value,
-            comparisons=[cst.ComparisonTarget(operator=cst.LessThanEqual(), comparator=node.args[1].value)],
-        )
-        return cst.Assert(test=comp)
+        return nodes.assert_compare(node.args[0].value, nodes.LESS_THAN_EQUAL, node.args[1].value)
     return node
 
 
@@ -357,22 +284,12 @@ def transform_assert_almost_equal(node: cst.Call, config: Any | None = None) ->
                 places = arg.value
                 break
         if places is None:
-            approx_call = cst.Call(
-                func=cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="approx")),
-                args=[cst.Arg(value=right)],
-            )
-            comp = cst.Comparison(
-                left=left, comparisons=[cst.ComparisonTarget(operator=cst.Equal(), comparator=approx_call)]
-            )
-            return cst.Assert(test=comp)
+            approx_call = nodes.call("pytest.approx", [cst.Arg(value=right)])
+            return nodes.assert_compare(left, nodes.EQUAL, approx_call)
         else:
-            diff = cst.BinaryOperation(left=left, operator=cst.Subtract(), right=right)
-            round_call = cst.Call(func=cst.Name(value="round"), args=[cst.Arg(value=diff), cst.Arg(value=places)])
-            comp = cst.Comparison(
-                left=round_call,
-                comparisons=[cst.ComparisonTarget(operator=cst.Equal(), comparator=cst.Integer(value="0"))],
-            )
-            return cst.Assert(test=comp)
+            diff = cst.BinaryOperation(left=left, operator=nodes.SUBTRACT, right=right)
+            round_call = cst.Call(func=nodes.name("round"), args=[cst.Arg(value=diff), cst.Arg(value=places)])
+            return nodes.assert_compare(round_call, nodes.EQUAL, nodes.ZERO)
     return node
 
 
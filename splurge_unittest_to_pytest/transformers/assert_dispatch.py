@@ -0,0 +1,318 @@
+"""Precomputed dispatch table for ``self.assert*`` call rewrites.
+
+The CST transformer used to build a dictionary of method name to rewrite
+function on every :class:`libcst.Call` it left, including calls that have
+nothing to do with ``unittest``. This module builds that table once per
+process as a :class:`AssertionDispatchRegistry` of
+:class:`AssertionRule` records, so dispatch is a single dictionary lookup.
+
+Each rule records which imports its output needs and can optionally keep
+counters (hits, failures and cumulative time) so slow or failing rules can
+be identified on a real corpus. Extra rules can be registered directly or
+through :meth:`splurge_unittest_to_pytest.plugins.PluginManager.register_assertion_rule`.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import libcst as cst
+
+from .assert_transformer import (
+    transform_assert_almost_equal,
+    transform_assert_count_equal,
+    transform_assert_dict_equal,
+    transform_assert_equal,
+    transform_assert_false,
+    transform_assert_greater,
+    transform_assert_greater_equal,
+    transform_assert_in,
+    transform_assert_is,
+    transform_assert_is_none,
+    transform_assert_is_not,
+    transform_assert_is_not_none,
+    transform_assert_isinstance,
+    transform_assert_less,
+    transform_assert_less_equal,
+    transform_assert_list_equal,
+    transform_assert_multiline_equal,
+    transform_assert_not_almost_equal,
+    transform_assert_not_equal,
+    transform_assert_not_in,
+    transform_assert_not_isinstance,
+    transform_assert_not_regex,
+    transform_assert_raises,
+    transform_assert_raises_regex,
+    transform_assert_regex,
+    transform_assert_set_equal,
+    transform_assert_true,
+    transform_assert_tuple_equal,
+    transform_assert_warns,
+    transform_assert_warns_regex,
+    transform_fail,
+    transform_skip_test,
+)
+
+logger = logging.getLogger(__name__)
+
+BUILTIN_SOURCE = "builtin"
+
+# Rewrite signatures: plain rules take only the call; contextual rules also
+# receive the transformer so they can read ``config``, ``re_alias`` and
+# ``re_search_name``.
+AssertionRewrite = Callable[..., cst.CSTNode]
+
+
+@dataclass(slots=True)
+class AssertionRule:
+    """A rewrite for one ``unittest`` assertion method.
+
+    Attributes:
+        method_name: The ``self``/``cls`` method the rule handles, e.g. ``"assertEqual"``.
+        rewrite: Function returning the replacement expression or statement.
+        uses_context: When True, ``rewrite`` is called as ``rewrite(node, transformer)``;
+            otherwise as ``rewrite(node)``.
+        requires: Modules the rewritten code imports (``"pytest"`` and/or ``"re"``).
+        source: ``"builtin"`` or the name of the plugin that registered the rule.
+        hits: Number of dispatches while statistics are enabled.
+        failures: Number of dispatches that raised while statistics are enabled.
+        total_time: Cumulative seconds spent in ``rewrite`` while statistics are enabled.
+    """
+
+    method_name: str
+    rewrite: AssertionRewrite
+    uses_context: bool = False
+    requires: frozenset[str] = field(default_factory=frozenset)
+    source: str = BUILTIN_SOURCE
+    hits: int = 0
+    failures: int = 0
+    total_time: float = 0.0
+
+    def apply(self, node: cst.Call, context: Any) -> cst.CSTNode:
+        """Run the rewrite on ``node`` without touching the counters."""
+        if self.uses_context:
+            return self.rewrite(node, context)
+        return self.rewrite(node)
+
+    def reset_stats(self) -> None:
+        """Zero the hit, failure and timing counters."""
+        self.hits = 0
+        self.failures = 0
+        self.total_time = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the counters as a dictionary."""
+        return {
+            "method_name": self.method_name,
+            "source": self.source,
+            "hits": self.hits,
+            "failures": self.failures,
+            "total_time": self.total_time,
+        }
+
+
+class AssertionDispatchRegistry:
+    """Method-name keyed table of :class:`AssertionRule` records.
+
+    Attributes:
+        generation: Incremented whenever the set of active rules changes, so
+            cached rewrites can tell they were produced by other rules.
+        stats_enabled: Whether :meth:`dispatch` updates the rule counters.
+    """
+
+    def __init__(self, rules: Iterable[AssertionRule] = ()) -> None:
+        self._rules: dict[str, AssertionRule] = {}
+        self._shadowed: dict[str, list[AssertionRule]] = {}
+        self.generation = 0
+        self.stats_enabled = False
+        for rule in rules:
+            self._rules[rule.method_name] = rule
+
+    def __contains__(self, method_name: object) -> bool:
+        return method_name in self._rules
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def get(self, method_name: str) -> AssertionRule | None:
+        """Return the rule for ``method_name`` or None when it is not handled."""
+        return self._rules.get(method_name)
+
+    def rules(self) -> list[AssertionRule]:
+        """Return all registered rules in registration order."""
+        return list(self._rules.values())
+
+    def register(self, rule: AssertionRule, replace: bool = False) -> bool:
+        """Register ``rule`` under its method name.
+
+        Args:
+            rule: The rule to add.
+            replace: Allow replacing an existing rule. A replaced rule is
+                restored when the replacement is unregistered.
+
+        Returns:
+            True if the rule was registered, False if the method name is
+            already handled and ``replace`` is False.
+        """
+        existing = self._rules.get(rule.method_name)
+        if existing is not None:
+            if not replace:
+                logger.warning(f"Assertion rule for {rule.method_name} already registered by {existing.source}")
+                return False
+            self._shadowed.setdefault(rule.method_name, []).append(existing)
+        self._rules[rule.method_name] = rule
+        self.generation += 1
+        return True
+
+    def unregister(self, method_name: str) -> AssertionRule | None:
+        """Remove the rule for ``method_name``, restoring any rule it replaced.
+
+        Returns:
+            The removed rule, or None if no rule was registered.
+        """
+        removed = self._rules.pop(method_name, None)
+        if removed is not None:
+            self.generation += 1
+            shadowed = self._shadowed.get(method_name)
+            if shadowed:
+                self._rules[method_name] = shadowed.pop()
+                if not shadowed:
+                    del self._shadowed[method_name]
+        return removed
+
+    def unregister_source(self, source: str) -> list[AssertionRule]:
+        """Remove every rule registered by ``source`` (for example a plugin name)."""
+        for stack in self._shadowed.values():
+            stack[:] = [rule for rule in stack if rule.source != source]
+        names = [name for name, rule in self._rules.items() if rule.source == source]
+        return [rule for name in names if (rule := self.unregister(name)) is not None]
+
+    def dispatch(self, rule: AssertionRule, node: cst.Call, context: Any) -> cst.CSTNode:
+        """Apply ``rule`` to ``node``, updating its counters when statistics are enabled.
+
+        Exceptions raised by the rewrite propagate to the caller.
+        """
+        if not self.stats_enabled:
+            return rule.apply(node, context)
+        rule.hits += 1
+        start = time.perf_counter()
+        try:
+            return rule.apply(node, context)
+        except Exception:
+            rule.failures += 1
+            raise
+        finally:
+            rule.total_time += time.perf_counter() - start
+
+    def enable_stats(self, enabled: bool = True) -> None:
+        """Turn per-rule counters on or off."""
+        self.stats_enabled = enabled
+
+    def reset_stats(self) -> None:
+        """Zero the counters of every rule."""
+        for rule in self._rules.values():
+            rule.reset_stats()
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Return per-rule counters for rules that were hit, slowest first."""
+        rows = [rule.stats() for rule in self._rules.values() if rule.hits]
+        rows.sort(key=lambda row: row["total_time"], reverse=True)
+        return rows
+
+
+def _almost_equal(node: cst.Call, transformer: Any) -> cst.CSTNode:
+    return transform_assert_almost_equal(node, config=transformer.config)
+
+
+def _not_almost_equal(node: cst.Call, transformer: Any) -> cst.CSTNode:
+    return transform_assert_not_almost_equal(node, config=transformer.config)
+
+
+def _regex(node: cst.Call, transformer: Any) -> cst.CSTNode:
+    return transform_assert_regex(node, re_alias=transformer.re_alias, re_search_name=transformer.re_search_name)
+
+
+def _not_regex(node: cst.Call, transformer: Any) -> cst.CSTNode:
+    return transform_assert_not_regex(node, re_alias=transformer.re_alias, re_search_name=transformer.re_search_name)
+
+
+_NEEDS_PYTEST = frozenset({"pytest"})
+_NEEDS_RE = frozenset({"re"})
+
+
+def builtin_rules() -> list[AssertionRule]:
+    """Return fresh records for the assertion methods handled out of the box."""
+    plain: dict[str, AssertionRewrite] = {
+        "assertEqual": transform_assert_equal,
+        "assertEquals": transform_assert_equal,
+        "assertNotEqual": transform_assert_not_equal,
+        "assertNotEquals": transform_assert_not_equal,
+        "assertTrue": transform_assert_true,
+        "assertIsTrue": transform_assert_true,
+        "assertFalse": transform_assert_false,
+        "assertIsFalse": transform_assert_false,
+        "assertIs": transform_assert_is,
+        "assertIsNot": transform_assert_is_not,
+        "assertIn": transform_assert_in,
+        "assertNotIn": transform_assert_not_in,
+        "assertIsInstance": transform_assert_isinstance,
+        "assertNotIsInstance": transform_assert_not_isinstance,
+        "assertDictEqual": transform_assert_dict_equal,
+        "assertDictEquals": transform_assert_dict_equal,
+        "assertListEqual": transform_assert_list_equal,
+        "assertListEquals": transform_assert_list_equal,
+        "assertSetEqual": transform_assert_set_equal,
+        "assertSetEquals": transform_assert_set_equal,
+        "assertTupleEqual": transform_assert_tuple_equal,
+        "assertTupleEquals": transform_assert_tuple_equal,
+        "assertCountEqual": transform_assert_count_equal,
+        "assertSequenceEqual": transform_assert_equal,
+        "skipTest": transform_skip_test,
+        "fail": transform_fail,
+        "assertMultiLineEqual": transform_assert_multiline_equal,
+        "assertIsNone": transform_assert_is_none,
+        "assertIsNotNone": transform_assert_is_not_none,
+        # warning assertions
+        "assertWarns": transform_assert_warns,
+        "assertWarnsRegex": transform_assert_warns_regex,
+        # numeric comparisons
+        "assertGreater": transform_assert_greater,
+        "assertGreaterEqual": transform_assert_greater_equal,
+        "assertLess": transform_assert_less,
+        "assertLessEqual": transform_assert_less_equal,
+    }
+    rules = [AssertionRule(method_name, rewrite) for method_name, rewrite in plain.items()]
+    rules += [
+        AssertionRule("assertRaises", transform_assert_raises, requires=_NEEDS_PYTEST),
+        AssertionRule("assertRaisesRegex", transform_assert_raises_regex, requires=_NEEDS_PYTEST),
+        AssertionRule("assertAlmostEqual", _almost_equal, uses_context=True),
+        AssertionRule("assertNotAlmostEqual", _not_almost_equal, uses_context=True),
+        # assertLogs/assertNoLogs are handled by the With/block rewrites
+        AssertionRule("assertRegex", _regex, uses_context=True, requires=_NEEDS_RE),
+        AssertionRule("assertNotRegex", _not_regex, uses_context=True, requires=_NEEDS_RE),
+    ]
+    return rules
+
+
+# Global registry instance
+_assertion_registry = AssertionDispatchRegistry(builtin_rules())
+
+
+def get_assertion_registry() -> AssertionDispatchRegistry:
+    """Get the global assertion dispatch registry."""
+    return _assertion_registry
+
+
+__all__ = [
+    "AssertionRule",
+    "AssertionDispatchRegistry",
+    "builtin_rules",
+    "get_assertion_registry",
+]
@@ -25,11 +25,14 @@ This software is released under the MIT License.
 
 import logging
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, cast
 
 import libcst as cst
 
+from . import node_factory as nodes
+
 # Import error reporting for enhanced debugging
 try:
     from ..helpers.error_reporting import report_transformation_error
@@ -46,6 +49,7 @@ from ._caplog_helpers import (
     build_get_message_call,
     extract_alias_output_slices,
 )
+from .transformer_helper import wrap_small_stmt_if_needed
 
 
 def _preserve_indented_block(
@@ -264,7 +268,7 @@ def _rewrite_equality_comparison(
         # Direct attribute: <alias>.exception
         if isinstance(expr, cst.Attribute) and isinstance(expr.value, cst.Name):
             if expr.value.value == alias_name and isinstance(expr.attr, cst.Name) and expr.attr.value == "exception":
-                return expr.with_changes(attr=cst.Name(value="value"))
+                return expr.with_changes(attr=nodes.name("value"))
 
         # Call wrapping attribute: e.g., str(<alias>.exception)
         if isinstance(expr, cst.Call) and expr.args:
@@ -467,7 +471,7 @@ def transform_assert_raises(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
         exception_type = node.args[0].value
         code_to_test = node.args[1].value
-        new_attr = cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="raises"))
+        new_attr = nodes.dotted_name("pytest.raises")
 
         # Enhanced: Handle custom exception types by preserving the original exception reference
         # This allows for custom exception classes defined in the test module
@@ -490,11 +494,7 @@ def transform_assert_raises(node: cst.Call) -> cst.CSTNode:
                 None, cst.IndentedBlock(body=[cst.SimpleStatementLine(body=[cst.Expr(value=lambda_call)])])
             )
             new_args.append(
-                cst.Arg(
-                    value=cst.Lambda(
-                        params=cst.Parameters(params=[]), body=_preserve_indented_block(None, lambda_block)
-                    )
-                )
+                cst.Arg(value=cst.Lambda(params=nodes.NO_PARAMETERS, body=_preserve_indented_block(None, lambda_block)))
             )
         else:
             # Standard case with just the callable
@@ -509,7 +509,7 @@ def transform_assert_raises(node: cst.Call) -> cst.CSTNode:
                     lambda_body = cst.SimpleStatementLine(body=[cst.Expr(value=code_to_test)])
 
                 lambda_block = _preserve_indented_block(None, cst.IndentedBlock(body=[lambda_body]))
-                new_args.append(cst.Arg(value=cst.Lambda(params=cst.Parameters(params=[]), body=lambda_block)))
+                new_args.append(cst.Arg(value=cst.Lambda(params=nodes.NO_PARAMETERS, body=lambda_block)))
 
         return cst.Call(func=new_attr, args=new_args)
     return node
@@ -540,7 +540,7 @@ def transform_assert_raises_regex(node: cst.Call) -> cst.CSTNode:
             lambda_block = _preserve_indented_block(
                 None, cst.IndentedBlock(body=[cst.SimpleStatementLine(body=[cst.Expr(value=lambda_call)])])
             )
-            args.append(cst.Arg(value=cst.Lambda(params=cst.Parameters(params=[]), body=lambda_block)))
+            args.append(cst.Arg(value=cst.Lambda(params=nodes.NO_PARAMETERS, body=lambda_block)))
         else:
             # Standard case with just the callable
             if isinstance(callable_arg, cst.Lambda):
@@ -554,10 +554,10 @@ def transform_assert_raises_regex(node: cst.Call) -> cst.CSTNode:
                     lambda_body = cst.SimpleStatementLine(body=[cst.Expr(value=callable_arg)])
 
                 lambda_block = _preserve_indented_block(None, cst.IndentedBlock(body=[lambda_body]))
-                args.append(cst.Arg(value=cst.Lambda(params=cst.Parameters(params=[]), body=lambda_block)))
+                args.append(cst.Arg(value=cst.Lambda(params=nodes.NO_PARAMETERS, body=lambda_block)))
 
-        args.append(cst.Arg(keyword=cst.Name(value="match"), value=match_arg))
-        return cst.Call(func=cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="raises")), args=args)
+        args.append(nodes.keyword_arg("match", match_arg))
+        return cst.Call(func=nodes.dotted_name("pytest.raises"), args=args)
     return node
 
 
@@ -600,7 +600,7 @@ def transform_assert_warns(node: cst.Call) -> cst.CSTNode:
     if len(node.args) >= 2:
         warning_type = node.args[0].value
         code_to_test = node.args[1].value
-        new_attr = cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="warns"))
+        new_attr = nodes.dotted_name("pytest.warns")
 
         # Enhanced: Handle custom warning types by preserving the original warning reference
         # This allows for custom warning classes defined in the test module
@@ -623,11 +623,7 @@ def transform_assert_warns(node: cst.Call) -> cst.CSTNode:
                 None, cst.IndentedBlock(body=[cst.SimpleStatementLine(body=[cst.Expr(value=lambda_call)])])
             )
             new_args.append(
-                cst.Arg(
-                    value=cst.Lambda(
-                        params=cst.Parameters(params=[]), body=_preserve_indented_block(None, lambda_block)
-                    )
-                )
+                cst.Arg(value=cst.Lambda(params=nodes.NO_PARAMETERS, body=_preserve_indented_block(None, lambda_block)))
             )
         else:
             # Standard case with just the callable
@@ -645,9 +641,7 @@ def transform_assert_warns(node: cst.Call) -> cst.CSTNode:
                 lambda_block = _preserve_indented_block(None, cst.IndentedBlock(body=[lambda_body]))
                 new_args.append(
                     cst.Arg(
-                        value=cst.Lambda(
-                            params=cst.Parameters(params=[]), body=_preserve_indented_block(None, lambda_block)
-                        )
+                        value=cst.Lambda(params=nodes.NO_PARAMETERS, body=_preserve_indented_block(None, lambda_block))
                     )
                 )
 
@@ -673,7 +667,7 @@ def transform_assert_warns_regex(node: cst.Call) -> cst.CSTNode:
             args: list[cst.Arg] = [
                 cst.Arg(value=exc),
                 cst.Arg(value=callable_arg),
-                cst.Arg(keyword=cst.Name(value="match"), value=match_arg),
+                nodes.keyword_arg("match", match_arg),
             ]
         else:
             # If callable_arg is a function name, we need to call it
@@ -688,13 +682,13 @@ def transform_assert_warns_regex(node: cst.Call) -> cst.CSTNode:
                 cst.Arg(value=exc),
                 cst.Arg(
                     value=cst.Lambda(
-                        params=cst.Parameters(params=[]),
+                        params=nodes.NO_PARAMETERS,
                         body=_preserve_indented_block(None, cst.IndentedBlock(body=[lambda_body])),
                     )
                 ),
-                cst.Arg(keyword=cst.Name(value="match"), value=match_arg),
+                nodes.keyword_arg("match", match_arg),
             ]
-        return cst.Call(func=cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="warns")), args=args)
+        return cst.Call(func=nodes.dotted_name("pytest.warns"), args=args)
     return node
 
 
@@ -1023,68 +1017,30 @@ def wrap_assert_in_block(statements: list[cst.BaseStatement], max_depth: int = 7
     This helper looks for bare expression statements like
     ``self.assertLogs(...)`` or existing ``with self.assertLogs(...)``
     blocks and rewrites them to use pytest-style context managers such
-    as ``caplog.at_level(...)`` or ``pytest.raises(...)``. The
-    function returns a new list of statements with the transformations
-    applied; input ordering is preserved when nodes are not changed.
+    as ``caplog.at_level(...)`` or ``pytest.raises(...)``. Nested
+    try/if/for/while/with blocks are handled at any depth in a single
+    iterative pass. The function returns a new list of statements with
+    the transformations applied; input ordering is preserved when nodes
+    are not changed.
 
     Args:
         statements: The list of :class:`libcst.BaseStatement` nodes to
             process.
+        max_depth: Accepted for backwards compatibility; nesting depth is
+            not limited.
 
     Returns:
         A new list of statements with applicable transformations
         applied. The function is conservative and preserves original
         nodes on error.
     """
-
     _logger = logging.getLogger(__name__)
-    out: list[cst.BaseStatement] = []
-
-    # Use shared utility to keep behavior consistent across transformers
-    from .transformer_helper import wrap_small_stmt_if_needed as _wrap_small_stmt_if_needed
-
-    i = 0
     try:
         _logger.debug("assert_transformer.wrap_assert_in_block: starting with %d statements", len(statements))
     except Exception:
         pass
 
-    while i < len(statements):
-        stmt = statements[i]
-
-        try:
-            processed_nodes, consumed = _process_statement_with_fallback(stmt, statements, i, max_depth)
-            # Ensure small-statement nodes are wrapped before appending so
-            # they remain valid Statement nodes when placed in IndentedBlock.body.
-            for n in processed_nodes:
-                wrapped = _wrap_small_stmt_if_needed(n)
-                try:
-                    _logger.debug(
-                        "assert_transformer.wrap_assert_in_block: appending %s (wrapped=%s)",
-                        type(n).__name__,
-                        type(wrapped).__name__,
-                    )
-                except Exception:
-                    pass
-                out.append(wrapped)
-            i += consumed
-        except Exception as e:
-            # Ultimate fallback - preserve original statement and continue
-            report_transformation_error(
-                e,
-                "assert_transformer",
-                "wrap_assert_in_block",
-                suggestions=["Check statement processing logic"],
-            )
-            out.append(stmt)
-            i += 1
-
-    # Final step: ensure nested With items inside Try/If/With were rewritten
-    final_out: list[cst.BaseStatement] = []
-    for s in out:
-        final_out.append(_recursively_rewrite_withs(s))
-
-    return final_out
+    return _rewrite_statement_blocks(statements, rewrite_calls=True)
 
 
 def _process_with_statement(stmt: cst.With, statements: list[cst.BaseStatement], index: int) -> cst.With | None:
@@ -1178,11 +1134,12 @@ def _safe_extract_statements(body_container, max_depth: int = 7) -> list[cst.Bas
 
     Keeping this symbol in the original module preserves the public
     API while allowing the implementation to live in the new file.
+    ``max_depth`` is accepted for backwards compatibility and ignored.
     """
     try:
         from . import assert_with_rewrites as _with_rewrites
 
-        return _with_rewrites._safe_extract_statements(body_container, max_depth)
+        return _with_rewrites._safe_extract_statements(body_container)
     except Exception:
         return None
 
@@ -1191,290 +1148,355 @@ def _safe_extract_statements(body_container, max_depth: int = 7) -> list[cst.Bas
 
 
 def _process_try_statement(stmt: cst.BaseStatement, max_depth: int = 7) -> cst.BaseStatement | None:
-    """Process a Try statement by recursively applying wrap_assert_in_block to its inner blocks.
+    """Process a Try statement by rewriting assertion context managers in its blocks.
 
     Args:
         stmt: The statement to process
+        max_depth: Accepted for backwards compatibility; nesting depth is
+            not limited.
 
     Returns:
         The processed statement, or None if the statement is not a Try
     """
     if not isinstance(stmt, cst.Try):
         return None
-
-    try:
-        # Process the try body
-        try_body = getattr(stmt, "body", None)
-        body_statements = _safe_extract_statements(try_body, max_depth)
-        if body_statements is not None:
-            new_try_body = try_body.with_changes(body=wrap_assert_in_block(body_statements, max_depth))
-        else:
-            new_try_body = try_body
-
-        # Process except handlers
-        new_handlers = []
-        for h in getattr(stmt, "handlers", []) or []:
-            h_body = getattr(h, "body", None)
-            body_statements = _safe_extract_statements(h_body, max_depth)
-            if body_statements is not None:
-                new_h_body = h_body.with_changes(body=wrap_assert_in_block(body_statements, max_depth))
-                new_h = h.with_changes(body=new_h_body)
-            else:
-                new_h = h
-            new_handlers.append(new_h)
-
-        # Process orelse
-        new_orelse = getattr(stmt, "orelse", None)
-        body_statements = _safe_extract_statements(new_orelse, max_depth)
-        if body_statements is not None and new_orelse is not None and hasattr(new_orelse, "body"):
-            # Update the inner list within the BaseSuite body
-            new_orelse = new_orelse.with_changes(
-                body=new_orelse.body.with_changes(body=wrap_assert_in_block(body_statements, max_depth))
-            )
-
-        # Process finalbody
-        new_finalbody = getattr(stmt, "finalbody", None)
-        body_statements = _safe_extract_statements(new_finalbody, max_depth)
-        if body_statements is not None and new_finalbody is not None and hasattr(new_finalbody, "body"):
-            # Update the inner list within the BaseSuite body
-            new_finalbody = new_finalbody.with_changes(
-                body=new_finalbody.body.with_changes(body=wrap_assert_in_block(body_statements, max_depth))
-            )
-
-        # Build new Try node with updated blocks
-        new_try = stmt.with_changes(
-            body=new_try_body, handlers=new_handlers, orelse=new_orelse, finalbody=new_finalbody
-        )
-
-        # Ensure nested With items inside the newly constructed Try are rewritten as well
-        try:
-            new_try = _recursively_rewrite_withs(new_try)
-        except (AttributeError, TypeError, IndexError) as e:
-            report_transformation_error(
-                e,
-                "assert_transformer",
-                "_process_try_statement",
-                suggestions=["Check nested With rewriting in Try blocks"],
-            )
-
-        return new_try
-
-    except (AttributeError, TypeError, IndexError) as e:
-        # Report error but don't raise - let caller handle fallback
-        report_transformation_error(
-            e,
-            "assert_transformer",
-            "_process_try_statement",
-            suggestions=["Check Try block transformation logic"],
-        )
-        return None
+    return _rewrite_compound_statement(stmt, "_process_try_statement")
 
 
 def _process_if_statement(stmt: cst.BaseStatement, max_depth: int = 7) -> cst.BaseStatement | None:
-    """Process an If statement by recursively applying wrap_assert_in_block to its body and orelse.
+    """Process an If statement by rewriting assertion context managers in its body and orelse.
 
     Args:
         stmt: The statement to process
+        max_depth: Accepted for backwards compatibility; nesting depth is
+            not limited.
 
     Returns:
         The processed statement, or None if the statement is not an If
     """
     if not isinstance(stmt, cst.If):
         return None
-
-    try:
-        # Process the if body
-        if_body = getattr(stmt, "body", None)
-        body_statements = _safe_extract_statements(if_body, max_depth)
-        if body_statements is not None:
-            new_if_body = if_body.with_changes(body=wrap_assert_in_block(body_statements, max_depth))
-        else:
-            new_if_body = if_body
-
-        # Process orelse (may be Else node with a .body BaseSuite)
-        new_orelse = getattr(stmt, "orelse", None)
-        body_statements = _safe_extract_statements(new_orelse, max_depth)
-        if body_statements is not None and new_orelse is not None and hasattr(new_orelse, "body"):
-            try:
-                # Preferred: update the inner BaseSuite body if present
-                new_orelse = new_orelse.with_changes(
-                    body=new_orelse.body.with_changes(body=wrap_assert_in_block(body_statements, max_depth))
-                )
-            except Exception:
-                try:
-                    # Fallback: update the orelse body directly
-                    new_orelse = new_orelse.with_changes(body=wrap_assert_in_block(body_statements, max_depth))
-                except Exception:
-                    pass
-
-        new_if = stmt.with_changes(body=new_if_body, orelse=new_orelse)
-        # Ensure nested With items are also rewritten
-        try:
-            new_if = _recursively_rewrite_withs(new_if)
-        except (AttributeError, TypeError, IndexError):
-            pass
-        return new_if
-
-    except (AttributeError, TypeError, IndexError) as e:
-        report_transformation_error(
-            e,
-            "assert_transformer",
-            "_process_if_statement",
-            suggestions=["Check If block transformation logic"],
-        )
-        return None
+    return _rewrite_compound_statement(stmt, "_process_if_statement")
 
 
 def _process_loop_statement(stmt: cst.BaseStatement, max_depth: int = 7) -> cst.BaseStatement | None:
-    """Process For/While loops by recursively applying wrap_assert_in_block to body and orelse.
+    """Process For/While loops by rewriting assertion context managers in body and orelse.
 
     Args:
         stmt: The statement to process
+        max_depth: Accepted for backwards compatibility; nesting depth is
+            not limited.
 
     Returns:
         The processed statement, or None if not a For/While loop
     """
     if not isinstance(stmt, cst.For | cst.While):
         return None
+    return _rewrite_compound_statement(stmt, "_process_loop_statement")
 
-    try:
-        loop_body = getattr(stmt, "body", None)
-        body_statements = _safe_extract_statements(loop_body, max_depth)
-        if body_statements is not None:
-            new_loop_body = loop_body.with_changes(body=wrap_assert_in_block(body_statements, max_depth))
-        else:
-            new_loop_body = loop_body
 
-        # Process orelse which can be a BaseSuite
-        new_orelse = getattr(stmt, "orelse", None)
-        body_statements = _safe_extract_statements(new_orelse, max_depth)
-        if body_statements is not None and new_orelse is not None and hasattr(new_orelse, "body"):
-            try:
-                # Preferred: if inner body supports with_changes
-                new_orelse = new_orelse.with_changes(
-                    body=new_orelse.body.with_changes(body=wrap_assert_in_block(body_statements, max_depth))
-                )
-            except Exception:
-                try:
-                    # Fallback: set body directly
-                    new_orelse = new_orelse.with_changes(body=wrap_assert_in_block(body_statements, max_depth))
-                except Exception:
-                    pass
+def _recursively_rewrite_withs(stmt: cst.BaseStatement) -> cst.BaseStatement:
+    """Rewrite With.items inside a statement using transform_with_items.
+
+    This post-pass ensures any nested With nodes (inside Try, If, loop or
+    With bodies) have their With.items converted from self.assert* to
+    pytest equivalents. Bare ``self.assert*(...)`` statements are left
+    alone. It is intentionally conservative and returns the original
+    statement on any error.
+    """
+    try:
+        return _rewrite_statement_blocks([stmt], rewrite_calls=False)[0]
+    except (AttributeError, TypeError, IndexError, re.error):
+        return stmt
 
-        new_loop = stmt.with_changes(body=new_loop_body, orelse=new_orelse)
-        # Ensure nested With items are also rewritten
-        try:
-            new_loop = _recursively_rewrite_withs(new_loop)
-        except (AttributeError, TypeError, IndexError):
-            pass
-        return new_loop
 
+def _rewrite_compound_statement(stmt: cst.BaseStatement, operation: str) -> cst.BaseStatement | None:
+    """Run the block rewriter over a single compound statement."""
+    try:
+        return _rewrite_statement_blocks([stmt], rewrite_calls=True)[0]
     except (AttributeError, TypeError, IndexError) as e:
         report_transformation_error(
             e,
             "assert_transformer",
-            "_process_loop_statement",
-            suggestions=["Check For/While loop transformation logic"],
+            operation,
+            suggestions=["Check nested block transformation logic"],
         )
         return None
 
 
-def _recursively_rewrite_withs(stmt: cst.BaseStatement) -> cst.BaseStatement:
-    """Recursively rewrite With.items inside a statement using transform_with_items.
+# Block rewriting
+#
+# Context-manager assertions can sit at any depth inside try/if/for/while/
+# with blocks. The helpers below walk those blocks with an explicit stack
+# rather than Python recursion, so nesting depth is bounded only by memory
+# and every statement is visited once per function body. Compound
+# statements that contain no assertion context manager are kept as-is
+# without descending into them.
+
+
+def _is_context_assert_call(expr: cst.BaseExpression) -> bool:
+    """Return True for ``self``/``cls`` calls that map to a pytest context manager."""
+    if not isinstance(expr, cst.Call):
+        return False
+    func = expr.func
+    return (
+        isinstance(func, cst.Attribute)
+        and isinstance(func.value, cst.Name)
+        and func.value.value in ("self", "cls")
+        and func.attr.value in _with_rewrites.CONTEXT_MANAGER_ASSERT_METHODS
+    )
 
-    This post-pass ensures any nested With nodes (inside Try, If, or With
-    bodies) have their With.items converted from self.assert* to pytest
-    equivalents. It is intentionally conservative and returns the original
-    statement on any error.
+
+def _is_bare_context_assert(stmt: cst.BaseStatement) -> bool:
+    """Return True for a statement line that is just ``self.assertRaises(...)`` or similar."""
+    return (
+        isinstance(stmt, cst.SimpleStatementLine)
+        and len(stmt.body) == 1
+        and isinstance(stmt.body[0], cst.Expr)
+        and _is_context_assert_call(stmt.body[0].value)
+    )
+
+
+def _suite_statements(suite: cst.BaseSuite | None) -> Sequence[cst.BaseStatement] | None:
+    # One-line suites hold small statements only and cannot take a With.
+    return suite.body if isinstance(suite, cst.IndentedBlock) else None
+
+
+def _nested_blocks(stmt: cst.BaseStatement) -> list[Sequence[cst.BaseStatement] | None]:
+    """Return the statement blocks nested directly in ``stmt``.
+
+    The order matches :func:`_rebuild_compound`. ``None`` marks a block
+    that is not rewritten. An ``elif`` is returned as a one-statement block
+    so it is handled like any other ``if``.
     """
-    try:
-        # Direct With node: transform its items and recurse into its body
-        if isinstance(stmt, cst.With):
-            new_with, alias, changed = transform_with_items(stmt)
-            # Recurse into body
-            body = new_with.body
-            if hasattr(body, "body"):
-                new_inner = []
-                for s in body.body:
-                    new_inner.append(_recursively_rewrite_withs(s))
-                new_body = body.with_changes(body=new_inner)
-                return new_with.with_changes(body=new_body)
-            return new_with
+    if isinstance(stmt, cst.With):
+        return [_suite_statements(stmt.body)]
+    if isinstance(stmt, cst.If):
+        orelse = stmt.orelse
+        if isinstance(orelse, cst.If):
+            tail: Sequence[cst.BaseStatement] | None = (orelse,)
+        else:
+            tail = _suite_statements(orelse.body) if orelse is not None else None
+        return [_suite_statements(stmt.body), tail]
+    if isinstance(stmt, cst.For | cst.While):
+        orelse = stmt.orelse
+        return [_suite_statements(stmt.body), _suite_statements(orelse.body) if orelse is not None else None]
+    if isinstance(stmt, cst.Try):
+        blocks = [_suite_statements(stmt.body)]
+        blocks.extend(_suite_statements(handler.body) for handler in stmt.handlers)
+        blocks.append(_suite_statements(stmt.orelse.body) if stmt.orelse is not None else None)
+        blocks.append(_suite_statements(stmt.finalbody.body) if stmt.finalbody is not None else None)
+        return blocks
+    return []
+
+
+def _rebuild_compound(stmt: cst.BaseStatement, results: list[list[cst.BaseStatement] | None]) -> cst.BaseStatement:
+    """Return ``stmt`` with rewritten nested blocks; ``None`` results keep the original block."""
+
+    def suite(block: Any, new_body: list[cst.BaseStatement] | None) -> Any:
+        return block if new_body is None else block.with_changes(body=new_body)
+
+    if isinstance(stmt, cst.With):
+        return stmt.with_changes(body=suite(stmt.body, results[0]))
+    if isinstance(stmt, cst.If):
+        orelse = stmt.orelse
+        tail = results[1]
+        if tail is not None:
+            if isinstance(orelse, cst.If):
+                orelse = tail[0]
+            else:
+                orelse = orelse.with_changes(body=suite(orelse.body, tail))
+        return stmt.with_changes(body=suite(stmt.body, results[0]), orelse=orelse)
+    if isinstance(stmt, cst.For | cst.While):
+        orelse = stmt.orelse
+        if results[1] is not None:
+            orelse = orelse.with_changes(body=suite(orelse.body, results[1]))
+        return stmt.with_changes(body=suite(stmt.body, results[0]), orelse=orelse)
+    if isinstance(stmt, cst.Try):
+        count = len(stmt.handlers)
+        handlers = [
+            handler if new_body is None else handler.with_changes(body=suite(handler.body, new_body))
+            for handler, new_body in zip(stmt.handlers, results[1 : 1 + count], strict=True)
+        ]
+        orelse = stmt.orelse
+        if results[1 + count] is not None:
+            orelse = orelse.with_changes(body=suite(orelse.body, results[1 + count]))
+        finalbody = stmt.finalbody
+        if results[2 + count] is not None:
+            finalbody = finalbody.with_changes(body=suite(finalbody.body, results[2 + count]))
+        return stmt.with_changes(
+            body=suite(stmt.body, results[0]), handlers=handlers, orelse=orelse, finalbody=finalbody
+        )
+    return stmt
 
-        # Try nodes: rewrite bodies and handlers
-        if isinstance(stmt, cst.Try):
-            new_body = stmt.body
-            if hasattr(stmt.body, "body"):
-                new_body = stmt.body.with_changes(body=[_recursively_rewrite_withs(s) for s in stmt.body.body])
-
-            new_handlers = []
-            for h in getattr(stmt, "handlers", []) or []:
-                if hasattr(h.body, "body"):
-                    new_h = h.with_changes(
-                        body=h.body.with_changes(body=[_recursively_rewrite_withs(s) for s in h.body.body])
-                    )
-                else:
-                    new_h = h
-                new_handlers.append(new_h)
 
-            new_orelse = stmt.orelse
-            if getattr(stmt, "orelse", None) and hasattr(stmt.orelse, "body"):
-                new_orelse = stmt.orelse.with_changes(body=[_recursively_rewrite_withs(s) for s in stmt.orelse.body])
+def _index_context_assert_statements(statements: Sequence[cst.BaseStatement]) -> set[int]:
+    """Return ids of compound statements containing an assertion context manager.
 
-            new_final = stmt.finalbody
-            if getattr(stmt, "finalbody", None) and hasattr(stmt.finalbody, "body"):
-                new_final = stmt.finalbody.with_changes(
-                    body=[_recursively_rewrite_withs(s) for s in stmt.finalbody.body]
-                )
+    A compound statement qualifies when a ``With`` at any depth below it
+    (or the statement itself) uses an assert helper as a context manager,
+    or when one of its blocks holds a bare ``self.assert*(...)`` line. The
+    walk is iterative and only descends statement blocks, never
+    expressions.
+    """
+    relevant: set[int] = set()
+    # Each compound statement is pushed twice: once to expand its blocks
+    # and once, after its children have been decided, to decide itself.
+    stack: list[tuple[cst.BaseStatement, bool]] = [(stmt, False) for stmt in statements]
+    while stack:
+        stmt, expanded = stack.pop()
+        if isinstance(stmt, cst.SimpleStatementLine):
+            continue
+        blocks = _nested_blocks(stmt)
+        if not blocks:
+            continue
+        if not expanded:
+            stack.append((stmt, True))
+            for block in blocks:
+                if block:
+                    stack.extend((child, False) for child in block)
+            continue
+        if (isinstance(stmt, cst.With) and any(_is_context_assert_call(item.item) for item in stmt.items)) or any(
+            id(child) in relevant or _is_bare_context_assert(child) for block in blocks if block for child in block
+        ):
+            relevant.add(id(stmt))
+    return relevant
+
+
+class _BlockFrame:
+    """A statement block being rewritten on the explicit stack."""
+
+    __slots__ = ("source", "statements", "index", "out", "rewrite_calls")
+
+    def __init__(
+        self, source: Sequence[cst.BaseStatement], statements: list[cst.BaseStatement], rewrite_calls: bool
+    ) -> None:
+        self.source = source
+        # Alias rewriting may replace following statements in place, so
+        # this list is the one handed to the per-statement helpers.
+        self.statements = statements
+        self.index = 0
+        self.out: list[cst.BaseStatement] = []
+        self.rewrite_calls = rewrite_calls
+
+    def result(self) -> list[cst.BaseStatement] | None:
+        """Return the rewritten block, or None when nothing changed."""
+        out = self.out
+        if len(out) == len(self.source) and all(new is old for new, old in zip(out, self.source, strict=True)):
+            return None
+        return out
+
+
+class _CompoundFrame:
+    """A compound statement waiting for its nested blocks to be rewritten."""
+
+    __slots__ = ("node", "blocks", "results", "rewrite_calls")
+
+    def __init__(self, node: cst.BaseStatement, rewrite_calls: bool) -> None:
+        self.node = node
+        self.blocks = _nested_blocks(node)
+        self.results: list[list[cst.BaseStatement] | None] = []
+        # With bodies only get their nested With items rewritten, which
+        # matches how the recursive implementation treated them.
+        self.rewrite_calls = rewrite_calls and not isinstance(node, cst.With)
+
+    def finish(self) -> cst.BaseStatement:
+        if all(result is None for result in self.results):
+            return self.node
+        try:
+            return _rebuild_compound(self.node, self.results)
+        except (AttributeError, TypeError, ValueError) as e:
+            report_transformation_error(
+                e,
+                "assert_transformer",
+                "_rebuild_compound",
+                suggestions=["Check nested block structure"],
+            )
+            return self.node
 
-            return stmt.with_changes(body=new_body, handlers=new_handlers, orelse=new_orelse, finalbody=new_final)
 
-        # If nodes: rewrite bodies and else blocks
-        if isinstance(stmt, cst.If):
-            new_body = stmt.body
-            if hasattr(stmt.body, "body"):
-                new_body = stmt.body.with_changes(body=[_recursively_rewrite_withs(s) for s in stmt.body.body])
-            new_orelse = stmt.orelse
-            if getattr(stmt, "orelse", None) and hasattr(stmt.orelse, "body"):
-                try:
-                    # If Else.body is a BaseSuite with inner .body list
-                    new_orelse = stmt.orelse.with_changes(
-                        body=stmt.orelse.body.with_changes(
-                            body=[_recursively_rewrite_withs(s) for s in stmt.orelse.body.body]
-                        )
-                    )
-                except Exception:
-                    # Fallback: treat orelse.body as list
-                    new_orelse = stmt.orelse.with_changes(
-                        body=[_recursively_rewrite_withs(s) for s in stmt.orelse.body]
-                    )
-            return stmt.with_changes(body=new_body, orelse=new_orelse)
-
-        # For/While nodes: rewrite bodies and else blocks
-        if isinstance(stmt, cst.For | cst.While):
-            new_body = stmt.body
-            if hasattr(stmt.body, "body"):
-                new_body = stmt.body.with_changes(body=[_recursively_rewrite_withs(s) for s in stmt.body.body])
-            new_orelse = stmt.orelse
-            if getattr(stmt, "orelse", None) and hasattr(stmt.orelse, "body"):
-                try:
-                    new_orelse = stmt.orelse.with_changes(
-                        body=stmt.orelse.body.with_changes(
-                            body=[_recursively_rewrite_withs(s) for s in stmt.orelse.body.body]
-                        )
-                    )
-                except Exception:
-                    new_orelse = stmt.orelse.with_changes(
-                        body=[_recursively_rewrite_withs(s) for s in stmt.orelse.body]
-                    )
-            return stmt.with_changes(body=new_body, orelse=new_orelse)
+def _step_block(frame: _BlockFrame, relevant: set[int]) -> _CompoundFrame | None:
+    """Rewrite the next statement of ``frame``.
+
+    Simple statements are appended to ``frame.out`` directly. Compound
+    statements that need rewriting are returned as a new frame for the
+    caller to push; the finished node is appended once its blocks are done.
+    """
+    statements = frame.statements
+    i = frame.index
+    stmt = statements[i]
+    frame.index = i + 1
+    try:
+        if isinstance(stmt, cst.SimpleStatementLine):
+            if frame.rewrite_calls and _is_bare_context_assert(stmt):
+                result = _handle_simple_statement_line(stmt, statements, i)
+                if result is not None and result[2]:
+                    nodes, consumed, _handled = result
+                    frame.index = i + max(consumed, 1)
+                    nodes = [wrap_small_stmt_if_needed(n) for n in nodes]
+                    # The statement wrapped into the new With may itself hold
+                    # With items that need rewriting.
+                    if len(nodes) == 1 and isinstance(nodes[0], cst.With):
+                        return _CompoundFrame(nodes[0], rewrite_calls=False)
+                    frame.out.extend(nodes)
+                    return None
+        elif id(stmt) in relevant:
+            if isinstance(stmt, cst.With):
+                node = _handle_with_statement(stmt, statements, i) if frame.rewrite_calls else None
+                if node is None:
+                    node, _alias, _changed = transform_with_items(stmt)
+                return _CompoundFrame(node, frame.rewrite_calls)
+            return _CompoundFrame(stmt, frame.rewrite_calls)
+    except Exception as e:
+        # Ultimate fallback - preserve original statement and continue
+        report_transformation_error(
+            e,
+            "assert_transformer",
+            "wrap_assert_in_block",
+            suggestions=["Check statement processing logic"],
+        )
+        frame.index = i + 1
+    frame.out.append(stmt)
+    return None
 
-        # Default: return original
-        return stmt
-    except (AttributeError, TypeError, IndexError, re.error):
-        return stmt
 
-    # Debug: unreachable here normally
+def _rewrite_statement_blocks(statements: list[cst.BaseStatement], rewrite_calls: bool) -> list[cst.BaseStatement]:
+    """Rewrite assertion context managers in ``statements`` and all nested blocks.
+
+    Args:
+        statements: Statements of one block, typically a function body.
+            The list may be updated in place by alias rewriting.
+        rewrite_calls: When True, bare ``self.assert*(...)`` statements are
+            turned into ``with`` blocks and ``with`` aliases are rewritten;
+            when False only ``With`` items are converted.
+
+    Returns:
+        The rewritten statements.
+    """
+    relevant = _index_context_assert_statements(statements)
+    root = _BlockFrame(statements, statements, rewrite_calls)
+    stack: list[_BlockFrame | _CompoundFrame] = [root]
+    while stack:
+        frame = stack[-1]
+        if isinstance(frame, _CompoundFrame):
+            if len(frame.results) < len(frame.blocks):
+                block = frame.blocks[len(frame.results)]
+                if block is None:
+                    frame.results.append(None)
+                else:
+                    stack.append(_BlockFrame(block, list(block), frame.rewrite_calls))
+                continue
+            stack.pop()
+            cast(_BlockFrame, stack[-1]).out.append(frame.finish())
+        elif frame.index < len(frame.statements):
+            compound = _step_block(frame, relevant)
+            if compound is not None:
+                stack.append(compound)
+        else:
+            stack.pop()
+            if stack:
+                cast(_CompoundFrame, stack[-1]).results.append(frame.result())
+    return root.out
 
 
 def transform_skip_test(node: cst.Call) -> cst.CSTNode:
@@ -1484,7 +1506,7 @@ def transform_skip_test(node: cst.Call) -> cst.CSTNode:
     original call.
     """
     # Preserve any arguments (message or reason)
-    new_func = cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="skip"))
+    new_func = nodes.dotted_name("pytest.skip")
     return cst.Call(func=new_func, args=node.args)
 
 
@@ -1494,7 +1516,7 @@ def transform_fail(node: cst.Call) -> cst.CSTNode:
     All arguments are preserved.
     """
     # Use a Name with dotted path parsed as Name; better to use Attribute
-    new_attr = cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="fail"))
+    new_attr = nodes.dotted_name("pytest.fail")
     return cst.Call(func=new_attr, args=node.args)
 
 
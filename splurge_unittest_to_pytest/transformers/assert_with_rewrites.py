@@ -11,6 +11,7 @@ from typing import Any
 import libcst as cst
 
 from . import assert_transformer as _orig
+from . import node_factory as nodes
 from ._caplog_helpers import (
     AliasOutputAccess,
 )
@@ -23,10 +24,18 @@ from ._caplog_helpers import (
 from ._caplog_helpers import (
     extract_alias_output_slices as _caplog_extract_alias_output_slices,
 )
-from .transformer_helper import wrap_small_stmt_if_needed
 
 _logger = logging.getLogger(__name__)
 
+# Upper bound on nested ``.body`` wrappers _safe_extract_statements will unwrap
+_MAX_BODY_UNWRAP = 7
+
+# Assert helpers that unittest code uses as context managers and that
+# :func:`build_with_item_from_assert_call` maps to pytest equivalents.
+CONTEXT_MANAGER_ASSERT_METHODS = frozenset(
+    {"assertLogs", "assertNoLogs", "assertWarns", "assertWarnsRegex", "assertRaises"}
+)
+
 
 def _extract_alias_output_slices(expr: cst.BaseExpression) -> "AliasOutputAccess | None":
     return _caplog_extract_alias_output_slices(expr)
@@ -303,7 +312,7 @@ def _replace_exception_attr_in_expr(expr: cst.BaseExpression, alias_name: str) -
     # Direct attribute: <alias>.exception
     if isinstance(expr, cst.Attribute) and isinstance(expr.value, cst.Name):
         if expr.value.value == alias_name and isinstance(expr.attr, cst.Name) and expr.attr.value == "exception":
-            return expr.with_changes(attr=cst.Name(value="value"))
+            return expr.with_changes(attr=nodes.name("value"))
 
     # Call wrapping attribute: e.g., str(<alias>.exception)
     if isinstance(expr, cst.Call) and getattr(expr, "args", None):
@@ -380,21 +389,23 @@ def _rewrite_length_comparison(
     return None
 
 
-def _safe_extract_statements(body_container, max_depth: int = 7) -> list[cst.BaseStatement] | None:
+def _safe_extract_statements(body_container) -> list[cst.BaseStatement] | None:
     """Safely extract a list of statements from a body container.
 
     This is a small, well-typed copy of the helper from
     `assert_transformer` used during the staged migration so the
     orchestration code can call it without creating circular imports.
     It returns None when the body cannot be interpreted as a list of
-    statements.
+    statements. Wrappers are unwrapped at most ``_MAX_BODY_UNWRAP`` times
+    so malformed containers cannot loop forever; this bound is unrelated
+    to the deprecated ``max_depth`` option.
     """
     if body_container is None or not hasattr(body_container, "body"):
         return None
 
     current = body_container.body
     depth = 0
-    while depth < max_depth:
+    while depth < _MAX_BODY_UNWRAP:
         # Accept actual lists/tuples of statements. However some libcst
         # shapes produce a one-element list containing another container
         # (for example an IndentedBlock nested inside a list). In that
@@ -565,13 +576,13 @@ def get_caplog_level_args(call_expr: cst.Call) -> list[cst.Arg]:
         if getattr(arg, "keyword", None) and isinstance(arg.keyword, cst.Name) and arg.keyword.value == "level":
             return [cst.Arg(value=arg.value)]
     # default to "INFO"
-    return [cst.Arg(value=cst.SimpleString(value='"INFO"'))]
+    return [cst.Arg(value=nodes.string('"INFO"'))]
 
 
 def build_caplog_call(call_expr: cst.Call) -> cst.Call:
     """Construct a :class:`libcst.Call` for ``caplog.at_level(...)`` using level args."""
     args = get_caplog_level_args(call_expr)
-    return cst.Call(func=cst.Attribute(value=cst.Name(value="caplog"), attr=cst.Name(value="at_level")), args=args)
+    return nodes.call("caplog.at_level", args)
 
 
 # --- Backwards-compatible delegations for orchestration helpers ---
@@ -588,7 +599,7 @@ def build_with_item_from_assert_call(call_expr: cst.Call) -> cst.WithItem | None
     if owner not in {"self", "cls"}:
         return None
     name = func.attr.value if isinstance(func.attr, cst.Name) else None
-    if not name:
+    if name not in CONTEXT_MANAGER_ASSERT_METHODS:
         return None
 
     # assertLogs / assertNoLogs -> caplog.at_level
@@ -608,7 +619,7 @@ def build_with_item_from_assert_call(call_expr: cst.Call) -> cst.WithItem | None
             new_args.append(orig_args[0])
             # second arg becomes keyword 'match'
             second = orig_args[1]
-            new_args.append(cst.Arg(value=second.value, keyword=cst.Name(value="match")))
+            new_args.append(nodes.keyword_arg("match", second.value))
             # append remaining original args as-is (starting from index 2)
             for a in orig_args[2:]:
                 new_args.append(a)
@@ -616,17 +627,12 @@ def build_with_item_from_assert_call(call_expr: cst.Call) -> cst.WithItem | None
             new_args = orig_args
 
         return cst.WithItem(
-            item=cst.Call(
-                func=cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="warns")), args=new_args
-            ),
+            item=nodes.call("pytest.warns", new_args),
             asname=None,
         )
     if name == "assertRaises":
         return cst.WithItem(
-            item=cst.Call(
-                func=cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="raises")),
-                args=list(getattr(call_expr, "args", ())),
-            ),
+            item=nodes.call("pytest.raises", list(getattr(call_expr, "args", ()))),
             asname=None,
         )
 
@@ -676,95 +682,15 @@ def _process_with_statement(stmt: cst.With, statements: list[cst.BaseStatement],
 
 
 def _process_try_statement(stmt: cst.BaseStatement, max_depth: int = 7) -> cst.BaseStatement | None:
-    """Process a Try statement by recursively applying local wrap/rewrites.
+    """Process a Try statement by rewriting assertion context managers in its blocks.
 
-    This adapted implementation uses the local `_safe_extract_statements`
-    helper and reuses the original module's `wrap_assert_in_block` and
-    `_recursively_rewrite_withs` where appropriate to minimize code
-    duplication during the staged migration.
+    Delegates to the original module's iterative block rewriter so both
+    modules share one implementation.
     """
     if not isinstance(stmt, cst.Try):
         return None
-
     try:
-        try_body = getattr(stmt, "body", None)
-        try:
-            _logger.debug("_process_try_statement: entering Try node: %s", repr(stmt))
-        except Exception:
-            pass
-        body_statements = _safe_extract_statements(try_body, max_depth)
-        if body_statements is not None and try_body is not None:
-            # reuse original wrap_assert_in_block to avoid duplicating larger logic
-            new_try_body = try_body.with_changes(body=_orig.wrap_assert_in_block(body_statements, max_depth))
-        else:
-            new_try_body = try_body
-
-        new_handlers = []
-        for h in getattr(stmt, "handlers", []) or []:
-            h_body = getattr(h, "body", None)
-            body_statements = _safe_extract_statements(h_body, max_depth)
-            if body_statements is not None and h_body is not None:
-                new_h_body = h_body.with_changes(body=_orig.wrap_assert_in_block(body_statements, max_depth))
-                new_h = h.with_changes(body=new_h_body)
-            else:
-                new_h = h
-            new_handlers.append(new_h)
-
-        new_orelse = getattr(stmt, "orelse", None)
-        body_statements = _safe_extract_statements(new_orelse, max_depth)
-        if new_orelse is not None and hasattr(new_orelse, "body"):
-            body_statements = _safe_extract_statements(new_orelse, max_depth)
-            if body_statements is not None:
-                new_orelse = new_orelse.with_changes(
-                    body=new_orelse.body.with_changes(body=_orig.wrap_assert_in_block(body_statements, max_depth))
-                )
-
-        new_finalbody = getattr(stmt, "finalbody", None)
-        body_statements = _safe_extract_statements(new_finalbody, max_depth)
-        if new_finalbody is not None and hasattr(new_finalbody, "body"):
-            body_statements = _safe_extract_statements(new_finalbody, max_depth)
-            if body_statements is not None:
-                new_finalbody = new_finalbody.with_changes(
-                    body=new_finalbody.body.with_changes(body=_orig.wrap_assert_in_block(body_statements, max_depth))
-                )
-
-        new_try = stmt.with_changes(
-            body=new_try_body, handlers=new_handlers, orelse=new_orelse, finalbody=new_finalbody
-        )
-
-        # As a defensive step during the staged migration, explicitly visit
-        # nested With nodes inside the constructed Try and apply the local
-        # transform_with_items helper. This ensures With.items that use
-        # ``self.assertRaises`` / ``self.assertWarns`` are converted to
-        # pytest equivalents and are preserved in subsequent passes.
-        try:
-
-            class _WithRewriter(cst.CSTTransformer):
-                def leave_With(self, original: cst.With, updated: cst.With) -> cst.With:
-                    try:
-                        new_with, _alias, changed = transform_with_items(updated)
-                        return new_with
-                    except Exception:
-                        return updated
-
-            rewritten_try = new_try.visit(_WithRewriter())
-            if isinstance(rewritten_try, cst.Try):
-                if rewritten_try is not new_try:
-                    _logger.debug(
-                        "_process_try_statement: applied With-item rewrites inside Try -> %s", repr(rewritten_try)
-                    )
-                new_try = rewritten_try
-        except Exception:
-            # Fall back to original behavior when anything goes wrong
-            pass
-
-        try:
-            _logger.debug("_process_try_statement: exiting Try node -> %s", repr(new_try))
-        except Exception:
-            pass
-
-        return new_try
-
+        return _orig._process_try_statement(stmt, max_depth)
     except Exception:
         return None
 
@@ -952,45 +878,7 @@ def wrap_assert_in_block(statements: list[cst.BaseStatement], max_depth: int = 7
     Keeping a local symbol avoids callers needing to import `_orig` and
     simplifies staged migration.
     """
-    # Local conservative implementation: iterate statements and process
-    # each with the local `_process_statement_with_fallback` helper. This
-    # reduces cross-module delegation during migration while preserving
-    # the original behavior where we can't safely transform.
-    logger = logging.getLogger(__name__)
-    out: list[cst.BaseStatement] = []
-
-    # Use shared utility for wrapping small statements
-    _wrap_small_stmt_if_needed = wrap_small_stmt_if_needed
-
-    i = 0
-    while i < len(statements):
-        stmt = statements[i]
-        try:
-            logger.debug("wrap_assert_in_block: processing stmt[%d]=%s", i, type(stmt).__name__)
-        except Exception:
-            pass
-        try:
-            nodes, consumed = _process_statement_with_fallback(stmt, statements, i, max_depth)
-        except Exception:
-            # On error, append the original statement and move on
-            out.append(stmt)
-            i += 1
-            continue
-
-        # nodes is a list of nodes to append; consumed indicates how many
-        # original statements were consumed (usually 1 or 2)
-        for n in nodes:
-            wrapped = _wrap_small_stmt_if_needed(n)
-            try:
-                logger.debug(
-                    "wrap_assert_in_block: appended node type=%s (wrapped=%s)", type(n).__name__, type(wrapped).__name__
-                )
-            except Exception:
-                pass
-            out.append(wrapped)
-        i += consumed
-
-    return out
+    return _orig.wrap_assert_in_block(statements, max_depth)
 
 
 def _process_if_statement(stmt: cst.BaseStatement, max_depth: int = 7) -> cst.BaseStatement | None:
@@ -1024,7 +912,7 @@ def create_with_wrapping_next_stmt(
         # Use an Expr(Name('pass')) inside a SimpleStatementLine so the
         # resulting AST string matches the tests' expectations (some test
         # assertions expect a Name('pass') inside the SimpleStatementLine).
-        pass_stmt = cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))])
+        pass_stmt = cst.SimpleStatementLine(body=[nodes.PASS_EXPR])
         body = cst.IndentedBlock(body=[pass_stmt])
         try:
             _logger.debug("create_with_wrapping_next_stmt: created With with pass body: %s", repr(with_item))
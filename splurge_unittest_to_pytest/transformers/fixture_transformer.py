@@ -7,6 +7,11 @@ CST-based transformation is inappropriate or unavailable. They are
 separate from the libcst-powered transformers to make targeted testing
 and reuse easier.
 
+The ``create_*_fixture`` builders accept the collected setup/teardown
+statements either as libcst statement nodes, which are inserted as-is so
+comments and formatting survive, or as source strings, which are parsed
+on demand.
+
 Notes:
         - The string-based transforms are conservative and operate on the
             raw source text; they are not guaranteed to preserve all edge
@@ -21,9 +26,15 @@ This software is released under the MIT License.
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 
 import libcst as cst
 
+from . import node_factory as nodes
+
+# A collected setup/teardown statement: a libcst node or its source text
+FixtureStatement = cst.BaseStatement | str
+
 
 def transform_fixtures_string_based(code: str) -> str:
     """Perform conservative string-level conversion of setUp/tearDown to fixtures.
@@ -67,72 +78,69 @@ def transform_fixtures_string_based(code: str) -> str:
     return code
 
 
-def create_class_fixture(setup_class_code: list[str], teardown_class_code: list[str]) -> cst.FunctionDef:
+def _coerce_fixture_statement(entry: FixtureStatement) -> cst.BaseStatement:
+    """Return a statement node for a collected setup/teardown entry.
+
+    Statement nodes are returned unchanged. Strings are parsed as an
+    expression statement first and then as a full statement; entries that
+    cannot be parsed become ``pass``.
+    """
+    if isinstance(entry, cst.BaseStatement):
+        return entry
+
+    try:
+        # Try parsing as an expression (simple assignments/expressions)
+        return cst.SimpleStatementLine(body=[cst.Expr(value=cst.parse_expression(entry))])
+    except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
+        try:
+            # Parse full statement and append it regardless of its concrete type
+            return cst.parse_module(entry).body[0]
+        except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
+            return cst.SimpleStatementLine(body=[nodes.PASS_EXPR])
+
+
+def create_class_fixture(
+    setup_class_code: Sequence[FixtureStatement], teardown_class_code: Sequence[FixtureStatement]
+) -> cst.FunctionDef:
     """Create a :class:`libcst.FunctionDef` representing a class-scoped fixture.
 
     The produced fixture is decorated with ``@pytest.fixture(scope="class", autouse=True)``
     and contains the provided ``setup_class_code`` lines, a ``yield`` to
     separate setup from teardown, and then the ``teardown_class_code``
-    lines. Inputs are lists of source-code strings which are parsed and
-    appended into the function body when possible.
+    lines. Inputs are statement nodes, which are used as-is, or
+    source-code strings, which are parsed when possible.
 
     Args:
-        setup_class_code: List of source lines to include in the setup
-            portion of the fixture.
-        teardown_class_code: List of source lines to include after the
-            yield for teardown.
+        setup_class_code: Statements to include in the setup portion of
+            the fixture.
+        teardown_class_code: Statements to include after the yield for
+            teardown.
 
     Returns:
         A :class:`libcst.FunctionDef` node suitable for insertion into
         a module AST.
     """
 
-    decorator = cst.Decorator(
-        decorator=cst.Call(
-            func=cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="fixture")),
-            args=[
-                cst.Arg(keyword=cst.Name(value="scope"), value=cst.SimpleString(value='"class"')),
-                cst.Arg(keyword=cst.Name(value="autouse"), value=cst.Name(value="True")),
-            ],
-        )
-    )
+    decorator = nodes.fixture_decorator(scope="class", autouse=True)
 
     body_statements: list[cst.BaseStatement] = []
 
-    for setup_line in setup_class_code:
-        try:
-            # Try parsing as an expression (simple assignments/expressions)
-            body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.parse_expression(setup_line))]))
-        except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-            try:
-                # Parse full statement and append it regardless of its concrete type
-                parsed_stmt = cst.parse_module(setup_line).body[0]
-                body_statements.append(parsed_stmt)
-            except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-                body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]))
+    body_statements.extend(_coerce_fixture_statement(entry) for entry in setup_class_code)
 
-    body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.Yield(value=None))]))
+    body_statements.append(cst.SimpleStatementLine(body=[nodes.YIELD_EXPR]))
 
-    for teardown_line in teardown_class_code:
-        try:
-            body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.parse_expression(teardown_line))]))
-        except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-            try:
-                parsed_stmt = cst.parse_module(teardown_line).body[0]
-                body_statements.append(parsed_stmt)
-            except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-                body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]))
+    body_statements.extend(_coerce_fixture_statement(entry) for entry in teardown_class_code)
 
     if not body_statements:
         body_statements = [
-            cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]),
-            cst.SimpleStatementLine(body=[cst.Expr(value=cst.Yield(value=None))]),
-            cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]),
+            cst.SimpleStatementLine(body=[nodes.PASS_EXPR]),
+            cst.SimpleStatementLine(body=[nodes.YIELD_EXPR]),
+            cst.SimpleStatementLine(body=[nodes.PASS_EXPR]),
         ]
 
     func = cst.FunctionDef(
-        name=cst.Name(value="setup_class"),
-        params=cst.Parameters(params=[cst.Param(name=cst.Name(value="cls"), annotation=None)]),
+        name=nodes.name("setup_class"),
+        params=cst.Parameters(params=[cst.Param(name=nodes.name("cls"), annotation=None)]),
         body=cst.IndentedBlock(body=body_statements),
         decorators=[decorator],
         returns=None,
@@ -141,64 +149,45 @@ def create_class_fixture(setup_class_code: list[str], teardown_class_code: list[
     return func
 
 
-def create_instance_fixture(setup_code: list[str], teardown_code: list[str]) -> cst.FunctionDef:
+def create_instance_fixture(
+    setup_code: Sequence[FixtureStatement], teardown_code: Sequence[FixtureStatement]
+) -> cst.FunctionDef:
     """Create an instance-scoped autouse fixture ``setup_method``.
 
     The returned :class:`libcst.FunctionDef` is decorated with
-    ``@pytest.fixture(autouse=True)`` and will contain parsed setup
-    lines, a ``yield``, and parsed teardown lines. Inputs are lists of
-    source-code strings that are parsed into libcst statements when
-    possible; non-parseable lines are replaced with ``pass``.
+    ``@pytest.fixture(autouse=True)`` and will contain the setup
+    statements, a ``yield``, and the teardown statements. Statement nodes
+    are used as-is; strings are parsed into libcst statements when
+    possible and non-parseable lines are replaced with ``pass``.
 
     Args:
-        setup_code: Lines to place before the ``yield``.
-        teardown_code: Lines to place after the ``yield``.
+        setup_code: Statements to place before the ``yield``.
+        teardown_code: Statements to place after the ``yield``.
 
     Returns:
         A :class:`libcst.FunctionDef` for ``setup_method(self)``.
     """
 
-    decorator = cst.Decorator(
-        decorator=cst.Call(
-            func=cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="fixture")),
-            args=[cst.Arg(keyword=cst.Name(value="autouse"), value=cst.Name(value="True"))],
-        )
-    )
+    decorator = nodes.fixture_decorator(autouse=True)
 
     body_statements: list[cst.BaseStatement] = []
 
-    for setup_line in setup_code:
-        try:
-            body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.parse_expression(setup_line))]))
-        except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-            try:
-                parsed_stmt = cst.parse_module(setup_line).body[0]
-                body_statements.append(parsed_stmt)
-            except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-                body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]))
+    body_statements.extend(_coerce_fixture_statement(entry) for entry in setup_code)
 
-    body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.Yield(value=None))]))
+    body_statements.append(cst.SimpleStatementLine(body=[nodes.YIELD_EXPR]))
 
-    for teardown_line in teardown_code:
-        try:
-            body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.parse_expression(teardown_line))]))
-        except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-            try:
-                parsed_stmt = cst.parse_module(teardown_line).body[0]
-                body_statements.append(parsed_stmt)
-            except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-                body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]))
+    body_statements.extend(_coerce_fixture_statement(entry) for entry in teardown_code)
 
     if not body_statements:
         body_statements = [
-            cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]),
-            cst.SimpleStatementLine(body=[cst.Expr(value=cst.Yield(value=None))]),
-            cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]),
+            cst.SimpleStatementLine(body=[nodes.PASS_EXPR]),
+            cst.SimpleStatementLine(body=[nodes.YIELD_EXPR]),
+            cst.SimpleStatementLine(body=[nodes.PASS_EXPR]),
         ]
 
     func = cst.FunctionDef(
-        name=cst.Name(value="setup_method"),
-        params=cst.Parameters(params=[cst.Param(name=cst.Name(value="self"), annotation=None)]),
+        name=nodes.name("setup_method"),
+        params=cst.Parameters(params=[cst.Param(name=nodes.name("self"), annotation=None)]),
         body=cst.IndentedBlock(body=body_statements),
         decorators=[decorator],
         returns=None,
@@ -207,39 +196,31 @@ def create_instance_fixture(setup_code: list[str], teardown_code: list[str]) ->
     return func
 
 
-def create_teardown_fixture(teardown_code: list[str]) -> cst.FunctionDef:
+def create_teardown_fixture(teardown_code: Sequence[FixtureStatement]) -> cst.FunctionDef:
     """Create an autouse ``teardown_method`` fixture.
 
     This helper builds a :class:`libcst.FunctionDef` named
     ``teardown_method(self)`` decorated with ``@pytest.fixture`` and
-    containing a ``yield`` followed by teardown statements parsed from
-    ``teardown_code``. If parsing a line fails the helper inserts a
-    ``pass`` statement as a conservative fallback.
+    containing a ``yield`` followed by the ``teardown_code`` statements.
+    If parsing a string entry fails the helper inserts a ``pass``
+    statement as a conservative fallback.
 
     Args:
-        teardown_code: Lines to execute after the yield.
+        teardown_code: Statements to execute after the yield.
 
     Returns:
         A :class:`libcst.FunctionDef` representing ``teardown_method``.
     """
 
-    decorator = cst.Decorator(decorator=cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="fixture")))
+    decorator = nodes.fixture_decorator()
 
-    body_statements: list[cst.BaseStatement] = [cst.SimpleStatementLine(body=[cst.Expr(value=cst.Yield(value=None))])]
+    body_statements: list[cst.BaseStatement] = [cst.SimpleStatementLine(body=[nodes.YIELD_EXPR])]
 
-    for teardown_line in teardown_code:
-        try:
-            body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.parse_expression(teardown_line))]))
-        except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-            try:
-                parsed_stmt = cst.parse_module(teardown_line).body[0]
-                body_statements.append(parsed_stmt)
-            except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-                body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]))
+    body_statements.extend(_coerce_fixture_statement(entry) for entry in teardown_code)
 
     func = cst.FunctionDef(
-        name=cst.Name(value="teardown_method"),
-        params=cst.Parameters(params=[cst.Param(name=cst.Name(value="self"), annotation=None)]),
+        name=nodes.name("teardown_method"),
+        params=cst.Parameters(params=[cst.Param(name=nodes.name("self"), annotation=None)]),
         body=cst.IndentedBlock(body=body_statements),
         decorators=[decorator],
         returns=None,
@@ -248,67 +229,46 @@ def create_teardown_fixture(teardown_code: list[str]) -> cst.FunctionDef:
     return func
 
 
-def create_module_fixture(setup_module_code: list[str], teardown_module_code: list[str]) -> cst.FunctionDef:
+def create_module_fixture(
+    setup_module_code: Sequence[FixtureStatement], teardown_module_code: Sequence[FixtureStatement]
+) -> cst.FunctionDef:
     """Create a module-scoped, autouse fixture named ``setup_module``.
 
     The returned node is decorated with
     ``@pytest.fixture(scope="module", autouse=True)`` and contains the
-    provided setup lines, a ``yield``, and the provided teardown lines.
+    provided setup statements, a ``yield``, and the provided teardown
+    statements.
 
     Args:
-        setup_module_code: Lines to include before the yield.
-        teardown_module_code: Lines to include after the yield.
+        setup_module_code: Statements to include before the yield.
+        teardown_module_code: Statements to include after the yield.
 
     Returns:
         A :class:`libcst.FunctionDef` node for insertion into the module
         AST.
     """
 
-    decorator = cst.Decorator(
-        decorator=cst.Call(
-            func=cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="fixture")),
-            args=[
-                cst.Arg(keyword=cst.Name(value="scope"), value=cst.SimpleString(value='"module"')),
-                cst.Arg(keyword=cst.Name(value="autouse"), value=cst.Name(value="True")),
-            ],
-        )
-    )
+    decorator = nodes.fixture_decorator(scope="module", autouse=True)
 
     body_statements: list[cst.BaseStatement] = []
 
-    for line in setup_module_code:
-        try:
-            body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.parse_expression(line))]))
-        except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-            try:
-                parsed_stmt = cst.parse_module(line).body[0]
-                body_statements.append(parsed_stmt)
-            except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-                body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]))
+    body_statements.extend(_coerce_fixture_statement(entry) for entry in setup_module_code)
 
     # Insert the yield for teardown pairing
-    body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.Yield(value=None))]))
+    body_statements.append(cst.SimpleStatementLine(body=[nodes.YIELD_EXPR]))
 
-    for line in teardown_module_code:
-        try:
-            body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.parse_expression(line))]))
-        except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-            try:
-                parsed_stmt = cst.parse_module(line).body[0]
-                body_statements.append(parsed_stmt)
-            except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-                body_statements.append(cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]))
+    body_statements.extend(_coerce_fixture_statement(entry) for entry in teardown_module_code)
 
     if not body_statements:
         body_statements = [
-            cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]),
-            cst.SimpleStatementLine(body=[cst.Expr(value=cst.Yield(value=None))]),
-            cst.SimpleStatementLine(body=[cst.Expr(value=cst.Name(value="pass"))]),
+            cst.SimpleStatementLine(body=[nodes.PASS_EXPR]),
+            cst.SimpleStatementLine(body=[nodes.YIELD_EXPR]),
+            cst.SimpleStatementLine(body=[nodes.PASS_EXPR]),
         ]
 
     func = cst.FunctionDef(
-        name=cst.Name(value="setup_module"),
-        params=cst.Parameters(params=[]),
+        name=nodes.name("setup_module"),
+        params=nodes.NO_PARAMETERS,
         body=cst.IndentedBlock(body=body_statements),
         decorators=[decorator],
         returns=None,
@@ -0,0 +1,164 @@
+"""Function-level transformation cache for incremental re-runs.
+
+Re-running the converter after editing a single test method should not
+pay for re-transforming every other method in the file. This module
+provides :class:`FunctionTransformCache`, a bounded LRU cache that maps a
+hash of a ``FunctionDef``'s rendered source plus the context that
+influences its rewrite (test prefixes, decision-model strategy,
+parametrize knobs, regex import names, nesting column) to the
+transformed function.
+
+Alongside the text, each entry records the side effects the transform
+had on the owning transformer, the pytest/``re`` import flags. Replaying
+those on a cache hit keeps the output identical to a full transform.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass, field
+
+import libcst as cst
+
+
+@dataclass
+class FunctionCacheEntry:
+    """Transformed function text plus the side effects needed to replay it.
+
+    Attributes:
+        code: Rendered source of the transformed ``FunctionDef``.
+        node: The transformed node itself. When absent the node is parsed
+            from ``code`` on first use.
+        needs_pytest_import: Whether the transform required ``pytest``.
+        needs_re_import: Whether the transform required ``re``.
+    """
+
+    code: str
+    needs_pytest_import: bool = False
+    needs_re_import: bool = False
+    node: cst.FunctionDef | None = field(default=None, repr=False, compare=False)
+
+    def to_node(self, parser_config: cst.PartialParserConfig | None = None) -> cst.FunctionDef:
+        """Return the cached function as a CST node, parsing ``code`` at most once.
+
+        Args:
+            parser_config: Parser configuration of the module the function
+                will be spliced into (indentation and newline style).
+
+        Returns:
+            The transformed :class:`libcst.FunctionDef`.
+
+        Raises:
+            TypeError: If the cached text does not parse to a function.
+        """
+        if self.node is None:
+            if parser_config is None:
+                parsed = cst.parse_statement(self.code)
+            else:
+                parsed = cst.parse_statement(self.code, config=parser_config)
+            if not isinstance(parsed, cst.FunctionDef):
+                raise TypeError(f"Cached code is not a function definition: {type(parsed).__name__}")
+            self.node = parsed
+        return self.node
+
+
+class FunctionTransformCache:
+    """Bounded, thread-safe LRU cache of transformed function definitions.
+
+    Keys are produced by :meth:`make_key` from the function's original
+    source and a sequence of hashable context values. The cache is shared
+    between transformer instances so repeated runs over the same file only
+    re-transform methods whose source or context changed.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries retained before the
+                least recently used entry is evicted.
+        """
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[str, FunctionCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(source: str, context: Sequence[Hashable]) -> str:
+        """Return a stable cache key for a function's source and context.
+
+        Args:
+            source: Rendered source of the original ``FunctionDef``.
+            context: Values that influence how the function is rewritten.
+
+        Returns:
+            Hex digest identifying the function/context pair.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(source.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+        digest.update(repr(tuple(context)).encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> FunctionCacheEntry | None:
+        """Return the entry for ``key`` and mark it recently used.
+
+        Args:
+            key: Key produced by :meth:`make_key`.
+
+        Returns:
+            The cached entry, or ``None`` when absent.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: FunctionCacheEntry) -> None:
+        """Store ``entry`` under ``key``, evicting old entries when full.
+
+        Args:
+            key: Key produced by :meth:`make_key`.
+            entry: Transformed function text and side effects.
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+
+# Process-wide cache shared by pipeline runs
+_function_cache = FunctionTransformCache()
+
+
+def get_function_cache() -> FunctionTransformCache:
+    """Get the process-wide function transformation cache."""
+    return _function_cache
+
+
+__all__ = ["FunctionCacheEntry", "FunctionTransformCache", "get_function_cache"]
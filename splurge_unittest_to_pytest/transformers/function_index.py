@@ -0,0 +1,159 @@
+"""Per-function feature index used by the subtest and parametrize helpers.
+
+Several helpers need to answer small questions about a function body:
+does it use ``subtests.test`` or ``caplog.at_level``, is a name referenced
+outside a loop, which names are assigned before a statement. Answering
+each of those with a fresh subtree walk made conversion quadratic for
+methods with large loops. :class:`FunctionFeatureIndex` walks a body once
+and records the features those helpers query.
+
+Positions are top-level statement indexes within the indexed body, which
+is the granularity every caller works at.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Container, Sequence
+
+import libcst as cst
+
+# Receivers recognised for ``self.subTest(...)`` / ``self.assert*(...)`` calls
+_SELF_NAMES = frozenset({"self", "cls"})
+
+
+class FunctionFeatureIndex:
+    """Features of a statement body collected in a single traversal.
+
+    Attributes:
+        name_uses: Map of identifier to the ascending indexes of top-level
+            statements containing a ``Name`` node with that value.
+        name_defs: Map of identifier to the indexes of top-level simple
+            statements that assign it (``x = ...`` or ``x: T = ...``).
+        with_calls: Map of ``(receiver, attribute)`` to the number of
+            ``with`` items calling ``receiver.attribute(...)``.
+        subtest_calls: ``self.subTest(...)``/``cls.subTest(...)`` calls.
+        loops: ``for`` and ``while`` statements at any depth.
+        assert_calls: ``self.assert*(...)`` calls.
+
+    Each entry in ``subtest_calls``, ``loops`` and ``assert_calls`` is a
+    ``(statement_index, node)`` pair.
+    """
+
+    __slots__ = ("name_uses", "name_defs", "with_calls", "subtest_calls", "loops", "assert_calls")
+
+    def __init__(self) -> None:
+        self.name_uses: dict[str, list[int]] = {}
+        self.name_defs: dict[str, list[int]] = {}
+        self.with_calls: dict[tuple[str, str], int] = {}
+        self.subtest_calls: list[tuple[int, cst.Call]] = []
+        self.loops: list[tuple[int, cst.For | cst.While]] = []
+        self.assert_calls: list[tuple[int, cst.Call]] = []
+
+    @classmethod
+    def build(cls, statements: Sequence[cst.CSTNode], skip: Container[int] = ()) -> FunctionFeatureIndex:
+        """Index ``statements`` with one traversal of each statement.
+
+        Args:
+            statements: Top-level statements of a function body (or any
+                block) to index.
+            skip: Positions whose subtrees are not walked. Their top-level
+                assignments are still recorded, which keeps
+                :meth:`names_assigned_before` cheap for callers that never
+                need name uses inside large literal assignments.
+
+        Returns:
+            The populated index.
+        """
+        index = cls()
+        collector = _FeatureCollector(index)
+        for position, stmt in enumerate(statements):
+            collector.position = position
+            if isinstance(stmt, cst.SimpleStatementLine):
+                index._record_assignments(stmt, position)
+            if position not in skip:
+                stmt.visit(collector)
+        return index
+
+    def _record_assignments(self, stmt: cst.SimpleStatementLine, position: int) -> None:
+        for small_stmt in stmt.body:
+            if isinstance(small_stmt, cst.Assign):
+                for assign_target in small_stmt.targets:
+                    if isinstance(assign_target.target, cst.Name):
+                        self.name_defs.setdefault(assign_target.target.value, []).append(position)
+            elif isinstance(small_stmt, cst.AnnAssign):
+                if isinstance(small_stmt.target, cst.Name):
+                    self.name_defs.setdefault(small_stmt.target.value, []).append(position)
+
+    def uses_name(self, name: str) -> bool:
+        """Return True when ``name`` appears anywhere in the indexed body."""
+        return name in self.name_uses
+
+    def name_used_outside(self, name: str, excluded: Container[int]) -> bool:
+        """Return True when ``name`` appears in a statement not in ``excluded``.
+
+        Args:
+            name: Identifier to look up.
+            excluded: Statement indexes to ignore.
+
+        Returns:
+            ``True`` if any other top-level statement references ``name``.
+        """
+        return any(position not in excluded for position in self.name_uses.get(name, ()))
+
+    def names_assigned_before(self, position: int) -> set[str]:
+        """Return names assigned by top-level simple statements before ``position``."""
+        return {name for name, positions in self.name_defs.items() if positions[0] < position}
+
+    def uses_with_call(self, receiver: str, attribute: str) -> bool:
+        """Return True when a ``with`` item calls ``receiver.attribute(...)``."""
+        return (receiver, attribute) in self.with_calls
+
+
+class _FeatureCollector(cst.CSTVisitor):
+    """Visitor that fills a :class:`FunctionFeatureIndex`."""
+
+    def __init__(self, index: FunctionFeatureIndex) -> None:
+        super().__init__()
+        self.index = index
+        self.position = 0
+
+    def visit_Name(self, node: cst.Name) -> bool:  # noqa: N802 - libcst naming
+        positions = self.index.name_uses.setdefault(node.value, [])
+        if not positions or positions[-1] != self.position:
+            positions.append(self.position)
+        return False
+
+    def visit_WithItem(self, node: cst.WithItem) -> bool:  # noqa: N802 - libcst naming
+        call = node.item
+        if (
+            isinstance(call, cst.Call)
+            and isinstance(call.func, cst.Attribute)
+            and isinstance(call.func.value, cst.Name)
+        ):
+            key = (call.func.value.value, call.func.attr.value)
+            self.index.with_calls[key] = self.index.with_calls.get(key, 0) + 1
+        return True
+
+    def visit_Call(self, node: cst.Call) -> bool:  # noqa: N802 - libcst naming
+        func = node.func
+        if isinstance(func, cst.Attribute) and isinstance(func.value, cst.Name) and func.value.value in _SELF_NAMES:
+            attr = func.attr.value
+            if attr == "subTest":
+                self.index.subtest_calls.append((self.position, node))
+            elif attr.startswith("assert"):
+                self.index.assert_calls.append((self.position, node))
+        return True
+
+    def visit_For(self, node: cst.For) -> bool:  # noqa: N802 - libcst naming
+        self.index.loops.append((self.position, node))
+        return True
+
+    def visit_While(self, node: cst.While) -> bool:  # noqa: N802 - libcst naming
+        self.index.loops.append((self.position, node))
+        return True
+
+
+__all__ = ["FunctionFeatureIndex"]
@@ -13,10 +13,107 @@ This software is released under the MIT License.
 
 from __future__ import annotations
 
+from collections.abc import Collection, Iterable
+
 import libcst as cst
 
+from .pass_manager import CSTPass
+
+
+def _dynamic_import_target(node: cst.Call) -> str | None:
+    """Return ``name`` for ``__import__('name')`` or ``<x>.import_module('name')`` calls."""
+    try:
+        is_dynamic = (isinstance(node.func, cst.Name) and node.func.value == "__import__") or (
+            isinstance(node.func, cst.Attribute)
+            and isinstance(node.func.attr, cst.Name)
+            and node.func.attr.value == "import_module"
+        )
+        if is_dynamic and node.args and isinstance(node.args[0].value, cst.SimpleString):
+            return node.args[0].value.value.strip("'\"")
+    except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
+        # Be conservative and ignore errors in detection
+        pass
+    return None
+
+
+class DynamicImportFinder(CSTPass):
+    """Record which of ``names`` are imported dynamically.
+
+    Detects ``__import__('name')`` and ``importlib.import_module('name')``
+    (or any ``<x>.import_module('name')``) calls anywhere in the module.
+    """
+
+    interests = frozenset({"Call"})
+
+    def __init__(self, names: Iterable[str]) -> None:
+        super().__init__()
+        self.names = frozenset(names)
+        self.found: set[str] = set()
+
+    def visit_Call(self, node: cst.Call) -> None:
+        target = _dynamic_import_target(node)
+        if target is not None and target in self.names:
+            self.found.add(target)
+
+
+class UnittestUsageFinder(CSTPass):
+    """Detect module-level uses of ``unittest`` outside import statements.
+
+    Names inside imports, classes and functions do not count; dynamic
+    imports of ``unittest`` anywhere do.
+    """
+
+    interests = frozenset({"Import", "ImportFrom", "ClassDef", "FunctionDef", "Name", "Call"})
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.found = False
+        self._in_import = 0
+        self._depth = 0
+
+    def visit_Import(self, node: cst.Import) -> None:
+        # Entering an import statement - don't count names here
+        self._in_import += 1
+
+    def leave_Import(self, original_node: cst.Import, updated_node: cst.Import) -> cst.Import:
+        self._in_import -= 1
+        return updated_node
+
+    def visit_ImportFrom(self, node: cst.ImportFrom) -> None:
+        self._in_import += 1
+
+    def leave_ImportFrom(self, original_node: cst.ImportFrom, updated_node: cst.ImportFrom) -> cst.ImportFrom:
+        self._in_import -= 1
+        return updated_node
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> None:
+        self._depth += 1
+
+    def leave_ClassDef(self, original_node: cst.ClassDef, updated_node: cst.ClassDef) -> cst.ClassDef:
+        self._depth -= 1
+        return updated_node
 
-def add_pytest_imports(code: str, transformer: object | None = None) -> str:
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
+        self._depth += 1
+
+    def leave_FunctionDef(self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef) -> cst.FunctionDef:
+        self._depth -= 1
+        return updated_node
+
+    def visit_Name(self, node: cst.Name) -> None:
+        # Only mark 'unittest' as found when not inside import nodes
+        if node.value == "unittest" and self._in_import == 0 and self._depth == 0:
+            self.found = True
+
+    def visit_Call(self, node: cst.Call) -> None:
+        # Treat dynamic import calls as usage of the module
+        if _dynamic_import_target(node) == "unittest":
+            self.found = True
+
+
+def add_pytest_imports(
+    code: str, transformer: object | None = None, dynamic_imports: Collection[str] | None = None
+) -> str:
     """Ensure ``import pytest`` and optional ``re`` imports are present.
 
     This function parses the given source text with libcst and inspects
@@ -39,6 +136,10 @@ def add_pytest_imports(code: str, transformer: object | None = None) -> str:
         code: The Python source text to inspect and modify.
         transformer: Optional object providing flags/alias hints
             (``needs_re_import``, ``re_alias``, ``re_search_name``).
+        dynamic_imports: Names already known to be imported dynamically,
+            for example collected by a :class:`DynamicImportFinder` fused
+            into an earlier traversal of the same code. When given, the
+            module is not walked again to find them.
 
     Returns:
         The modified source text with the inserted import statements, or
@@ -53,34 +154,6 @@ def add_pytest_imports(code: str, transformer: object | None = None) -> str:
 
         module = cst.parse_module(code)
 
-        # Helper: detect dynamic imports like __import__('pytest') or importlib.import_module('pytest')
-        class _DynImportFinder(cst.CSTVisitor):
-            def __init__(self, name: str) -> None:
-                self.name = name
-                self.found = False
-
-            def visit_Call(self, node: cst.Call) -> None:
-                try:
-                    # __import__('name')
-                    if isinstance(node.func, cst.Name) and node.func.value == "__import__":
-                        if node.args and isinstance(node.args[0].value, cst.SimpleString):
-                            s = node.args[0].value.value.strip("'\"")
-                            if s == self.name:
-                                self.found = True
-                                return
-
-                    # importlib.import_module('name') or something.import_module('name')
-                    if isinstance(node.func, cst.Attribute) and isinstance(node.func.attr, cst.Name):
-                        if node.func.attr.value == "import_module":
-                            if node.args and isinstance(node.args[0].value, cst.SimpleString):
-                                s = node.args[0].value.value.strip("'\"")
-                                if s == self.name:
-                                    self.found = True
-                                    return
-                except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-                    # Be conservative and ignore errors in detection
-                    pass
-
         # Collect existing top-level imports. libcst may present imports either
         # as Import/ImportFrom nodes or as SimpleStatementLine wrapping an Expr
         # whose value is an Import/ImportFrom. Treat both forms equivalently.
@@ -134,16 +207,14 @@ def add_pytest_imports(code: str, transformer: object | None = None) -> str:
 
         # Also treat dynamic import calls as evidence the module is present/used
         try:
-            if not has_pytest:
-                finder = _DynImportFinder("pytest")
-                module.visit(finder)
-                if finder.found:
-                    has_pytest = True
-            if not has_re:
-                finder = _DynImportFinder("re")
-                module.visit(finder)
-                if finder.found:
-                    has_re = True
+            missing = {name for name, present in (("pytest", has_pytest), ("re", has_re)) if not present}
+            if missing:
+                if dynamic_imports is None:
+                    finder = DynamicImportFinder(missing)
+                    module.visit(finder)
+                    dynamic_imports = finder.found
+                has_pytest = has_pytest or "pytest" in dynamic_imports
+                has_re = has_re or "re" in dynamic_imports
         except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
             pass
 
@@ -194,7 +265,7 @@ def add_pytest_imports(code: str, transformer: object | None = None) -> str:
         return code
 
 
-def remove_unittest_imports_if_unused(code: str) -> str:
+def remove_unittest_imports_if_unused(code: str, unittest_used: bool | None = None) -> str:
     """Remove top-level ``unittest`` imports when the module no longer references it.
 
     This helper parses the module with libcst and checks for any
@@ -211,6 +282,9 @@ def remove_unittest_imports_if_unused(code: str) -> str:
 
     Args:
         code: The module source text to analyze and potentially modify.
+        unittest_used: Result of a :class:`UnittestUsageFinder` already run
+            over the same code in an earlier traversal; the module is only
+            walked when this is None.
 
     Returns:
         The source text with unused top-level unittest imports removed,
@@ -221,65 +295,11 @@ def remove_unittest_imports_if_unused(code: str) -> str:
         module = cst.parse_module(code)
 
         # Detect whether 'unittest' is referenced elsewhere in the module
-        class Finder(cst.CSTVisitor):
-            def __init__(self) -> None:
-                self.found = False
-                self._in_import = 0
-                self._depth = 0
-
-            def visit_Import(self, node: cst.Import) -> None:
-                # Entering an import statement - don't count names here
-                self._in_import += 1
-
-            def leave_Import(self, node: cst.Import) -> None:
-                self._in_import -= 1
-
-            def visit_ClassDef(self, node: cst.ClassDef) -> None:
-                self._depth += 1
-
-            def leave_ClassDef(self, node: cst.ClassDef) -> None:
-                self._depth -= 1
-
-            def visit_ImportFrom(self, node: cst.ImportFrom) -> None:
-                # Entering a from-import statement
-                self._in_import += 1
-
-            def leave_ImportFrom(self, node: cst.ImportFrom) -> None:
-                self._in_import -= 1
-
-            def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
-                self._depth += 1
-
-            def leave_FunctionDef(self, node: cst.FunctionDef) -> None:
-                self._depth -= 1
-
-            def visit_Name(self, node: cst.Name) -> None:
-                # Only mark 'unittest' as found when not inside import nodes
-                if node.value == "unittest" and self._in_import == 0 and self._depth == 0:
-                    self.found = True
-
-            def visit_Call(self, node: cst.Call) -> None:
-                # Treat dynamic import calls as usage of the module
-                try:
-                    if isinstance(node.func, cst.Name) and node.func.value == "__import__":
-                        if node.args and isinstance(node.args[0].value, cst.SimpleString):
-                            s = node.args[0].value.value.strip("'\"")
-                            if s == "unittest":
-                                self.found = True
-                                return
-                    if isinstance(node.func, cst.Attribute) and isinstance(node.func.attr, cst.Name):
-                        if node.func.attr.value == "import_module":
-                            if node.args and isinstance(node.args[0].value, cst.SimpleString):
-                                s = node.args[0].value.value.strip("'\"")
-                                if s == "unittest":
-                                    self.found = True
-                                    return
-                except (AttributeError, TypeError, IndexError, cst.ParserSyntaxError):
-                    pass
-
-        finder = Finder()
-        module.visit(finder)
-        if finder.found:
+        if unittest_used is None:
+            finder = UnittestUsageFinder()
+            module.visit(finder)
+            unittest_used = finder.found
+        if unittest_used:
             return code
 
         # Remove import statements that import unittest. Handle both plain Import/ImportFrom
@@ -0,0 +1,165 @@
+"""Shared, interned libcst nodes for the assertion and fixture transformers.
+
+libcst nodes are frozen dataclasses, so a node that carries no per-site
+information (an identifier, an operator, ``pytest.raises``, a fixture
+decorator) can be placed at any number of positions in a tree. The
+assertion and fixture rewrites used to build those nodes afresh for every
+converted call; on assertion-dense files that is most of what they
+allocate. This module keeps one instance of each such node and exposes
+small builders for the shapes the transformers emit.
+
+Interned nodes must only be used for fixed identifiers and literals known
+to the transformer, never for arbitrary user values, so the caches stay
+bounded.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import libcst as cst
+
+_NAMES: dict[str, cst.Name] = {}
+_DOTTED: dict[str, cst.Name | cst.Attribute] = {}
+_STRINGS: dict[str, cst.SimpleString] = {}
+_FIXTURE_DECORATORS: dict[tuple[str | None, bool], cst.Decorator] = {}
+
+# Comparison and unary operators with libcst's default spacing
+EQUAL = cst.Equal()
+NOT_EQUAL = cst.NotEqual()
+LESS_THAN = cst.LessThan()
+LESS_THAN_EQUAL = cst.LessThanEqual()
+GREATER_THAN = cst.GreaterThan()
+GREATER_THAN_EQUAL = cst.GreaterThanEqual()
+IS = cst.Is()
+IS_NOT = cst.IsNot()
+IN = cst.In()
+NOT_IN = cst.NotIn()
+NOT = cst.Not()
+SUBTRACT = cst.Subtract()
+
+ZERO = cst.Integer(value="0")
+
+# Parameter list of ``lambda: ...`` and argument-less fixtures
+NO_PARAMETERS = cst.Parameters()
+
+# ``yield`` and ``pass`` expressions used in generated fixture bodies
+YIELD_EXPR = cst.Expr(value=cst.Yield(value=None))
+PASS_EXPR = cst.Expr(value=cst.Name(value="pass"))
+
+
+def name(value: str) -> cst.Name:
+    """Return the shared :class:`libcst.Name` for identifier ``value``."""
+    node = _NAMES.get(value)
+    if node is None:
+        node = _NAMES[value] = cst.Name(value=value)
+    return node
+
+
+def dotted_name(path: str) -> cst.Name | cst.Attribute:
+    """Return the shared expression for a dotted path such as ``pytest.mark.skip``.
+
+    Args:
+        path: Dot-separated identifiers.
+
+    Returns:
+        A :class:`libcst.Name` for a single identifier, otherwise a chain of
+        :class:`libcst.Attribute` nodes. Prefixes are shared as well, so
+        ``pytest.mark.skip`` and ``pytest.mark.xfail`` reuse ``pytest.mark``.
+    """
+    node = _DOTTED.get(path)
+    if node is None:
+        owner, _, attr = path.rpartition(".")
+        node = cst.Attribute(value=dotted_name(owner), attr=name(attr)) if owner else name(path)
+        _DOTTED[path] = node
+    return node
+
+
+def string(literal: str) -> cst.SimpleString:
+    """Return the shared :class:`libcst.SimpleString` for ``literal`` (quotes included)."""
+    node = _STRINGS.get(literal)
+    if node is None:
+        node = _STRINGS[literal] = cst.SimpleString(value=literal)
+    return node
+
+
+def keyword_arg(keyword: str, value: cst.BaseExpression) -> cst.Arg:
+    """Return ``keyword=value`` as a :class:`libcst.Arg` with a shared keyword name."""
+    return cst.Arg(keyword=name(keyword), value=value)
+
+
+def call(path: str, args: Sequence[cst.Arg] = ()) -> cst.Call:
+    """Return a call to the dotted ``path`` (for example ``pytest.raises``) with ``args``."""
+    return cst.Call(func=dotted_name(path), args=args)
+
+
+def compare(left: cst.BaseExpression, operator: cst.BaseCompOp, right: cst.BaseExpression) -> cst.Comparison:
+    """Return the comparison ``left <operator> right``."""
+    return cst.Comparison(left=left, comparisons=[cst.ComparisonTarget(operator=operator, comparator=right)])
+
+
+def assert_compare(left: cst.BaseExpression, operator: cst.BaseCompOp, right: cst.BaseExpression) -> cst.Assert:
+    """Return ``assert left <operator> right``."""
+    return cst.Assert(test=compare(left, operator, right))
+
+
+def assert_not(expression: cst.BaseExpression) -> cst.Assert:
+    """Return ``assert not expression``."""
+    return cst.Assert(test=cst.UnaryOperation(operator=NOT, expression=expression))
+
+
+def fixture_decorator(scope: str | None = None, autouse: bool = False) -> cst.Decorator:
+    """Return the shared ``@pytest.fixture`` decorator for ``scope``/``autouse``.
+
+    Args:
+        scope: Fixture scope such as ``"class"`` or ``"module"``; omitted
+            from the decorator when ``None``.
+        autouse: Whether to add ``autouse=True``.
+
+    Returns:
+        ``@pytest.fixture`` when neither option is set, otherwise
+        ``@pytest.fixture(scope=..., autouse=True)`` with the given options.
+    """
+    key = (scope, autouse)
+    decorator = _FIXTURE_DECORATORS.get(key)
+    if decorator is None:
+        args: list[cst.Arg] = []
+        if scope is not None:
+            args.append(keyword_arg("scope", string(f'"{scope}"')))
+        if autouse:
+            args.append(keyword_arg("autouse", name("True")))
+        target = call("pytest.fixture", args) if args else dotted_name("pytest.fixture")
+        decorator = _FIXTURE_DECORATORS[key] = cst.Decorator(decorator=target)
+    return decorator
+
+
+__all__ = [
+    "EQUAL",
+    "NOT_EQUAL",
+    "LESS_THAN",
+    "LESS_THAN_EQUAL",
+    "GREATER_THAN",
+    "GREATER_THAN_EQUAL",
+    "IS",
+    "IS_NOT",
+    "IN",
+    "NOT_IN",
+    "NOT",
+    "SUBTRACT",
+    "ZERO",
+    "NO_PARAMETERS",
+    "YIELD_EXPR",
+    "PASS_EXPR",
+    "name",
+    "dotted_name",
+    "string",
+    "keyword_arg",
+    "call",
+    "compare",
+    "assert_compare",
+    "assert_not",
+    "fixture_decorator",
+]
@@ -18,13 +18,14 @@ This software is released under the MIT License.
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Container, Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import cast
 
 import libcst as cst
 
 from ..exceptions import ParametrizeConversionError
+from . import node_factory as nodes
 from ._resolvers import (
     _collect_constant_assignment_values as _collect_constant_assignment_values_resolver,
 )
@@ -52,6 +53,7 @@ from ._resolvers import (
 from ._resolvers import (
     _resolve_sequence_argument as _resolve_sequence_argument_resolver,
 )
+from .function_index import FunctionFeatureIndex
 
 
 # Lightweight wrappers to preserve the original local function names and
@@ -139,12 +141,17 @@ class ParametrizeOptions:
 
     parametrize_include_ids: bool = True
     parametrize_add_annotations: bool = True
+    # Tables with more rows than this are emitted as a module-level constant
+    # referenced by the decorator; 0 keeps every table inline.
+    parametrize_table_threshold: int = 0
 
 
 def convert_subtest_loop_to_parametrize(
     original_func: cst.FunctionDef,
     updated_func: cst.FunctionDef,
     transformer_or_options,
+    module_tables: list[cst.SimpleStatementLine] | None = None,
+    reserved_names: Container[str] = (),
 ) -> cst.FunctionDef | None:
     """Return a parametrized ``FunctionDef`` when a simple subTest loop is detected.
 
@@ -153,6 +160,12 @@ def convert_subtest_loop_to_parametrize(
         updated_func: Function definition to analyse and potentially rewrite.
         transformer: Transformer instance used to record side effects such as
             ``needs_pytest_import``.
+        module_tables: Optional sink for module-level table assignments.
+            When given and the row count exceeds
+            ``parametrize_table_threshold``, the rows are appended here as
+            a constant assignment and the decorator references that name.
+        reserved_names: Names the module already binds (see
+            :func:`module_bound_names`); a hoisted table never reuses one.
 
     Returns:
         Updated function definition with a parametrization decorator when
@@ -176,13 +189,13 @@ def convert_subtest_loop_to_parametrize(
         _validate_inner_body(subtest_loop.body)
         _validate_subtest_call(subtest_loop.call, param_names)
 
-        rows, removal_candidates = _extract_iter_rows(
+        table, removal_candidates = _build_row_table(
             subtest_loop.loop.iter,
             body_statements,
             subtest_loop.index,
             len(param_names),
         )
-        if not rows:
+        if not table.row_count:
             return None
 
         removable_indexes = _filter_removal_candidates(removal_candidates, body_statements, subtest_loop)
@@ -194,13 +207,15 @@ def convert_subtest_loop_to_parametrize(
             options = transformer_or_options
             include_ids = options.parametrize_include_ids
             add_annotations = options.parametrize_add_annotations
+            table_threshold = options.parametrize_table_threshold
             transformer = None
         else:
             transformer = transformer_or_options
             include_ids = getattr(transformer, "parametrize_include_ids", True)
             add_annotations = getattr(transformer, "parametrize_add_annotations", True)
+            table_threshold = getattr(transformer, "parametrize_table_threshold", 0)
 
-        annotations = _infer_param_annotations(rows) if add_annotations else tuple(None for _ in param_names)
+        annotations = table.annotations() if add_annotations else tuple(None for _ in param_names)
         new_params = _ensure_function_params(updated_func.params, param_names, annotations)
         new_body = _build_new_body(body_statements, subtest_loop, removable_indexes)
 
@@ -215,11 +230,20 @@ def convert_subtest_loop_to_parametrize(
 
         if matching_index is not None:
             target_decorator = existing_decorators[matching_index]
-            updated_decorator = _append_rows_to_decorator(target_decorator, rows, include_ids)
+            updated_decorator = _append_elements_to_decorator(target_decorator, table.elements, include_ids)
             decorators = list(existing_decorators)
             decorators[matching_index] = updated_decorator
         else:
-            decorator = _build_decorator(param_names, rows, include_ids)
+            if module_tables is not None and 0 < table_threshold < table.row_count:
+                table_name = _unique_table_name(updated_func.name.value, module_tables, reserved_names)
+                module_tables.append(_build_table_assignment(table_name, table.elements))
+                decorator = _make_parametrize_decorator(
+                    param_names, cst.Name(value=table_name), table.row_count, include_ids, compact_ids=True
+                )
+            else:
+                decorator = _make_parametrize_decorator(
+                    param_names, cst.List(elements=tuple(table.elements)), table.row_count, include_ids
+                )
             decorators = [decorator, *existing_decorators]
 
         return updated_func.with_changes(
@@ -332,27 +356,107 @@ def _validate_subtest_call(call: cst.Call, target_names: Sequence[str]) -> None:
         raise ParametrizeConversionError
 
 
-def _extract_iter_rows(
+# Leaf literals that cannot reference names and need no inlining
+_LEAF_LITERALS = (cst.Integer, cst.Float, cst.Imaginary, cst.SimpleString)
+_BUILTIN_CONSTANTS = frozenset({"True", "False", "None"})
+# Column hint marker for columns whose rows disagree on type
+_MIXED = "<mixed>"
+
+
+class _RowTable:
+    """Streaming, single-pass builder for parametrize rows.
+
+    Each value produced by the loop iterable is split into a row, checked
+    for references to function-local state, has compile-time constants
+    inlined, contributes to per-column type inference and is converted to
+    its list element as soon as it is added. Every cell is touched once, so
+    building a table is linear in its size.
+    """
+
+    __slots__ = ("arity", "constants", "blocked_names", "elements", "row_count", "_column_hints")
+
+    def __init__(
+        self,
+        arity: int,
+        constants: Mapping[str, cst.BaseExpression],
+        blocked_names: frozenset[str],
+    ) -> None:
+        self.arity = arity
+        self.constants = constants
+        self.blocked_names = blocked_names
+        self.elements: list[cst.Element] = []
+        self.row_count = 0
+        self._column_hints: list[str | None] = [None] * arity
+
+    def add(self, value: cst.BaseExpression) -> None:
+        """Append the row for one iterable ``value``.
+
+        Raises:
+            ParametrizeConversionError: If the value does not unpack into
+                ``arity`` cells or references local state.
+        """
+        cells = tuple(self._prepare_cell(cell) for cell in _split_row(value, self.arity))
+        hints = self._column_hints
+        for column, cell in enumerate(cells):
+            hint = _infer_expression_type(cell)
+            if hint is None or hints[column] == hint:
+                continue
+            hints[column] = hint if hints[column] is None else _MIXED
+
+        if len(cells) == 1:
+            self.elements.append(cst.Element(value=cells[0]))
+        else:
+            self.elements.append(cst.Element(value=cst.Tuple(elements=[cst.Element(value=cell) for cell in cells])))
+        self.row_count += 1
+
+    def _prepare_cell(self, expression: cst.BaseExpression) -> cst.BaseExpression:
+        # Decorators are evaluated at import time, so rows must not refer to
+        # function locals; compile-time constants are inlined instead (see
+        # ``_inline_constant_expression`` for the general case).
+        if isinstance(expression, _LEAF_LITERALS):
+            return expression.deep_clone()
+        if isinstance(expression, cst.Name):
+            name = expression.value
+            replacement = self.constants.get(name)
+            if replacement is not None:
+                return replacement.deep_clone()
+            if name in self.blocked_names and name not in _BUILTIN_CONSTANTS:
+                raise ParametrizeConversionError
+            return expression.deep_clone()
+
+        referenced = _collect_expression_names(expression)
+        if any(name in self.blocked_names and name not in self.constants for name in referenced):
+            raise ParametrizeConversionError
+        cloned = expression.deep_clone()
+        if self.constants and not referenced.isdisjoint(self.constants):
+            return _inline_constant_expression(cloned, self.constants)
+        return cloned
+
+    def annotations(self) -> tuple[cst.Annotation | None, ...]:
+        """Return parameter annotations inferred from the rows added so far."""
+        return tuple(
+            cst.Annotation(annotation=cst.parse_expression(hint)) if hint is not None and hint != _MIXED else None
+            for hint in self._column_hints
+        )
+
+
+def _build_row_table(
     iter_node: cst.BaseExpression,
     statements: Sequence[cst.BaseStatement],
     loop_index: int,
     arity: int,
-) -> tuple[tuple[tuple[cst.BaseExpression, ...], ...], tuple[_RemovalCandidate, ...]]:
+) -> tuple[_RowTable, tuple[_RemovalCandidate, ...]]:
     values, removal_candidates = _resolve_rows_from_iterable(iter_node, statements, loop_index)
 
-    rows: list[tuple[cst.BaseExpression, ...]] = []
-    for value in values:
-        row = _normalize_iter_value(value, arity)
-        if row is None:
-            raise ParametrizeConversionError
-        rows.append(row)
-
     constants = _collect_constant_assignment_values(statements, loop_index)
-    _reject_rows_referencing_local_state(rows, statements, loop_index, constants)
+    local_names = _collect_local_assignment_names(statements, loop_index)
+    blocked_names = frozenset(local_names | {"self", "cls"}) if local_names else frozenset()
 
-    normalized_rows = _inline_constant_rows(rows, constants)
+    table = _RowTable(arity, constants, blocked_names)
+    for value in values:
+        table.add(value)
 
-    return normalized_rows, tuple(removal_candidates)
+    return table, tuple(removal_candidates)
 
 
 def _resolve_rows_from_iterable(
@@ -486,32 +590,163 @@ def _make_parametrize_call(
     Returns:
         A libcst.Decorator node wrapping the parametrize Call.
     """
-    param_arg_value = ",".join(param_names)
-    params_arg = cst.Arg(value=cst.SimpleString(value=f'"{param_arg_value}"'))
+    data = cst.List(elements=tuple(_row_elements(rows)))
+    return _make_parametrize_decorator(param_names, data, len(rows), include_ids)
 
-    list_elements: list[cst.Element] = []
+
+def _row_elements(rows: Sequence[tuple[cst.BaseExpression, ...]]) -> list[cst.Element]:
+    elements: list[cst.Element] = []
     for row in rows:
         if len(row) == 1:
-            list_elements.append(cst.Element(value=row[0].deep_clone()))
+            elements.append(cst.Element(value=row[0].deep_clone()))
         else:
             tuple_expr = cst.Tuple(elements=[cst.Element(value=item.deep_clone()) for item in row])
-            list_elements.append(cst.Element(value=tuple_expr))
+            elements.append(cst.Element(value=tuple_expr))
+    return elements
+
 
-    data_arg = cst.Arg(value=cst.List(elements=tuple(list_elements)))
+def _make_parametrize_decorator(
+    param_names: tuple[str, ...],
+    data: cst.BaseExpression,
+    row_count: int,
+    include_ids: bool,
+    compact_ids: bool = False,
+) -> cst.Decorator:
+    """Construct a ``pytest.mark.parametrize`` decorator around ``data``.
+
+    Args:
+        param_names: tuple of parameter names as strings.
+        data: The row table expression (a list literal or a constant name).
+        row_count: Number of rows in ``data``.
+        include_ids: whether to append an ``ids`` kwarg with row ids.
+        compact_ids: Emit ids as a comprehension instead of one literal
+            per row; used for tables hoisted to module level.
+
+    Returns:
+        A libcst.Decorator node wrapping the parametrize Call.
+    """
+    param_arg_value = ",".join(param_names)
+    params_arg = cst.Arg(value=cst.SimpleString(value=f'"{param_arg_value}"'))
 
-    args: list[cst.Arg] = [params_arg, data_arg]
+    args: list[cst.Arg] = [params_arg, cst.Arg(value=data)]
 
     if include_ids:
-        id_elements = [cst.Element(value=cst.SimpleString(value=f'"row_{i}"')) for i in range(len(rows))]
-        ids_arg = cst.Arg(keyword=cst.Name(value="ids"), value=cst.List(elements=tuple(id_elements)))
-        args.append(ids_arg)
+        ids_value: cst.BaseExpression
+        if compact_ids:
+            ids_value = cst.parse_expression(f'[f"row_{{i}}" for i in range({row_count})]')
+        else:
+            ids_value = cst.List(
+                elements=tuple(cst.Element(value=cst.SimpleString(value=f'"row_{i}"')) for i in range(row_count))
+            )
+        args.append(nodes.keyword_arg("ids", ids_value))
+
+    return cst.Decorator(decorator=nodes.call("pytest.mark.parametrize", tuple(args)))
+
+
+def module_bound_names(module: cst.Module) -> set[str]:
+    """Return the names bound at module level.
+
+    Covers assignment, ``for``, ``with ... as`` and walrus targets, imports,
+    ``except ... as`` names, and function and class definitions, including
+    those nested in module-level ``if``/``try``/loop blocks. Function and
+    class bodies are not entered.
+    """
+    collector = _ModuleBindingCollector()
+    module.visit(collector)
+    return collector.names
+
+
+class _ModuleBindingCollector(cst.CSTVisitor):
+    """Collect module-level bindings for :func:`module_bound_names`."""
+
+    def __init__(self) -> None:
+        self.names: set[str] = set()
+
+    def _bind(self, target: cst.CSTNode) -> None:
+        if isinstance(target, cst.Name):
+            self.names.add(target.value)
+        elif isinstance(target, cst.Tuple | cst.List):
+            for element in target.elements:
+                self._bind(element.value)
+        elif isinstance(target, cst.StarredElement):
+            self._bind(target.value)
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802 - libcst naming
+        self.names.add(node.name.value)
+        return False
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> bool:  # noqa: N802 - libcst naming
+        self.names.add(node.name.value)
+        return False
+
+    def visit_Lambda(self, node: cst.Lambda) -> bool:  # noqa: N802 - libcst naming
+        return False
+
+    def visit_AssignTarget(self, node: cst.AssignTarget) -> None:  # noqa: N802 - libcst naming
+        self._bind(node.target)
+
+    def visit_AnnAssign(self, node: cst.AnnAssign) -> None:  # noqa: N802 - libcst naming
+        self._bind(node.target)
+
+    def visit_AugAssign(self, node: cst.AugAssign) -> None:  # noqa: N802 - libcst naming
+        self._bind(node.target)
+
+    def visit_NamedExpr(self, node: cst.NamedExpr) -> None:  # noqa: N802 - libcst naming
+        self._bind(node.target)
+
+    def visit_For(self, node: cst.For) -> None:  # noqa: N802 - libcst naming
+        self._bind(node.target)
+
+    def visit_AsName(self, node: cst.AsName) -> None:  # noqa: N802 - libcst naming
+        self._bind(node.name)
+
+    def visit_ImportAlias(self, node: cst.ImportAlias) -> None:  # noqa: N802 - libcst naming
+        if node.asname is None:
+            # ``import a.b`` binds ``a``
+            name = node.name
+            while isinstance(name, cst.Attribute):
+                name = name.value
+            self._bind(name)
+
+
+def _unique_table_name(
+    function_name: str, module_tables: Sequence[cst.SimpleStatementLine], reserved_names: Container[str] = ()
+) -> str:
+    taken: set[str] = set()
+    for stmt in module_tables:
+        for small_stmt in stmt.body:
+            if isinstance(small_stmt, cst.Assign):
+                for target in small_stmt.targets:
+                    if isinstance(target.target, cst.Name):
+                        taken.add(target.target.value)
+
+    base = f"_{function_name.upper()}_PARAMS"
+    name = base
+    suffix = 2
+    while name in taken or name in reserved_names:
+        name = f"{base}_{suffix}"
+        suffix += 1
+    return name
+
+
+def _build_table_assignment(name: str, elements: Sequence[cst.Element]) -> cst.SimpleStatementLine:
+    """Return ``name = [...]`` with one row per line."""
+
+    def _newline(indent: str) -> cst.ParenthesizedWhitespace:
+        return cst.ParenthesizedWhitespace(
+            first_line=cst.TrailingWhitespace(), indent=True, last_line=cst.SimpleWhitespace(value=indent)
+        )
 
-    func = cst.Attribute(
-        value=cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="mark")),
-        attr=cst.Name(value="parametrize"),
+    rows = [element.with_changes(comma=cst.Comma(whitespace_after=_newline("    "))) for element in elements]
+    if rows:
+        rows[-1] = rows[-1].with_changes(comma=cst.Comma(whitespace_after=_newline("")))
+    table = cst.List(
+        elements=rows,
+        lbracket=cst.LeftSquareBracket(whitespace_after=_newline("    ")),
+    )
+    return cst.SimpleStatementLine(
+        body=[cst.Assign(targets=[cst.AssignTarget(target=cst.Name(value=name))], value=table)]
     )
-    call = cst.Call(func=func, args=tuple(args))
-    return cst.Decorator(decorator=call)
 
 
 # The detailed implementation of name-resolution was moved into
@@ -519,21 +754,21 @@ def _make_parametrize_call(
 # delegates to that implementation so the local API remains stable.
 
 
-def _normalize_iter_value(value: cst.BaseExpression, arity: int) -> tuple[cst.BaseExpression, ...] | None:
+def _split_row(value: cst.BaseExpression, arity: int) -> tuple[cst.BaseExpression, ...]:
     if arity == 1:
-        return (value.deep_clone(),)
+        return (value,)
 
     if isinstance(value, cst.Tuple | cst.List):
-        extracted: list[cst.BaseExpression] = []
+        cells: list[cst.BaseExpression] = []
         for element in value.elements:
             if not isinstance(element, cst.Element):
-                return None
-            extracted.append(element.value.deep_clone())
-        if len(extracted) != arity:
-            return None
-        return tuple(extracted)
+                raise ParametrizeConversionError
+            cells.append(element.value)
+        if len(cells) != arity:
+            raise ParametrizeConversionError
+        return tuple(cells)
 
-    return None
+    raise ParametrizeConversionError
 
 
 def _build_enumerate_rows(
@@ -612,40 +847,6 @@ def _build_mapping_rows(
     return tuple(rows), removal_candidates
 
 
-def _infer_param_annotations(
-    rows: Sequence[tuple[cst.BaseExpression, ...]],
-) -> tuple[cst.Annotation | None, ...]:
-    if not rows:
-        return ()
-
-    columns = list(zip(*rows, strict=False))
-    annotations: list[cst.Annotation | None] = []
-
-    for column in columns:
-        type_hint = _infer_column_type(column)
-        if type_hint is None:
-            annotations.append(None)
-            continue
-        annotations.append(cst.Annotation(annotation=cst.parse_expression(type_hint)))
-
-    return tuple(annotations)
-
-
-def _infer_column_type(values: Sequence[cst.BaseExpression]) -> str | None:
-    inferred: set[str] = set()
-
-    for value in values:
-        hint = _infer_expression_type(value)
-        if hint is not None:
-            inferred.add(hint)
-
-    if not inferred:
-        return None
-    if len(inferred) == 1:
-        return next(iter(inferred))
-    return None
-
-
 def _infer_expression_type(expr: cst.BaseExpression) -> str | None:
     if isinstance(expr, cst.Integer):
         return "int"
@@ -733,6 +934,14 @@ def _append_rows_to_decorator(
     decorator: cst.Decorator,
     rows: Sequence[tuple[cst.BaseExpression, ...]],
     include_ids: bool,
+) -> cst.Decorator:
+    return _append_elements_to_decorator(decorator, _row_elements(rows), include_ids)
+
+
+def _append_elements_to_decorator(
+    decorator: cst.Decorator,
+    new_elements: Sequence[cst.Element],
+    include_ids: bool,
 ) -> cst.Decorator:
     call = decorator.decorator
     if not isinstance(call, cst.Call):
@@ -747,13 +956,7 @@ def _append_rows_to_decorator(
     if not isinstance(data_value, cst.List):
         raise ParametrizeConversionError
 
-    elements = list(data_value.elements)
-    for row in rows:
-        if len(row) == 1:
-            elements.append(cst.Element(value=row[0].deep_clone()))
-        else:
-            tuple_expr = cst.Tuple([cst.Element(value=item.deep_clone()) for item in row])
-            elements.append(cst.Element(value=tuple_expr))
+    elements = [*data_value.elements, *new_elements]
 
     updated_data = data_value.with_changes(elements=elements)
     args[1] = data_arg.with_changes(value=updated_data)
@@ -776,7 +979,7 @@ def _append_rows_to_decorator(
 
         id_elements = list(ids_value.elements)
         start = len(id_elements)
-        for offset in range(len(rows)):
+        for offset in range(len(new_elements)):
             id_elements.append(cst.Element(value=cst.SimpleString(value=f'"row_{start + offset}"')))
 
         updated_ids = ids_value.with_changes(elements=id_elements)
@@ -786,96 +989,50 @@ def _append_rows_to_decorator(
     return decorator.with_changes(decorator=updated_call)
 
 
-def _reject_rows_referencing_local_state(
-    rows: Sequence[tuple[cst.BaseExpression, ...]],
-    statements: Sequence[cst.BaseStatement],
-    loop_index: int,
-    constants: Mapping[str, cst.BaseExpression],
-) -> None:
-    if not rows:
-        return
-
-    local_names = _collect_local_assignment_names(statements, loop_index)
-    if not local_names:
-        return
-
-    blocked_names = local_names | {"self", "cls"}
-
-    for row in rows:
-        for expression in row:
-            referenced = _collect_expression_names(expression)
-            if not referenced:
-                continue
-            blocked_refs = referenced.intersection(blocked_names)
-            if not blocked_refs:
-                continue
-
-            remaining = {name for name in blocked_refs if name not in constants}
-            if remaining:
-                raise ParametrizeConversionError
-
-
 def _collect_local_assignment_names(
     statements: Sequence[cst.BaseStatement],
     loop_index: int,
+    index: FunctionFeatureIndex | None = None,
 ) -> set[str]:
-    names: set[str] = set()
-
-    for index in range(loop_index):
-        stmt = statements[index]
-        if not isinstance(stmt, cst.SimpleStatementLine):
-            continue
-        for small_stmt in stmt.body:
-            if isinstance(small_stmt, cst.Assign):
-                for assign_target in small_stmt.targets:
-                    target = assign_target.target
-                    if isinstance(target, cst.Name):
-                        names.add(target.value)
-            elif isinstance(small_stmt, cst.AnnAssign):
-                target = small_stmt.target
-                if isinstance(target, cst.Name):
-                    names.add(target.value)
-
-    return names
+    if index is None:
+        # Only top-level assignments are needed; skip walking the subtrees
+        index = FunctionFeatureIndex.build(statements[:loop_index], skip=range(loop_index))
+    return index.names_assigned_before(loop_index)
 
 
 # _collect_constant_assignment_values is implemented near the top of this file
 
 
-def _inline_constant_rows(
-    rows: Sequence[tuple[cst.BaseExpression, ...]],
-    constants: Mapping[str, cst.BaseExpression],
-) -> tuple[tuple[cst.BaseExpression, ...], ...]:
-    """Inline compile-time constants referenced by parametrized rows.
-
-    Developer Note:
-        Parametrization decorators are evaluated during module import, before
-        the test function executes and establishes its local scope. When a row
-        references a loop-local constant (for example, ``size = 3`` declared
-        immediately before the loop), the decorator would otherwise raise a
-        ``NameError`` because that name is undefined at decoration time. By
-        substituting the literal value recorded in ``constants`` we keep the
-        generated code import-safe while preserving the author’s intent. If a
-        value cannot be resolved to a compile-time constant we refuse the
-        conversion instead of emitting a broken parametrization.
-    """
-    if not constants:
-        return tuple(tuple(expression for expression in row) for row in rows)
-
-    return tuple(tuple(_inline_constant_expression(expression, constants) for expression in row) for row in rows)
-
-
 def _filter_removal_candidates(
     candidates: Sequence[_RemovalCandidate],
     statements: Sequence[cst.BaseStatement],
     subtest_loop: _SubtestLoop,
+    index: FunctionFeatureIndex | None = None,
 ) -> tuple[int, ...]:
-    removable_indexes: set[int] = set()
+    named = [candidate for candidate in candidates if candidate.name is not None]
+    if not named:
+        return ()
+
+    candidate_indexes = {candidate.index for candidate in named}
+    if index is None:
+        # The candidate assignments hold the (possibly huge) row literals and
+        # the loop is checked through its subTest body, so neither is walked.
+        index = FunctionFeatureIndex.build(statements, skip=candidate_indexes | {subtest_loop.index})
+    loop_body_index = FunctionFeatureIndex.build(subtest_loop.body.body)
 
-    for candidate in candidates:
-        if candidate.name is None:
+    removable_indexes: set[int] = set()
+    for candidate in named:
+        name = cast(str, candidate.name)
+        if _is_name_used_outside_loop(
+            name,
+            statements,
+            subtest_loop,
+            candidate.index,
+            index=index,
+            loop_body_index=loop_body_index,
+        ):
             continue
-        if _is_name_used_outside_loop(candidate.name, statements, subtest_loop, candidate.index):
+        if any(_node_contains_name(statements[other], name) for other in candidate_indexes if other != candidate.index):
             continue
         removable_indexes.add(candidate.index)
 
@@ -887,42 +1044,26 @@ def _is_name_used_outside_loop(
     statements: Sequence[cst.BaseStatement],
     subtest_loop: _SubtestLoop,
     assignment_index: int,
+    index: FunctionFeatureIndex | None = None,
+    loop_body_index: FunctionFeatureIndex | None = None,
 ) -> bool:
-    for index, statement in enumerate(statements):
-        if index == assignment_index:
-            continue
-        if index == subtest_loop.index:
-            if _block_contains_name(subtest_loop.body, name):
-                return True
-            continue
-        if _node_contains_name(statement, name):
-            return True
-
-    return False
+    if index is None:
+        index = FunctionFeatureIndex.build(statements, skip=(assignment_index, subtest_loop.index))
+    # Outside the loop statement every reference counts; inside it only the
+    # subTest body does (the loop target and iterable are being lifted).
+    if index.name_used_outside(name, (assignment_index, subtest_loop.index)):
+        return True
+    if loop_body_index is None:
+        return _block_contains_name(subtest_loop.body, name)
+    return loop_body_index.uses_name(name)
 
 
 def _block_contains_name(block: cst.IndentedBlock, name: str) -> bool:
-    for inner in block.body:
-        if _node_contains_name(inner, name):
-            return True
-    return False
+    return FunctionFeatureIndex.build(block.body).uses_name(name)
 
 
 def _node_contains_name(node: cst.CSTNode, name: str) -> bool:
-    class _Visitor(cst.CSTVisitor):
-        def __init__(self, target: str) -> None:
-            self.target = target
-            self.found = False
-
-        def visit_Name(self, visit_node: cst.Name) -> bool:  # noqa: N802 - libcst naming
-            if visit_node.value == self.target:
-                self.found = True
-                return False
-            return True
-
-    visitor = _Visitor(name)
-    node.visit(visitor)
-    return visitor.found
+    return FunctionFeatureIndex.build((node,)).uses_name(name)
 
 
 def _is_parametrize_decorator(decorator: cst.Decorator) -> bool:
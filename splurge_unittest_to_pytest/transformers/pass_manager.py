@@ -0,0 +1,187 @@
+"""Pass manager that runs compatible CST passes in a single traversal.
+
+Post-processing used to run each small transformer or visitor with its own
+``module.visit`` call, so every new cleanup added another walk over the
+whole tree. A :class:`CSTPass` declares the node types it handles in
+``interests``. :class:`PassManager` groups consecutive passes and runs
+each group as one traversal, calling every pass's ``visit_<Type>`` and
+``leave_<Type>`` hooks in pass order. It also records how long each pass
+spent in its hooks.
+
+Fusing is only correct for passes whose hooks look at the node being left
+and state collected on the way down. A pass that must see the complete
+output of an earlier pass (for example one that inspects siblings or
+whole-module results) sets ``barrier = True`` and starts a new traversal.
+Attribute hooks (``visit_<Type>_<attribute>``) are not dispatched in a
+fused traversal.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, ClassVar
+
+import libcst as cst
+
+
+class CSTPass(cst.CSTTransformer):
+    """A transformer that can be fused with other passes by :class:`PassManager`.
+
+    Subclasses implement ordinary libcst ``visit_<Type>``/``leave_<Type>``
+    hooks and list the node type names they handle in ``interests``; they
+    can still be run on their own with ``module.visit(pass_)``, so leave
+    hooks always return the (possibly updated) node, read-only passes
+    included.
+
+    Attributes:
+        interests: Node type names (``"ClassDef"``, ``"Call"``) whose hooks
+            the pass implements.
+        barrier: Run this pass in a new traversal, after all earlier passes
+            have finished.
+    """
+
+    interests: ClassVar[frozenset[str]] = frozenset()
+    barrier: ClassVar[bool] = False
+
+    @property
+    def pass_name(self) -> str:
+        """Name used in timing reports (the class name by default)."""
+        return type(self).__name__
+
+
+_Hook = tuple[int, Callable[..., Any]]
+
+
+class _FusedTraversal(cst.CSTTransformer):
+    """Single traversal dispatching to the hooks of several passes."""
+
+    def __init__(self, passes: Sequence[CSTPass], timings: list[float] | None) -> None:
+        super().__init__()
+        self._visit_hooks: dict[str, list[_Hook]] = {}
+        self._leave_hooks: dict[str, list[_Hook]] = {}
+        for position, pass_ in enumerate(passes):
+            for type_name in pass_.interests:
+                visit = getattr(pass_, f"visit_{type_name}", None)
+                if visit is not None:
+                    self._visit_hooks.setdefault(type_name, []).append((position, visit))
+                leave = getattr(pass_, f"leave_{type_name}", None)
+                if leave is not None:
+                    self._leave_hooks.setdefault(type_name, []).append((position, leave))
+        # Node below which each pass asked not to be called (its visit hook returned False)
+        self._suppressed: list[cst.CSTNode | None] = [None] * len(passes)
+        self._suppressed_count = 0
+        self._timings = timings
+
+    def on_visit(self, node: cst.CSTNode) -> bool:
+        hooks = self._visit_hooks.get(type(node).__name__)
+        if hooks:
+            suppressed = self._suppressed
+            timings = self._timings
+            for position, hook in hooks:
+                if suppressed[position] is not None:
+                    continue
+                start = time.perf_counter() if timings is not None else 0.0
+                if hook(node) is False:
+                    suppressed[position] = node
+                    self._suppressed_count += 1
+                if timings is not None:
+                    timings[position] += time.perf_counter() - start
+        return True
+
+    def on_leave(self, original_node: cst.CSTNode, updated_node: cst.CSTNode) -> Any:
+        hooks = self._leave_hooks.get(type(original_node).__name__)
+        suppressed = self._suppressed
+        if hooks:
+            timings = self._timings
+            for position, hook in hooks:
+                blocker = suppressed[position]
+                if blocker is not None and blocker is not original_node:
+                    continue
+                start = time.perf_counter() if timings is not None else 0.0
+                result = hook(original_node, updated_node)
+                if timings is not None:
+                    timings[position] += time.perf_counter() - start
+                if result is None:
+                    continue
+                if not isinstance(result, cst.CSTNode):
+                    # RemovalSentinel / FlattenSentinel: later passes cannot see the node
+                    self._release(original_node)
+                    return result
+                updated_node = result
+        self._release(original_node)
+        return updated_node
+
+    def _release(self, node: cst.CSTNode) -> None:
+        if not self._suppressed_count:
+            return
+        suppressed = self._suppressed
+        for position, blocker in enumerate(suppressed):
+            if blocker is node:
+                suppressed[position] = None
+                self._suppressed_count -= 1
+
+    def on_visit_attribute(self, node: cst.CSTNode, attribute: str) -> None:
+        return None
+
+    def on_leave_attribute(self, original_node: cst.CSTNode, attribute: str) -> None:
+        return None
+
+
+class PassManager:
+    """Run a sequence of :class:`CSTPass` objects with as few traversals as possible.
+
+    Consecutive passes are fused into one traversal; a pass with
+    ``barrier = True`` starts a new one. Per-pass hook time is accumulated
+    in :attr:`timings` across :meth:`run` calls.
+    """
+
+    def __init__(self, passes: Iterable[CSTPass], collect_timings: bool = True) -> None:
+        self.passes: list[CSTPass] = list(passes)
+        self.collect_timings = collect_timings
+        self.timings: dict[str, float] = {pass_.pass_name: 0.0 for pass_ in self.passes}
+        self.traversals = 0
+
+    def groups(self) -> list[list[CSTPass]]:
+        """Return the passes grouped by the traversal that runs them."""
+        groups: list[list[CSTPass]] = []
+        for pass_ in self.passes:
+            if not groups or pass_.barrier:
+                groups.append([])
+            groups[-1].append(pass_)
+        return groups
+
+    def add_pass(self, pass_: CSTPass) -> None:
+        """Append ``pass_``; it joins the last traversal unless it is a barrier."""
+        self.passes.append(pass_)
+        self.timings.setdefault(pass_.pass_name, 0.0)
+
+    def run(self, module: cst.Module) -> cst.Module:
+        """Run every pass over ``module`` and return the transformed module."""
+        for group in self.groups():
+            timings = [0.0] * len(group) if self.collect_timings else None
+            try:
+                if len(group) == 1 and timings is None:
+                    module = module.visit(group[0])
+                else:
+                    module = module.visit(_FusedTraversal(group, timings))
+            finally:
+                self.traversals += 1
+                if timings is not None:
+                    for pass_, seconds in zip(group, timings, strict=True):
+                        self.timings[pass_.pass_name] += seconds
+        return module
+
+    def report(self) -> list[dict[str, Any]]:
+        """Return one row per pass with its traversal group and cumulative seconds."""
+        return [
+            {"name": pass_.pass_name, "group": index, "seconds": self.timings.get(pass_.pass_name, 0.0)}
+            for index, group in enumerate(self.groups())
+            for pass_ in group
+        ]
+
+
+__all__ = ["CSTPass", "PassManager"]
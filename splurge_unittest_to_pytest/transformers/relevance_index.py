@@ -0,0 +1,127 @@
+"""Per-module index of the statements the main CST transformer must visit.
+
+:class:`~splurge_unittest_to_pytest.transformers.unittest_transformer.UnittestToPytestCstTransformer`
+only acts on a few kinds of nodes: ``self``/``cls`` method calls
+(assertions, ``subTest``), ``pytest.raises`` calls, ``caplog`` and
+``subtests`` fixture usage, imports, classes and functions (lifecycle
+methods, decorators, fixtures). Every other subtree, such as helper logic
+or large data literals, used to be visited and rebuilt for nothing.
+:func:`build_relevant_statement_index` walks the module once, without the
+visitor machinery, and returns the identities of every statement whose
+subtree contains one of those features; the transformer skips the
+children of all other statements.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+
+import libcst as cst
+
+# Identifiers whose presence makes a statement relevant to the transformer
+RELEVANT_NAMES = frozenset({"self", "cls", "pytest", "unittest", "caplog", "subtests"})
+
+# Nodes whose statements are always visited: the transformer tracks state on
+# them (class and function context, lifecycle bodies, ``re`` import aliases)
+_ALWAYS_RELEVANT = (cst.ClassDef, cst.FunctionDef, cst.Import, cst.ImportFrom)
+
+# Fields that only hold whitespace, punctuation or operators
+_IGNORED_FIELDS = frozenset(
+    {
+        "asynchronous",
+        "colon",
+        "comma",
+        "dot",
+        "equal",
+        "footer",
+        "header",
+        "lbrace",
+        "lbracket",
+        "leading_lines",
+        "lines_after_decorators",
+        "lpar",
+        "operator",
+        "rbrace",
+        "rbracket",
+        "rpar",
+        "semicolon",
+        "trailing_whitespace",
+    }
+)
+
+_CHILD_FIELDS: dict[type, tuple[str, ...]] = {}
+
+
+def _child_fields(node_type: type) -> tuple[str, ...]:
+    fields = _CHILD_FIELDS.get(node_type)
+    if fields is None:
+        fields = tuple(
+            f.name
+            for f in dataclasses.fields(node_type)
+            if f.name not in _IGNORED_FIELDS and not f.name.startswith("whitespace")
+        )
+        _CHILD_FIELDS[node_type] = fields
+    return fields
+
+
+def build_relevant_statement_index(module: cst.Module) -> frozenset[int]:
+    """Return the ids of statements in ``module`` that need a full visit.
+
+    A statement is relevant when it is a class, function or import, or when
+    its subtree contains a :class:`libcst.Name` in :data:`RELEVANT_NAMES`.
+    The enclosing statements of a relevant statement are relevant as well.
+    The walk is iterative, so deeply nested code cannot exhaust the
+    recursion limit.
+
+    Args:
+        module: The module about to be transformed. The ids are only valid
+            while it is alive and unmodified.
+
+    Returns:
+        ``id()`` values of the relevant :class:`libcst.BaseStatement` nodes.
+    """
+    relevant: set[int] = set()
+    # Statements enclosing the node being walked; ``None`` marks where a
+    # statement's subtree ends
+    open_statements: list[cst.CSTNode] = []
+    stack: list[cst.CSTNode | None] = [module]
+
+    def mark(statement: cst.CSTNode | None) -> None:
+        # Ancestors of a marked statement are already marked, so stop early
+        if statement is not None and id(statement) not in relevant:
+            relevant.add(id(statement))
+        for outer in reversed(open_statements):
+            if id(outer) in relevant:
+                break
+            relevant.add(id(outer))
+
+    while stack:
+        node = stack.pop()
+        if node is None:
+            open_statements.pop()
+            continue
+        if isinstance(node, cst.Name):
+            if node.value in RELEVANT_NAMES:
+                mark(None)
+            continue
+        if isinstance(node, cst.BaseStatement):
+            if isinstance(node, _ALWAYS_RELEVANT):
+                mark(node)
+            open_statements.append(node)
+            stack.append(None)
+        elif isinstance(node, _ALWAYS_RELEVANT):
+            # Imports are small statements; their enclosing line is relevant
+            mark(None)
+        for field_name in _child_fields(type(node)):
+            value = getattr(node, field_name)
+            if isinstance(value, cst.CSTNode):
+                stack.append(value)
+            elif isinstance(value, (tuple, list)):
+                stack.extend(child for child in value if isinstance(child, cst.CSTNode))
+    return frozenset(relevant)
+
+
+__all__ = ["RELEVANT_NAMES", "build_relevant_statement_index"]
@@ -14,6 +14,11 @@ from __future__ import annotations
 
 import libcst as cst
 
+from . import node_factory as nodes
+
+# ``@pytest.mark.xfail()`` carries no arguments, so one node serves every site
+_XFAIL_DECORATOR = cst.Decorator(decorator=nodes.call("pytest.mark.xfail"))
+
 
 def rewrite_skip_decorators(decorators: list[cst.Decorator] | None) -> list[cst.Decorator] | None:
     """Convert unittest skip and expected failure decorators into pytest mark decorators.
@@ -50,26 +55,18 @@ def rewrite_skip_decorators(decorators: list[cst.Decorator] | None) -> list[cst.
                 if isinstance(owner, cst.Name) and owner.value == "unittest" and isinstance(name, cst.Name):
                     if name.value == "skip":
                         # Build @pytest.mark.skip(<args...>)
-                        mark_attr = cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="mark"))
-                        new_call = cst.Call(
-                            func=cst.Attribute(value=mark_attr, attr=cst.Name(value="skip")), args=dec.args
-                        )
+                        new_call = nodes.call("pytest.mark.skip", dec.args)
                         new_decorators.append(cst.Decorator(decorator=new_call))
                         changed = True
                         continue
                     elif name.value == "skipIf":
-                        mark_attr = cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="mark"))
-                        new_call = cst.Call(
-                            func=cst.Attribute(value=mark_attr, attr=cst.Name(value="skipif")), args=dec.args
-                        )
+                        new_call = nodes.call("pytest.mark.skipif", dec.args)
                         new_decorators.append(cst.Decorator(decorator=new_call))
                         changed = True
                         continue
                     elif name.value == "expectedFailure":
                         # Build @pytest.mark.xfail (no args needed for basic expectedFailure)
-                        mark_attr = cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="mark"))
-                        new_call = cst.Call(func=cst.Attribute(value=mark_attr, attr=cst.Name(value="xfail")))
-                        new_decorators.append(cst.Decorator(decorator=new_call))
+                        new_decorators.append(_XFAIL_DECORATOR)
                         changed = True
                         continue
             elif isinstance(dec, cst.Attribute):
@@ -79,9 +76,7 @@ def rewrite_skip_decorators(decorators: list[cst.Decorator] | None) -> list[cst.
                 if isinstance(owner, cst.Name) and owner.value == "unittest" and isinstance(name, cst.Name):
                     if name.value == "expectedFailure":
                         # Build @pytest.mark.xfail (no args needed for basic expectedFailure)
-                        mark_attr = cst.Attribute(value=cst.Name(value="pytest"), attr=cst.Name(value="mark"))
-                        new_call = cst.Call(func=cst.Attribute(value=mark_attr, attr=cst.Name(value="xfail")))
-                        new_decorators.append(cst.Decorator(decorator=new_call))
+                        new_decorators.append(_XFAIL_DECORATOR)
                         changed = True
                         continue
             # Otherwise keep as-is
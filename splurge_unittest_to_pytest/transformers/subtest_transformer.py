@@ -25,6 +25,7 @@ from collections.abc import Sequence
 
 import libcst as cst
 
+from .function_index import FunctionFeatureIndex
 from .parametrize_helper import ParametrizeOptions, convert_subtest_loop_to_parametrize
 
 
@@ -61,8 +62,15 @@ def convert_simple_subtests_to_parametrize(
         options = ParametrizeOptions(
             parametrize_include_ids=getattr(transformer, "parametrize_include_ids", True),
             parametrize_add_annotations=getattr(transformer, "parametrize_add_annotations", True),
+            parametrize_table_threshold=getattr(transformer, "parametrize_table_threshold", 0),
+        )
+        converted = convert_subtest_loop_to_parametrize(
+            current,
+            current,
+            options,
+            module_tables=getattr(transformer, "parametrize_tables", None),
+            reserved_names=getattr(transformer, "module_bound_names", ()),
         )
-        converted = convert_subtest_loop_to_parametrize(current, current, options)
         if converted is None:
             break
         changed = True
@@ -213,75 +221,21 @@ def convert_subtests_in_body(statements: Sequence[cst.CSTNode]) -> list[cst.Base
     return out
 
 
-def body_uses_subtests(statements: Sequence[cst.CSTNode]) -> bool:
+def body_uses_subtests(statements: Sequence[cst.CSTNode], index: FunctionFeatureIndex | None = None) -> bool:
     """Return True when a statement body uses the `subtests.test` helper.
 
     Args:
         statements: Sequence of libcst statement nodes to inspect.
+        index: Optional prebuilt feature index for ``statements``; built
+            on demand when omitted.
 
     Returns:
         ``True`` if any ``with`` item calls ``subtests.test(...);``
         otherwise ``False``.
     """
-
-    def _walk(stmts: Sequence[cst.CSTNode]) -> bool:
-        for s in stmts:
-            # Direct With nodes
-            if isinstance(s, cst.With):
-                for item in s.items:
-                    if isinstance(item.item, cst.Call) and isinstance(item.item.func, cst.Attribute):
-                        func = item.item.func
-                        if isinstance(func.value, cst.Name) and func.value.value == "subtests":
-                            if func.attr.value == "test":
-                                return True
-                # check nested body
-                body = getattr(s.body, "body", [])
-                if _walk(body):
-                    return True
-
-            # If statements: check body and orelse
-            if isinstance(s, cst.If):
-                if _walk(getattr(s.body, "body", [])):
-                    return True
-                # orelse can be an IndentedBlock, SimpleStatementSuite, or another If (elif)
-                orelse = getattr(s, "orelse", None)
-                if orelse:
-                    # orelse may be a list of nodes in SimpleStatementSuite or an IndentedBlock
-                    if isinstance(orelse, cst.BaseSuite):
-                        if _walk(getattr(orelse, "body", [])):
-                            return True
-
-            # For/While loops: check body and orelse
-            if isinstance(s, cst.For | cst.While):
-                if _walk(getattr(s.body, "body", [])):
-                    return True
-                orelse = getattr(s, "orelse", None)
-                if orelse and isinstance(orelse, cst.BaseSuite):
-                    if _walk(getattr(orelse, "body", [])):
-                        return True
-
-            # Try: check body, handlers, orelse, finalbody
-            if isinstance(s, cst.Try):
-                if _walk(getattr(s.body, "body", [])):
-                    return True
-                for h in getattr(s, "handlers", []) or []:
-                    if _walk(getattr(h.body, "body", [])):
-                        return True
-                if _walk(getattr(s.orelse, "body", []) if getattr(s, "orelse", None) else []):
-                    return True
-                if _walk(getattr(s.finalbody, "body", []) if getattr(s, "finalbody", None) else []):
-                    return True
-
-            # SimpleStatementLine may contain nested statements (rare) - inspect inner statements
-            if isinstance(s, cst.SimpleStatementLine):
-                for inner in getattr(s, "body", []) or []:
-                    # some inner nodes might be With/If/etc.
-                    if _walk([inner]):
-                        return True
-
-        return False
-
-    return _walk(statements)
+    if index is None:
+        index = FunctionFeatureIndex.build(statements)
+    return index.uses_with_call("subtests", "test")
 
 
 def ensure_subtests_param(func: cst.FunctionDef) -> cst.FunctionDef:
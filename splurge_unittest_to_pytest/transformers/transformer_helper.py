@@ -4,14 +4,22 @@ This module provides two small utilities used by multi-pass libcst
 transformations:
 
 - :class:`ReplacementRegistry` records planned node replacements keyed
-    by source position metadata so nodes can be matched across passes.
+    by source position metadata so nodes can be matched across passes,
+    or by node identity so they can be applied later in the same pass.
 - :class:`ReplacementApplier` is a :class:`libcst.CSTTransformer` that
     applies the recorded replacements during a second-pass traversal. It
     depends on :class:`libcst.metadata.PositionProvider` metadata.
-
-These helpers are useful when a transformation pass needs to record
-that a later pass should replace a specific expression or statement,
-and object identity cannot be relied upon between passes.
+- :func:`build_statement_replacement` turns a recorded statement-level
+    replacement into the statement that should take the place of an
+    existing ``SimpleStatementLine``.
+
+:class:`~.unittest_transformer.UnittestToPytestCstTransformer` only
+uses identity-keyed replacements: it records the updated ``Call`` it is
+about to return and substitutes the replacement when the enclosing
+statement line is left, so no second traversal, tree copy or position
+computation is needed. Position-keyed recording and
+:class:`ReplacementApplier` are standalone utilities for callers that run
+their own second pass.
 
 Copyright (c) 2025 Jim Schilling
 This software is released under the MIT License.
@@ -48,6 +56,9 @@ class ReplacementRegistry:
     def __init__(self) -> None:
         # map from position tuple to replacement node
         self.replacements: dict[tuple[int, int, int, int], cst.CSTNode] = {}
+        # map from id(node) to (node, replacement); the node is kept alive so
+        # its id cannot be reused while the entry is pending
+        self.node_replacements: dict[int, tuple[cst.CSTNode, cst.CSTNode]] = {}
 
     @staticmethod
     def key_from_position(pos) -> tuple[int, int, int, int]:
@@ -68,6 +79,31 @@ class ReplacementRegistry:
         key = self.key_from_position(pos)
         self.replacements[key] = new_node
 
+    def record_node(self, node: cst.CSTNode, new_node: cst.CSTNode) -> None:
+        """Record a replacement for a specific node object.
+
+        Args:
+            node: The node instance that will appear in the updated tree.
+            new_node: The replacement node.
+        """
+        self.node_replacements[id(node)] = (node, new_node)
+
+    def pop_node(self, node: cst.CSTNode) -> cst.CSTNode | None:
+        """Remove and return the replacement recorded for ``node``.
+
+        Args:
+            node: The node instance to look up.
+
+        Returns:
+            The recorded replacement, or ``None`` when none was recorded
+            for this exact object.
+        """
+        entry = self.node_replacements.get(id(node))
+        if entry is None or entry[0] is not node:
+            return None
+        del self.node_replacements[id(node)]
+        return entry[1]
+
     def get(self, pos) -> cst.CSTNode | None:
         """Return a recorded replacement node for the given position.
 
@@ -127,17 +163,6 @@ class ReplacementApplier(cst.CSTTransformer):
                     pos = self.get_metadata(PositionProvider, expr)
                     repl = self.registry.get(pos)
                     if repl is not None and isinstance(repl, cst.BaseStatement):
-                        # Ensure the replacement is a SimpleStatementLine when
-                        # inserted into an IndentedBlock body. Some transforms
-                        # return small-statement nodes (for example cst.Assert)
-                        # which must be wrapped in a SimpleStatementLine to
-                        # preserve correct indentation/formatting when rendered.
-                        try:
-                            # Copy leading_lines metadata from the original
-                            leading = getattr(original_node, "leading_lines", ())
-                        except Exception:
-                            leading = ()
-
                         try:
                             pos = self.get_metadata(PositionProvider, expr)
                             key = self.registry.key_from_position(pos)
@@ -149,61 +174,47 @@ class ReplacementApplier(cst.CSTTransformer):
                             type(repl).__name__,
                         )
 
-                        # If the replacement is already a SimpleStatementLine,
-                        # preserve it and copy metadata when possible.
-                        if isinstance(repl, cst.SimpleStatementLine):
-                            try:
-                                # Always return the recorded SimpleStatementLine.
-                                # If there are leading_lines on the original node,
-                                # copy them onto the replacement when possible so
-                                # formatting is preserved. If not, return the
-                                # replacement as-is.
-                                if hasattr(repl, "with_changes") and leading:
-                                    self._logger.debug(
-                                        "ReplacementApplier: preserving leading_lines on existing SimpleStatementLine at %s",
-                                        key,
-                                    )
-                                    return repl.with_changes(leading_lines=leading)
-                                self._logger.debug(
-                                    "ReplacementApplier: returning existing SimpleStatementLine at %s",
-                                    key,
-                                )
-                                return repl
-                            except Exception:
-                                return repl
-
-                        # Otherwise wrap the replacement into a SimpleStatementLine
-                        try:
-                            # Only wrap when the replacement is a BaseSmallStatement
-                            # (for example an Assert or Pass). Wrapping compound
-                            # statements (Try/With/If) into a SimpleStatementLine
-                            # is invalid. If the replacement is not a
-                            # BaseSmallStatement, return it directly.
-                            if isinstance(repl, cst.BaseSmallStatement):
-                                wrapped = cst.SimpleStatementLine(body=[repl])
-                                if leading and hasattr(wrapped, "with_changes"):
-                                    wrapped = wrapped.with_changes(leading_lines=leading)
-                                self._logger.debug(
-                                    "ReplacementApplier: wrapped %s into SimpleStatementLine at %s",
-                                    type(repl).__name__,
-                                    key,
-                                )
-                                return wrapped
-                            # Not a small-statement: return the replacement as-is
-                            self._logger.debug(
-                                "ReplacementApplier: replacement %s is not a small-statement, returning as-is",
-                                type(repl).__name__,
-                            )
-                            return repl
-                        except Exception:
-                            # If wrapping fails, return the raw replacement
-                            self._logger.exception("ReplacementApplier: failed to wrap replacement at %s", key)
-                            return repl
+                        # Small statements (for example cst.Assert) must be
+                        # wrapped in a SimpleStatementLine to render with the
+                        # correct indentation inside an IndentedBlock.
+                        return build_statement_replacement(original_node, repl)
         except (AttributeError, TypeError, IndexError):
             pass
         return updated_node
 
 
+def build_statement_replacement(line: cst.SimpleStatementLine, repl: cst.BaseStatement) -> cst.BaseStatement:
+    """Return the statement that should replace ``line``.
+
+    Small statements (for example :class:`libcst.Assert`) are wrapped in a
+    ``SimpleStatementLine``; ``leading_lines`` from ``line`` are carried
+    over so comments and blank lines are preserved. Compound statements are
+    returned unchanged because they cannot be wrapped.
+
+    Args:
+        line: The statement line being replaced.
+        repl: The recorded replacement statement.
+
+    Returns:
+        The statement to insert in place of ``line``.
+    """
+    leading = getattr(line, "leading_lines", ())
+
+    if isinstance(repl, cst.SimpleStatementLine):
+        if leading:
+            return repl.with_changes(leading_lines=leading)
+        return repl
+
+    if isinstance(repl, cst.BaseSmallStatement):
+        wrapped = cst.SimpleStatementLine(body=[repl])
+        if leading:
+            wrapped = wrapped.with_changes(leading_lines=leading)
+        return wrapped
+
+    # Not a small-statement: return the replacement as-is
+    return repl
+
+
 # Backwards-compatible export: many modules historically imported
 # `_wrap_small_stmt_if_needed` from transformer_helper; provide the
 # shared implementation under the legacy name for convenience.
@@ -240,4 +251,9 @@ def wrap_small_stmt_if_needed(node: cst.CSTNode) -> cst.BaseStatement:
 # Historically callers imported `_wrap_small_stmt_if_needed` from this
 # module; exposing it explicitly here keeps the module's public surface
 # stable during the migration/refactor.
-__all__ = ["ReplacementRegistry", "ReplacementApplier", "wrap_small_stmt_if_needed"]
+__all__ = [
+    "ReplacementRegistry",
+    "ReplacementApplier",
+    "build_statement_replacement",
+    "wrap_small_stmt_if_needed",
+]
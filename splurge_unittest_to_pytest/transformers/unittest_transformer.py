@@ -10,7 +10,7 @@ other submodules to keep this file concise and focused on orchestration.
 
 The transformer performs the following high-level steps:
 - Parse source into a libcst Module and run CST-based passes.
-- Record and apply targeted replacements using position metadata.
+- Substitute statement-level assertion rewrites as each line is left.
 - Convert lifecycle methods (setUp/tearDown) into pytest fixtures.
 - Rewrite unittest assertions and skip decorators to pytest idioms.
 - Tidy up unittest.TestCase inheritance and test method names.
@@ -25,7 +25,7 @@ This software is released under the MIT License.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -33,49 +33,29 @@ import libcst as cst
 from libcst.metadata import MetadataWrapper, PositionProvider
 
 from ..exceptions import TransformationValidationError
+from .assert_dispatch import get_assertion_registry
 from .assert_transformer import (
     _recursively_rewrite_withs,
-    transform_assert_almost_equal,
-    transform_assert_count_equal,
-    transform_assert_dict_equal,
-    transform_assert_equal,
-    transform_assert_false,
-    transform_assert_greater,
-    transform_assert_greater_equal,
-    transform_assert_in,
-    transform_assert_is,
-    transform_assert_is_none,
-    transform_assert_is_not,
-    transform_assert_is_not_none,
-    transform_assert_isinstance,
-    transform_assert_less,
-    transform_assert_less_equal,
-    transform_assert_list_equal,
-    transform_assert_multiline_equal,
-    transform_assert_not_almost_equal,
-    transform_assert_not_equal,
-    transform_assert_not_in,
-    transform_assert_not_isinstance,
-    transform_assert_not_regex,
-    transform_assert_raises,
-    transform_assert_raises_regex,
-    transform_assert_regex,
-    transform_assert_set_equal,
-    transform_assert_true,
-    transform_assert_tuple_equal,
-    transform_assert_warns,
-    transform_assert_warns_regex,
     transform_caplog_alias_string_fallback,
-    transform_fail,
-    transform_skip_test,
     wrap_assert_in_block,
 )
 from .fixture_transformer import (
+    FixtureStatement,
     create_class_fixture,
     create_instance_fixture,
     create_module_fixture,
 )
-from .import_transformer import add_pytest_imports, remove_unittest_imports_if_unused
+from .function_cache import FunctionCacheEntry, FunctionTransformCache
+from .function_index import FunctionFeatureIndex
+from .import_transformer import (
+    DynamicImportFinder,
+    UnittestUsageFinder,
+    add_pytest_imports,
+    remove_unittest_imports_if_unused,
+)
+from .parametrize_helper import module_bound_names
+from .pass_manager import CSTPass, PassManager
+from .relevance_index import build_relevant_statement_index
 from .skip_transformer import rewrite_skip_decorators
 from .subtest_transformer import (
     body_uses_subtests,
@@ -83,7 +63,7 @@ from .subtest_transformer import (
     convert_subtests_in_body,
     ensure_subtests_param,
 )
-from .transformer_helper import ReplacementApplier, ReplacementRegistry
+from .transformer_helper import ReplacementRegistry, build_statement_replacement
 
 # mypy: ignore-errors
 
@@ -101,23 +81,136 @@ class RegexImportTracker:
     re_search_name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
+class ClassFixtureRecord:
+    """Lifecycle statements collected for a single class.
+
+    Buffers are append-only while the class is traversed and are released
+    together with the record when the enclosing module has been rebuilt.
+    """
+
+    name: str
+    setup: list[FixtureStatement] = field(default_factory=list)
+    teardown: list[FixtureStatement] = field(default_factory=list)
+    setup_class: list[FixtureStatement] = field(default_factory=list)
+    teardown_class: list[FixtureStatement] = field(default_factory=list)
+
+
+class _PerClassBufferView(Mapping[str, tuple[FixtureStatement, ...]]):
+    """Read-only mapping of class name to one buffer of its fixture record.
+
+    Only classes listed in ``names`` (those that received statements for
+    this buffer) are exposed, matching the legacy ``per_class_*``
+    dictionaries that gained a key on first append. Values are tuple
+    snapshots, so the records cannot be mutated through the view.
+    """
+
+    __slots__ = ("_records", "_names", "_attr")
+
+    def __init__(self, records: dict[str, ClassFixtureRecord], names: dict[str, None], attr: str) -> None:
+        self._records = records
+        self._names = names
+        self._attr = attr
+
+    def __getitem__(self, name: str) -> tuple[FixtureStatement, ...]:
+        if name not in self._names:
+            raise KeyError(name)
+        return tuple(getattr(self._records[name], self._attr))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+@dataclass(slots=True)
 class FixtureCollectionState:
-    """Track collected fixture snippets for module, class, and instance scopes."""
-
-    class_setup: list[str] = field(default_factory=list)
-    class_teardown: list[str] = field(default_factory=list)
-    instance_setup: list[str] = field(default_factory=list)
-    instance_teardown: list[str] = field(default_factory=list)
-    module_setup: list[str] = field(default_factory=list)
-    module_teardown: list[str] = field(default_factory=list)
-    per_class_setup: dict[str, list[str]] = field(default_factory=dict)
-    per_class_teardown: dict[str, list[str]] = field(default_factory=dict)
-    per_class_setup_class: dict[str, list[str]] = field(default_factory=dict)
-    per_class_teardown_class: dict[str, list[str]] = field(default_factory=dict)
+    """Track collected fixture statements for module, class, and instance scopes.
+
+    Entries are the original libcst statement nodes from lifecycle method
+    bodies; source strings are also accepted for callers that build
+    fixtures from text.
+
+    Scope lifetimes:
+        - Module-scope buffers (``class_setup`` ... ``module_teardown``)
+          collect lifecycle functions defined outside classes and are
+          released by :meth:`clear_autouse_buffers` once the module
+          fixtures have been emitted.
+        - Per-class statements live in one :class:`ClassFixtureRecord` per
+          class name (see :meth:`record_for`) and are released together by
+          :meth:`clear_per_class_buffers` at the end of the module.
+
+    The ``per_class_*`` attributes are read-only views over the class
+    records kept for compatibility with older callers. They list the
+    classes whose buffers were filled through :meth:`extend_class_buffer`.
+    """
+
+    class_setup: list[FixtureStatement] = field(default_factory=list)
+    class_teardown: list[FixtureStatement] = field(default_factory=list)
+    instance_setup: list[FixtureStatement] = field(default_factory=list)
+    instance_teardown: list[FixtureStatement] = field(default_factory=list)
+    module_setup: list[FixtureStatement] = field(default_factory=list)
+    module_teardown: list[FixtureStatement] = field(default_factory=list)
+    classes: dict[str, ClassFixtureRecord] = field(default_factory=dict)
+    # Buffer name -> classes with statements in that buffer, in insertion order
+    _class_names: dict[str, dict[str, None]] = field(default_factory=dict, init=False, repr=False)
+
+    def record_for(self, class_name: str) -> ClassFixtureRecord:
+        """Return the fixture record for ``class_name``, creating it on first use."""
+
+        record = self.classes.get(class_name)
+        if record is None:
+            record = self.classes[class_name] = ClassFixtureRecord(class_name)
+        return record
+
+    def extend_class_buffer(self, class_name: str, buffer: str, statements: Sequence[FixtureStatement]) -> None:
+        """Append ``statements`` to one buffer of the record for ``class_name``.
+
+        Args:
+            class_name: Name of the class whose record receives the statements.
+            buffer: ``"setup"``, ``"teardown"``, ``"setup_class"`` or
+                ``"teardown_class"``.
+            statements: Statements to append; nothing is recorded when empty.
+        """
+
+        if not statements:
+            return
+        getattr(self.record_for(class_name), buffer).extend(statements)
+        self._class_names.setdefault(buffer, {})[class_name] = None
+
+    def _per_class_view(self, buffer: str) -> Mapping[str, tuple[FixtureStatement, ...]]:
+        return _PerClassBufferView(self.classes, self._class_names.setdefault(buffer, {}), buffer)
+
+    @property
+    def per_class_setup(self) -> Mapping[str, tuple[FixtureStatement, ...]]:
+        """Read-only view of per-class ``setUp`` statements."""
+
+        return self._per_class_view("setup")
+
+    @property
+    def per_class_teardown(self) -> Mapping[str, tuple[FixtureStatement, ...]]:
+        """Read-only view of per-class ``tearDown`` statements."""
+
+        return self._per_class_view("teardown")
+
+    @property
+    def per_class_setup_class(self) -> Mapping[str, tuple[FixtureStatement, ...]]:
+        """Read-only view of per-class ``setUpClass`` statements."""
+
+        return self._per_class_view("setup_class")
+
+    @property
+    def per_class_teardown_class(self) -> Mapping[str, tuple[FixtureStatement, ...]]:
+        """Read-only view of per-class ``tearDownClass`` statements."""
+
+        return self._per_class_view("teardown_class")
 
     def clear_autouse_buffers(self) -> None:
-        """Clear collected snippet buffers for module, class, and instance fixtures."""
+        """Clear collected statement buffers for module, class, and instance fixtures."""
 
         self.class_setup.clear()
         self.class_teardown.clear()
@@ -127,17 +220,36 @@ class FixtureCollectionState:
         self.module_teardown.clear()
 
     def clear_per_class_buffers(self) -> None:
-        """Clear per-class collected setup and teardown snippets."""
+        """Release all per-class fixture records."""
+
+        self.classes.clear()
+        self._class_names.clear()
+
+
+@dataclass
+class _FunctionCacheFrame:
+    """Per-function bookkeeping while a cacheable ``FunctionDef`` is traversed."""
+
+    key: str
+    start_line: int
+    entry: FunctionCacheEntry | None = None
+    cacheable: bool = True
+    needs_pytest_import: bool = False
+    needs_re_import: bool = False
 
-        self.per_class_setup.clear()
-        self.per_class_teardown.clear()
-        self.per_class_setup_class.clear()
-        self.per_class_teardown_class.clear()
 
+# Lifecycle methods feed fixture buffers as a side effect of traversal and
+# are therefore never served from the function cache.
+_LIFECYCLE_METHOD_NAMES = frozenset(
+    {"setUp", "tearDown", "setUpClass", "tearDownClass", "setUpModule", "tearDownModule"}
+)
 
-class _RemoveUnittestTestCaseBases(cst.CSTTransformer):
+
+class _RemoveUnittestTestCaseBases(CSTPass):
     """Remove ``unittest.TestCase`` bases from class definitions."""
 
+    interests = frozenset({"ClassDef"})
+
     def leave_ClassDef(self, original: cst.ClassDef, updated: cst.ClassDef) -> cst.ClassDef:
         new_bases: list[cst.Arg] = []
         changed = False
@@ -164,9 +276,11 @@ class _RemoveUnittestTestCaseBases(cst.CSTTransformer):
         return updated
 
 
-class _NormalizeClassBases(cst.CSTTransformer):
+class _NormalizeClassBases(CSTPass):
     """Normalize class bases so libcst renders them without artifacts."""
 
+    interests = frozenset({"ClassDef"})
+
     def leave_ClassDef(self, original: cst.ClassDef, updated: cst.ClassDef) -> cst.ClassDef:
         try:
             if not updated.bases:
@@ -192,14 +306,17 @@ class _NormalizeClassBases(cst.CSTTransformer):
             return updated
 
 
-class _NormalizeTestMethodNames(cst.CSTTransformer):
+class _NormalizeTestMethodNames(CSTPass):
     """Normalize test method names for classes formerly inheriting from unittest."""
 
+    interests = frozenset({"ClassDef", "FunctionDef"})
+
     def __init__(
         self,
         unittest_classes: set[str] | None,
         test_prefixes: Sequence[str],
     ) -> None:
+        super().__init__()
         self._stack: list[str] = []
         self._unittest_classes = set(unittest_classes or set())
         prefixes = list(test_prefixes) or ["test"]
@@ -241,8 +358,9 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
     specialized transformations (assertion rewrites, lifecycle-to-fixture
     conversion, subTest handling, and import cleanup). It is intentionally
     conservative: most changes are implemented as targeted node
-    replacements recorded by source position and applied in a second
-    pass, which reduces accidental formatting churn.
+    replacements recorded against the node being returned and applied
+    when the enclosing statement line is left, which reduces accidental
+    formatting churn without a second traversal.
 
     Attributes:
         needs_pytest_import (bool): Set when transformations require pytest
@@ -252,7 +370,8 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         test_prefixes (list[str]): Accepted test method prefixes used when
             normalizing test method names.
         replacement_registry (ReplacementRegistry): Registry used to
-            record and later apply node replacements keyed by source span.
+            record statement-level replacements keyed by node identity until
+            the enclosing statement line is left.
 
     See Also:
         The concrete transformation implementations are provided in the
@@ -268,6 +387,8 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         parametrize_add_annotations: bool | None = None,
         decision_model: Any | None = None,
         config: Any | None = None,
+        function_cache: FunctionTransformCache | None = None,
+        parametrize_table_threshold: int | None = None,
     ) -> None:
         self._import_tracker = RegexImportTracker()
         self._fixture_state = FixtureCollectionState()
@@ -281,18 +402,50 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         self.parametrize_add_annotations = (
             parametrize_add_annotations if parametrize_add_annotations is not None else False
         )
+        # Parametrize tables with more rows than this are hoisted into a
+        # module-level constant (0 disables hoisting)
+        self.parametrize_table_threshold = (
+            parametrize_table_threshold
+            if parametrize_table_threshold is not None
+            else int(getattr(config, "parametrize_table_threshold", 0) or 0)
+        )
+        # Module-level table assignments produced while converting subTest
+        # loops; inserted ahead of the module fixtures in leave_Module
+        self.parametrize_tables: list[cst.SimpleStatementLine] = []
+        # Names the module binds at top level; hoisted tables avoid them
+        self.module_bound_names: set[str] = set()
         # Decision model for enhanced transformation decisions
         self.decision_model = decision_model
         # Migration configuration for transformation settings
         self.config = config
-        # Replacement registry for two-pass metadata-based replacements
+        # Replacement registry for statement-level replacements
         self.replacement_registry = ReplacementRegistry()
+        # Cumulative seconds spent in each post-processing CST pass
+        self.pass_timings: dict[str, float] = {}
+        # (dynamically imported names, unittest used) from the last inheritance cleanup
+        self._import_facts: tuple[frozenset[str], bool] | None = None
+        # Process-wide assertion method -> rewrite table used by leave_Call
+        self._assertion_registry = get_assertion_registry()
+        # ids of the statements whose subtrees must be visited (see
+        # relevance_index); None disables subtree skipping
+        self._relevant_statements: frozenset[int] | None = None
+        # Wrapper over the module being visited; positions are resolved lazily
+        # through it only when a caller actually needs them
+        self._metadata_wrapper: MetadataWrapper | None = None
         # Debugging flag to enable verbose internal tracing
         self.debug_trace = True
         # Stack to track current function context during traversal
         self._function_stack: list[str] = []
         # Set of function names that need the pytest 'request' fixture injected
         self._functions_need_request: set[str] = set()
+        # Optional cache of transformed functions; unchanged methods are spliced
+        # in from the cache instead of being re-transformed
+        self.function_cache = function_cache
+        # Module being visited (used to render original function source)
+        self._module: cst.Module | None = None
+        self._source_lines: list[str] = []
+        # One entry per FunctionDef on the traversal stack (None when not cacheable)
+        self._cache_frames: list[_FunctionCacheFrame | None] = []
         # Legacy state flags maintained for compatibility with existing helpers/tests
         self.in_setup = False
         self.in_teardown = False
@@ -312,105 +465,89 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         return self._fixture_state
 
     @property
-    def setup_code(self) -> list[str]:
-        """Return collected instance-level setup snippets."""
+    def setup_code(self) -> list[FixtureStatement]:
+        """Return collected instance-level setup statements."""
 
         return self.fixture_state.instance_setup
 
     @setup_code.setter
-    def setup_code(self, value: Sequence[str]) -> None:
-        self.fixture_state.instance_setup = list(value)
+    def setup_code(self, value: Sequence[FixtureStatement]) -> None:
+        self.fixture_state.instance_setup[:] = value
 
     @property
-    def teardown_code(self) -> list[str]:
-        """Return collected instance-level teardown snippets."""
+    def teardown_code(self) -> list[FixtureStatement]:
+        """Return collected instance-level teardown statements."""
 
         return self.fixture_state.instance_teardown
 
     @teardown_code.setter
-    def teardown_code(self, value: Sequence[str]) -> None:
-        self.fixture_state.instance_teardown = list(value)
+    def teardown_code(self, value: Sequence[FixtureStatement]) -> None:
+        self.fixture_state.instance_teardown[:] = value
 
     @property
-    def setup_class_code(self) -> list[str]:
-        """Return collected class-level setup snippets."""
+    def setup_class_code(self) -> list[FixtureStatement]:
+        """Return collected class-level setup statements."""
 
         return self.fixture_state.class_setup
 
     @setup_class_code.setter
-    def setup_class_code(self, value: Sequence[str]) -> None:
-        self.fixture_state.class_setup = list(value)
+    def setup_class_code(self, value: Sequence[FixtureStatement]) -> None:
+        self.fixture_state.class_setup[:] = value
 
     @property
-    def teardown_class_code(self) -> list[str]:
-        """Return collected class-level teardown snippets."""
+    def teardown_class_code(self) -> list[FixtureStatement]:
+        """Return collected class-level teardown statements."""
 
         return self.fixture_state.class_teardown
 
     @teardown_class_code.setter
-    def teardown_class_code(self, value: Sequence[str]) -> None:
-        self.fixture_state.class_teardown = list(value)
+    def teardown_class_code(self, value: Sequence[FixtureStatement]) -> None:
+        self.fixture_state.class_teardown[:] = value
 
     @property
-    def setup_module_code(self) -> list[str]:
-        """Return collected module-level setup snippets."""
+    def setup_module_code(self) -> list[FixtureStatement]:
+        """Return collected module-level setup statements."""
 
         return self.fixture_state.module_setup
 
     @setup_module_code.setter
-    def setup_module_code(self, value: Sequence[str]) -> None:
-        self.fixture_state.module_setup = list(value)
+    def setup_module_code(self, value: Sequence[FixtureStatement]) -> None:
+        self.fixture_state.module_setup[:] = value
 
     @property
-    def teardown_module_code(self) -> list[str]:
-        """Return collected module-level teardown snippets."""
+    def teardown_module_code(self) -> list[FixtureStatement]:
+        """Return collected module-level teardown statements."""
 
         return self.fixture_state.module_teardown
 
     @teardown_module_code.setter
-    def teardown_module_code(self, value: Sequence[str]) -> None:
-        self.fixture_state.module_teardown = list(value)
+    def teardown_module_code(self, value: Sequence[FixtureStatement]) -> None:
+        self.fixture_state.module_teardown[:] = value
 
     @property
-    def _per_class_setup(self) -> dict[str, list[str]]:
+    def _per_class_setup(self) -> Mapping[str, tuple[FixtureStatement, ...]]:
         """Expose per-class instance setup collections for legacy callers."""
 
         return self.fixture_state.per_class_setup
 
-    @_per_class_setup.setter
-    def _per_class_setup(self, value: dict[str, list[str]]) -> None:
-        self.fixture_state.per_class_setup = {k: list(v) for k, v in value.items()}
-
     @property
-    def _per_class_teardown(self) -> dict[str, list[str]]:
+    def _per_class_teardown(self) -> Mapping[str, tuple[FixtureStatement, ...]]:
         """Expose per-class instance teardown collections for legacy callers."""
 
         return self.fixture_state.per_class_teardown
 
-    @_per_class_teardown.setter
-    def _per_class_teardown(self, value: dict[str, list[str]]) -> None:
-        self.fixture_state.per_class_teardown = {k: list(v) for k, v in value.items()}
-
     @property
-    def _per_class_setup_class(self) -> dict[str, list[str]]:
+    def _per_class_setup_class(self) -> Mapping[str, tuple[FixtureStatement, ...]]:
         """Expose per-class classmethod setup collections for legacy callers."""
 
         return self.fixture_state.per_class_setup_class
 
-    @_per_class_setup_class.setter
-    def _per_class_setup_class(self, value: dict[str, list[str]]) -> None:
-        self.fixture_state.per_class_setup_class = {k: list(v) for k, v in value.items()}
-
     @property
-    def _per_class_teardown_class(self) -> dict[str, list[str]]:
+    def _per_class_teardown_class(self) -> Mapping[str, tuple[FixtureStatement, ...]]:
         """Expose per-class classmethod teardown collections for legacy callers."""
 
         return self.fixture_state.per_class_teardown_class
 
-    @_per_class_teardown_class.setter
-    def _per_class_teardown_class(self, value: dict[str, list[str]]) -> None:
-        self.fixture_state.per_class_teardown_class = {k: list(v) for k, v in value.items()}
-
     @property
     def needs_pytest_import(self) -> bool:
         return self._import_tracker.needs_pytest_import
@@ -418,6 +555,10 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
     @needs_pytest_import.setter
     def needs_pytest_import(self, value: bool) -> None:
         self._import_tracker.needs_pytest_import = value
+        if value:
+            for frame in self._cache_frames:
+                if frame is not None:
+                    frame.needs_pytest_import = True
 
     @property
     def needs_re_import(self) -> bool:
@@ -426,6 +567,10 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
     @needs_re_import.setter
     def needs_re_import(self, value: bool) -> None:
         self._import_tracker.needs_re_import = value
+        if value:
+            for frame in self._cache_frames:
+                if frame is not None:
+                    frame.needs_re_import = True
 
     @property
     def re_alias(self) -> str | None:
@@ -443,8 +588,9 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
     def re_search_name(self, value: str | None) -> None:
         self._import_tracker.re_search_name = value
 
-    # Require PositionProvider metadata so we can record precise source spans
-    METADATA_DEPENDENCIES = (PositionProvider,)
+    # Positions are resolved lazily via _get_position rather than eagerly
+    # for every traversal, so no metadata dependencies are declared.
+    METADATA_DEPENDENCIES = ()
 
     def _compute_module_insert_index(self, body: Sequence[cst.CSTNode]) -> int:
         """Return insertion index after imports and module docstring."""
@@ -516,7 +662,7 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         return False
 
     def _collect_module_fixtures(self) -> list[cst.FunctionDef]:
-        """Build module-level fixtures from collected setup/teardown snippets."""
+        """Build module-level fixtures from collected setup/teardown statements."""
 
         module_fixtures: list[cst.FunctionDef] = []
         state = self.fixture_state
@@ -589,20 +735,19 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
             cls_name = node.name.value
 
             try:
-                state = self.fixture_state
-                if cls_name in state.per_class_setup_class or cls_name in state.per_class_teardown_class:
-                    setup_cls = list(dict.fromkeys(state.per_class_setup_class.get(cls_name, [])))
-                    teardown_cls = list(dict.fromkeys(state.per_class_teardown_class.get(cls_name, [])))
-                    if setup_cls or teardown_cls:
-                        class_fixture = create_class_fixture(setup_cls, teardown_cls)
+                record = self.fixture_state.classes.get(cls_name)
+                if record is not None:
+                    if record.setup_class or record.teardown_class:
+                        class_fixture = create_class_fixture(
+                            list(dict.fromkeys(record.setup_class)), list(dict.fromkeys(record.teardown_class))
+                        )
                         class_body_items.append(class_fixture)
                         self.needs_pytest_import = True
 
-                if cls_name in state.per_class_setup or cls_name in state.per_class_teardown:
-                    setup_inst = list(dict.fromkeys(state.per_class_setup.get(cls_name, [])))
-                    teardown_inst = list(dict.fromkeys(state.per_class_teardown.get(cls_name, [])))
-                    if setup_inst or teardown_inst:
-                        instance_fixture = create_instance_fixture(setup_inst, teardown_inst)
+                    if record.setup or record.teardown:
+                        instance_fixture = create_instance_fixture(
+                            list(dict.fromkeys(record.setup)), list(dict.fromkeys(record.teardown))
+                        )
                         class_body_items.append(instance_fixture)
                         self.needs_pytest_import = True
             except (AttributeError, TypeError, ValueError):
@@ -641,8 +786,7 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
                 continue
 
             try:
-                max_depth = getattr(self.config, "max_depth", 7) if self.config else 7
-                wrapped_nodes = wrap_assert_in_block([node], max_depth)
+                wrapped_nodes = wrap_assert_in_block([node])
                 rewritten.extend(wrapped_nodes)
             except (AttributeError, TypeError, ValueError):
                 # Assert wrapping failed, keep original
@@ -670,6 +814,7 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
     ) -> tuple[cst.FunctionDef, list[cst.CSTNode]]:
         """Handle parametrize conversion and subTest rewrites for a function body."""
 
+        tables_before = len(self.parametrize_tables)
         try:
             current_node = node
             function_name = original_node.name.value
@@ -700,6 +845,11 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         except (AttributeError, TypeError, ValueError):
             # Subtest conversion failed, return original
             return node, list(getattr(node.body, "body", []))
+        finally:
+            # A hoisted table lives outside the function; replaying the cached
+            # function alone would leave its decorator referencing nothing.
+            if len(self.parametrize_tables) != tables_before:
+                self._mark_cache_frames_uncacheable()
 
     def _get_function_decision(self, function_name: str) -> Any | None:
         """Get transformation decision for a specific function."""
@@ -766,6 +916,7 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         function_name: str,
         node: cst.FunctionDef,
         body_statements: Sequence[cst.CSTNode],
+        features: FunctionFeatureIndex | None = None,
     ) -> cst.FunctionDef:
         """Ensure request fixture parameter is present when required and inspect caplog usage."""
 
@@ -778,7 +929,7 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
                     result_node = result_node.with_changes(params=result_node.params.with_changes(params=params))
 
             # Detection for caplog usage is retained for parity with previous behavior.
-            if self._uses_caplog_at_level(body_statements):
+            if self._uses_caplog_at_level(body_statements, features):
                 params = list(result_node.params.params)
                 if not any(isinstance(param.name, cst.Name) and param.name.value == "caplog" for param in params):
                     params.append(cst.Param(name=cst.Name(value="caplog")))
@@ -788,47 +939,14 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
 
         return result_node
 
-    def _uses_caplog_at_level(self, statements: Sequence[cst.CSTNode]) -> bool:
+    def _uses_caplog_at_level(
+        self, statements: Sequence[cst.CSTNode], index: FunctionFeatureIndex | None = None
+    ) -> bool:
         """Detect `caplog.at_level` usage within the provided statements."""
         try:
-
-            def walk(node: cst.CSTNode) -> bool:
-                # Check current node for a caplog.at_level with-call
-                if isinstance(node, cst.With):
-                    for item in node.items:
-                        ctx = getattr(item, "item", None)
-                        if isinstance(ctx, cst.Call) and isinstance(ctx.func, cst.Attribute):
-                            attr = ctx.func
-                            if (
-                                isinstance(attr.value, cst.Name)
-                                and attr.value.value == "caplog"
-                                and isinstance(attr.attr, cst.Name)
-                                and attr.attr.value == "at_level"
-                            ):
-                                return True
-                    # Recurse into the with-body
-                    for stmt in getattr(node.body, "body", []):
-                        if walk(stmt):
-                            return True
-
-                # Recurse into common container attributes (body, orelse, finalbody, handlers)
-                for child_name in ("body", "orelse", "finalbody", "handlers"):
-                    child = getattr(node, child_name, None)
-                    if isinstance(child, cst.IndentedBlock):
-                        for stmt in getattr(child, "body", []):
-                            if walk(stmt):
-                                return True
-                    elif isinstance(child, list):
-                        for stmt in child:
-                            if isinstance(stmt, cst.CSTNode) and walk(stmt):
-                                return True
-
-                return False
-
-            for stmt in statements:
-                if walk(stmt):
-                    return True
-            return False
+            if index is None:
+                index = FunctionFeatureIndex.build(statements)
+            return index.uses_with_call("caplog", "at_level")
         except (AttributeError, TypeError, ValueError):
             return False
 
@@ -852,22 +970,30 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         return cst.parse_module(code)
 
     def _visit_with_metadata(self, module: cst.Module) -> cst.Module:
-        """Execute the transformer with metadata support enabled."""
+        """Execute the transformer with lazily resolved position metadata.
 
-        wrapper = MetadataWrapper(module)
-        return wrapper.visit(self)
+        The module is freshly parsed by the caller, so the wrapper skips the
+        defensive deep copy; :class:`PositionProvider` is only computed if a
+        position is requested during traversal.
+        """
 
-    def _apply_recorded_replacements(self, module: cst.Module) -> cst.Module:
-        """Apply recorded replacements when present, otherwise return the module unchanged."""
+        self._metadata_wrapper = MetadataWrapper(module, unsafe_skip_copy=True)
+        try:
+            return module.visit(self)
+        finally:
+            self._metadata_wrapper = None
+            self.replacement_registry.node_replacements.clear()
 
-        if not self.replacement_registry.replacements:
-            return module
+    def _get_position(self, node: cst.CSTNode) -> Any:
+        """Return the source span of ``node`` in the module being visited.
 
-        try:
-            wrapper = MetadataWrapper(module)
-            return wrapper.visit(ReplacementApplier(self.replacement_registry))
-        except (AttributeError, TypeError, ValueError):
-            return module
+        Raises:
+            KeyError: If no position metadata is available for ``node``.
+        """
+        wrapper = self._metadata_wrapper
+        if wrapper is not None:
+            return wrapper.resolve(PositionProvider)[node]
+        return self.get_metadata(PositionProvider, node)
 
     def _apply_recursive_with_cleanup(self, module: cst.Module) -> cst.Module:
         """Apply recursive with-statement rewrites across the module body."""
@@ -908,9 +1034,14 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         # has been removed in favor of targeted helpers. This method now focuses
         # solely on the final string-level cleanup and validation.
 
+        self._import_facts = None
         transformed_code = self._transform_unittest_inheritance(code)
+        # Facts collected during the inheritance traversal; None when it did not run
+        facts = self._import_facts
+        dynamic_imports = facts[0] if facts is not None else None
+        unittest_used = facts[1] if facts is not None else None
 
-        transformed_code = add_pytest_imports(transformed_code, transformer=self)
+        transformed_code = add_pytest_imports(transformed_code, transformer=self, dynamic_imports=dynamic_imports)
 
         # Targeted post-pass for remaining caplog alias usages.
         try:
@@ -927,7 +1058,7 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         except (AttributeError, TypeError, ValueError):
             pass
 
-        transformed_code = remove_unittest_imports_if_unused(transformed_code)
+        transformed_code = remove_unittest_imports_if_unused(transformed_code, unittest_used=unittest_used)
 
         try:
             self._parse_to_module(transformed_code)
@@ -984,58 +1115,174 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         module: cst.Module,
         unittest_classes: set[str] | None,
     ) -> cst.Module:
-        """Run the staged inheritance cleanup pipeline on the provided module."""
-
-        transformers: tuple[cst.CSTTransformer, ...] = (
-            _RemoveUnittestTestCaseBases(),
-            _NormalizeClassBases(),
-            _NormalizeTestMethodNames(
-                unittest_classes=unittest_classes or set(),
-                test_prefixes=self.test_prefixes,
-            ),
-        )
+        """Run the inheritance cleanup passes on the provided module.
+
+        The passes only touch class and function definitions, so the
+        :class:`PassManager` fuses them into a single traversal. The same
+        traversal also collects the dynamic-import and ``unittest`` usage
+        facts that :func:`add_pytest_imports` and
+        :func:`remove_unittest_imports_if_unused` would otherwise each walk
+        the module for; the cleanup never changes either. Per-pass hook
+        time is added to :attr:`pass_timings`.
+        """
 
-        cleaned_module = module
-        for transformer in transformers:
-            try:
-                cleaned_module = cleaned_module.visit(transformer)
-            except (AttributeError, TypeError, ValueError):
-                return cleaned_module
+        dynamic_imports = DynamicImportFinder({"pytest", "re"})
+        unittest_usage = UnittestUsageFinder()
+        manager = PassManager(
+            [
+                _RemoveUnittestTestCaseBases(),
+                _NormalizeClassBases(),
+                _NormalizeTestMethodNames(
+                    unittest_classes=unittest_classes or set(),
+                    test_prefixes=self.test_prefixes,
+                ),
+                dynamic_imports,
+                unittest_usage,
+            ]
+        )
+        try:
+            cleaned_module = manager.run(module)
+        except (AttributeError, TypeError, ValueError):
+            return module
+        finally:
+            for name, seconds in manager.timings.items():
+                self.pass_timings[name] = self.pass_timings.get(name, 0.0) + seconds
 
+        self._import_facts = (frozenset(dynamic_imports.found), unittest_usage.found)
         return cleaned_module
 
-    def record_replacement(self, old_node: cst.CSTNode, new_node: cst.CSTNode) -> None:
-        """Record a planned replacement keyed by the original node's position.
+    def _mark_cache_frames_uncacheable(self) -> None:
+        """Prevent enclosing functions from being cached.
 
-        The transformer records replacements using the :class:`PositionProvider`
-        metadata so that multiple, independent passes can safely schedule
-        modifications without clobbering one another.
+        Used when traversal inside a function has side effects on transformer
+        state (class tracking, import aliases, fixture buffers) that replaying
+        a cached result would not reproduce.
+        """
+        for frame in self._cache_frames:
+            if frame is not None:
+                frame.cacheable = False
 
-        Args:
-            old_node: The original CST node to replace.
-            new_node: The replacement CST node.
+    def _function_cache_context(self, node: cst.FunctionDef, column: int) -> tuple[Any, ...]:
+        """Return the transformer state that influences how ``node`` is rewritten."""
+        name = node.name.value
+        decision = self._get_function_decision(name)
+        module = self._module
+        return (
+            column,
+            tuple(self.test_prefixes),
+            bool(self.parametrize),
+            bool(self.parametrize_include_ids),
+            bool(self.parametrize_add_annotations),
+            self.parametrize_table_threshold,
+            bool(self.decision_model),
+            getattr(decision, "recommended_strategy", None),
+            self.re_alias,
+            self.re_search_name,
+            name in self._functions_need_request,
+            getattr(self.config, "assert_almost_equal_places", 7) if self.config else 7,
+            self._assertion_registry.generation,
+            module.default_indent if module is not None else None,
+            module.default_newline if module is not None else None,
+            self._outer_line_indents(node),
+        )
+
+    @staticmethod
+    def _outer_line_indents(node: cst.FunctionDef) -> tuple[bool, ...]:
+        """Return indentation flags of blank/comment lines outside the ``def``..body span."""
+        lines = list(node.leading_lines)
+        for decorator in node.decorators:
+            lines.extend(decorator.leading_lines)
+        lines.extend(node.lines_after_decorators)
+        lines.extend(getattr(node.body, "footer", ()))
+        return tuple(line.indent for line in lines)
+
+    def _begin_function_cache(self, node: cst.FunctionDef) -> _FunctionCacheFrame | None:
+        """Look up ``node`` in the function cache and open a frame for it.
 
         Returns:
-            None. Failures to obtain position metadata are ignored to keep
-            the transformer conservative.
+            A frame carrying the cache key and, on a hit, the cached entry;
+            ``None`` when caching is disabled or position metadata is missing.
         """
+        cache = self.function_cache
+        module = self._module
+        # A cache hit skips rule dispatch, so per-rule statistics need every function transformed
+        if cache is None or module is None or self._assertion_registry.stats_enabled:
+            return None
+
         try:
-            pos = self.get_metadata(PositionProvider, old_node)
-            # Log the replacement key for debugging when TRANSFORM_DEBUG enabled
+            pos = self._get_position(node)
+            # code_for_node renders without the enclosing indentation, so the
+            # raw span of the definition is hashed as well to keep blank-line
+            # and comment indentation inside the body significant.
+            source = module.code_for_node(node) + "\0" + "".join(self._source_lines[pos.start.line - 1 : pos.end.line])
+        except (KeyError, AttributeError, TypeError, ValueError):
+            return None
+
+        key = cache.make_key(source, self._function_cache_context(node, pos.start.column))
+        frame = _FunctionCacheFrame(key=key, start_line=pos.start.line)
+        entry = cache.get(key)
+        if entry is not None:
             try:
-                import logging
+                entry.to_node(module.config_for_parsing)
+                frame.entry = entry
+            except (cst.ParserSyntaxError, TypeError, ValueError):
+                # Unusable entry; transform normally and overwrite it
+                frame.entry = None
+        return frame
+
+    def _replay_cached_function(self, frame: _FunctionCacheFrame) -> cst.FunctionDef:
+        """Re-apply a cached function's side effects and return its node."""
+        entry = frame.entry
+        if entry.needs_pytest_import:
+            self.needs_pytest_import = True
+        if entry.needs_re_import:
+            self.needs_re_import = True
+        return entry.to_node(self._module.config_for_parsing)
+
+    def _store_cached_function(self, frame: _FunctionCacheFrame, node: cst.FunctionDef) -> None:
+        """Store a freshly transformed function in the cache when it is safe to do so."""
+        if not frame.cacheable or self.function_cache is None or self._module is None:
+            return
 
-                logger = logging.getLogger(__name__)
-                key = self.replacement_registry.key_from_position(pos)
-                logger.debug("record_replacement: recording replacement at %s -> %s", key, type(new_node).__name__)
-            except Exception:
-                # ignore logging errors
-                pass
-            self.replacement_registry.record(pos, new_node)
-            # recorded replacement
+        try:
+            code = self._module.code_for_node(node)
         except (AttributeError, TypeError, ValueError):
-            # If metadata isn't available for some reason, skip recording
-            pass
+            return
+
+        self.function_cache.put(
+            frame.key,
+            FunctionCacheEntry(
+                code=code,
+                node=node,
+                needs_pytest_import=frame.needs_pytest_import,
+                needs_re_import=frame.needs_re_import,
+            ),
+        )
+
+    def on_visit(self, node: cst.CSTNode) -> bool:
+        """Skip the children of statements that contain nothing to rewrite.
+
+        Statements outside the per-module relevance index built in
+        :meth:`visit_Module` hold no ``self``/``cls`` calls, ``pytest`` or
+        ``unittest`` references, classes, functions or imports, so none of
+        the ``visit_*``/``leave_*`` hooks would change them.
+        """
+        relevant = self._relevant_statements
+        if relevant is not None and isinstance(node, cst.BaseStatement) and id(node) not in relevant:
+            return False
+        return super().on_visit(node)
+
+    def visit_Module(self, node: cst.Module) -> bool | None:
+        """Index the statements worth visiting, collect module names and remember the module for caching."""
+        try:
+            self._relevant_statements = build_relevant_statement_index(node)
+        except (AttributeError, TypeError, ValueError):
+            self._relevant_statements = None
+        self.module_bound_names = module_bound_names(node)
+        if self.function_cache is not None:
+            self._module = node
+            self._source_lines = node.code.splitlines(keepends=True)
+        return True
 
     def visit_ClassDef(self, node: cst.ClassDef) -> None:
         """Inspect a class definition and mark unittest.TestCase subclasses.
@@ -1052,6 +1299,7 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
             None. This method only updates transformer internal state.
         """
         self.current_class = node.name.value
+        self._mark_cache_frames_uncacheable()
 
         # Check for unittest.TestCase inheritance
         if not hasattr(self, "_unittest_classes"):
@@ -1092,6 +1340,7 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
             A possibly modified :class:`libcst.Module` with inserted
             fixtures and lifecycle methods removed.
         """
+        self._relevant_statements = None
         new_body = list(updated_node.body)
 
         # Determine insertion index after imports and module docstring
@@ -1116,7 +1365,7 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
                 cleaned_body.append(node)
 
         # Insert module-level fixtures (collected outside classes) after imports/docstring
-        module_fixtures = self._collect_module_fixtures()
+        module_fixtures: list[cst.CSTNode] = list(self._collect_module_fixtures())
 
         # Clear per-class collected code now that we've inserted fixtures
         self.fixture_state.clear_per_class_buffers()
@@ -1134,6 +1383,12 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
             for mf in module_fixtures:
                 final_body.append(mf)
 
+        # Hoisted parametrize tables go right before the class or function
+        # that uses them, below any module-level names their rows reference
+        fallback_index = min(insert_index, len(cleaned_body)) + len(module_fixtures)
+        final_body = self._place_parametrize_tables(final_body, fallback_index)
+        self.parametrize_tables = []
+
         # Note: we intentionally do not append a top-level pytest.main() call
         # for modules where the original `if __name__ == '__main__'` guard only
         # contained `unittest.main()`. Those guards are dropped to avoid
@@ -1147,6 +1402,32 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
 
         return updated_node.with_changes(body=final_body)
 
+    def _place_parametrize_tables(self, body: list[cst.CSTNode], fallback_index: int) -> list[cst.CSTNode]:
+        """Insert each hoisted table just before the first top-level statement using it.
+
+        A table whose user cannot be found is placed at ``fallback_index``
+        (after the imports and module fixtures).
+        """
+        if not self.parametrize_tables:
+            return body
+        # One pass over the module maps each name to the statements using it
+        name_uses = FunctionFeatureIndex.build(body).name_uses
+        tables_before: dict[int, list[cst.SimpleStatementLine]] = {}
+        for table in self.parametrize_tables:
+            assign = table.body[0]
+            target = assign.targets[0].target if isinstance(assign, cst.Assign) else None
+            uses = name_uses.get(target.value) if isinstance(target, cst.Name) else None
+            position = uses[0] if uses else fallback_index
+            tables_before.setdefault(position, []).append(table)
+
+        placed: list[cst.CSTNode] = []
+        for position, stmt in enumerate(body):
+            placed.extend(tables_before.pop(position, ()))
+            placed.append(stmt)
+        for position in sorted(tables_before):
+            placed.extend(tables_before[position])
+        return placed
+
     def leave_FunctionDef(self, original_node: cst.FunctionDef, updated_node: cst.FunctionDef) -> cst.FunctionDef:
         """Perform function-level rewrites and inject required fixtures.
 
@@ -1171,15 +1452,37 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
             decorators, and possibly augmented parameters.
         """
         func_name = original_node.name.value
+        frame = self._cache_frames[-1] if self._cache_frames else None
+        if frame is not None and frame.entry is not None:
+            self._cache_frames.pop()
+            if self._function_stack:
+                self._function_stack.pop()
+            return self._replay_cached_function(frame)
+
         node = updated_node
         body_statements: list[cst.CSTNode] = list(getattr(node.body, "body", []))
 
+        if not self._body_may_need_rewrites(original_node):
+            # Nothing in the body can be rewritten; only the decorators and
+            # the signature (request fixture) may change
+            try:
+                node = self._rewrite_function_decorators(node)
+            except (AttributeError, TypeError, ValueError):
+                pass
+            node = self._ensure_fixture_parameters(func_name, node, body_statements, FunctionFeatureIndex())
+            if self._function_stack:
+                self._function_stack.pop()
+            if self._cache_frames:
+                frame = self._cache_frames.pop()
+                if frame is not None:
+                    self._store_cached_function(frame, node)
+            return node
+
         try:
             node = self._rewrite_function_decorators(node)
             node, body_statements = self._convert_simple_subtests(original_node, node)
             try:
-                max_depth = getattr(self.config, "max_depth", 7) if self.config else 7
-                wrapped_body = wrap_assert_in_block(body_statements, max_depth)
+                wrapped_body = wrap_assert_in_block(body_statements)
             except (AttributeError, TypeError, ValueError):
                 wrapped_body = body_statements
             node = node.with_changes(body=node.body.with_changes(body=wrapped_body))
@@ -1187,11 +1490,18 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
             wrapped_body = list(getattr(node.body, "body", []))
             node = node.with_changes(body=node.body.with_changes(body=wrapped_body))
 
-        node = self._ensure_fixture_parameters(func_name, node, wrapped_body)
+        # One feature index serves both fixture checks below; the with-rewrite
+        # pass only produces pytest.raises/warns and caplog.at_level items, so
+        # it cannot introduce subtests.test usage.
+        try:
+            features: FunctionFeatureIndex | None = FunctionFeatureIndex.build(wrapped_body)
+        except (AttributeError, TypeError, ValueError):
+            features = None
+        node = self._ensure_fixture_parameters(func_name, node, wrapped_body, features)
         node = self._apply_recursive_with_rewrites(node)
 
         try:
-            if body_uses_subtests(getattr(node.body, "body", [])):
+            if body_uses_subtests(getattr(node.body, "body", []), features):
                 node = ensure_subtests_param(node)
         except (AttributeError, TypeError, ValueError):
             pass
@@ -1203,84 +1513,103 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
             except (AttributeError, TypeError, ValueError):
                 pass
 
+        if self._cache_frames:
+            frame = self._cache_frames.pop()
+            if frame is not None:
+                self._store_cached_function(frame, node)
+
         return node
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
-        """Visit function definitions to track setUp/tearDown methods."""
+    def _body_may_need_rewrites(self, node: cst.FunctionDef) -> bool:
+        """Return False when no statement of ``node``'s body is in the relevance index.
+
+        Such a body has no ``self``/``cls`` calls and no ``caplog`` or
+        ``subtests`` references, so the subTest, assertion-block and
+        fixture-usage rewrites of :meth:`leave_FunctionDef` cannot apply.
+        """
+        relevant = self._relevant_statements
+        if relevant is None or not isinstance(node.body, cst.IndentedBlock):
+            return True
+        return any(id(stmt) in relevant for stmt in node.body.body)
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool | None:
+        """Visit function definitions to track setUp/tearDown methods.
+
+        When a function cache is configured, non-lifecycle functions whose
+        source and transformation context are unchanged are served from the
+        cache: traversal of their body is skipped and :meth:`leave_FunctionDef`
+        splices in the cached result.
+        """
         # Track function stack entry so leave_Call can know the enclosing function
         try:
             self._function_stack.append(node.name.value)
         except (AttributeError, TypeError, ValueError):
             pass
         name = node.name.value
+        if name in _LIFECYCLE_METHOD_NAMES:
+            self._mark_cache_frames_uncacheable()
+            self._cache_frames.append(None)
+        else:
+            frame = self._begin_function_cache(node)
+            self._cache_frames.append(frame)
+            if frame is not None and frame.entry is not None:
+                return False
         # Decide whether we're inside a class; if so, record per-class; otherwise module-level
         cls = self.current_class
         state = self.fixture_state
         if name == "setUp":
             if cls:
-                buffer = state.per_class_setup.setdefault(cls, [])
-                self._extract_method_body(node, buffer)
+                state.extend_class_buffer(cls, "setup", self._method_body_statements(node))
             else:
                 self._extract_method_body(node, state.instance_setup)
         elif name == "tearDown":
             if cls:
-                buffer = state.per_class_teardown.setdefault(cls, [])
-                self._extract_method_body(node, buffer)
+                state.extend_class_buffer(cls, "teardown", self._method_body_statements(node))
             else:
                 self._extract_method_body(node, state.instance_teardown)
         elif name == "setUpClass":
             if cls:
-                buffer = state.per_class_setup_class.setdefault(cls, [])
-                self._extract_method_body(node, buffer)
+                state.extend_class_buffer(cls, "setup_class", self._method_body_statements(node))
             else:
                 self._extract_method_body(node, state.class_setup)
         elif name == "tearDownClass":
             if cls:
-                buffer = state.per_class_teardown_class.setdefault(cls, [])
-                self._extract_method_body(node, buffer)
+                state.extend_class_buffer(cls, "teardown_class", self._method_body_statements(node))
             else:
                 self._extract_method_body(node, state.class_teardown)
         elif name == "setUpModule":
             self._extract_method_body(node, state.module_setup)
         elif name == "tearDownModule":
             self._extract_method_body(node, state.module_teardown)
+        return None
 
-    def _extract_method_body(self, node: cst.FunctionDef, target_list: list[str]) -> None:
-        """Serialize statements from a function body into strings.
+    def _extract_method_body(self, node: cst.FunctionDef, target_list: list[FixtureStatement]) -> None:
+        """Collect the top-level statements of a function body.
 
-        The transformer extracts each top-level statement within the
-        provided function and appends a generated code string to
-        ``target_list``. Compound statements (``if``, ``with``, etc.) are
-        preserved by generating a single-statement :class:`libcst.Module`
-        containing that statement and appending its rendered code. This
-        behavior is used by the fixture conversion helpers which expect
-        ready-to-insert source fragments.
+        The original statement nodes (simple and compound alike) are
+        appended to ``target_list`` unchanged, so the fixture builders can
+        insert them directly without a render-and-reparse round trip and
+        comments and formatting inside lifecycle methods are preserved.
 
         Args:
             node: The function node whose body should be inspected.
-            target_list: A list to which serialized statement strings will
-                be appended.
+            target_list: A list to which the body statements will be
+                appended.
 
         Returns:
-            None. Failures to render a statement are ignored; in very
-            conservative cases the statement's type name may be appended
-            instead.
+            None.
         """
-        if node.body.body:
-            for stmt in node.body.body:
-                # Preserve any statement (SimpleStatementLine, If, With, etc.) by
-                # generating a Module containing that single statement and appending
-                # its generated code. This keeps compound statements like `if`
-                # blocks intact when we later create fixtures.
-                try:
-                    stmt_module = cst.Module(body=[stmt])
-                    target_list.append(stmt_module.code.strip())
-                except (AttributeError, TypeError, ValueError):
-                    # Fallback: try to stringify the node or skip if generation fails
-                    try:
-                        target_list.append(str(type(stmt).__name__))
-                    except (AttributeError, TypeError, ValueError):
-                        pass
+        target_list.extend(self._method_body_statements(node))
+
+    @staticmethod
+    def _method_body_statements(node: cst.FunctionDef) -> list[cst.BaseStatement]:
+        """Return the top-level statements of ``node`` as statement lines."""
+        body = getattr(node.body, "body", ())
+        if isinstance(node.body, cst.IndentedBlock):
+            return list(body)
+        # ``def setUp(self): x = 1`` -- re-home the inline small statements
+        # on their own line
+        return [cst.SimpleStatementLine(body=[stmt.with_changes(semicolon=cst.MaybeSentinel.DEFAULT)]) for stmt in body]
 
     # Fixture string-based fallback moved to transformers.fixture_transformer.transform_fixtures_string_based
 
@@ -1318,6 +1647,7 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         Returns:
             True to continue traversal.
         """
+        self._mark_cache_frames_uncacheable()
         for alias in node.names:
             # alias.name can be a dotted name but for 're' it's a simple Name
             if isinstance(alias.name, cst.Name) and alias.name.value == "re":
@@ -1341,6 +1671,7 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         Returns:
             True to continue traversal.
         """
+        self._mark_cache_frames_uncacheable()
         if isinstance(node.module, cst.Name) and node.module.value == "re":
             # node.names can be an ImportStar or a sequence of ImportAlias; guard accordingly
             if isinstance(node.names, cst.ImportStar):
@@ -1359,12 +1690,13 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
         """Transform supported ``self.assert*`` calls into pytest equivalents.
 
         This method handles attribute calls on ``self`` or ``cls`` and
-        dispatches to the specific assertion transform helpers defined in
-        :mod:`assert_transformer`. Transformations may:
+        dispatches through the shared :class:`AssertionDispatchRegistry`
+        (see :mod:`assert_dispatch`) to the assertion transform helpers.
+        Transformations may:
 
         - Return an expression-level replacement (safe to return directly).
-        - Return a statement-level replacement (these are recorded via
-          :meth:`record_replacement` and applied in a later pass).
+        - Return a statement-level replacement (recorded against the
+          returned call and substituted by :meth:`leave_SimpleStatementLine`).
 
         Side Effects:
             May set ``needs_pytest_import`` or ``needs_re_import`` when a
@@ -1384,94 +1716,36 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
             if owner in {"self", "cls"}:
                 method_name = updated_node.func.attr.value
 
-                # Map known unittest assert method names to the extracted transform functions
-                mapping = {
-                    "assertEqual": transform_assert_equal,
-                    "assertEquals": transform_assert_equal,
-                    "assertNotEqual": transform_assert_not_equal,
-                    "assertNotEquals": transform_assert_not_equal,
-                    "assertTrue": transform_assert_true,
-                    "assertIsTrue": transform_assert_true,
-                    "assertFalse": transform_assert_false,
-                    "assertIsFalse": transform_assert_false,
-                    "assertIs": transform_assert_is,
-                    "assertIsNot": transform_assert_is_not,
-                    "assertIn": transform_assert_in,
-                    "assertNotIn": transform_assert_not_in,
-                    "assertIsInstance": transform_assert_isinstance,
-                    "assertNotIsInstance": transform_assert_not_isinstance,
-                    "assertDictEqual": transform_assert_dict_equal,
-                    "assertDictEquals": transform_assert_dict_equal,
-                    "assertListEqual": transform_assert_list_equal,
-                    "assertListEquals": transform_assert_list_equal,
-                    "assertSetEqual": transform_assert_set_equal,
-                    "assertSetEquals": transform_assert_set_equal,
-                    "assertTupleEqual": transform_assert_tuple_equal,
-                    "assertTupleEquals": transform_assert_tuple_equal,
-                    "assertCountEqual": transform_assert_count_equal,
-                    "assertSequenceEqual": transform_assert_equal,
-                    "skipTest": transform_skip_test,
-                    "fail": transform_fail,
-                    "assertMultiLineEqual": transform_assert_multiline_equal,
-                    "assertIsNone": transform_assert_is_none,
-                    "assertIsNotNone": transform_assert_is_not_none,
-                    # raises / regex handled with lambdas so we can pass transformer context when needed
-                    "assertRaises": transform_assert_raises,
-                    "assertRaisesRegex": transform_assert_raises_regex,
-                    # warning assertions
-                    "assertWarns": transform_assert_warns,
-                    "assertWarnsRegex": transform_assert_warns_regex,
-                    # numeric comparisons
-                    "assertGreater": transform_assert_greater,
-                    "assertGreaterEqual": transform_assert_greater_equal,
-                    "assertLess": transform_assert_less,
-                    "assertLessEqual": transform_assert_less_equal,
-                    "assertAlmostEqual": lambda node: transform_assert_almost_equal(node, config=self.config),
-                    "assertNotAlmostEqual": lambda node: transform_assert_not_almost_equal(node, config=self.config),
-                    # assertLogs/assertNoLogs handled by wrap_assert_logs_in_block
-                    "assertRegex": lambda node: transform_assert_regex(
-                        node, re_alias=self.re_alias, re_search_name=self.re_search_name
-                    ),
-                    "assertNotRegex": lambda node: transform_assert_not_regex(
-                        node, re_alias=self.re_alias, re_search_name=self.re_search_name
-                    ),
-                }
-
-                if method_name in mapping:
+                rule = self._assertion_registry.get(method_name)
+                if rule is not None:
                     try:
-                        new_node = mapping[method_name](updated_node)
+                        new_node = self._assertion_registry.dispatch(rule, updated_node, self)
                         # debug: log when a transform returns a statement-level replacement
                         try:
                             import logging
 
                             logger = logging.getLogger(__name__)
                             if isinstance(new_node, cst.BaseStatement):
-                                # attempt to get position key
-                                try:
-                                    pos = self.get_metadata(PositionProvider, original_node)
-                                    key = self.replacement_registry.key_from_position(pos)
-                                except Exception:
-                                    key = None
                                 logger.debug(
-                                    "leave_Call: transform for %s produced statement replacement at %s -> %s",
+                                    "leave_Call: transform for %s produced statement replacement -> %s",
                                     method_name,
-                                    key,
                                     type(new_node).__name__,
                                 )
                         except Exception:
                             pass
-                        # If we transformed to pytest.raises, ensure import is tracked
-                        if method_name in {"assertRaises", "assertRaisesRegex"}:
-                            self.needs_pytest_import = True
-                        # If we transformed regex assertions, note that we need `re`
-                        if method_name in {"assertRegex", "assertNotRegex"}:
-                            self.needs_re_import = True
+                        # Track imports the rewritten code relies on (pytest.raises, re.search)
+                        if rule.requires:
+                            if "pytest" in rule.requires:
+                                self.needs_pytest_import = True
+                            if "re" in rule.requires:
+                                self.needs_re_import = True
                         # new_node may be a statement (e.g., cst.Assert) or an expression.
-                        # If it's a statement, record a replacement to apply in a second pass
-                        # keyed by source position. Otherwise return the expression.
+                        # If it's a statement, record it against the Call we return so
+                        # leave_SimpleStatementLine can substitute it. Otherwise return
+                        # the expression.
                         if isinstance(new_node, cst.BaseStatement):
                             # schedule replacement and keep the Call expression intact for now
-                            self.record_replacement(original_node, new_node)
+                            self.replacement_registry.record_node(updated_node, new_node)
                             return updated_node
                         # expression-level replacement is safe to return
                         return new_node  # type: ignore[return-value]
@@ -1547,12 +1821,39 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
 
         return True  # Continue traversal
 
+    def leave_SimpleStatementLine(
+        self, original_node: cst.SimpleStatementLine, updated_node: cst.SimpleStatementLine
+    ) -> cst.BaseStatement:
+        """Substitute statement-level replacements recorded by :meth:`leave_Call`.
+
+        Only a line consisting of a single bare call expression is replaced,
+        mirroring :class:`ReplacementApplier`.
+
+        Args:
+            original_node: The original statement line.
+            updated_node: The statement line after inner transforms.
+
+        Returns:
+            The replacement statement, or ``updated_node`` when none applies.
+        """
+        registry = self.replacement_registry
+        if not registry.node_replacements or len(updated_node.body) != 1:
+            return updated_node
+
+        expr = updated_node.body[0]
+        if not isinstance(expr, cst.Expr) or not isinstance(expr.value, cst.Call):
+            return updated_node
+
+        repl = registry.pop_node(expr.value)
+        if repl is None or not isinstance(repl, cst.BaseStatement):
+            return updated_node
+        return build_statement_replacement(updated_node, repl)
+
     def transform_code(self, code: str) -> str:
         """Convert a source string containing unittest-based tests to pytest.
 
         The method first parses the input into a libcst Module and runs the
-        transformer passes. Any recorded position-based replacements are
-        applied in a subsequent pass. After CST-based transforms it runs a
+        transformer passes. After CST-based transforms it runs a
         few conservative string-level cleanups (for example caplog alias
         fixes) and removes ``unittest`` imports that are no longer used.
 
@@ -1578,9 +1879,6 @@ class UnittestToPytestCstTransformer(cst.CSTTransformer):
             # churn. If regressions appear later, reintroduce a focused
             # fallback with tight unit tests guarding it.
 
-            # If we recorded replacements, run a second pass to apply them.
-            transformed_cst = self._apply_recorded_replacements(transformed_cst)
-
             transformed_code = transformed_cst.code
 
             # Focused final CST pass: apply a lightweight recursive With-item rewrite
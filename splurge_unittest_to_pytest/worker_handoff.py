@@ -0,0 +1,75 @@
+"""Compact handoff of source and generated code between worker processes.
+
+Sending a file to a worker process as a source string, and getting the
+generated code back the same way, pickles both through a pipe and keeps
+full copies in the parent for every file in flight. Process workers
+instead receive only the source path: they read the file, transform it
+and write the output themselves, and return the target path. When the
+generated code has to come back (dry runs), the worker spools it to a
+file and returns a :class:`CodeHandle`, which the parent maps with
+``mmap`` only once the file is done.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import tempfile
+from dataclasses import dataclass
+
+__all__ = ["CodeHandle", "spool_code"]
+
+_SPOOL_PREFIX = "splurge-code-"
+
+
+@dataclass(frozen=True, slots=True)
+class CodeHandle:
+    """Reference to generated code spooled to a file by a worker.
+
+    Attributes:
+        path: Spool file holding the UTF-8 encoded code.
+        size: Size of the encoded code in bytes.
+    """
+
+    path: str
+    size: int
+
+    def read_text(self) -> str:
+        """Map the spool file and decode the code."""
+        if self.size == 0:
+            return ""
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[: self.size].decode("utf-8")
+
+    def release(self) -> None:
+        """Delete the spool file; releasing twice is harmless."""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def spool_code(code: str, directory: str | None = None) -> CodeHandle:
+    """Write ``code`` to a new spool file and return its handle.
+
+    Args:
+        code: Generated code.
+        directory: Directory for the spool file (default: the system
+            temporary directory).
+
+    Returns:
+        Handle the parent process resolves with :meth:`CodeHandle.read_text`
+        and frees with :meth:`CodeHandle.release`.
+    """
+    data = code.encode("utf-8")
+    fd, path = tempfile.mkstemp(prefix=_SPOOL_PREFIX, suffix=".py", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return CodeHandle(path, len(data))
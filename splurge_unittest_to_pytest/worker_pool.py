@@ -0,0 +1,150 @@
+"""Pre-forked worker processes with a warm, frozen heap.
+
+A plain ``ProcessPoolExecutor`` starts workers that each import libcst,
+black, isort, pydantic and the transformer modules again on their first
+file, which costs seconds per worker. :func:`create_worker_pool` uses the
+``forkserver`` start method with :mod:`.worker_zygote` as its preload: the
+fork server imports every heavy module once, runs a small migration to
+warm the formatters, compiled regexes and caches, and calls
+:func:`gc.freeze` so the warm heap stays in shared copy-on-write pages.
+Every worker is then forked from that server already warm, so starting 32
+workers costs about the same as starting one.
+
+The fork server and its preload list are process-wide. The zygote is
+appended to the preload list the host has already configured rather than
+replacing it. A fork server that is already running without the zygote is
+left alone, and its workers warm themselves instead. Where ``forkserver``
+is not available, each worker runs :func:`warm_up` itself as the pool
+initializer.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from __future__ import annotations
+
+import gc
+import importlib
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import forkserver
+
+__all__ = ["PRELOAD_MODULES", "create_worker_pool", "warm_up"]
+
+_logger = logging.getLogger(__name__)
+
+PRELOAD_MODULES = (
+    "libcst",
+    "black",
+    "isort",
+    "pydantic",
+    "splurge_unittest_to_pytest.config_validation",
+    "splurge_unittest_to_pytest.migration_orchestrator",
+    "splurge_unittest_to_pytest.steps.format_steps",
+    "splurge_unittest_to_pytest.transformers",
+)
+"""Modules imported by :func:`warm_up` before the warm-up migration."""
+
+_ZYGOTE_MODULE = "splurge_unittest_to_pytest.worker_zygote"
+
+_WARM_UP_SOURCE = """\
+import unittest
+
+
+class TestWarmUp(unittest.TestCase):
+    def setUp(self):
+        self.value = 1
+
+    def test_value(self):
+        for item in [1, 2]:
+            with self.subTest(item=item):
+                self.assertEqual(self.value, 1)
+        with self.assertRaises(ValueError):
+            int("x")
+"""
+
+_warm_up_seconds: float | None = None
+
+
+def warm_up() -> float:
+    """Import the heavy modules, run one migration in memory and freeze the heap.
+
+    Runs once per process; later calls return at once.
+
+    Returns:
+        Seconds spent warming up (by the first call).
+    """
+    global _warm_up_seconds
+    if _warm_up_seconds is not None:
+        return _warm_up_seconds
+    start = time.perf_counter()
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            _logger.debug(f"Cannot preload {name}: {e}")
+    try:
+        from .context import MigrationConfig
+        from .migration_orchestrator import _worker_orchestrator
+
+        # Formats with black and isort, which is what pulls them fully in
+        _worker_orchestrator().transform_source(
+            _WARM_UP_SOURCE, MigrationConfig(cache_analysis_results=False), source_name="<warm-up>"
+        )
+    except Exception as e:  # a failed warm-up only costs speed
+        _logger.warning(f"Worker warm-up migration failed: {e}")
+    # Move everything alive now out of the collector's reach, so collections
+    # in forked workers never write to (and un-share) these pages
+    gc.collect()
+    gc.freeze()
+    _warm_up_seconds = time.perf_counter() - start
+    return _warm_up_seconds
+
+
+def _add_zygote_preload() -> bool:
+    """Append the zygote to the process-wide fork server preload list.
+
+    Modules already on the list (``__main__`` by default, or whatever the
+    host application set) are kept.
+
+    Returns:
+        Whether workers forked from the fork server will start warm: false
+        when a fork server without the zygote is already running, since a
+        preload change only applies when the server starts.
+    """
+    # multiprocessing has no public getter for the preload list or server state
+    server = forkserver._forkserver
+    modules = list(getattr(server, "_preload_modules", ["__main__"]))
+    if _ZYGOTE_MODULE in modules:
+        return True
+    if getattr(server, "_forkserver_pid", None) is not None:
+        return False
+    forkserver.set_forkserver_preload([*modules, _ZYGOTE_MODULE])
+    return True
+
+
+def create_worker_pool(workers: int, *, preload: bool = True) -> ProcessPoolExecutor:
+    """Create a process pool whose workers start warm.
+
+    With ``forkserver`` this changes process-wide state: :mod:`.worker_zygote`
+    is appended to the fork server's preload list, and the fork server, once
+    started, serves every later ``forkserver`` pool in this process.
+
+    Args:
+        workers: Number of worker processes.
+        preload: Whether workers start warm. Without it this is a plain
+            ``ProcessPoolExecutor``.
+
+    Returns:
+        The executor. Shut it down like any other executor.
+    """
+    if not preload:
+        return ProcessPoolExecutor(max_workers=workers)
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        if _add_zygote_preload():
+            return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        return ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=warm_up)
+    return ProcessPoolExecutor(max_workers=workers, initializer=warm_up)
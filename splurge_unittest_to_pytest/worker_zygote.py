@@ -0,0 +1,14 @@
+"""Fork-server preload module of the warm worker pool.
+
+The ``forkserver`` started by :func:`.worker_pool.create_worker_pool`
+imports this module before forking any worker. Importing it runs
+:func:`.worker_pool.warm_up`, so every worker forked afterwards shares the
+server's imported modules, warm caches and frozen heap.
+
+Copyright (c) 2025 Jim Schilling
+This software is released under the MIT License.
+"""
+
+from .worker_pool import warm_up
+
+warm_up()
@@ -0,0 +1,60 @@
+"""Shared fixtures for the unit tests."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+UNITTEST_SOURCE = """\
+import unittest
+
+
+class TestNumbers(unittest.TestCase):
+    def setUp(self):
+        self.value = 2
+
+    def test_value(self):
+        self.assertEqual(self.value, 2)
+"""
+
+SUBTEST_SOURCE = """\
+import unittest
+
+
+class TestNumbers(unittest.TestCase):
+    def test_values(self):
+        for value in [1, 2, 3]:
+            with self.subTest(value=value):
+                self.assertTrue(value)
+"""
+
+
+@pytest.fixture
+def unittest_source() -> str:
+    """A small ``unittest`` module with a ``setUp`` and one assertion."""
+    return UNITTEST_SOURCE
+
+
+@pytest.fixture
+def subtest_source() -> str:
+    """A ``unittest`` module whose only test loops over ``subTest`` cases."""
+    return SUBTEST_SOURCE
+
+
+@pytest.fixture
+def unittest_sources(tmp_path: Path) -> Callable[..., list[str]]:
+    """Return a factory writing ``test_numbers_<i>.py`` files to ``tmp_path``.
+
+    ``unittest_sources(count, source=UNITTEST_SOURCE)`` returns the paths of
+    the written files.
+    """
+
+    def write(count: int = 2, source: str = UNITTEST_SOURCE) -> list[str]:
+        paths = []
+        for index in range(count):
+            path = tmp_path / f"test_numbers_{index}.py"
+            path.write_text(source, encoding="utf-8")
+            paths.append(str(path))
+        return paths
+
+    return write
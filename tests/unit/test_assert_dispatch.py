@@ -0,0 +1,164 @@
+"""Tests for the precomputed assertion dispatch registry."""
+
+import libcst as cst
+import pytest
+
+from splurge_unittest_to_pytest.plugins import PluginInfo, PluginManager
+from splurge_unittest_to_pytest.transformers.assert_dispatch import (
+    AssertionDispatchRegistry,
+    AssertionRule,
+    builtin_rules,
+    get_assertion_registry,
+)
+from splurge_unittest_to_pytest.transformers.function_cache import FunctionTransformCache
+from splurge_unittest_to_pytest.transformers.unittest_transformer import UnittestToPytestCstTransformer
+
+
+def _call(code: str) -> cst.Call:
+    expr = cst.parse_expression(code)
+    assert isinstance(expr, cst.Call)
+    return expr
+
+
+@pytest.fixture
+def registry():
+    registry = get_assertion_registry()
+    yield registry
+    registry.enable_stats(False)
+    registry.reset_stats()
+    for rule in registry.rules():
+        if rule.source != "builtin":
+            registry.unregister_source(rule.source)
+
+
+def test_builtin_rules_cover_assertion_methods_with_import_requirements() -> None:
+    rules = {rule.method_name: rule for rule in builtin_rules()}
+
+    assert {"assertEqual", "assertEquals", "assertIsNone", "skipTest", "fail", "assertWarnsRegex"} <= set(rules)
+    assert "assertLogs" not in rules
+    assert rules["assertRaises"].requires == frozenset({"pytest"})
+    assert rules["assertRegex"].requires == frozenset({"re"})
+    assert rules["assertRegex"].uses_context and rules["assertAlmostEqual"].uses_context
+    assert not rules["assertEqual"].requires
+
+
+def test_registry_is_shared_by_transformers() -> None:
+    assert UnittestToPytestCstTransformer()._assertion_registry is get_assertion_registry()
+
+
+def test_stats_are_collected_only_when_enabled(registry) -> None:
+    code = "import unittest\n\nclass T(unittest.TestCase):\n    def test_a(self):\n        self.assertEqual(a, 1)\n"
+    UnittestToPytestCstTransformer().transform_code(code)
+    assert registry.get("assertEqual").hits == 0
+
+    registry.enable_stats()
+    UnittestToPytestCstTransformer().transform_code(code)
+
+    rows = {row["method_name"]: row for row in registry.stats()}
+    assert rows["assertEqual"]["hits"] == 1
+    assert rows["assertEqual"]["failures"] == 0
+    assert rows["assertEqual"]["total_time"] > 0
+    registry.reset_stats()
+    assert registry.stats() == []
+
+
+def test_dispatch_counts_failures_and_reraises() -> None:
+    def boom(node):
+        raise ValueError("bad call")
+
+    registry = AssertionDispatchRegistry([AssertionRule("assertBoom", boom)])
+    registry.enable_stats()
+    rule = registry.get("assertBoom")
+
+    with pytest.raises(ValueError):
+        registry.dispatch(rule, _call("self.assertBoom(x)"), None)
+
+    assert (rule.hits, rule.failures) == (1, 1)
+
+
+def test_replacing_rule_restores_original_on_unregister() -> None:
+    registry = AssertionDispatchRegistry(builtin_rules())
+    original = registry.get("assertEqual")
+    custom = AssertionRule("assertEqual", lambda node: node, source="custom")
+
+    assert registry.register(custom) is False
+    assert registry.register(custom, replace=True) is True
+    assert registry.get("assertEqual") is custom
+
+    assert registry.unregister_source("custom") == [custom]
+    assert registry.get("assertEqual") is original
+
+
+def test_plugin_manager_registers_context_aware_rule(registry) -> None:
+    def rewrite(node, transformer):
+        assert transformer.re_alias is None
+        return cst.Assert(test=node.args[0].value)
+
+    manager = PluginManager()
+    assert manager.register_assertion_rule(
+        "assertHolds", rewrite, uses_context=True, requires=["pytest"], source="acme"
+    )
+
+    result = UnittestToPytestCstTransformer().transform_code(
+        "import unittest\n\nclass T(unittest.TestCase):\n    def test_a(self):\n        self.assertHolds(ok)\n"
+    )
+
+    assert "assert ok" in result
+    assert "import pytest" in result
+
+
+def test_registry_changes_invalidate_cached_functions(registry) -> None:
+    code = "import unittest\n\nclass T(unittest.TestCase):\n    def test_a(self):\n        self.assertEqual(1, 1)\n"
+    cache = FunctionTransformCache()
+    assert "assert 1 == 1" in UnittestToPytestCstTransformer(function_cache=cache).transform_code(code)
+
+    custom = AssertionRule("assertEqual", lambda node: cst.Assert(test=cst.Name("checked")), source="custom")
+    assert registry.register(custom, replace=True)
+    assert "assert checked" in UnittestToPytestCstTransformer(function_cache=cache).transform_code(code)
+
+    registry.unregister_source("custom")
+    assert "assert 1 == 1" in UnittestToPytestCstTransformer(function_cache=cache).transform_code(code)
+    assert cache.hits == 0
+    UnittestToPytestCstTransformer(function_cache=cache).transform_code(code)
+    assert cache.hits == 1
+
+
+def test_stats_count_functions_that_are_cached(registry) -> None:
+    code = "import unittest\n\nclass T(unittest.TestCase):\n    def test_a(self):\n        self.assertEqual(a, 1)\n"
+    cache = FunctionTransformCache()
+    UnittestToPytestCstTransformer(function_cache=cache).transform_code(code)
+
+    registry.enable_stats()
+    UnittestToPytestCstTransformer(function_cache=cache).transform_code(code)
+    UnittestToPytestCstTransformer(function_cache=cache).transform_code(code)
+
+    assert registry.get("assertEqual").hits == 2
+
+
+class _RulesPlugin:
+    name = "rules_plugin"
+    version = "1.0.0"
+    description = "Provides assertion rules"
+
+    def can_handle(self, node, context):
+        return False
+
+    def transform(self, node, context):
+        return None
+
+    def assertion_rules(self):
+        return [AssertionRule("assertPositive", lambda node: cst.Assert(test=node.args[0].value))]
+
+
+def test_plugin_assertion_rules_follow_enabled_state(registry) -> None:
+    manager = PluginManager()
+    info = PluginInfo("rules_plugin", "1.0.0", "Provides assertion rules", "<test>", _RulesPlugin)
+
+    assert manager.register_plugin(info)
+    assert registry.get("assertPositive").source == "rules_plugin"
+
+    manager.disable_plugin("rules_plugin")
+    assert "assertPositive" not in registry
+
+    manager.enable_plugin("rules_plugin")
+    assert "assertPositive" in registry
@@ -0,0 +1,65 @@
+"""Import-time regression tests for the CLI entry point."""
+
+import re
+import subprocess
+import sys
+
+import pytest
+
+from splurge_unittest_to_pytest import cli
+
+# Importing the migration engine, libcst and pydantic eagerly took about
+# 700 ms; the lazy CLI imports in roughly 140 ms. Absolute timings vary too
+# much between machines and loaded CI workers, so the budget is relative:
+# the CLI's cumulative import time must stay below this fraction of
+# ``import libcst`` measured in the same process (about 0.5 today; the eager
+# CLI imported libcst itself and was well above 1).
+IMPORT_BUDGET_RATIO = 1.0
+
+HEAVY_MODULES = [
+    "libcst",
+    "pydantic",
+    "black",
+    "isort",
+    "splurge_unittest_to_pytest.main",
+    "splurge_unittest_to_pytest.migration_orchestrator",
+    "splurge_unittest_to_pytest.config_validation",
+    "splurge_unittest_to_pytest.error_reporting",
+]
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True)
+
+
+def _cumulative_import_us(stderr: str, module: str) -> int:
+    match = re.search(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$", stderr, re.MULTILINE)
+    assert match is not None, f"{module} missing from -X importtime output (already loaded earlier?)"
+    return int(match.group(1))
+
+
+def test_cli_import_does_not_load_heavy_modules() -> None:
+    code = f"import sys, splurge_unittest_to_pytest.cli; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+
+    assert _run(code).stdout.strip() == "[]"
+
+
+def test_cli_import_time_stays_within_budget() -> None:
+    ratios = []
+    for _ in range(3):
+        stderr = _run("import splurge_unittest_to_pytest.cli; import libcst", "-X", "importtime").stderr
+        cli_us = _cumulative_import_us(stderr, "splurge_unittest_to_pytest.cli")
+        ratios.append(cli_us / _cumulative_import_us(stderr, "libcst"))
+
+    best = min(ratios)
+    assert best < IMPORT_BUDGET_RATIO, f"CLI import took {best:.2f}x as long as libcst (budget {IMPORT_BUDGET_RATIO}x)"
+
+
+def test_lazy_attributes_resolve_on_access() -> None:
+    from splurge_unittest_to_pytest import main
+    from splurge_unittest_to_pytest.error_reporting import ErrorReporter
+
+    assert cli.main_module is main
+    assert cli.ErrorReporter is ErrorReporter
+    with pytest.raises(AttributeError):
+        cli.not_a_cli_attribute  # noqa: B018
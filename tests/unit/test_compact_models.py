@@ -0,0 +1,74 @@
+"""Tests for slotted, interned IR and decision model objects."""
+
+import json
+from pathlib import Path
+
+from splurge_unittest_to_pytest.context import MigrationConfig, PipelineContext
+from splurge_unittest_to_pytest.decision_model import (
+    DecisionModel,
+    EvidenceCode,
+    FunctionProposal,
+    intern_evidence,
+)
+from splurge_unittest_to_pytest.events import EventBus
+from splurge_unittest_to_pytest.ir import TestMethod
+from splurge_unittest_to_pytest.jobs.decision_analysis_job import DecisionAnalysisJob
+from splurge_unittest_to_pytest.pattern_analyzer import UnittestPatternAnalyzer
+
+# Appended to the shared subTest module so the model also covers a
+# class setup method and a plain test
+EXTRA_METHODS = """
+    def setUp(self):
+        self.items = []
+
+    def test_plain(self):
+        self.assertEqual(1, 1)
+"""
+
+
+def _decision_model(source: str, name: str = "test_numbers.py") -> DecisionModel:
+    context = PipelineContext.create(name, config=MigrationConfig(cache_analysis_results=False))
+    DecisionAnalysisJob(EventBus()).execute(context, source + EXTRA_METHODS)
+    return context.metadata["decision_model"]
+
+
+def test_models_use_slots(subtest_source: str) -> None:
+    ir_module = UnittestPatternAnalyzer().analyze_module(subtest_source + EXTRA_METHODS)
+    proposal = FunctionProposal("test_values", "parametrize")
+
+    for obj in (ir_module, ir_module.classes[0], ir_module.classes[0].methods[0], proposal):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_identifier_strings_are_shared_between_instances() -> None:
+    first = TestMethod(name="".join(["test_", "values"]), body=[])
+    second = TestMethod(name="".join(["test_", "values"]), body=[])
+    one = FunctionProposal("".join(["test_", "x"]), "subtests", loop_var_name="".join(["val", "ue"]))
+    two = FunctionProposal("".join(["test_", "x"]), "subtests", loop_var_name="".join(["val", "ue"]))
+
+    assert first.name is second.name
+    assert one.function_name is two.function_name
+    assert one.loop_var_name is two.loop_var_name
+
+
+def test_fixed_evidence_uses_codes_that_render_as_text(subtest_source: str) -> None:
+    class_proposal = _decision_model(subtest_source).module_proposals["test_numbers.py"].class_proposals["TestNumbers"]
+    values = class_proposal.function_proposals["TestNumbers.test_values"].evidence
+
+    assert EvidenceCode.LITERAL_ITERABLE in values
+    code = next(item for item in values if isinstance(item, EvidenceCode))
+    assert str(code) == f"{code}" == code.value
+    assert intern_evidence(str.__str__(EvidenceCode.RANGE_CALL)) is EvidenceCode.RANGE_CALL
+    assert json.loads(json.dumps(values)) == [str(item) for item in values]
+
+
+def test_serialization_round_trips_are_unchanged(tmp_path: Path, subtest_source: str) -> None:
+    model = _decision_model(subtest_source)
+    model.save_to_file(tmp_path / "model.json")
+
+    from_bytes = DecisionModel.from_bytes(model.to_bytes())
+    from_json = DecisionModel(module_proposals={})
+    from_json.load_from_file(tmp_path / "model.json")
+
+    assert from_bytes == model
+    assert from_json == model
@@ -0,0 +1,212 @@
+"""Tests for the migration daemon and its client."""
+
+import os
+import socket
+import stat
+import tempfile
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from splurge_unittest_to_pytest import cli
+from splurge_unittest_to_pytest.context import MigrationConfig
+from splurge_unittest_to_pytest.daemon import (
+    MigrationDaemon,
+    RequestHandler,
+    default_socket_path,
+    run_request,
+    send_request,
+)
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def socket_dir() -> Iterator[Path]:
+    # Unix socket paths are limited to ~100 characters, so avoid tmp_path
+    with tempfile.TemporaryDirectory(prefix="sutp-") as directory:
+        yield Path(directory)
+
+
+@pytest.fixture
+def daemon(socket_dir: Path) -> Iterator[MigrationDaemon]:
+    server = MigrationDaemon(socket_dir / "daemon.sock", MigrationConfig(format_output=False))
+    server.start(warm_up=False)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    send_request({"op": "shutdown"}, server.socket_path, timeout=5.0)
+    thread.join(timeout=10)
+
+
+@pytest.fixture
+def fake_daemon(socket_dir: Path) -> Iterator[tuple[Path, list[bytes]]]:
+    """A socket that reads one request, then answers with the queued reply (or just closes)."""
+    path = socket_dir / "fake.sock"
+    replies: list[bytes] = []
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(path))
+    listener.listen()
+
+    def serve() -> None:
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            with conn, conn.makefile("rb") as reader:
+                reader.readline()
+                if replies:
+                    conn.sendall(replies.pop(0))
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield path, replies
+    listener.close()
+
+
+def test_daemon_migrates_files_and_inline_code(daemon: MigrationDaemon, tmp_path: Path, unittest_source: str) -> None:
+    source = tmp_path / "test_numbers.py"
+    source.write_text(unittest_source, encoding="utf-8")
+
+    migrated = send_request(
+        {"op": "migrate", "source_file": str(source), "config": {"target_suffix": "_pt"}}, daemon.socket_path
+    )
+    inline = send_request({"op": "migrate", "code": unittest_source}, daemon.socket_path)
+
+    assert migrated is not None and migrated["status"] == "success"
+    assert migrated["data"] == str(tmp_path / "test_numbers_pt.py")
+    assert "assert self.value == 2" in (tmp_path / "test_numbers_pt.py").read_text(encoding="utf-8")
+    assert inline is not None and "assert self.value == 2" in inline["generated_code"]
+    assert inline["data"] is None
+
+
+def test_daemon_reports_bad_requests_and_keeps_serving(daemon: MigrationDaemon, unittest_source: str) -> None:
+    unknown_field = send_request({"op": "migrate", "code": unittest_source, "config": {"nope": 1}}, daemon.socket_path)
+    unknown_op = send_request({"op": "explode"}, daemon.socket_path)
+    ping = send_request({"op": "ping"}, daemon.socket_path)
+
+    assert unknown_field is not None
+    assert (unknown_field["status"], unknown_field["error"]) == ("error", "Unknown configuration fields: nope")
+    assert unknown_op is not None and unknown_op["status"] == "error"
+    assert ping is not None and ping["requests"] == 3
+
+
+def test_shutdown_removes_the_socket(socket_dir: Path) -> None:
+    server = MigrationDaemon(socket_dir / "daemon.sock")
+    server.start(warm_up=False)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    assert send_request({"op": "shutdown"}, server.socket_path) == {"status": "success"}
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert not server.socket_path.exists()
+    assert send_request({"op": "ping"}, server.socket_path) is None
+
+
+def test_run_request_falls_back_in_process_without_daemon(socket_dir: Path, unittest_source: str) -> None:
+    response = run_request({"op": "migrate", "code": unittest_source}, socket_dir / "missing.sock")
+
+    assert response["served_by"] == "in-process"
+    assert "assert self.value == 2" in response["generated_code"]
+
+
+def test_config_overrides_are_validated_and_cached() -> None:
+    handler = RequestHandler(MigrationConfig(line_length=100))
+
+    config = handler.config_for({"target_suffix": "_pt"})
+
+    assert config.line_length == 100 and config.target_suffix == "_pt"
+    assert handler.config_for({"target_suffix": "_pt"}) is config
+    assert handler.config_for(None) is handler.base_config
+
+
+def test_client_command_uses_running_daemon(daemon: MigrationDaemon, tmp_path: Path, unittest_source: str) -> None:
+    source = tmp_path / "test_numbers.py"
+    source.write_text(unittest_source, encoding="utf-8")
+    runner = CliRunner()
+
+    result = runner.invoke(cli.app, ["client", "--socket", str(daemon.socket_path), "--dry-run", str(source)])
+    ping = runner.invoke(cli.app, ["client", "--socket", str(daemon.socket_path), "--ping"])
+
+    assert result.exit_code == 0
+    assert "assert self.value == 2" in result.output
+    assert "Daemon running" in ping.output
+
+
+def test_socket_is_created_private(daemon: MigrationDaemon) -> None:
+    assert stat.S_IMODE(os.stat(daemon.socket_path).st_mode) == 0o600
+
+
+def test_failed_daemon_request_is_not_rerun_in_process(
+    fake_daemon: tuple[Path, list[bytes]], tmp_path: Path, unittest_source: str
+) -> None:
+    path, _ = fake_daemon
+    source = tmp_path / "test_numbers.py"
+    source.write_text(unittest_source, encoding="utf-8")
+
+    response = run_request({"op": "migrate", "source_file": str(source)}, path)
+
+    assert response["status"] == "error"
+    assert response["served_by"] == "daemon"
+    assert source.read_text(encoding="utf-8") == unittest_source
+    assert list(tmp_path.iterdir()) == [source]
+
+
+@pytest.mark.parametrize("reply", [b'{"status": "succ\n', b"[1, 2]\n"])
+def test_unreadable_daemon_response_is_an_error(fake_daemon: tuple[Path, list[bytes]], reply: bytes) -> None:
+    path, replies = fake_daemon
+    replies.append(reply)
+
+    response = send_request({"op": "ping"}, path)
+
+    assert response is not None
+    assert response["status"] == "error"
+    assert "Invalid daemon response" in response["error"]
+
+
+def test_daemon_timeout_is_an_error(socket_dir: Path) -> None:
+    path = socket_dir / "silent.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(path))
+        listener.listen()
+
+        response = send_request({"op": "ping"}, path, timeout=0.2)
+
+    assert response is not None
+    assert response["status"] == "error"
+
+
+def test_socket_owned_by_another_user_is_ignored(
+    fake_daemon: tuple[Path, list[bytes]],
+    monkeypatch: pytest.MonkeyPatch,
+    unittest_source: str,
+) -> None:
+    path, replies = fake_daemon
+    replies.append(b'{"status": "success", "generated_code": "forged"}\n')
+    other_uid = os.getuid() + 1
+    monkeypatch.setattr(os, "getuid", lambda: other_uid)
+
+    assert send_request({"op": "ping"}, path) is None
+    assert run_request({"op": "migrate", "code": unittest_source}, path)["served_by"] == "in-process"
+
+
+def test_default_socket_path_prefers_runtime_dir(socket_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("SPLURGE_UNITTEST_TO_PYTEST_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(socket_dir))
+    assert default_socket_path() == socket_dir / "splurge-unittest-to-pytest.sock"
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setattr(tempfile, "tempdir", str(socket_dir))
+    fallback = default_socket_path()
+    assert fallback.parent == socket_dir / f"splurge-unittest-to-pytest-{os.getuid()}"
+
+    fallback.parent.mkdir(mode=0o755)
+    os.chmod(fallback.parent, 0o755)
+    with pytest.raises(RuntimeError, match="not accessible to others"):
+        MigrationDaemon().start(warm_up=False)
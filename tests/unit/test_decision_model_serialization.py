@@ -0,0 +1,115 @@
+"""Tests for lossless decision model serialization and stored-model reuse."""
+
+from pathlib import Path
+
+import pytest
+
+from splurge_unittest_to_pytest.context import MigrationConfig, PipelineContext
+from splurge_unittest_to_pytest.decision_model import (
+    BINARY_MAGIC,
+    SCHEMA_VERSION,
+    CaplogAliasMetadata,
+    ClassProposal,
+    DecisionModel,
+    FunctionProposal,
+    ModuleProposal,
+)
+from splurge_unittest_to_pytest.events import EventBus
+from splurge_unittest_to_pytest.jobs.decision_analysis_job import DecisionAnalysisJob
+
+
+def _model() -> DecisionModel:
+    func = FunctionProposal(
+        function_name="test_values",
+        recommended_strategy="subtests",
+        loop_var_name="value",
+        iterable_origin="name",
+        accumulator_mutated=True,
+        caplog_aliases=[CaplogAliasMetadata("log", True, False, ["line 4"])],
+        evidence=["Found subTest loop", "Accumulator detected"],
+    )
+    other = FunctionProposal("test_plain", "keep-loop")
+    class_prop = ClassProposal(
+        class_name="TestNumbers",
+        function_proposals={"test_values": func, "test_plain": other},
+        class_fixtures=["resource"],
+        class_setup_methods=["setUp", "tearDown"],
+    )
+    module = ModuleProposal(
+        module_name="tests/test_numbers.py",
+        class_proposals={"TestNumbers": class_prop},
+        module_fixtures=["db"],
+        module_imports=["unittest"],
+        top_level_assignments={"VALUES": "[1, 2, 3]"},
+    )
+    return DecisionModel(module_proposals={"tests/test_numbers.py": module})
+
+
+@pytest.mark.parametrize("suffix", [".json", ".sdm"])
+def test_save_and_load_round_trip_every_field(tmp_path: Path, suffix: str) -> None:
+    model = _model()
+    path = tmp_path / f"model{suffix}"
+
+    model.save_to_file(path)
+    loaded = DecisionModel(module_proposals={})
+    loaded.load_from_file(path)
+
+    assert loaded == model
+
+
+def test_binary_encoding_is_versioned_and_smaller_than_json(tmp_path: Path) -> None:
+    model = _model()
+    model.save_to_file(tmp_path / "model.json")
+
+    data = model.to_bytes()
+
+    assert data.startswith(BINARY_MAGIC)
+    assert int.from_bytes(data[len(BINARY_MAGIC) : len(BINARY_MAGIC) + 2], "big") == SCHEMA_VERSION
+    assert len(data) < (tmp_path / "model.json").stat().st_size
+    assert DecisionModel.from_bytes(data) == model
+
+
+def test_from_bytes_rejects_other_versions_and_fingerprints() -> None:
+    data = _model().to_bytes("abc")
+    newer = BINARY_MAGIC + (SCHEMA_VERSION + 1).to_bytes(2, "big") + data[len(BINARY_MAGIC) + 2 :]
+
+    with pytest.raises(ValueError, match="schema version"):
+        DecisionModel.from_bytes(newer)
+    with pytest.raises(ValueError, match="fingerprint"):
+        DecisionModel.from_bytes(data, "xyz")
+    with pytest.raises(ValueError, match="not a binary decision model"):
+        DecisionModel.from_bytes(b"{}")
+    assert DecisionModel.from_bytes(data, "abc") == _model()
+
+
+def test_job_reuses_stored_model_for_unchanged_source(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, subtest_source: str
+) -> None:
+    config = MigrationConfig(decision_model_dir=str(tmp_path / "models"))
+    job = DecisionAnalysisJob(EventBus())
+    analyses: list[str] = []
+    task = job.tasks[0]
+    original_execute = task.execute
+    monkeypatch.setattr(task, "execute", lambda context, data: analyses.append(data) or original_execute(context, data))
+
+    first = PipelineContext.create("test_numbers.py", config=config)
+    assert job.execute(first, subtest_source).is_success()
+    assert len(list((tmp_path / "models").iterdir())) == 1
+
+    second = PipelineContext.create("test_numbers.py", config=config)
+    result = job.execute(second, subtest_source)
+
+    assert result.is_success() and result.data == subtest_source
+    assert second.metadata["decision_model"] == first.metadata["decision_model"]
+    assert len(analyses) == 1
+
+    job.execute(PipelineContext.create("test_numbers.py", config=config), subtest_source + "\n# edited\n")
+    assert len(analyses) == 2
+
+
+def test_job_ignores_model_dir_when_analysis_caching_is_disabled(tmp_path: Path, subtest_source: str) -> None:
+    config = MigrationConfig(decision_model_dir=str(tmp_path), cache_analysis_results=False)
+
+    DecisionAnalysisJob(EventBus()).execute(PipelineContext.create("test_numbers.py", config=config), subtest_source)
+
+    assert list(tmp_path.iterdir()) == []
@@ -111,3 +111,67 @@ class TestDeeplyNestedControlFlow:
         assert "from unittest.mock import Mock, patch" in result.stdout
         assert "import pytest" in result.stdout
         assert "class TestDeeplyNestedControlFlow" in result.stdout
+
+    def test_nesting_beyond_recursion_limit_is_rewritten(self):
+        """Assertion context managers are rewritten at any nesting depth."""
+        import sys
+
+        import libcst as cst
+
+        from splurge_unittest_to_pytest.transformers.assert_transformer import wrap_assert_in_block
+
+        depth = sys.getrecursionlimit() + 50
+        innermost = cst.parse_statement("with self.assertRaises(ValueError):\n    int('x')\n")
+        stmt: cst.BaseStatement = innermost
+        for level in range(depth):
+            stmt = cst.If(test=cst.Name(f"flag{level}"), body=cst.IndentedBlock(body=[stmt]))
+
+        out = wrap_assert_in_block([stmt])
+
+        node = out[0]
+        for _ in range(depth):
+            assert isinstance(node, cst.If)
+            node = node.body.body[0]
+        assert isinstance(node, cst.With)
+        assert cst.Module(body=[]).code_for_node(node.items[0].item) == "pytest.raises(ValueError)"
+
+    def test_elif_chains_and_bare_calls_are_rewritten(self):
+        """Every elif/else branch and nested bare calls are handled in one pass."""
+        import libcst as cst
+
+        from splurge_unittest_to_pytest.transformers.assert_transformer import wrap_assert_in_block
+
+        source = (
+            "if a:\n"
+            "    pass\n"
+            "elif b:\n"
+            "    pass\n"
+            "else:\n"
+            "    for item in items:\n"
+            "        try:\n"
+            "            self.assertRaises(KeyError)\n"
+            "            lookup(item)\n"
+            "        finally:\n"
+            "            with self.assertWarns(UserWarning):\n"
+            "                warn()\n"
+        )
+        module = cst.parse_module(source)
+
+        code = module.with_changes(body=wrap_assert_in_block(list(module.body))).code
+
+        assert "with pytest.raises(KeyError):\n                lookup(item)" in code
+        assert "with pytest.warns(UserWarning):" in code
+        assert "self.assert" not in code
+
+    def test_statements_without_context_asserts_are_untouched(self):
+        """Blocks without assertion context managers keep their original nodes."""
+        import libcst as cst
+
+        from splurge_unittest_to_pytest.transformers.assert_transformer import wrap_assert_in_block
+
+        module = cst.parse_module("try:\n    for x in y:\n        self.assertEqual(x, 1)\nexcept E:\n    pass\n")
+        statements = list(module.body)
+
+        out = wrap_assert_in_block(statements)
+
+        assert out[0] is statements[0]
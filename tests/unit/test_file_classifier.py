@@ -0,0 +1,102 @@
+"""Tests for pre-migration file classification and the no-op migrate path."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from splurge_unittest_to_pytest import main as main_module
+from splurge_unittest_to_pytest.context import MigrationConfig
+from splurge_unittest_to_pytest.detectors import classify_source
+from splurge_unittest_to_pytest.detectors.file_classifier import ALREADY_PYTEST, NO_UNITTEST
+from splurge_unittest_to_pytest.migration_orchestrator import MigrationOrchestrator
+
+# Deliberately not black-formatted, so a copy is distinguishable from a rewrite
+PYTEST_SOURCE = """\
+import pytest
+from unittest.mock import patch
+
+def test_value( ):
+    with patch( "os.getcwd" ):
+        assert 1+1 == 2
+"""
+
+
+@pytest.mark.parametrize(
+    "source, candidate, reason",
+    [
+        ("import unittest\n\nclass TestSum(unittest.TestCase):\n    pass\n", True, "unittest test module"),
+        ("class Mixin:\n    def check(self):\n        self.assertTrue(True)\n", True, "uses unittest"),
+        ("class Base:\n    def setUp(self):\n        self.items = []\n", True, "uses unittest"),
+        ("def skip_slow():\n    return unittest.skip('slow')\n", True, "uses unittest"),
+        (PYTEST_SOURCE, False, ALREADY_PYTEST),
+        ("def add(a, b):\n    return a + b\n", False, NO_UNITTEST),
+    ],
+)
+def test_classify_source(source: str, candidate: bool, reason: str) -> None:
+    classification = classify_source(source)
+
+    assert classification.is_candidate is candidate
+    assert classification.reason == reason
+
+
+def test_classify_source_rejects_invalid_code() -> None:
+    with pytest.raises(SyntaxError):
+        classify_source("def broken(:\n")
+    with pytest.raises(SyntaxError):
+        classify_source("x = 1\0\n")
+
+
+@pytest.fixture
+def mixed_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, unittest_source: str) -> tuple[Path, Path, list[str]]:
+    """A unittest file and a pytest file; records which files reach the full pipeline."""
+    unittest_file = tmp_path / "test_unit.py"
+    unittest_file.write_text(unittest_source, encoding="utf-8")
+    pytest_file = tmp_path / "test_py.py"
+    pytest_file.write_text(PYTEST_SOURCE, encoding="utf-8")
+
+    migrated: list[str] = []
+    original = MigrationOrchestrator.migrate_file
+
+    def spy(self, source_file, config=None):
+        migrated.append(Path(source_file).name)
+        return original(self, source_file, config)
+
+    monkeypatch.setattr(MigrationOrchestrator, "migrate_file", spy)
+    return unittest_file, pytest_file, migrated
+
+
+def test_non_candidates_are_copied_through_to_target_root(tmp_path: Path, mixed_tree) -> None:
+    unittest_file, pytest_file, migrated = mixed_tree
+    out = tmp_path / "out"
+
+    result = main_module.migrate(
+        [str(unittest_file), str(pytest_file)],
+        MigrationConfig(target_root=str(out), report_path=str(tmp_path / "report.jsonl")),
+    )
+
+    assert result.is_success()
+    assert migrated == ["test_unit.py"]
+    assert sorted(Path(p).name for p in result.data) == ["test_py.py", "test_unit.py"]
+    assert (out / "test_py.py").read_bytes() == pytest_file.read_bytes()
+    assert "assert self.value == 2" in (out / "test_unit.py").read_text(encoding="utf-8")
+    assert result.metadata["skipped"] == {str(pytest_file): ALREADY_PYTEST}
+    records = [json.loads(line) for line in (tmp_path / "report.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [(r["status"], r["skip_reason"]) for r in records] == [("success", None), ("success", ALREADY_PYTEST)]
+
+
+@pytest.mark.parametrize("pipeline_mode", ["sequential", "staged"])
+def test_non_candidates_are_skipped_in_place(mixed_tree, pipeline_mode: str) -> None:
+    unittest_file, pytest_file, migrated = mixed_tree
+
+    result = main_module.migrate(
+        [str(pytest_file), str(unittest_file)],
+        MigrationConfig(dry_run=True, pipeline_mode=pipeline_mode),
+    )
+
+    assert result.is_success()
+    assert [Path(p).name for p in result.data] == ["test_unit.py"]
+    assert result.metadata["skipped"] == {str(pytest_file): ALREADY_PYTEST}
+    assert pytest_file.read_text(encoding="utf-8") == PYTEST_SOURCE
+    if pipeline_mode == "sequential":
+        assert migrated == ["test_unit.py"]
@@ -110,3 +110,35 @@ def test_create_module_fixture_with_malformed_code():
     # Should handle exceptions gracefully
     assert isinstance(result, cst.FunctionDef)
     assert result.name.value == "setup_module"
+
+
+def test_create_instance_fixture_reuses_statement_nodes():
+    """Statement nodes are inserted as-is so comments survive."""
+    from splurge_unittest_to_pytest.transformers.fixture_transformer import create_instance_fixture
+
+    setup_stmt = cst.parse_statement("# prepare state\nself.value = 1  # initial\n")
+    teardown_stmt = cst.parse_statement("if self.value:\n    del self.value\n")
+
+    fixture = create_instance_fixture([setup_stmt], [teardown_stmt])
+
+    body = list(fixture.body.body)
+    assert body[0] is setup_stmt
+    assert body[-1] is teardown_stmt
+    rendered = cst.Module(body=[fixture]).code
+    assert "# prepare state" in rendered
+    assert "self.value = 1  # initial" in rendered
+
+
+def test_transform_preserves_comments_in_setup():
+    code = """
+class TestX(unittest.TestCase):
+    def setUp(self):
+        # build the fixture value
+        self.x = compute()  # expensive
+
+    def test_x(self):
+        self.assertEqual(self.x, 1)
+"""
+    out = UnittestToPytestCstTransformer().transform_code(code)
+    assert "# build the fixture value" in out
+    assert "self.x = compute()  # expensive" in out
@@ -0,0 +1,115 @@
+"""Unit tests for the per-function feature index."""
+
+from __future__ import annotations
+
+import textwrap
+
+import libcst as cst
+
+from splurge_unittest_to_pytest.transformers import parametrize_helper
+from splurge_unittest_to_pytest.transformers.function_index import FunctionFeatureIndex
+from splurge_unittest_to_pytest.transformers.parametrize_helper import (
+    ParametrizeOptions,
+    convert_subtest_loop_to_parametrize,
+)
+from splurge_unittest_to_pytest.transformers.subtest_transformer import body_uses_subtests
+
+
+def _body(source: str) -> list[cst.BaseStatement]:
+    func = cst.parse_statement(textwrap.dedent(source))
+    assert isinstance(func, cst.FunctionDef)
+    return list(func.body.body)
+
+
+def test_index_records_names_definitions_and_calls() -> None:
+    statements = _body(
+        """
+        def test_sample(self):
+            values = [1, 2]
+            size: int = 3
+            for value in values:
+                with self.subTest(value=value):
+                    self.assertEqual(value, size)
+            while False:
+                pass
+        """
+    )
+
+    index = FunctionFeatureIndex.build(statements)
+
+    assert index.name_uses["values"] == [0, 2]
+    assert index.name_uses["size"] == [1, 2]
+    assert index.name_defs == {"values": [0], "size": [1]}
+    assert index.names_assigned_before(2) == {"values", "size"}
+    assert index.names_assigned_before(1) == {"values"}
+    assert index.uses_with_call("self", "subTest")
+    assert [position for position, _ in index.subtest_calls] == [2]
+    assert [position for position, _ in index.assert_calls] == [2]
+    assert [type(loop).__name__ for _, loop in index.loops] == ["For", "While"]
+    assert index.name_used_outside("values", {0}) is True
+    assert index.name_used_outside("values", {0, 2}) is False
+
+
+def test_with_call_queries_cover_nested_branches() -> None:
+    statements = _body(
+        """
+        def test_sample(self, subtests, caplog):
+            if flag:
+                pass
+            else:
+                try:
+                    pass
+                except ValueError:
+                    with subtests.test(msg="x"):
+                        pass
+            with caplog.at_level("INFO"):
+                pass
+        """
+    )
+
+    index = FunctionFeatureIndex.build(statements)
+
+    assert body_uses_subtests(statements, index) is True
+    assert index.uses_with_call("caplog", "at_level")
+    assert not index.uses_with_call("self", "subTest")
+
+
+def test_removal_candidate_kept_when_used_inside_subtest_body() -> None:
+    source = """
+    def test_sample(self):
+        cases = [1, 2]
+        for case in cases:
+            with self.subTest(case=case):
+                self.assertTrue(cases)
+    """
+    func = cst.parse_statement(textwrap.dedent(source))
+
+    result = convert_subtest_loop_to_parametrize(func, func, ParametrizeOptions())
+
+    assert result is not None
+    rendered = cst.Module(body=[result]).code
+    assert "cases = [1, 2]" in rendered
+
+
+def test_removal_candidate_dropped_when_only_loop_uses_it() -> None:
+    source = """
+    def test_sample(self):
+        cases = [1, 2]
+        for case in cases:
+            with self.subTest(case=case):
+                self.assertTrue(case)
+    """
+    func = cst.parse_statement(textwrap.dedent(source))
+
+    result = convert_subtest_loop_to_parametrize(func, func, ParametrizeOptions())
+
+    assert result is not None
+    assert "cases = [1, 2]" not in cst.Module(body=[result]).code
+
+
+def test_name_helpers_agree_with_index() -> None:
+    node = cst.parse_statement("x = compute(y)\n")
+
+    assert parametrize_helper._node_contains_name(node, "y") is True
+    assert parametrize_helper._node_contains_name(node, "z") is False
+    assert parametrize_helper._collect_local_assignment_names([node, node], 1) == {"x"}
@@ -0,0 +1,126 @@
+"""Unit tests for the function-level transformation cache."""
+
+from __future__ import annotations
+
+import textwrap
+
+from splurge_unittest_to_pytest.transformers.function_cache import (
+    FunctionCacheEntry,
+    FunctionTransformCache,
+    get_function_cache,
+)
+from splurge_unittest_to_pytest.transformers.unittest_transformer import (
+    UnittestToPytestCstTransformer,
+)
+
+SOURCE = textwrap.dedent(
+    """
+    import unittest
+
+
+    class TestSample(unittest.TestCase):
+        def setUp(self):
+            self.value = 1
+
+        def test_equal(self):
+            self.assertEqual(self.value, 1)
+            with self.assertRaises(ValueError):
+                int("x")
+
+        def test_regex(self):
+            self.assertRegex("abc", "a")
+
+        def testLogs(self):
+            with self.assertLogs("pkg") as cm:
+                pass
+            self.assertIn("a", "abc")
+    """
+)
+
+
+def _transform(source: str, cache: FunctionTransformCache | None = None) -> str:
+    return UnittestToPytestCstTransformer(function_cache=cache).transform_code(source)
+
+
+def test_cached_output_matches_uncached_output() -> None:
+    cache = FunctionTransformCache()
+    expected = _transform(SOURCE)
+
+    first = _transform(SOURCE, cache)
+    second = _transform(SOURCE, cache)
+
+    assert first == expected
+    assert second == expected
+    # setUp is never cached; the three test methods are
+    assert len(cache) == 3
+    assert cache.hits == 3
+
+
+def test_cache_hit_replays_statement_replacements_and_imports() -> None:
+    cache = FunctionTransformCache()
+    _transform(SOURCE, cache)
+
+    result = _transform(SOURCE, cache)
+
+    assert "assert self.value == 1" in result
+    assert "pytest.raises(ValueError)" in result
+    assert "import re" in result
+    assert "self.assertEqual" not in result
+
+
+def test_edited_function_is_retransformed() -> None:
+    cache = FunctionTransformCache()
+    _transform(SOURCE, cache)
+    edited = SOURCE.replace('self.assertIn("a", "abc")', 'self.assertIn("b", "abc")')
+
+    result = _transform(edited, cache)
+
+    assert result == _transform(edited)
+    assert 'assert "b" in "abc"' in result
+    assert cache.hits == 2
+
+
+def test_shifted_function_reuses_entry_with_adjusted_positions() -> None:
+    cache = FunctionTransformCache()
+    _transform(SOURCE, cache)
+    shifted = SOURCE.replace("import unittest\n", "import os\nimport unittest\n")
+
+    result = _transform(shifted, cache)
+
+    assert result == _transform(shifted)
+    assert cache.hits == 3
+
+
+def test_context_change_misses_cache() -> None:
+    cache = FunctionTransformCache()
+    UnittestToPytestCstTransformer(function_cache=cache).transform_code(SOURCE)
+
+    UnittestToPytestCstTransformer(test_prefixes=["spec"], function_cache=cache).transform_code(SOURCE)
+
+    assert cache.hits == 0
+
+
+def test_lru_eviction_and_clear() -> None:
+    cache = FunctionTransformCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, FunctionCacheEntry(code="def f():\n    pass\n"))
+
+    assert "a" not in cache
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0 and cache.misses == 0
+
+
+def test_entry_parses_code_when_node_missing() -> None:
+    entry = FunctionCacheEntry(code="def f(x):\n    return x\n")
+
+    node = entry.to_node()
+
+    assert node.name.value == "f"
+    assert entry.to_node() is node
+
+
+def test_global_cache_is_shared() -> None:
+    assert get_function_cache() is get_function_cache()
@@ -0,0 +1,101 @@
+"""Tests for git-based changed-file discovery (``--since`` / ``--staged``)."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from splurge_unittest_to_pytest import cli
+from splurge_unittest_to_pytest.cli_helpers import validate_source_files_with_patterns
+from splurge_unittest_to_pytest.helpers.git_changes import (
+    GitChangesError,
+    changed_python_files,
+    filter_changed_files,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, unittest_source: str) -> Path:
+    """A repository with committed tests, one modified and one staged."""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    for name in ["tests/test_a.py", "tests/test_b.py", "tests/unit/test_c.py", "src/helpers.py"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(unittest_source, encoding="utf-8")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+
+    (tmp_path / "tests" / "test_a.py").write_text(unittest_source + "\n", encoding="utf-8")
+    (tmp_path / "tests" / "unit" / "test_c.py").write_text(unittest_source + "\n", encoding="utf-8")
+    (tmp_path / "src" / "helpers.py").write_text(unittest_source + "\n", encoding="utf-8")
+    (tmp_path / "README.md").write_text("notes\n", encoding="utf-8")
+    _git(tmp_path, "add", "tests/unit/test_c.py", "README.md")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_changed_python_files_reports_only_changed_python_files(repo: Path) -> None:
+    since_head = changed_python_files(since="HEAD")
+    staged = changed_python_files(staged=True)
+
+    assert sorted(Path(p).relative_to(repo.resolve()).as_posix() for p in since_head) == [
+        "src/helpers.py",
+        "tests/test_a.py",
+        "tests/unit/test_c.py",
+    ]
+    assert [Path(p).relative_to(repo.resolve()).as_posix() for p in staged] == ["tests/unit/test_c.py"]
+
+
+def test_changed_files_are_intersected_with_patterns_and_scope(repo: Path) -> None:
+    changed = changed_python_files(since="HEAD")
+
+    assert sorted(filter_changed_files(changed, [], None, ["test_*.py"])) == [
+        str(Path("tests/test_a.py")),
+        str(Path("tests/unit/test_c.py")),
+    ]
+    assert filter_changed_files(changed, [], "tests", ["test_*.py"], recurse=False) == [str(Path("tests/test_a.py"))]
+    assert filter_changed_files(changed, ["src/helpers.py"], None, ["test_*.py"]) == [str(Path("src/helpers.py"))]
+    assert filter_changed_files(changed, [], None, ["tests/**/test_*.py"]) == [str(Path("tests/unit/test_c.py"))]
+
+
+def test_validate_source_files_with_patterns_uses_git_when_asked(repo: Path) -> None:
+    assert validate_source_files_with_patterns([], None, ["test_*.py"], staged=True) == [
+        str(Path("tests/unit/test_c.py"))
+    ]
+
+
+def test_git_errors_are_reported(repo: Path) -> None:
+    with pytest.raises(GitChangesError):
+        changed_python_files(since="no-such-ref")
+    with pytest.raises(GitChangesError):
+        changed_python_files(since="--output=/tmp/x")
+    with pytest.raises(ValueError):
+        changed_python_files()
+
+
+def test_migrate_staged_dry_run_lists_only_staged_tests(repo: Path) -> None:
+    result = CliRunner().invoke(cli.app, ["migrate", "--staged", "--dry-run", "--list", "--posix"])
+
+    assert result.exit_code == 0
+    assert result.output.strip() == "== FILES: tests/unit/test_c.py =="
+
+
+def test_migrate_since_outside_a_repository_fails(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    monkeypatch.chdir(outside)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+
+    result = CliRunner().invoke(cli.app, ["migrate", "--since", "HEAD", "--dry-run"])
+
+    assert result.exit_code == 1
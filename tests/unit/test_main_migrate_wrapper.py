@@ -5,11 +5,23 @@ from pathlib import Path
 from splurge_unittest_to_pytest import main as main_module
 from splurge_unittest_to_pytest.result import Result, ResultStatus
 
+# Files without unittest code never reach the orchestrator, so use a unittest module
+UNITTEST_SOURCE = textwrap.dedent(
+    """\
+    import unittest
+
+
+    class TestSample(unittest.TestCase):
+        def test_ok(self):
+            self.assertTrue(True)
+    """
+)
+
 
 def test_main_migrate_file_success(monkeypatch, tmp_path: Path):
     # Create a temporary python test file
     f = tmp_path / "test_sample.py"
-    f.write_text("print('ok')")
+    f.write_text(UNITTEST_SOURCE)
 
     # Monkeypatch MigrationOrchestrator to return success for migrate_file
     class DummyResult:
@@ -32,7 +44,7 @@ def test_main_migrate_file_success(monkeypatch, tmp_path: Path):
 
 def test_main_migrate_file_failure(monkeypatch, tmp_path: Path):
     f = tmp_path / "test_sample.py"
-    f.write_text("print('ok')")
+    f.write_text(UNITTEST_SOURCE)
 
     class DummyResult:
         def __init__(self):
@@ -0,0 +1,174 @@
+"""Tests for the asyncio migration API."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from splurge_unittest_to_pytest import main as main_module
+from splurge_unittest_to_pytest.context import MigrationConfig
+from splurge_unittest_to_pytest.result import Result
+
+
+class _SlowOrchestrator:
+    """Stands in for ``MigrationOrchestrator`` and records concurrency."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.cancelled = 0
+
+    async def migrate_file_async(self, source_file: str, config: Any, **executors: Any) -> Result[str]:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+        return Result.success(source_file)
+
+
+class _WritingOrchestrator:
+    """Writes each file from the transform executor, like a direct-IO worker."""
+
+    def __init__(self, out: Path) -> None:
+        self.out = out
+        self.started = threading.Event()
+
+    async def migrate_file_async(
+        self, source_file: str, config: Any, *, transform_executor: Any, **executors: Any
+    ) -> Result[str]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(transform_executor, self._write, source_file)
+
+    def _write(self, source_file: str) -> Result[str]:
+        self.started.set()
+        time.sleep(0.2)
+        target = self.out / source_file
+        target.write_text("converted", encoding="utf-8")
+        return Result.success(str(target))
+
+
+def test_migrate_async_matches_the_synchronous_output(
+    tmp_path: Path, unittest_sources: Callable[..., list[str]]
+) -> None:
+    sources = unittest_sources(4)
+    sync_out, async_out = tmp_path / "sync", tmp_path / "async"
+
+    expected = main_module.migrate(sources, MigrationConfig(target_root=str(sync_out), generate_report=False))
+    result = asyncio.run(
+        main_module.migrate_async(
+            sources, MigrationConfig(target_root=str(async_out), generate_report=False), max_in_flight=2, workers=2
+        )
+    )
+
+    assert result.is_success()
+    assert [Path(p).name for p in result.data] == [Path(p).name for p in expected.data]
+    for path in expected.data:
+        assert (async_out / Path(path).name).read_text(encoding="utf-8") == Path(path).read_text(encoding="utf-8")
+
+
+def test_iter_migrate_async_yields_every_file_including_failures(
+    tmp_path: Path, unittest_sources: Callable[..., list[str]]
+) -> None:
+    sources = [*unittest_sources(2), str(tmp_path / "test_missing.py")]
+
+    async def collect() -> dict[str, Result[str]]:
+        config = MigrationConfig(dry_run=True)
+        return {source: result async for source, result in main_module.iter_migrate_async(sources, config)}
+
+    results = asyncio.run(collect())
+
+    assert set(results) == set(sources)
+    assert not results[sources[-1]].is_success()
+    for source in sources[:-1]:
+        assert "assert self.value == 2" in results[source].metadata["generated_code"]
+
+
+def test_migrate_async_fails_on_the_first_failing_file(
+    tmp_path: Path, unittest_sources: Callable[..., list[str]]
+) -> None:
+    sources = [str(tmp_path / "test_missing.py"), *unittest_sources(1)]
+
+    result = asyncio.run(main_module.migrate_async(sources, MigrationConfig(dry_run=True)))
+
+    assert not result.is_success()
+    assert isinstance(result.error, FileNotFoundError)
+
+
+def test_in_flight_files_are_bounded(tmp_path: Path) -> None:
+    orchestrator = _SlowOrchestrator(delay=0.01)
+
+    async def drain() -> list[str]:
+        results = main_module.iter_migrate_async(
+            [f"test_{i}.py" for i in range(20)], orchestrator=orchestrator, max_in_flight=3, workers=1
+        )
+        return [source async for source, _ in results]
+
+    assert len(asyncio.run(drain())) == 20
+    assert orchestrator.peak == 3
+
+
+def test_cancelling_the_consumer_cancels_files_in_flight() -> None:
+    orchestrator = _SlowOrchestrator(delay=30)
+
+    async def consume() -> None:
+        async for _ in main_module.iter_migrate_async(
+            [f"test_{i}.py" for i in range(10)], orchestrator=orchestrator, max_in_flight=4, workers=1
+        ):
+            pass
+
+    async def run() -> None:
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+    assert orchestrator.cancelled == 4
+    assert orchestrator.active == 0
+
+
+@pytest.mark.parametrize("caller_executor", [False, True])
+def test_started_writes_finish_before_the_iterator_closes(tmp_path: Path, caller_executor: bool) -> None:
+    orchestrator = _WritingOrchestrator(tmp_path)
+    executor = ThreadPoolExecutor(max_workers=1) if caller_executor else None
+
+    async def consume() -> None:
+        async for _ in main_module.iter_migrate_async(
+            [f"test_{i}.py" for i in range(4)],
+            orchestrator=orchestrator,
+            max_in_flight=2,
+            workers=1,
+            transform_executor=executor,
+        ):
+            pass
+
+    async def run() -> list[str]:
+        task = asyncio.create_task(consume())
+        await asyncio.get_running_loop().run_in_executor(None, orchestrator.started.wait)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return sorted(p.name for p in tmp_path.iterdir())
+
+    # The started file is complete on return and the queued one never runs
+    assert asyncio.run(asyncio.wait_for(run(), timeout=10)) == ["test_0.py"]
+    if executor is not None:
+        executor.shutdown(wait=True)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["test_0.py"]
@@ -0,0 +1,94 @@
+"""Tests for the streaming JSONL migration report."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from splurge_unittest_to_pytest import main as main_module
+from splurge_unittest_to_pytest.context import MigrationConfig
+from splurge_unittest_to_pytest.events import EventBus
+from splurge_unittest_to_pytest.migration_report import (
+    REPORT_FILENAME,
+    MigrationReportWriter,
+    iter_report_records,
+    render_report_summary,
+)
+from splurge_unittest_to_pytest.result import Result
+
+
+def test_migrate_writes_one_line_per_file(
+    tmp_path: Path, subtest_source: str, unittest_sources: Callable[..., list[str]]
+) -> None:
+    sources = unittest_sources(2, subtest_source)
+    config = MigrationConfig(target_root=str(tmp_path / "out"), format_output=False)
+
+    result = main_module.migrate(sources, config)
+
+    assert result.is_success()
+    assert result.metadata["report"] == str(tmp_path / "out" / REPORT_FILENAME)
+    records = list(iter_report_records(result.metadata["report"]))
+    assert [record["source"] for record in records] == sources
+    for record in records:
+        assert record["status"] == "success"
+        assert record["target"] == str(tmp_path / "out" / Path(record["source"]).name)
+        assert record["tier"] == "advanced"
+        assert sum(record["strategies"].values()) == 1
+        assert set(record["timings_ms"]) == {"decision_analysis", "collector", "formatter", "output"}
+        assert record["input_bytes"] == len(subtest_source)
+        assert record["output_bytes"] == Path(record["target"]).stat().st_size
+        assert record["error"] is None
+
+
+def test_dry_run_and_disabled_reports_write_nothing(
+    tmp_path: Path, subtest_source: str, unittest_sources: Callable[..., list[str]]
+) -> None:
+    sources = unittest_sources(1, subtest_source)
+
+    dry = main_module.migrate(sources, MigrationConfig(dry_run=True, format_output=False))
+    off = main_module.migrate(sources, MigrationConfig(generate_report=False, target_suffix="_pt", format_output=False))
+
+    assert "report" not in (dry.metadata or {})
+    assert "report" not in (off.metadata or {})
+    assert not (tmp_path / REPORT_FILENAME).exists()
+
+
+def test_explicit_report_path_covers_dry_runs(
+    tmp_path: Path, subtest_source: str, unittest_sources: Callable[..., list[str]]
+) -> None:
+    report = tmp_path / "reports" / "run.jsonl"
+    config = MigrationConfig(dry_run=True, report_path=str(report), format_output=False)
+
+    main_module.migrate(unittest_sources(1, subtest_source), config)
+
+    (record,) = iter_report_records(report)
+    assert record["dry_run"] is True
+    assert record["output_bytes"] > 0
+
+
+def test_writer_records_failures_and_releases_file_state(tmp_path: Path) -> None:
+    with MigrationReportWriter(tmp_path / "report.jsonl", EventBus()) as writer:
+        record = writer.record("missing.py", Result.failure(FileNotFoundError("missing.py")), MigrationConfig())
+
+        assert writer._stage_ms == {} and writer._details == {}
+
+    assert record["status"] == "failed"
+    assert record["error"] == "missing.py"
+    assert record["output_bytes"] is None
+    assert list(iter_report_records(tmp_path / "report.jsonl")) == [record]
+
+
+@pytest.mark.parametrize("report_format, suffix", [("markdown", ".md"), ("html", ".html")])
+def test_summary_is_rendered_from_the_jsonl(
+    tmp_path: Path, report_format: str, suffix: str, subtest_source: str, unittest_sources: Callable[..., list[str]]
+) -> None:
+    config = MigrationConfig(target_root=str(tmp_path / "out"), report_format=report_format, format_output=False)
+
+    result = main_module.migrate(unittest_sources(2, subtest_source), config)
+
+    summary = Path(result.metadata["report_summary"])
+    assert summary == (tmp_path / "out" / REPORT_FILENAME).with_suffix(suffix)
+    text = summary.read_text(encoding="utf-8")
+    assert "Migration Report" in text
+    assert text.count("test_numbers_") == 4
+    assert render_report_summary(result.metadata["report"], "json") is None
@@ -0,0 +1,51 @@
+import libcst as cst
+
+from splurge_unittest_to_pytest.transformers import node_factory as nodes
+from splurge_unittest_to_pytest.transformers.assert_ast_rewrites import transform_assert_equal, transform_assert_is_none
+from splurge_unittest_to_pytest.transformers.fixture_transformer import create_instance_fixture
+
+
+def _code(node: cst.CSTNode) -> str:
+    return cst.Module(body=[]).code_for_node(node)
+
+
+def test_names_and_dotted_paths_are_interned() -> None:
+    assert nodes.name("pytest") is nodes.name("pytest")
+    assert nodes.dotted_name("pytest.raises") is nodes.dotted_name("pytest.raises")
+    skip = nodes.dotted_name("pytest.mark.skip")
+    xfail = nodes.dotted_name("pytest.mark.xfail")
+    assert isinstance(skip, cst.Attribute) and isinstance(xfail, cst.Attribute)
+    assert skip.value is xfail.value is nodes.dotted_name("pytest.mark")
+    assert _code(skip) == "pytest.mark.skip"
+
+
+def test_fixture_decorators_are_shared_per_options() -> None:
+    assert nodes.fixture_decorator(autouse=True) is nodes.fixture_decorator(autouse=True)
+    assert _code(nodes.fixture_decorator()) == "@pytest.fixture\n"
+    assert _code(nodes.fixture_decorator(scope="class", autouse=True)) == (
+        '@pytest.fixture(scope = "class", autouse = True)\n'
+    )
+
+
+def test_builders_render_like_fresh_nodes() -> None:
+    args = [cst.Arg(value=cst.Name("ValueError")), nodes.keyword_arg("match", nodes.string('"x"'))]
+    call = nodes.call("pytest.raises", args)
+    assert _code(call) == 'pytest.raises(ValueError, match = "x")'
+    assert _code(nodes.assert_compare(cst.Name("a"), nodes.IS_NOT, nodes.name("None"))) == "assert a is not None"
+    assert _code(nodes.assert_not(cst.Name("flag"))) == "assert not flag"
+
+
+def test_shared_nodes_can_appear_many_times_in_one_module() -> None:
+    module = cst.parse_module("self.assertEqual(a, 1)\nself.assertIsNone(b)\nself.assertEqual(c, 2)\n")
+    body = []
+    for stmt in module.body:
+        call = stmt.body[0].value
+        rewrite = transform_assert_is_none if call.func.attr.value == "assertIsNone" else transform_assert_equal
+        body.append(cst.SimpleStatementLine(body=[rewrite(call)]))
+    fixture = create_instance_fixture([], [])
+
+    code = module.with_changes(body=[*body, fixture]).code
+
+    assert code.startswith("assert a == 1\nassert b is None\nassert c == 2\n")
+    assert "@pytest.fixture(autouse = True)\ndef setup_method(self):\n    yield\n" in code
+    assert fixture.decorators[0] is create_instance_fixture([], []).decorators[0]
@@ -0,0 +1,227 @@
+"""Tests for streaming parametrize table construction and module-level tables."""
+
+from __future__ import annotations
+
+import textwrap
+
+import libcst as cst
+
+from splurge_unittest_to_pytest.context import MigrationConfig
+from splurge_unittest_to_pytest.transformers.parametrize_helper import (
+    ParametrizeOptions,
+    convert_subtest_loop_to_parametrize,
+)
+from splurge_unittest_to_pytest.transformers.unittest_transformer import UnittestToPytestCstTransformer
+
+
+def _table_function(row_count: int, prelude: str = "") -> cst.FunctionDef:
+    rows = ", ".join(f"({i}, 'v{i}')" for i in range(row_count))
+    source = (
+        "def test_table(self):\n"
+        f"{prelude}"
+        f"    cases = [{rows}]\n"
+        "    for number, label in cases:\n"
+        "        with self.subTest(number=number, label=label):\n"
+        "            self.assertTrue(label)\n"
+    )
+    func = cst.parse_statement(source)
+    assert isinstance(func, cst.FunctionDef)
+    return func
+
+
+def _render(node: cst.CSTNode) -> str:
+    return cst.Module(body=[]).code_for_node(node)
+
+
+def test_large_table_is_converted_with_inferred_annotations() -> None:
+    func = _table_function(3000)
+
+    result = convert_subtest_loop_to_parametrize(func, func, ParametrizeOptions(parametrize_include_ids=False))
+
+    assert result is not None
+    call = result.decorators[0].decorator
+    assert isinstance(call, cst.Call)
+    data = call.args[1].value
+    assert isinstance(data, cst.List)
+    assert len(data.elements) == 3000
+    params = {param.name.value: param for param in result.params.params}
+    assert _render(params["number"].annotation.annotation) == "int"
+    assert _render(params["label"].annotation.annotation) == "str"
+    assert "cases = [" not in _render(result)
+
+
+def test_mixed_column_types_are_not_annotated() -> None:
+    func = cst.parse_statement(textwrap.dedent("""
+            def test_mixed(self):
+                for value in [1, "a"]:
+                    with self.subTest(value=value):
+                        self.assertTrue(value)
+            """))
+
+    result = convert_subtest_loop_to_parametrize(func, func, ParametrizeOptions())
+
+    assert result is not None
+    params = {param.name.value: param for param in result.params.params}
+    assert params["value"].annotation is None
+
+
+def test_constants_are_inlined_and_local_state_rejected() -> None:
+    source = _render(_table_function(2, prelude="    size = 3\n")).replace("(0, 'v0')", "(size, 'v0')")
+    func = cst.parse_statement(source)
+
+    result = convert_subtest_loop_to_parametrize(func, func, ParametrizeOptions())
+
+    assert result is not None
+    assert "(3, 'v0')" in _render(result)
+
+    rejected = cst.parse_statement(source.replace("size = 3", "size = compute()"))
+    assert convert_subtest_loop_to_parametrize(rejected, rejected, ParametrizeOptions()) is None
+
+
+def test_table_above_threshold_is_hoisted_to_module_constant() -> None:
+    func = _table_function(5)
+    tables: list[cst.SimpleStatementLine] = []
+    options = ParametrizeOptions(parametrize_table_threshold=3)
+
+    result = convert_subtest_loop_to_parametrize(func, func, options, module_tables=tables)
+
+    assert result is not None
+    assert len(tables) == 1
+    table_code = _render(tables[0])
+    assert table_code.startswith("_TEST_TABLE_PARAMS = [\n    (0, 'v0'),\n")
+    assert table_code.count("\n") == 7
+    decorator = _render(result.decorators[0])
+    assert '"number,label", _TEST_TABLE_PARAMS' in decorator
+    assert '[f"row_{i}" for i in range(5)]' in decorator
+
+
+def test_table_at_threshold_stays_inline() -> None:
+    func = _table_function(3)
+    tables: list[cst.SimpleStatementLine] = []
+
+    result = convert_subtest_loop_to_parametrize(
+        func, func, ParametrizeOptions(parametrize_table_threshold=3), module_tables=tables
+    )
+
+    assert result is not None
+    assert tables == []
+
+
+def test_transformer_inserts_hoisted_tables_after_imports() -> None:
+    rows = ", ".join(f"({i}, {i * 2})" for i in range(4))
+    source = textwrap.dedent(f"""
+        import unittest
+
+
+        class TestDoubling(unittest.TestCase):
+            def test_double(self):
+                for value, expected in [{rows}]:
+                    with self.subTest(value=value):
+                        self.assertEqual(value * 2, expected)
+
+            def test_double_again(self):
+                for value, expected in [{rows}]:
+                    with self.subTest(value=value):
+                        self.assertEqual(expected, value * 2)
+        """)
+    transformer = UnittestToPytestCstTransformer(parametrize_table_threshold=2)
+
+    result = transformer.transform_code(source)
+
+    compile(result, "<generated>", "exec")
+    assert result.index("_TEST_DOUBLE_PARAMS = [") < result.index("class TestDoubling")
+    assert "_TEST_DOUBLE_AGAIN_PARAMS = [" in result
+    assert '@pytest.mark.parametrize("value,expected", _TEST_DOUBLE_PARAMS' in result
+    assert transformer.parametrize_tables == []
+
+
+def test_hoisted_table_follows_module_names_its_rows_use() -> None:
+    source = textwrap.dedent("""
+        import unittest
+
+        SENTINEL = object()
+
+
+        class TestRows(unittest.TestCase):
+            def test_rows(self):
+                for value, marker in [(1, SENTINEL), (2, SENTINEL), (3, SENTINEL)]:
+                    with self.subTest(value=value):
+                        self.assertIs(marker, SENTINEL)
+        """)
+
+    result = UnittestToPytestCstTransformer(parametrize_table_threshold=2).transform_code(source)
+
+    assert result.index("SENTINEL = object()") < result.index("_TEST_ROWS_PARAMS = [") < result.index("class TestRows")
+    namespace: dict[str, object] = {}
+    exec(compile(result, "<generated>", "exec"), namespace)
+    test_class = namespace["TestRows"]
+    assert isinstance(test_class, type)
+    test_class().test_rows(1, namespace["SENTINEL"])
+
+
+def test_transformer_reads_threshold_from_config() -> None:
+    transformer = UnittestToPytestCstTransformer(config=MigrationConfig(parametrize_table_threshold=10))
+
+    assert transformer.parametrize_table_threshold == 10
+
+
+def test_hoisted_table_name_avoids_names_the_module_binds() -> None:
+    rows = ", ".join(f"({i}, {i * 2})" for i in range(4))
+    source = textwrap.dedent(f"""
+        import unittest
+
+        from fractions import Fraction as _TEST_DOUBLE_PARAMS_3
+
+        _TEST_DOUBLE_PARAMS = "user data"
+
+
+        def _TEST_DOUBLE_PARAMS_2():
+            pass
+
+
+        class TestDoubling(unittest.TestCase):
+            def test_double(self):
+                for value, expected in [{rows}]:
+                    with self.subTest(value=value):
+                        self.assertEqual(value * 2, expected)
+        """)
+    transformer = UnittestToPytestCstTransformer(parametrize_table_threshold=2)
+
+    result = transformer.transform_code(source)
+
+    assert '@pytest.mark.parametrize("value,expected", _TEST_DOUBLE_PARAMS_4' in result
+    namespace: dict[str, object] = {}
+    exec(compile(result, "<generated>", "exec"), namespace)
+    assert namespace["_TEST_DOUBLE_PARAMS"] == "user data"
+    assert namespace["_TEST_DOUBLE_PARAMS_4"] == [(i, i * 2) for i in range(4)]
+
+
+def test_hoisted_tables_are_placed_before_their_own_classes() -> None:
+    rows = ", ".join(f"({i}, {i * 2})" for i in range(4))
+    classes = "".join(f"""
+        class Test{name}(unittest.TestCase):
+            def test_{name.lower()}(self):
+                for value, expected in [{rows}]:
+                    with self.subTest(value=value):
+                        self.assertEqual(value * 2, expected)
+
+            def test_{name.lower()}_again(self):
+                for value, expected in [{rows}]:
+                    with self.subTest(value=value):
+                        self.assertEqual(expected, value * 2)
+
+        """ for name in ("First", "Second"))
+    source = "import unittest\n" + textwrap.dedent(classes)
+
+    result = UnittestToPytestCstTransformer(parametrize_table_threshold=2).transform_code(source)
+
+    compile(result, "<generated>", "exec")
+    order = [
+        "_TEST_FIRST_PARAMS = [",
+        "_TEST_FIRST_AGAIN_PARAMS = [",
+        "class TestFirst",
+        "_TEST_SECOND_PARAMS = [",
+        "_TEST_SECOND_AGAIN_PARAMS = [",
+        "class TestSecond",
+    ]
+    assert [result.index(marker) for marker in order] == sorted(result.index(marker) for marker in order)
@@ -0,0 +1,145 @@
+"""Tests for the CST pass manager."""
+
+import libcst as cst
+
+from splurge_unittest_to_pytest.transformers.import_transformer import (
+    add_pytest_imports,
+    remove_unittest_imports_if_unused,
+)
+from splurge_unittest_to_pytest.transformers.pass_manager import CSTPass, PassManager
+from splurge_unittest_to_pytest.transformers.unittest_transformer import (
+    UnittestToPytestCstTransformer,
+    _NormalizeClassBases,
+    _NormalizeTestMethodNames,
+    _RemoveUnittestTestCaseBases,
+)
+
+SOURCE = """\
+class TestA(unittest.TestCase):
+    def testOne(self):
+        pass
+
+    def helper(self):
+        pass
+
+
+class Plain(Base, unittest.TestCase):
+    def testTwo(self):
+        pass
+"""
+
+
+def _inheritance_passes() -> list[CSTPass]:
+    return [
+        _RemoveUnittestTestCaseBases(),
+        _NormalizeClassBases(),
+        _NormalizeTestMethodNames(unittest_classes={"TestA"}, test_prefixes=["test"]),
+    ]
+
+
+class _CountFunctions(CSTPass):
+    interests = frozenset({"FunctionDef"})
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.names: list[str] = []
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
+        self.names.append(node.name.value)
+
+
+class _SkipPlainClass(CSTPass):
+    interests = frozenset({"ClassDef", "FunctionDef"})
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.seen: list[str] = []
+
+    def visit_ClassDef(self, node: cst.ClassDef) -> bool:
+        return node.name.value != "Plain"
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> None:
+        self.seen.append(node.name.value)
+
+
+class _RenameAfterAll(CSTPass):
+    interests = frozenset({"ClassDef"})
+    barrier = True
+
+    def leave_ClassDef(self, original_node: cst.ClassDef, updated_node: cst.ClassDef) -> cst.ClassDef:
+        return updated_node.with_changes(name=cst.Name(value=updated_node.name.value + "Fixed"))
+
+
+def test_fused_passes_match_sequential_runs() -> None:
+    module = cst.parse_module(SOURCE)
+    sequential = module
+    for pass_ in _inheritance_passes():
+        sequential = sequential.visit(pass_)
+
+    manager = PassManager(_inheritance_passes())
+    fused = manager.run(module)
+
+    assert fused.code == sequential.code
+    assert "class TestA:" in fused.code and "def test_One(self):" in fused.code
+    assert "class Plain(Base):" in fused.code
+    assert manager.traversals == 1
+
+
+def test_barrier_pass_runs_in_its_own_traversal() -> None:
+    counter = _CountFunctions()
+    manager = PassManager([*_inheritance_passes(), counter, _RenameAfterAll()])
+
+    assert [len(group) for group in manager.groups()] == [4, 1]
+    result = manager.run(cst.parse_module(SOURCE))
+
+    assert manager.traversals == 2
+    assert counter.names == ["testOne", "helper", "testTwo"]
+    assert "class TestAFixed:" in result.code
+
+
+def test_visit_returning_false_only_skips_that_pass() -> None:
+    skipper = _SkipPlainClass()
+    counter = _CountFunctions()
+
+    PassManager([skipper, counter]).run(cst.parse_module(SOURCE))
+
+    assert skipper.seen == ["testOne", "helper"]
+    assert counter.names == ["testOne", "helper", "testTwo"]
+
+
+def test_report_lists_each_pass_with_its_group_and_time() -> None:
+    manager = PassManager([*_inheritance_passes(), _RenameAfterAll()])
+    manager.run(cst.parse_module(SOURCE))
+
+    report = manager.report()
+
+    assert [(row["name"], row["group"]) for row in report] == [
+        ("_RemoveUnittestTestCaseBases", 0),
+        ("_NormalizeClassBases", 0),
+        ("_NormalizeTestMethodNames", 0),
+        ("_RenameAfterAll", 1),
+    ]
+    assert all(row["seconds"] >= 0.0 for row in report)
+
+
+def test_transformer_records_inheritance_pass_timings() -> None:
+    transformer = UnittestToPytestCstTransformer()
+    result = transformer.transform_code(
+        "import unittest\n\nclass TestA(unittest.TestCase):\n    def testOne(self):\n        self.assertTrue(1)\n"
+    )
+
+    assert "class TestA:" in result
+    assert set(transformer.pass_timings) >= {
+        "_RemoveUnittestTestCaseBases",
+        "_NormalizeClassBases",
+        "_NormalizeTestMethodNames",
+    }
+
+
+def test_import_helpers_accept_facts_from_a_fused_traversal() -> None:
+    code = "import unittest\n\nclass A:\n    pass\n"
+
+    assert "import pytest" not in add_pytest_imports(code, dynamic_imports={"pytest"})
+    assert "import pytest" in add_pytest_imports(code, dynamic_imports=set())
+    assert remove_unittest_imports_if_unused(code, unittest_used=True) == code
+    assert "import unittest" not in remove_unittest_imports_if_unused(code, unittest_used=False)
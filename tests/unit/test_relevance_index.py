@@ -0,0 +1,92 @@
+"""Tests for the per-module relevance index and subtree skipping."""
+
+import sys
+
+import libcst as cst
+
+from splurge_unittest_to_pytest.transformers.relevance_index import build_relevant_statement_index
+from splurge_unittest_to_pytest.transformers.unittest_transformer import UnittestToPytestCstTransformer
+
+SOURCE = """\
+import unittest
+from re import search
+
+TABLE = {"a": [1, 2, 3], "b": [4, 5, 6]}
+
+
+def helper(x):
+    total = sum(TABLE["a"]) + x
+    if total > 3:
+        total -= 1
+    return total
+
+
+class TestThing(unittest.TestCase):
+    def test_value(self):
+        value = helper(1)
+        self.assertEqual(value, 6)
+"""
+
+
+def _statement(module: cst.Module, code: str) -> cst.CSTNode:
+    for node in _walk_statements(module.body):
+        if module.code_for_node(node).strip().startswith(code):
+            return node
+    raise AssertionError(code)
+
+
+def _walk_statements(body):
+    for stmt in body:
+        yield stmt
+        inner = getattr(getattr(stmt, "body", None), "body", None)
+        if isinstance(inner, (list, tuple)):
+            yield from _walk_statements(inner)
+
+
+def test_index_marks_only_statements_with_test_features() -> None:
+    module = cst.parse_module(SOURCE)
+    relevant = build_relevant_statement_index(module)
+
+    def is_relevant(code: str) -> bool:
+        return id(_statement(module, code)) in relevant
+
+    assert is_relevant("import unittest")
+    assert is_relevant("from re import search")
+    assert is_relevant("def helper")
+    assert is_relevant("class TestThing")
+    assert is_relevant("self.assertEqual")
+    assert not is_relevant("TABLE =")
+    assert not is_relevant("total = sum")
+    assert not is_relevant("if total > 3")
+    assert not is_relevant("value = helper(1)")
+
+
+def test_irrelevant_statements_are_not_visited() -> None:
+    visited: list[type] = []
+
+    class Recording(UnittestToPytestCstTransformer):
+        def visit_Dict(self, node: cst.Dict) -> bool:
+            visited.append(type(node))
+            return True
+
+        def visit_Comparison(self, node: cst.Comparison) -> bool:
+            visited.append(type(node))
+            return True
+
+    result = Recording().transform_code(SOURCE)
+
+    assert visited == []
+    assert 'TABLE = {"a": [1, 2, 3], "b": [4, 5, 6]}' in result
+    assert "assert value == 6" in result
+
+
+def test_index_handles_nesting_beyond_recursion_limit() -> None:
+    depth = sys.getrecursionlimit() // 8
+    expr = "x"
+    for _ in range(depth):
+        expr = f"({expr} + 1)"
+    module = cst.parse_module(f"value = {expr}\nself.assertTrue(value)\n")
+
+    relevant = build_relevant_statement_index(module)
+
+    assert [id(stmt) in relevant for stmt in module.body] == [False, True]
@@ -0,0 +1,105 @@
+"""Tests for the repository readiness analysis and the ``analyze`` command."""
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from splurge_unittest_to_pytest import main
+from splurge_unittest_to_pytest.cli import app
+from splurge_unittest_to_pytest.repository_analysis import EFFORT_MINUTES, analyze_file, analyze_repository
+
+UNITTEST_SOURCE = """\
+import unittest
+
+
+class TestThing(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.value = 1
+        self.addCleanup(print)
+
+    def test_value(self):
+        self.assertEqual(self.value, 1)
+        self.assertTrue(self.value)
+        for item in [1, 2]:
+            with self.subTest(item=item):
+                self.assertIn(item, [1, 2])
+
+
+class TestDerived(TestThing):
+    def test_more(self):
+        self.assertEqual(2, 2)
+"""
+
+
+def _write_tree(root: Path) -> None:
+    (root / "pkg").mkdir()
+    (root / "test_thing.py").write_text(UNITTEST_SOURCE, encoding="utf-8")
+    (root / "pkg" / "test_plain.py").write_text("def test_plain():\n    assert True\n", encoding="utf-8")
+    (root / "pkg" / "test_broken.py").write_text("def broken(:\n", encoding="utf-8")
+
+
+def test_analyze_file_counts_ir_and_features(tmp_path: Path) -> None:
+    _write_tree(tmp_path)
+
+    result = analyze_file(str(tmp_path / "test_thing.py"))
+
+    assert result.error is None
+    assert (result.test_classes, result.test_methods, result.fixtures, result.subtests) == (2, 2, 1, 1)
+    assert result.assertions == {"assertEqual": 2, "assertTrue": 1, "assertIn": 1}
+    assert result.unsupported == {"maxDiff": 1, "addCleanup": 1}
+    assert result.effort_minutes == (
+        EFFORT_MINUTES["file"]
+        + 4 * EFFORT_MINUTES["assertion"]
+        + EFFORT_MINUTES["fixture"]
+        + EFFORT_MINUTES["subtest"]
+        + 2 * EFFORT_MINUTES["unsupported"]
+    )
+
+
+def test_analyze_file_records_parse_errors_and_non_unittest_files(tmp_path: Path) -> None:
+    _write_tree(tmp_path)
+
+    broken = analyze_file(str(tmp_path / "pkg" / "test_broken.py"))
+    plain = analyze_file(str(tmp_path / "pkg" / "test_plain.py"))
+
+    assert broken.error is not None and broken.error.startswith("ParserSyntaxError")
+    assert broken.effort_minutes == EFFORT_MINUTES["parse_error"]
+    assert plain.error is None and not plain.is_unittest and plain.effort_minutes == 0.0
+
+
+def test_parallel_and_in_process_analysis_agree(tmp_path: Path) -> None:
+    _write_tree(tmp_path)
+    files = [str(p) for p in sorted(tmp_path.rglob("*.py"))]
+
+    sequential = analyze_repository(files, workers=1)
+    parallel = analyze_repository(files, workers=2)
+
+    assert sequential.workers == 1
+    assert [f.path for f in parallel.files] == files
+    assert parallel.to_dict()["files"] == sequential.to_dict()["files"]
+    assert sequential.to_dict()["summary"]["unittest_files"] == 1
+
+
+def test_main_analyze_warns_about_unparseable_files(tmp_path: Path) -> None:
+    _write_tree(tmp_path)
+
+    result = main.analyze([str(tmp_path / "test_thing.py"), str(tmp_path / "pkg" / "test_broken.py")], workers=1)
+
+    assert result.is_warning()
+    assert result.metadata["failed_files"] == [str(tmp_path / "pkg" / "test_broken.py")]
+    assert result.data.assertion_counts()["assertEqual"] == 2
+
+
+def test_analyze_command_searches_directories_without_writing(tmp_path: Path) -> None:
+    _write_tree(tmp_path)
+    before = {p: p.read_bytes() for p in tmp_path.rglob("*") if p.is_file()}
+
+    result = CliRunner().invoke(app, ["analyze", str(tmp_path), "--workers", "1", "--json"])
+
+    assert result.exit_code == 0, result.output
+    summary = json.loads(result.output)["summary"]
+    assert (summary["files"], summary["failed_files"], summary["subtests"]) == (3, 1, 1)
+    assert {p: p.read_bytes() for p in tmp_path.rglob("*") if p.is_file()} == before
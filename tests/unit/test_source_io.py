@@ -0,0 +1,106 @@
+"""Tests for encoding-aware, single-read source ingestion."""
+
+from pathlib import Path
+
+import pytest
+
+from splurge_unittest_to_pytest import main as main_module
+from splurge_unittest_to_pytest.cli_helpers import detect_test_prefixes_from_files
+from splurge_unittest_to_pytest.context import MigrationConfig
+from splurge_unittest_to_pytest.detectors import UnittestFileDetector, classify_file
+from splurge_unittest_to_pytest.helpers.source_io import (
+    decode_source,
+    encode_source,
+    read_source,
+    source_cache,
+    source_exists,
+)
+
+LATIN1_SOURCE = """\
+# -*- coding: latin-1 -*-
+import unittest
+
+
+class TestCafe(unittest.TestCase):
+    def test_name(self):
+        self.assertEqual("café", "caf\\xe9")
+"""
+
+
+@pytest.mark.parametrize(
+    "data, text, encoding, newline",
+    [
+        (b"x = 1\ny = 2\n", "x = 1\ny = 2\n", "utf-8", "\n"),
+        (b"x = 1\r\ny = 2\r\n", "x = 1\ny = 2\n", "utf-8", "\r\n"),
+        (b"x = 1\ry = 2\r", "x = 1\ny = 2\n", "utf-8", "\r"),
+        (b"\xef\xbb\xbfx = 'caf\xc3\xa9'\n", "x = 'café'\n", "utf-8-sig", "\n"),
+        (b"# coding: latin-1\nx = 'caf\xe9'\n", "# coding: latin-1\nx = 'café'\n", "iso-8859-1", "\n"),
+        (b"# coding: nonsense\nx = 1\n", "# coding: nonsense\nx = 1\n", "utf-8", "\n"),
+    ],
+)
+def test_decode_source(data: bytes, text: str, encoding: str, newline: str) -> None:
+    assert decode_source(data) == (text, encoding, newline)
+    assert encode_source(text, encoding, newline) == data
+
+
+def test_decode_source_rejects_bytes_invalid_in_declared_encoding() -> None:
+    with pytest.raises(UnicodeDecodeError):
+        decode_source(b"x = 'caf\xe9'\n")
+
+
+def test_consumers_share_one_read_per_run(tmp_path: Path) -> None:
+    path = tmp_path / "test_cafe.py"
+    path.write_bytes(LATIN1_SOURCE.encode("latin-1"))
+
+    with source_cache() as cache:
+        assert UnittestFileDetector().is_unittest_file(path)
+        assert classify_file(path).is_candidate
+        assert detect_test_prefixes_from_files([str(path)]) == ["test_"]
+        with source_cache() as nested:
+            assert nested is cache
+            assert read_source(str(path)).encoding == "iso-8859-1"
+        assert source_exists(path)
+
+    assert (cache.reads, cache.hits) == (1, 3)
+    path.unlink()
+    assert not source_exists(path)
+
+
+def test_read_source_without_cache_reads_each_time(tmp_path: Path) -> None:
+    path = tmp_path / "module.py"
+    path.write_text("x = 1\n", encoding="utf-8")
+    assert read_source(path).text == "x = 1\n"
+
+    path.write_text("x = 2\n", encoding="utf-8")
+    assert read_source(path).text == "x = 2\n"
+
+
+@pytest.mark.parametrize("preserve", [True, False])
+def test_migrate_writes_source_encoding_and_newlines(tmp_path: Path, preserve: bool) -> None:
+    source = tmp_path / "test_cafe.py"
+    source.write_bytes(LATIN1_SOURCE.replace("\n", "\r\n").encode("latin-1"))
+    out = tmp_path / "out"
+
+    result = main_module.migrate([str(source)], MigrationConfig(target_root=str(out), preserve_file_encoding=preserve))
+
+    assert result.is_success()
+    data = (out / "test_cafe.py").read_bytes()
+    if preserve:
+        assert data.startswith(b"# -*- coding: latin-1 -*-\r\nimport pytest\r\n")
+        assert "café" in data.decode("latin-1")
+        assert b"\n" not in data.replace(b"\r\n", b"")
+    else:
+        assert b"\r" not in data
+        assert "café" in data.decode("utf-8")
+
+
+def test_migrate_in_place_keeps_bom(tmp_path: Path) -> None:
+    source = tmp_path / "test_bom.py"
+    source.write_bytes(b"\xef\xbb\xbf" + LATIN1_SOURCE.split("\n", 1)[1].encode("utf-8"))
+
+    result = main_module.migrate([str(source)])
+
+    assert result.is_success()
+    data = source.read_bytes()
+    assert data.startswith(b"\xef\xbb\xbfimport pytest\n")
+    assert "café" in data.decode("utf-8-sig")
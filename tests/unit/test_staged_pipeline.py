@@ -0,0 +1,86 @@
+"""Tests for the staged multi-file pipeline."""
+
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from splurge_unittest_to_pytest import main as main_module
+from splurge_unittest_to_pytest.context import MigrationConfig
+from splurge_unittest_to_pytest.staged_pipeline import STAGE_NAMES, StagedMigrationPipeline
+
+
+def test_staged_migrate_matches_the_sequential_output(
+    tmp_path: Path, unittest_sources: Callable[..., list[str]]
+) -> None:
+    sources = unittest_sources(5)
+    sequential_out, staged_out = tmp_path / "sequential", tmp_path / "staged"
+
+    expected = main_module.migrate(sources, MigrationConfig(target_root=str(sequential_out), generate_report=False))
+    result = main_module.migrate(
+        sources,
+        MigrationConfig(
+            target_root=str(staged_out), generate_report=False, pipeline_mode="staged", max_concurrent_files=2
+        ),
+    )
+
+    assert result.is_success()
+    assert [Path(p).name for p in result.data] == [Path(p).name for p in expected.data]
+    for path in expected.data:
+        assert (staged_out / Path(path).name).read_text(encoding="utf-8") == Path(path).read_text(encoding="utf-8")
+
+
+def test_stage_metrics_are_reported(unittest_sources: Callable[..., list[str]]) -> None:
+    sources = unittest_sources(4)
+
+    result = main_module.migrate(sources, MigrationConfig(dry_run=True, pipeline_mode="staged"))
+
+    metrics = result.metadata["stage_metrics"]
+    assert list(metrics) == list(STAGE_NAMES)
+    for stage in metrics.values():
+        assert stage["processed"] == 4
+        assert stage["failed"] == 0
+        assert 0.0 <= stage["utilization"] <= 1.0
+        assert 1 <= stage["max_queue_depth"] <= stage["queue_capacity"]
+    assert len(result.metadata["generated_code"]) == 4
+
+
+def test_failing_files_are_yielded_and_stop_staged_migrate(
+    tmp_path: Path, unittest_sources: Callable[..., list[str]]
+) -> None:
+    broken = tmp_path / "test_broken.py"
+    broken.write_text("class Broken(:\n", encoding="utf-8")
+    sources = [*unittest_sources(2), str(tmp_path / "test_missing.py"), str(broken)]
+
+    results = dict(StagedMigrationPipeline(MigrationConfig(dry_run=True)).run(sources))
+
+    assert set(results) == set(sources)
+    assert [results[source].is_success() for source in sources] == [True, True, False, False]
+    assert not main_module.migrate(sources, MigrationConfig(dry_run=True, pipeline_mode="staged")).is_success()
+
+
+def test_closing_the_iterator_early_stops_every_stage(unittest_sources: Callable[..., list[str]]) -> None:
+    sources = unittest_sources(12)
+    pipeline = StagedMigrationPipeline(MigrationConfig(dry_run=True), queue_size=1, prefetch=1)
+
+    results = pipeline.run(sources)
+    next(results)
+    results.close()
+
+    assert not [t for t in threading.enumerate() if t.name.startswith("splurge-")]
+    assert pipeline.metrics()["read"]["processed"] < len(sources)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"stage_workers": {"parse": 2}}, {"stage_workers": {"output": 0}}, {"queue_size": 0}, {"prefetch": 0}],
+)
+def test_invalid_stage_settings_are_rejected(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        StagedMigrationPipeline(**kwargs)
+
+
+def test_unknown_pipeline_mode_is_rejected() -> None:
+    with pytest.raises(ValueError, match="pipeline_mode"):
+        MigrationConfig.from_dict({"pipeline_mode": "parallel"})
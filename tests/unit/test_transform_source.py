@@ -0,0 +1,79 @@
+"""Tests for in-memory conversion and the CLI stdin mode."""
+
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from splurge_unittest_to_pytest import cli
+from splurge_unittest_to_pytest import main as main_module
+from splurge_unittest_to_pytest.context import MigrationConfig
+
+
+def test_transform_source_converts_without_touching_the_filesystem(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    unittest_source: str,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    config = MigrationConfig(
+        decision_model_dir=str(tmp_path / "models"),
+        cache_analysis_results=True,
+        generate_report=True,
+        target_root=str(tmp_path / "out"),
+    )
+
+    result = main_module.transform_source(unittest_source, config)
+
+    assert result.is_success()
+    assert "assert self.value == 2" in result.data
+    assert "unittest.TestCase" not in result.data
+    assert os.listdir(tmp_path) == []
+
+
+def test_transform_source_reports_invalid_code() -> None:
+    result = main_module.transform_source("class Broken(:\n")
+
+    assert not result.is_success()
+    assert result.error is not None
+
+
+def test_migrate_dash_reads_stdin_and_writes_stdout(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, unittest_source: str
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(cli.app, ["migrate", "-", "--no-format"], input=unittest_source)
+
+    assert result.exit_code == 0
+    assert result.stdout == main_module.transform_source(unittest_source, MigrationConfig(format_output=False)).data
+    assert os.listdir(tmp_path) == []
+
+
+def test_stdin_flag_with_diff_writes_a_unified_diff(unittest_source: str) -> None:
+    result = CliRunner().invoke(cli.app, ["migrate", "--stdin", "--diff"], input=unittest_source)
+
+    assert result.exit_code == 0
+    assert result.stdout.startswith("--- stdin\n+++ stdout\n")
+    assert "+        assert self.value == 2\n" in result.stdout
+
+
+@pytest.mark.parametrize(
+    "args, code",
+    [
+        (["migrate", "--stdin", "tests/test_a.py"], 2),
+        (["migrate"], 2),
+    ],
+)
+def test_stdin_mode_argument_errors(args: list[str], code: int, unittest_source: str) -> None:
+    result = CliRunner().invoke(cli.app, args, input=unittest_source)
+
+    assert result.exit_code == code
+
+
+def test_stdin_conversion_errors_exit_non_zero() -> None:
+    result = CliRunner().invoke(cli.app, ["migrate", "-"], input="class Broken(:\n")
+
+    assert result.exit_code == 1
+    assert result.stdout == ""
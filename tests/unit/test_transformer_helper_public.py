@@ -5,6 +5,7 @@ import libcst as cst
 from splurge_unittest_to_pytest.transformers.transformer_helper import (
     ReplacementApplier,
     ReplacementRegistry,
+    build_statement_replacement,
     wrap_small_stmt_if_needed,
 )
 
@@ -70,3 +71,28 @@ def test_wrap_small_stmt_if_needed_variants():
     expr = cst.Integer(value="3")
     w2 = wrap_small_stmt_if_needed(expr)
     assert isinstance(w2, cst.SimpleStatementLine)
+
+
+def test_replacement_registry_node_identity_round_trip():
+    registry = ReplacementRegistry()
+    call = cst.Call(func=cst.Name("f"))
+    twin = cst.Call(func=cst.Name("f"))
+    repl = cst.Assert(test=cst.Name("x"))
+
+    registry.record_node(call, repl)
+
+    assert registry.pop_node(twin) is None
+    assert registry.pop_node(call) is repl
+    assert registry.pop_node(call) is None
+
+
+def test_build_statement_replacement_preserves_leading_lines():
+    comment = cst.EmptyLine(comment=cst.Comment("# keep"))
+    line = cst.SimpleStatementLine(body=[cst.Expr(cst.Call(func=cst.Name("f")))], leading_lines=[comment])
+
+    wrapped = build_statement_replacement(line, cst.Assert(test=cst.Name("x")))
+    assert isinstance(wrapped, cst.SimpleStatementLine)
+    assert list(wrapped.leading_lines) == [comment]
+
+    compound = cst.If(test=cst.Name("x"), body=cst.IndentedBlock(body=[cst.SimpleStatementLine(body=[cst.Pass()])]))
+    assert build_statement_replacement(line, compound) is compound
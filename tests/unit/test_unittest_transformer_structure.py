@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import libcst as cst
 import pytest
-from libcst.metadata import MetadataWrapper, PositionProvider
 
 from splurge_unittest_to_pytest.transformers.unittest_transformer import (
     UnittestToPytestCstTransformer,
@@ -109,26 +108,65 @@ def test_visit_functiondef_populates_fixture_state() -> None:
 
     transformer.visit_FunctionDef(function)
     try:
-        assert transformer.fixture_state.instance_setup == ["value = 1"]
+        # The original statement nodes are collected, not rendered strings
+        assert transformer.fixture_state.instance_setup == list(function.body.body)
+        assert [_render_statement(stmt) for stmt in transformer.fixture_state.instance_setup] == ["value = 1"]
     finally:
         transformer.leave_FunctionDef(function, function)
 
 
+def test_per_class_accessors_are_read_only_views_over_class_records() -> None:
+    transformer = UnittestToPytestCstTransformer()
+    state = transformer.fixture_state
+    record = state.record_for("Sample")
+    state.record_for("Empty")
+
+    state.extend_class_buffer("Sample", "setup", ["self.value = 1"])
+    state.extend_class_buffer("Empty", "teardown", [])
+
+    assert state.record_for("Sample") is record
+    assert record.setup == ["self.value = 1"]
+    assert transformer._per_class_setup == {"Sample": ("self.value = 1",)}
+    assert "Empty" not in state.per_class_setup
+    assert len(state.per_class_teardown) == 0
+    with pytest.raises(AttributeError):
+        state.per_class_setup["Sample"].append("self.value = 2")  # type: ignore[attr-defined]
+    assert record.setup == ["self.value = 1"]
+    with pytest.raises(TypeError):
+        state.per_class_setup["Other"] = []  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        transformer._per_class_setup = {}  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        record.extra = []  # type: ignore[attr-defined]
+
+
+def test_fixture_setters_replace_buffers_in_place() -> None:
+    transformer = UnittestToPytestCstTransformer()
+    buffer = transformer.fixture_state.instance_setup
+
+    transformer.setup_code = ["self.value = 1"]
+
+    assert transformer.fixture_state.instance_setup is buffer
+    assert buffer == ["self.value = 1"]
+
+
 def test_leave_module_clears_per_class_state_after_fixture_insertion() -> None:
     transformer = UnittestToPytestCstTransformer()
-    transformer.fixture_state.per_class_setup["Sample"] = ["self.value = 1"]
+    transformer.fixture_state.extend_class_buffer("Sample", "setup", ["self.value = 1"])
     original = cst.parse_module("class Sample:\n    def test_case(self):\n        return True\n")
 
     updated = transformer.leave_Module(original, original)
 
     assert isinstance(updated, cst.Module)
     assert transformer.fixture_state.per_class_setup == {}
+    assert transformer.fixture_state.classes == {}
 
 
 def test_rebuild_class_def_injects_fixtures_and_removes_lifecycle() -> None:
     transformer = UnittestToPytestCstTransformer()
-    transformer._per_class_setup["Sample"] = ["self.value = 1"]
-    transformer._per_class_teardown["Sample"] = ["self.value = 0"]
+    record = transformer.fixture_state.record_for("Sample")
+    record.setup.append("self.value = 1")
+    record.teardown.append("self.value = 0")
     class_node = _first_node(
         'class Sample:\n    """Docstring"""\n    def setUp(self):\n        pass\n    def test_case(self):\n        return True\n'
     )
@@ -218,36 +256,15 @@ def test_visit_with_metadata_marks_pytest_needed() -> None:
     assert transformer.needs_pytest_import is True
 
 
-def test_apply_recorded_replacements_applies_assertion_rewrite() -> None:
+def test_visit_with_metadata_applies_statement_replacements_in_primary_pass() -> None:
     transformer = UnittestToPytestCstTransformer()
-    raw_module = transformer._parse_to_module("self.assertTrue(flag)\n")
-
-    wrapper = MetadataWrapper(raw_module)
-    module = wrapper.module
-    metadata = wrapper.resolve(PositionProvider)
-    stmt = module.body[0]
-    assert isinstance(stmt, cst.SimpleStatementLine)
-    expr = stmt.body[0]
-    assert isinstance(expr, cst.Expr)
-    call = expr.value
-    assert isinstance(call, cst.Call)
-
-    transformer.replacement_registry.record(
-        metadata[call],
-        cst.SimpleStatementLine(
-            body=[
-                cst.Assert(
-                    test=cst.Name(value="flag"),
-                )
-            ]
-        ),
-    )
+    module = transformer._parse_to_module("def test_sample(self):\n    # note\n    self.assertTrue(flag)\n")
 
-    updated = transformer._apply_recorded_replacements(module)
+    transformed = transformer._visit_with_metadata(module)
 
-    new_stmt = updated.body[0]
-    assert isinstance(new_stmt, cst.SimpleStatementLine)
-    assert isinstance(new_stmt.body[0], cst.Assert)
+    assert "    # note\n    assert flag\n" in transformed.code
+    assert transformer.replacement_registry.replacements == {}
+    assert transformer.replacement_registry.node_replacements == {}
 
 
 def test_apply_recursive_with_cleanup_invokes_function_helpers() -> None:
@@ -314,3 +331,18 @@ def test_run_inheritance_cleanup_normalizes_test_method_names() -> None:
     method = next(stmt for stmt in class_node.body.body if isinstance(stmt, cst.FunctionDef))
     assert method.name.value == "test_Example"
     assert "class Solo:" in cleaned.code
+
+
+def test_many_classes_each_receive_their_own_fixture() -> None:
+    classes = "\n".join(
+        f"class Test{i}(unittest.TestCase):\n    def setUp(self):\n        self.value = {i}\n\n"
+        f"    def test_value(self):\n        self.assertEqual(self.value, {i})\n"
+        for i in range(300)
+    )
+    transformer = UnittestToPytestCstTransformer()
+
+    result = transformer.transform_code("import unittest\n\n" + classes)
+
+    assert result.count("def setup_method(self):") == 300
+    assert "self.value = 299" in result
+    assert transformer.fixture_state.classes == {}
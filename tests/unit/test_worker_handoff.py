@@ -0,0 +1,82 @@
+"""Tests for the path-based worker handoff of ``migrate_file_async``."""
+
+import asyncio
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from splurge_unittest_to_pytest.context import MigrationConfig
+from splurge_unittest_to_pytest.migration_orchestrator import MigrationOrchestrator, _migrate_in_worker
+from splurge_unittest_to_pytest.worker_handoff import CodeHandle, spool_code
+
+
+def _large_source(source: str, methods: int) -> str:
+    method = "\n    def test_value_{0}(self):\n        self.assertEqual(self.value, {0})\n"
+    return source + "".join(method.format(i) for i in range(methods))
+
+
+def test_spooled_code_round_trips_and_is_released(tmp_path: Path) -> None:
+    code = "def test_ünïcode():\n    assert '€' == '€'\n"
+
+    handle = spool_code(code, str(tmp_path))
+    empty = spool_code("", str(tmp_path))
+
+    assert handle.size == len(code.encode("utf-8"))
+    assert handle.read_text() == code
+    assert empty.read_text() == ""
+    handle.release()
+    handle.release()
+    empty.release()
+    assert os.listdir(tmp_path) == []
+
+
+def test_worker_result_holds_only_the_target_path(tmp_path: Path, unittest_source: str) -> None:
+    source = tmp_path / "test_large.py"
+    source.write_text(_large_source(unittest_source, 300), encoding="utf-8")
+    out = tmp_path / "out"
+
+    result = _migrate_in_worker(str(source), MigrationConfig(target_root=str(out), format_output=False))
+
+    assert result.is_success()
+    assert Path(result.data) == out / "test_large.py"
+    assert "assert self.value == 299" in (out / "test_large.py").read_text(encoding="utf-8")
+    assert len(pickle.dumps(result)) < 1024 < source.stat().st_size
+
+
+def test_dry_run_code_comes_back_as_a_handle(tmp_path: Path, unittest_source: str) -> None:
+    source = tmp_path / "test_numbers.py"
+    source.write_text(unittest_source, encoding="utf-8")
+    spool = tmp_path / "spool"
+    spool.mkdir()
+
+    result = _migrate_in_worker(str(source), MigrationConfig(dry_run=True), str(spool))
+
+    handle = result.metadata["generated_code"]
+    assert isinstance(handle, CodeHandle)
+    assert "assert self.value == 2" in handle.read_text()
+    handle.release()
+
+
+def test_process_workers_migrate_files_by_path(tmp_path: Path, unittest_source: str) -> None:
+    source = tmp_path / "test_numbers.py"
+    source.write_text(unittest_source, encoding="utf-8")
+    orchestrator = MigrationOrchestrator()
+    expected = orchestrator.migrate_file(str(source), MigrationConfig(target_root=str(tmp_path / "expected")))
+
+    async def run() -> tuple:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            written = await orchestrator.migrate_file_async(
+                str(source), MigrationConfig(target_root=str(tmp_path / "out")), transform_executor=executor
+            )
+            preview = await orchestrator.migrate_file_async(
+                str(source), MigrationConfig(dry_run=True), transform_executor=executor, spool_dir=str(tmp_path)
+            )
+        return written, preview
+
+    written, preview = asyncio.run(run())
+
+    assert written.is_success()
+    assert Path(written.data).read_text(encoding="utf-8") == Path(expected.data).read_text(encoding="utf-8")
+    assert preview.metadata["generated_code"] == Path(expected.data).read_text(encoding="utf-8")
+    assert not list(tmp_path.glob("splurge-code-*"))
@@ -0,0 +1,39 @@
+"""Tests for the pre-forked warm worker pool."""
+
+import gc
+import multiprocessing
+import os
+from multiprocessing import forkserver
+
+import pytest
+
+from splurge_unittest_to_pytest.worker_pool import _ZYGOTE_MODULE, create_worker_pool
+
+pytestmark = pytest.mark.skipif(
+    "forkserver" not in multiprocessing.get_all_start_methods(), reason="forkserver start method is not available"
+)
+
+
+def test_workers_are_forked_warm_with_a_frozen_heap() -> None:
+    with create_worker_pool(2) as executor:
+        freeze_counts = [executor.submit(gc.get_freeze_count).result() for _ in range(4)]
+        pids = {executor.submit(os.getpid).result() for _ in range(4)}
+
+    assert min(freeze_counts) > 0
+    assert os.getpid() not in pids
+
+
+def test_without_preload_workers_start_cold() -> None:
+    with create_worker_pool(1, preload=False) as executor:
+        assert executor.submit(gc.get_freeze_count).result() == 0
+
+
+def test_existing_forkserver_preload_entries_are_kept(monkeypatch: pytest.MonkeyPatch) -> None:
+    server = forkserver._forkserver
+    monkeypatch.setattr(server, "_preload_modules", ["__main__", "json"])
+    monkeypatch.setattr(server, "_forkserver_pid", None)
+
+    create_worker_pool(1).shutdown()
+    create_worker_pool(1).shutdown()
+
+    assert server._preload_modules == ["__main__", "json", _ZYGOTE_MODULE]